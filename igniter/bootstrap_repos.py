@@ -8,9 +8,11 @@ import shutil
 import sys
 import tempfile
 from pathlib import Path
-from typing import Union, Callable, List, Tuple
+from typing import Union, Callable, List, Tuple, Iterator
 import hashlib
 import platform
+import json
+from concurrent.futures import ThreadPoolExecutor
 
 from zipfile import ZipFile, BadZipFile
 
@@ -383,7 +385,22 @@ class OpenPypeVersion(semver.VersionInfo):
 
         """
         # Return all local versions if arguments are set to None
+        dir_to_search = cls.get_remote_versions_dir()
+        if not dir_to_search:
+            return []
+
+        versions = cls.get_versions_from_directory(dir_to_search)
 
+        return list(sorted(set(versions)))
+
+    @classmethod
+    def get_remote_versions_dir(cls) -> Union[Path, None]:
+        """Get directory with versions in OpenPype path.
+
+        Returns:
+            Union[Path, None]: OpenPype path or path from registry.
+
+        """
         dir_to_search = None
         if cls.openpype_path_is_accessible():
             dir_to_search = Path(cls.get_openpype_path())
@@ -398,12 +415,7 @@ class OpenPypeVersion(semver.VersionInfo):
                 # nothing found in registry, we'll use data dir
                 pass
 
-        if not dir_to_search:
-            return []
-
-        versions = cls.get_versions_from_directory(dir_to_search)
-
-        return list(sorted(set(versions)))
+        return dir_to_search
 
     @staticmethod
     def get_versions_from_directory(
@@ -420,9 +432,30 @@ class OpenPypeVersion(semver.VersionInfo):
             ValueError: if invalid path is specified.
 
         """
-        openpype_versions = []
+        return sorted(
+            OpenPypeVersion.iter_versions_from_directory(openpype_dir)
+        )
+
+    @staticmethod
+    def iter_versions_from_directory(
+            openpype_dir: Path,
+            version: OpenPypeVersion = None) -> Iterator[OpenPypeVersion]:
+        """Iterate detected OpenPype versions in directory.
+
+        Versions are yielded as they're found so caller can stop the scan
+        when it has what it's looking for.
+
+        Args:
+            openpype_dir (Path): Directory to scan.
+            version (OpenPypeVersion, optional): Yield only this version.
+                Content of other versions is not checked.
+
+        Yields:
+            OpenPypeVersion: Detected version, not sorted.
+
+        """
         if not openpype_dir.exists() and not openpype_dir.is_dir():
-            return openpype_versions
+            return
 
         # iterate over directory in first level and find all that might
         # contain OpenPype.
@@ -430,10 +463,8 @@ class OpenPypeVersion(semver.VersionInfo):
             # if the item is directory with major.minor version, dive deeper
 
             if item.is_dir() and re.match(r"^\d+\.\d+$", item.name):
-                _versions = OpenPypeVersion.get_versions_from_directory(
-                    item)
-                if _versions:
-                    openpype_versions += _versions
+                yield from OpenPypeVersion.iter_versions_from_directory(
+                    item, version)
 
             # if file exists, strip extension, in case of dir don't.
             name = item.name if item.is_dir() else item.stem
@@ -443,6 +474,9 @@ class OpenPypeVersion(semver.VersionInfo):
                 detected_version: OpenPypeVersion
                 detected_version = result
 
+                if version is not None and detected_version != version:
+                    continue
+
                 if item.is_dir() and not OpenPypeVersion.is_version_in_dir(
                         item, detected_version
                 )[0]:
@@ -454,9 +488,7 @@ class OpenPypeVersion(semver.VersionInfo):
                     continue
 
                 detected_version.path = item
-                openpype_versions.append(detected_version)
-
-        return sorted(openpype_versions)
+                yield detected_version
 
     @staticmethod
     def get_installed_version_str() -> str:
@@ -889,6 +921,10 @@ class BootstrapRepos:
         of existing files in given path and compare. It will also compare
         lists of files together for missing files.
 
+        Successful validation is cached in user data dir, version is not
+        validated again until size or modification time of its files
+        changes.
+
         Args:
             path (Path): Path to OpenPype version to validate.
 
@@ -902,9 +938,130 @@ class BootstrapRepos:
         if not path.exists():
             return False, "Path doesn't exist"
 
+        cache = self._load_validation_cache()
+        cache_key = path.resolve().as_posix()
+        fingerprint = self._get_validation_fingerprint(path)
+        if fingerprint is not None and cache.get(cache_key) == fingerprint:
+            return True, "All ok (cached)"
+
         if path.is_file():
-            return self._validate_zip(path)
-        return self._validate_dir(path)
+            result = self._validate_zip(path)
+        else:
+            result = self._validate_dir(path)
+
+        if result == (True, "All ok") and fingerprint is not None:
+            cache[cache_key] = fingerprint
+            self._store_validation_cache(cache)
+        return result
+
+    def _get_validation_cache_path(self) -> Path:
+        return Path(self.data_dir) / "validation_cache.json"
+
+    def _load_validation_cache(self) -> dict:
+        cache_path = self._get_validation_cache_path()
+        try:
+            with open(cache_path, "r") as stream:
+                cache = json.load(stream)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return cache
+
+    def _store_validation_cache(self, cache: dict) -> None:
+        cache_path = self._get_validation_cache_path()
+        # write to temp file and rename so other processes don't read
+        #   incomplete file
+        tmp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump(cache, stream)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            self._log.debug(
+                "Failed to store validation cache", exc_info=True)
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    @staticmethod
+    def _get_validation_fingerprint(path: Path) -> Union[list, None]:
+        """Size and modification time of files in version.
+
+        For zip file it is the archive itself, for directory the `checksums`
+        file and all files listed in it.
+
+        Returns:
+            Union[list, None]: Fingerprint or None if it can't be created.
+
+        """
+        def _stat(filepath):
+            stat = os.stat(sanitize_long_path(filepath.as_posix()))
+            return [stat.st_size, stat.st_mtime_ns]
+
+        try:
+            if path.is_file():
+                return _stat(path)
+
+            checksums_file = path / "checksums"
+            fingerprint = _stat(checksums_file)
+            for _, file_name in BootstrapRepos._parse_checksums(
+                    checksums_file.read_text()):
+                fingerprint.extend(_stat(path / file_name))
+        except (OSError, ValueError):
+            return None
+        return fingerprint
+
+    @staticmethod
+    def _parse_checksums(checksums_data: str) -> List[Tuple[str, str]]:
+        """Split content of `checksums` file to (checksum, file name)."""
+        checksums = []
+        for line in checksums_data.split("\n"):
+            if not line:
+                continue
+            checksum, file_name = line.split(":", 1)
+            checksums.append((checksum, file_name))
+        return checksums
+
+    @staticmethod
+    def _compare_checksums(
+            checksums: List[Tuple[str, str]],
+            checksum_func: Callable[[str], str]) -> tuple:
+        """Calculate checksums of files in parallel and compare them.
+
+        Args:
+            checksums (list): List of expected checksum and file name.
+            checksum_func (callable): Function calculating checksum
+                of file by its name. Should raise 'FileNotFoundError'
+                if the file is missing.
+
+        Returns:
+            tuple(bool, str): Status and reason of first failure
+                in order of `checksums`.
+
+        """
+        is_windows = platform.system().lower() == "windows"
+
+        def _check(item):
+            file_checksum, file_name = item
+            if is_windows:
+                file_name = file_name.replace("/", "\\")
+            try:
+                current = checksum_func(file_name)
+            except FileNotFoundError:
+                return False, f"Missing file [ {file_name} ]"
+
+            if file_checksum != current:
+                return False, f"Invalid checksum on {file_name}"
+            return True, None
+
+        with ThreadPoolExecutor() as executor:
+            for valid, reason in executor.map(_check, checksums):
+                if not valid:
+                    executor.shutdown(cancel_futures=True)
+                    return valid, reason
+        return True, "All ok"
 
     @staticmethod
     def _validate_zip(path: Path) -> tuple:
@@ -912,16 +1069,13 @@ class BootstrapRepos:
         with ZipFile(path, "r") as zip_file:
             # read checksums
             try:
-                checksums_data = str(zip_file.read("checksums"))
-            except IOError:
+                checksums_data = zip_file.read("checksums").decode("utf-8")
+            except (IOError, KeyError):
                 # FIXME: This should be set to False sometimes in the future
                 return True, "Cannot read checksums for archive."
 
             # split it to the list of tuples
-            checksums = [
-                tuple(line.split(":"))
-                for line in checksums_data.split("\n") if line
-            ]
+            checksums = BootstrapRepos._parse_checksums(checksums_data)
 
             # get list of files in zip minus `checksums` file itself
             # and turn in to set to compare against list of files
@@ -934,19 +1088,15 @@ class BootstrapRepos:
             if diff:
                 return False, f"Missing files {diff}"
 
-            # calculate and compare checksums in the zip file
-            for file_checksum, file_name in checksums:
-                if platform.system().lower() == "windows":
-                    file_name = file_name.replace("/", "\\")
-                h = hashlib.sha256()
+            def _zip_sha256(file_name):
                 try:
-                    h.update(zip_file.read(file_name))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file_name} ]"
-                if h.hexdigest() != file_checksum:
-                    return False, f"Invalid checksum on {file_name}"
+                    content = zip_file.read(file_name)
+                except KeyError:
+                    raise FileNotFoundError(file_name)
+                return hashlib.sha256(content).hexdigest()
 
-        return True, "All ok"
+            # calculate and compare checksums in the zip file
+            return BootstrapRepos._compare_checksums(checksums, _zip_sha256)
 
     @staticmethod
     def _validate_dir(path: Path) -> tuple:
@@ -965,10 +1115,7 @@ class BootstrapRepos:
             # FIXME: This should be set to False sometimes in the future
             return True, "Cannot read checksums for archive."
         checksums_data = checksums_file.read_text()
-        checksums = [
-            tuple(line.split(":"))
-            for line in checksums_data.split("\n") if line
-        ]
+        checksums = BootstrapRepos._parse_checksums(checksums_data)
 
         # compare file list against list of files from checksum file.
         # If difference exists, something is wrong and we invalidate directly
@@ -983,21 +1130,13 @@ class BootstrapRepos:
         if diff:
             return False, f"Missing files {diff}"
 
-        # calculate and compare checksums
-        for file_checksum, file_name in checksums:
-            if platform.system().lower() == "windows":
-                file_name = file_name.replace("/", "\\")
-            try:
-                current = sha256sum(
-                    sanitize_long_path((path / file_name).as_posix())
-                )
-            except FileNotFoundError:
-                return False, f"Missing file [ {file_name} ]"
-
-            if file_checksum != current:
-                return False, f"Invalid checksum on {file_name}"
+        def _file_sha256(file_name):
+            return sha256sum(
+                sanitize_long_path((path / file_name).as_posix())
+            )
 
-        return True, "All ok"
+        # calculate and compare checksums
+        return BootstrapRepos._compare_checksums(checksums, _file_sha256)
 
     @staticmethod
     def add_paths_from_archive(archive: Path) -> None:
@@ -1062,24 +1201,28 @@ class BootstrapRepos:
         if installed_version == version:
             return installed_version
 
-        local_versions = OpenPypeVersion.get_local_versions()
+        # Scan only for requested version and stop on first match so
+        #   content of other versions is not checked
+        local_dir = OpenPypeVersion.get_local_openpype_path()
         zip_version = None
-        for local_version in local_versions:
-            if local_version == version:
-                if local_version.path.suffix.lower() == ".zip":
-                    zip_version = local_version
-                else:
+        if local_dir:
+            local_versions = OpenPypeVersion.iter_versions_from_directory(
+                Path(local_dir), version)
+            for local_version in local_versions:
+                if local_version.path.suffix.lower() != ".zip":
                     return local_version
+                zip_version = local_version
 
         if zip_version is not None:
             return zip_version
 
-        remote_versions = OpenPypeVersion.get_remote_versions()
+        remote_dir = OpenPypeVersion.get_remote_versions_dir()
+        if not remote_dir:
+            return None
         return next(
-            (
-                remote_version for remote_version in remote_versions
-                if remote_version == version
-            ), None)
+            OpenPypeVersion.iter_versions_from_directory(remote_dir, version),
+            None
+        )
 
     @staticmethod
     def find_latest_openpype_version() -> Union[OpenPypeVersion, None]:
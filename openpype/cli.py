@@ -186,14 +186,29 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
               multiple=True)
 @click.option("-g", "--gui", is_flag=True,
               help="Show Publish UI", default=False)
-def publish(paths, targets, gui):
+@click.option("--worker-port", type=int, default=None,
+              help="Port of running publish worker")
+def publish(paths, targets, gui, worker_port):
     """Start CLI publishing.
 
     Publish collects json from paths provided as an argument.
     More than one path is allowed.
     """
 
-    PypeCommands.publish(list(paths), targets, gui)
+    PypeCommands.publish(list(paths), targets, gui, worker_port)
+
+
+@main.command()
+@click.option("-p", "--port", type=int, default=None,
+              help="Port on which worker listens")
+def publish_worker(port):
+    """Start publish worker for headless publishing.
+
+    Worker keeps plugins and settings loaded and publishes jobs sent by
+    'publish' command with '--worker-port' one by one. Only processes of
+    the same user can send jobs to the worker.
+    """
+    PypeCommands.publish_worker(port)
 
 
 @main.command(context_settings={"ignore_unknown_options": True})
@@ -360,26 +375,57 @@ def repack_version(directory):
     "--dirpath", help="Directory where package is stored", default=None)
 @click.option(
     "--dbonly", help="Store only Database data", default=False, is_flag=True)
-def pack_project(project, dirpath, dbonly):
+@click.option(
+    "--stream",
+    help="Create package directory with parallel written archives",
+    default=False,
+    is_flag=True)
+@click.option(
+    "--previous",
+    help="Previous package directory for incremental packing",
+    default=None)
+def pack_project(project, dirpath, dbonly, stream, previous):
     """Create a package of project with all files and database dump."""
 
     if AYON_SERVER_ENABLED:
         raise RuntimeError("AYON does not support 'pack-project' command.")
-    PypeCommands().pack_project(project, dirpath, dbonly)
+    PypeCommands().pack_project(project, dirpath, dbonly, stream, previous)
 
 
 @main.command()
-@click.option("--zipfile", help="Path to zip file")
+@click.option("--zipfile", help="Path to zip file or package directory")
 @click.option(
     "--root", help="Replace root which was stored in project", default=None
 )
 @click.option(
     "--dbonly", help="Store only Database data", default=False, is_flag=True)
-def unpack_project(zipfile, root, dbonly):
+@click.option(
+    "--pattern",
+    help=(
+        "Unpack only project files matching the pattern,"
+        " database is not changed"
+    ),
+    multiple=True)
+def unpack_project(zipfile, root, dbonly, pattern):
     """Create a package of project with all files and database dump."""
     if AYON_SERVER_ENABLED:
         raise RuntimeError("AYON does not support 'unpack-project' command.")
-    PypeCommands().unpack_project(zipfile, root, dbonly)
+    PypeCommands().unpack_project(zipfile, root, dbonly, list(pattern))
+
+
+@main.command()
+@click.argument("journal_path")
+@click.option(
+    "--rollback", help="Revert the transaction instead of resuming it",
+    default=False, is_flag=True)
+def file_transaction(journal_path, rollback):
+    """Resume or rollback interrupted file transaction.
+
+    Journal file of interrupted transaction is stored in staging directory
+    of published instance. Resume transfers only files that were not
+    finished, rollback removes transferred files and restores backups.
+    """
+    PypeCommands().file_transaction(journal_path, rollback)
 
 
 @main.command()
@@ -1,5 +1,6 @@
 from .mongo import (
     OpenPypeMongoConnection,
+    entity_cache,
 )
 from .server.utils import get_ayon_server_api_connection
 
@@ -61,6 +62,7 @@ from .operations import (
 
 __all__ = (
     "OpenPypeMongoConnection",
+    "entity_cache",
 
     "get_ayon_server_api_connection",
 
@@ -10,6 +10,11 @@ from .mongo import (
     replace_project_documents,
     store_project_documents,
 )
+from .entity_cache import (
+    EntityCache,
+    get_active_entity_cache,
+    entity_cache,
+)
 
 
 __all__ = (
@@ -23,4 +28,8 @@ __all__ = (
     "load_json_file",
     "replace_project_documents",
     "store_project_documents",
+
+    "EntityCache",
+    "get_active_entity_cache",
+    "entity_cache",
 )
@@ -13,6 +13,7 @@ import six
 from bson.objectid import ObjectId
 
 from .mongo import get_project_database, get_project_connection
+from .entity_cache import get_active_entity_cache
 
 PatternType = type(re.compile(""))
 
@@ -169,6 +170,10 @@ def get_asset_by_id(project_name, asset_id, fields=None):
     if not asset_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None:
+        return cache.get(project_name, "asset", asset_id, fields)
+
     query_filter = {"type": "asset", "_id": asset_id}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
@@ -192,6 +197,10 @@ def get_asset_by_name(project_name, asset_name, fields=None):
     if not asset_name:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None:
+        return cache.get(project_name, "asset_by_name", asset_name, fields)
+
     query_filter = {"type": "asset", "name": asset_name}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
@@ -403,6 +412,10 @@ def get_subset_by_id(project_name, subset_id, fields=None):
     if not subset_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None:
+        return cache.get(project_name, "subset", subset_id, fields)
+
     query_filters = {"type": "subset", "_id": subset_id}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filters, _prepare_fields(fields))
@@ -430,6 +443,12 @@ def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
     if not asset_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None:
+        return cache.get(
+            project_name, "subset_by_name", (asset_id, subset_name), fields
+        )
+
     query_filters = {
         "type": "subset",
         "name": subset_name,
@@ -567,6 +586,10 @@ def get_version_by_id(project_name, version_id, fields=None):
     if not version_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None:
+        return cache.get(project_name, "version", version_id, fields)
+
     query_filter = {
         "type": {"$in": ["version", "hero_version"]},
         "_id": version_id
@@ -969,6 +992,10 @@ def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     if not subset_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None:
+        return cache.get(project_name, "last_version", subset_id, fields)
+
     last_versions = get_last_versions(
         project_name, subset_ids=[subset_id], fields=fields
     )
@@ -1034,6 +1061,12 @@ def get_representation_by_id(project_name, representation_id, fields=None):
     if not representation_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None:
+        return cache.get(
+            project_name, "representation", representation_id, fields
+        )
+
     repre_types = ["representation", "archived_representation"]
     query_filter = {
         "type": {"$in": repre_types}
@@ -0,0 +1,328 @@
+"""Request scoped cache of entity documents.
+
+Single entity getters ('get_asset_by_id', 'get_version_by_id', ...) query
+database on each call. Code which resolves many entities one by one, e.g.
+loader or publish plugins walking representation parents, issues a query
+for each entity, often for the same entity multiple times.
+
+Cache is opt-in and is active only inside 'entity_cache' context manager.
+Getters look into the active cache first, fetched documents are kept for
+whole scope of the context. Lookups can be deferred with
+'EntityCache.load' which returns 'EntityPromise'. All deferred lookups of
+the same type are fetched with one '$in' query when any of them is
+resolved.
+
+Example:
+    with entity_cache() as cache:
+        promises = [
+            cache.load(project_name, "version", version_id)
+            for version_id in version_ids
+        ]
+        # One query for all versions
+        version_docs = [promise.get() for promise in promises]
+        # Cached, no query
+        version_doc = get_version_by_id(project_name, version_ids[0])
+
+Cache stores full documents, requested fields are applied on returned
+documents. Returned documents are copies, so callers can modify them as
+documents from database. Cache does not know about changes done in
+database during its scope, use 'EntityCache.clear' after changes.
+
+Active cache is stored per thread.
+"""
+import copy
+import threading
+import contextlib
+import collections
+
+import six
+
+from .mongo import get_project_connection
+
+_local = threading.local()
+
+
+def _convert_id(in_id):
+    # Copy of 'convert_id' from 'entities' which imports this module
+    from bson.objectid import ObjectId
+
+    if isinstance(in_id, six.string_types):
+        return ObjectId(in_id)
+    return in_id
+
+
+def _apply_fields(doc, fields):
+    """Reduce document to fields same way as mongo projection does."""
+    if doc is None or not fields:
+        return doc
+
+    output = {"_id": doc["_id"]}
+    for field in fields:
+        parts = field.split(".")
+        value = doc
+        for part in parts:
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            target = output
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            target[parts[-1]] = value
+    return output
+
+
+def _find_by_ids(entity_types):
+    def load(project_name, ids):
+        conn = get_project_connection(project_name)
+        docs = conn.find({
+            "type": {"$in": entity_types},
+            "_id": {"$in": list(ids)}
+        })
+        return {doc["_id"]: doc for doc in docs}
+    return load
+
+
+def _load_assets_by_name(project_name, names):
+    conn = get_project_connection(project_name)
+    docs = conn.find({"type": "asset", "name": {"$in": list(names)}})
+    return {doc["name"]: doc for doc in docs}
+
+
+def _load_subsets_by_name(project_name, keys):
+    conn = get_project_connection(project_name)
+    docs = conn.find({
+        "type": "subset",
+        "parent": {"$in": list({asset_id for asset_id, _ in keys})},
+        "name": {"$in": list({name for _, name in keys})}
+    })
+    output = {}
+    for doc in docs:
+        key = (doc["parent"], doc["name"])
+        if key in keys:
+            output[key] = doc
+    return output
+
+
+def _load_last_versions(project_name, subset_ids):
+    from .entities import get_last_versions
+
+    return get_last_versions(project_name, subset_ids)
+
+
+# Loaders by entity type, each receives set of keys and returns documents
+#   by key
+_LOADERS = {
+    "asset": _find_by_ids(["asset"]),
+    "asset_by_name": _load_assets_by_name,
+    "subset": _find_by_ids(["subset"]),
+    "subset_by_name": _load_subsets_by_name,
+    "version": _find_by_ids(["version", "hero_version"]),
+    "last_version": _load_last_versions,
+    "representation": _find_by_ids(
+        ["representation", "archived_representation"]
+    ),
+}
+# Entity types which are looked up by other key than id, loaded documents
+#   are shared with the id based type
+_ID_ENTITY_TYPES = {
+    "asset_by_name": "asset",
+    "subset_by_name": "subset",
+    "last_version": "version",
+}
+
+
+class EntityPromise(object):
+    """Deferred lookup of entity in cache.
+
+    Lookup is fetched together with all other pending lookups of the same
+    type on first call of 'get'.
+    """
+    def __init__(self, cache, project_name, entity_type, key):
+        self._cache = cache
+        self._project_name = project_name
+        self._entity_type = entity_type
+        self._key = key
+
+    def get(self, fields=None):
+        """Entity document, None if entity was not found.
+
+        Args:
+            fields (Optional[Iterable[str]]): Fields that should be returned.
+                All fields are returned if 'None' is passed.
+        """
+        return self._cache.get(
+            self._project_name, self._entity_type, self._key, fields
+        )
+
+
+class EntityCache(object):
+    """Identity map of entity documents with batched loading.
+
+    Attributes:
+        hits (int): Lookups which were resolved from cache.
+        misses (int): Lookups which had to be fetched from database.
+        queries (int): Number of database queries done by cache.
+    """
+    def __init__(self):
+        # Documents by key in dictionary by project name and entity type,
+        #   'None' is stored for entities which were not found
+        self._docs = collections.defaultdict(dict)
+        self._pending = collections.defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+        self.queries = 0
+
+    @staticmethod
+    def _prepare_key(entity_type, key):
+        if entity_type not in _LOADERS:
+            raise ValueError("Unknown entity type \"{}\"".format(entity_type))
+        if entity_type == "subset_by_name":
+            asset_id, subset_name = key
+            return (_convert_id(asset_id), subset_name)
+        if entity_type == "asset_by_name":
+            return key
+        return _convert_id(key)
+
+    def get_stats(self):
+        """Counters of cache usage.
+
+        Returns:
+            dict[str, int]: Hits, misses and queries.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "queries": self.queries,
+        }
+
+    def load(self, project_name, entity_type, key):
+        """Defer lookup of entity.
+
+        Args:
+            project_name (str): Name of project.
+            entity_type (str): One of 'asset', 'asset_by_name', 'subset',
+                'subset_by_name', 'version', 'last_version' or
+                'representation'.
+            key (Any): Id of entity, name of asset for 'asset_by_name',
+                tuple of asset id and subset name for 'subset_by_name' and
+                subset id for 'last_version'.
+
+        Returns:
+            EntityPromise: Deferred lookup.
+        """
+        key = self._prepare_key(entity_type, key)
+        cache_key = (project_name, entity_type)
+        if key not in self._docs[cache_key]:
+            self._pending[cache_key].add(key)
+        return EntityPromise(self, project_name, entity_type, key)
+
+    def get(self, project_name, entity_type, key, fields=None):
+        """Entity document, pending lookups of the type are fetched too.
+
+        Returns:
+            Union[dict[str, Any], None]: Entity document or None if entity
+                was not found.
+        """
+        return self.get_many(project_name, entity_type, [key], fields)[0]
+
+    def get_many(self, project_name, entity_type, keys, fields=None):
+        """Entity documents for multiple keys with one query.
+
+        Returns:
+            list[Union[dict[str, Any], None]]: Documents in order of keys.
+        """
+        keys = [self._prepare_key(entity_type, key) for key in keys]
+        cache_key = (project_name, entity_type)
+        docs_by_key = self._docs[cache_key]
+        pending = self._pending.pop(cache_key, set())
+        for key in keys:
+            if key in docs_by_key:
+                self.hits += 1
+            else:
+                pending.add(key)
+
+        if pending:
+            self._fetch(project_name, entity_type, pending)
+
+        return [
+            copy.deepcopy(_apply_fields(docs_by_key[key], fields))
+            for key in keys
+        ]
+
+    def _fetch(self, project_name, entity_type, keys):
+        self.misses += len(keys)
+        self.queries += 1
+        loaded = _LOADERS[entity_type](project_name, keys)
+
+        id_entity_type = _ID_ENTITY_TYPES.get(entity_type)
+        docs_by_id = None
+        if id_entity_type:
+            docs_by_id = self._docs[(project_name, id_entity_type)]
+
+        docs_by_key = self._docs[(project_name, entity_type)]
+        for key in keys:
+            doc = loaded.get(key)
+            if doc is not None and docs_by_id is not None:
+                # Keep one object per entity
+                doc = docs_by_id.setdefault(doc["_id"], doc)
+            docs_by_key[key] = doc
+
+    def prime(self, project_name, entity_type, docs):
+        """Store already fetched documents in cache.
+
+        Args:
+            project_name (str): Name of project.
+            entity_type (str): 'asset', 'subset', 'version' or
+                'representation'.
+            docs (Iterable[dict[str, Any]]): Full documents of entities.
+        """
+        docs_by_key = self._docs[(project_name, entity_type)]
+        for doc in docs:
+            docs_by_key.setdefault(doc["_id"], doc)
+
+    def clear(self):
+        """Forget all cached documents and pending lookups."""
+        self._docs.clear()
+        self._pending.clear()
+
+
+def get_active_entity_cache():
+    """Entity cache of current thread.
+
+    Returns:
+        Union[EntityCache, None]: Active cache or None if getters are not
+            called inside 'entity_cache' context.
+    """
+    stack = getattr(_local, "stack", None)
+    if stack:
+        return stack[-1]
+    return None
+
+
+@contextlib.contextmanager
+def entity_cache(cache=None):
+    """Activate entity cache for entity getters in current thread.
+
+    Nested context without passed cache reuses active cache.
+
+    Args:
+        cache (Optional[EntityCache]): Cache to activate. New cache is
+            created if not passed and no cache is active.
+
+    Yields:
+        EntityCache: Active cache.
+    """
+    if cache is None:
+        cache = get_active_entity_cache() or EntityCache()
+
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = []
+        _local.stack = stack
+
+    stack.append(cache)
+    try:
+        yield cache
+    finally:
+        stack.pop()
@@ -68,7 +68,14 @@ function main(websocket_url){
 
     log.warn("connected");
 
-    RPC.addRoute('AfterEffects.open', function (data) {
+    // routes callable in one message through 'AfterEffects.batch'
+    var batchRoutes = {};
+    function addRoute(route, callback){
+        batchRoutes[route] = callback;
+        RPC.addRoute(route, callback);
+    }
+
+    addRoute('AfterEffects.open', function (data) {
         log.warn('Server called client route "open":', data);
         var escapedPath = EscapeStringForJSX(data.path);
         return runEvalScript("fileOpen('" + escapedPath +"')")
@@ -78,7 +85,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_metadata', function (data) {
+    addRoute('AfterEffects.get_metadata', function (data) {
         log.warn('Server called client route "get_metadata":', data);
         return runEvalScript("getMetadata()")
             .then(function(result){
@@ -87,7 +94,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_active_document_name', function (data) {
+    addRoute('AfterEffects.get_active_document_name', function (data) {
         log.warn('Server called client route ' +
             '"get_active_document_name":', data);
         return runEvalScript("getActiveDocumentName()")
@@ -97,7 +104,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_active_document_full_name', function (data){
+    addRoute('AfterEffects.get_active_document_full_name', function (data){
         log.warn('Server called client route ' +
             '"get_active_document_full_name":', data);
         return runEvalScript("getActiveDocumentFullName()")
@@ -107,7 +114,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.add_item', function (data) {
+    addRoute('AfterEffects.add_item', function (data) {
         log.warn('Server called client route "add_item":', data);
         var escapedName = EscapeStringForJSX(data.name);
         return runEvalScript("addItem('" + escapedName +"', " +
@@ -118,7 +125,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_items', function (data) {
+    addRoute('AfterEffects.get_items', function (data) {
         log.warn('Server called client route "get_items":', data);
         return runEvalScript("getItems("  + data.comps + "," +
                                             data.folders + "," +
@@ -129,7 +136,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.select_items', function (data) {
+    addRoute('AfterEffects.select_items', function (data) {
         log.warn('Server called client route "select_items":', data);
         return runEvalScript("selectItems("  + JSON.stringify(data.items) + ")")
             .then(function(result){
@@ -139,7 +146,7 @@ function main(websocket_url){
     });
 
 
-    RPC.addRoute('AfterEffects.get_selected_items', function (data) {
+    addRoute('AfterEffects.get_selected_items', function (data) {
         log.warn('Server called client route "get_selected_items":', data);
         return runEvalScript("getSelectedItems(" + data.comps + "," +
                                                    data.folders + "," +
@@ -150,7 +157,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.import_file', function (data) {
+    addRoute('AfterEffects.import_file', function (data) {
         log.warn('Server called client route "import_file":', data);
         var escapedPath = EscapeStringForJSX(data.path);
         return runEvalScript("importFile('" + escapedPath +"', " +
@@ -163,7 +170,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.replace_item', function (data) {
+    addRoute('AfterEffects.replace_item', function (data) {
         log.warn('Server called client route "replace_item":', data);
         var escapedPath = EscapeStringForJSX(data.path);
         return runEvalScript("replaceItem(" + data.item_id + ", " +
@@ -175,7 +182,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.rename_item', function (data) {
+    addRoute('AfterEffects.rename_item', function (data) {
         log.warn('Server called client route "rename_item":', data);
         return runEvalScript("renameItem(" + data.item_id + ", " +
                                          "'" + data.item_name + "')")
@@ -185,7 +192,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.delete_item', function (data) {
+    addRoute('AfterEffects.delete_item', function (data) {
         log.warn('Server called client route "delete_item":', data);
         return runEvalScript("deleteItem(" + data.item_id + ")")
             .then(function(result){
@@ -194,7 +201,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.imprint', function (data) {
+    addRoute('AfterEffects.imprint', function (data) {
         log.warn('Server called client route "imprint":', data);
         var escaped = data.payload.replace(/\n/g, "\\n");
         return runEvalScript("imprint('" + escaped +"')")
@@ -204,7 +211,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.set_label_color', function (data) {
+    addRoute('AfterEffects.set_label_color', function (data) {
         log.warn('Server called client route "set_label_color":', data);
         return runEvalScript("setLabelColor(" + data.item_id + "," +
                                                 data.color_idx + ")")
@@ -214,7 +221,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_comp_properties', function (data) {
+    addRoute('AfterEffects.get_comp_properties', function (data) {
         log.warn('Server called client route "get_comp_properties":', data);
         return runEvalScript("getCompProperties(" + data.item_id + ")")
             .then(function(result){
@@ -223,7 +230,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.set_comp_properties', function (data) {
+    addRoute('AfterEffects.set_comp_properties', function (data) {
         log.warn('Server called client route "set_work_area":', data);
         return runEvalScript("setCompProperties(" + data.item_id + ',' +
                                               data.start + ',' +
@@ -237,7 +244,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.saveAs', function (data) {
+    addRoute('AfterEffects.saveAs', function (data) {
         log.warn('Server called client route "saveAs":', data);
         var escapedPath = EscapeStringForJSX(data.image_path);
         return runEvalScript("saveAs('" + escapedPath + "', " +
@@ -248,7 +255,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.save', function (data) {
+    addRoute('AfterEffects.save', function (data) {
         log.warn('Server called client route "save":', data);
         return runEvalScript("save()")
             .then(function(result){
@@ -257,7 +264,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_render_info', function (data) {
+    addRoute('AfterEffects.get_render_info', function (data) {
         log.warn('Server called client route "get_render_info":', data);
         return runEvalScript("getRenderInfo(" + data.comp_id +")")
             .then(function(result){
@@ -266,7 +273,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_audio_url', function (data) {
+    addRoute('AfterEffects.get_audio_url', function (data) {
         log.warn('Server called client route "get_audio_url":', data);
         return runEvalScript("getAudioUrlForComp(" + data.item_id + ")")
             .then(function(result){
@@ -275,7 +282,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.import_background', function (data) {
+    addRoute('AfterEffects.import_background', function (data) {
         log.warn('Server called client route "import_background":', data);
         return runEvalScript("importBackground(" + data.comp_id + ", " +
                                                "'" + data.comp_name + "', " +
@@ -286,7 +293,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.reload_background', function (data) {
+    addRoute('AfterEffects.reload_background', function (data) {
         log.warn('Server called client route "reload_background":', data);
         return runEvalScript("reloadBackground(" + data.comp_id + ", " +
                                                "'" + data.comp_name + "', " +
@@ -297,7 +304,7 @@ function main(websocket_url){
             });
     });
 
-   RPC.addRoute('AfterEffects.add_item_as_layer', function (data) {
+   addRoute('AfterEffects.add_item_as_layer', function (data) {
        log.warn('Server called client route "add_item_as_layer":', data);
        return runEvalScript("addItemAsLayerToComp(" + data.comp_id + ", " +
                                                       data.item_id + "," +
@@ -308,7 +315,7 @@ function main(websocket_url){
            });
    });
 
-   RPC.addRoute('AfterEffects.add_item_instead_placeholder', function (data) {
+   addRoute('AfterEffects.add_item_instead_placeholder', function (data) {
     log.warn('Server called client route "add_item_instead_placeholder":', data);
     return runEvalScript("addItemInstead(" + data.placeholder_item_id + ", " +
                                              data.item_id + ")")
@@ -318,7 +325,7 @@ function main(websocket_url){
         });
 });
 
-   RPC.addRoute('AfterEffects.render', function (data) {
+   addRoute('AfterEffects.render', function (data) {
     log.warn('Server called client route "render":', data);
     var escapedPath = EscapeStringForJSX(data.folder_url);
     return runEvalScript("render('" + escapedPath +"', " + data.comp_id + ")")
@@ -328,12 +335,12 @@ function main(websocket_url){
         });
     });
 
-    RPC.addRoute('AfterEffects.get_extension_version', function (data) {
+    addRoute('AfterEffects.get_extension_version', function (data) {
       log.warn('Server called client route "get_extension_version":', data);
       return get_extension_version();
     });
 
-    RPC.addRoute('AfterEffects.get_app_version', function (data) {
+    addRoute('AfterEffects.get_app_version', function (data) {
         log.warn('Server called client route "get_app_version":', data);
         return runEvalScript("getAppVersion()")
             .then(function(result){
@@ -342,7 +349,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.add_placeholder', function (data) {
+    addRoute('AfterEffects.add_placeholder', function (data) {
         log.warn('Server called client route "add_placeholder":', data);
         var escapedName = EscapeStringForJSX(data.name);
         return runEvalScript("addPlaceholder('" + escapedName +"',"+
@@ -356,12 +363,12 @@ function main(websocket_url){
             });
     });
 
-     RPC.addRoute('AfterEffects.close', function (data) {
+     addRoute('AfterEffects.close', function (data) {
         log.warn('Server called client route "close":', data);
         return runEvalScript("close()");
     });
 
-    RPC.addRoute('AfterEffects.print_msg', function (data) {
+    addRoute('AfterEffects.print_msg', function (data) {
         log.warn('Server called client route "print_msg":', data);
         var escaped_msg = EscapeStringForJSX(data.msg);
         return runEvalScript("printMsg('" + escaped_msg +"')")
@@ -370,6 +377,37 @@ function main(websocket_url){
                 return result;
             });
     });
+
+    RPC.addRoute('AfterEffects.batch', function (data) {
+        // calls routes one by one, returns list of their results
+        log.warn('Server called client route "batch":', data);
+        var calls = JSON.parse(data.calls);
+        // reject whole batch before any call runs
+        var unknown = calls.filter(function(call){
+            return !batchRoutes.hasOwnProperty(call.method);
+        });
+        if (unknown.length > 0){
+            return Promise.reject(
+                'Unknown batch method: ' + unknown[0].method);
+        }
+        var results = [];
+        var chain = Promise.resolve();
+        calls.forEach(function(call){
+            chain = chain.then(function(){
+                return batchRoutes[call.method](call.params || {});
+            }).then(function(result){
+                results.push(typeof result === 'undefined' ? null : result);
+            });
+        });
+        return chain.then(function(){
+            return JSON.stringify(results);
+        });
+    });
+
+    // announce batch route to server
+    RPC.addEventListener("onconnect", function(){
+        RPC.call('AfterEffects.client_connected');
+    });
 }
 
 /** main entry point **/
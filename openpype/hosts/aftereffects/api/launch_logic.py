@@ -22,7 +22,7 @@ from openpype.modules import ModulesManager
 from openpype.tools.utils import host_tools, get_openpype_qt_app
 from openpype.tools.adobe_webserver.app import WebServerTool
 
-from .ws_stub import get_stub
+from .ws_stub import get_stub, AfterEffectsServerStub
 from .lib import set_settings
 
 log = logging.getLogger(__name__)
@@ -285,6 +285,10 @@ class AfterEffectsRoute(WebSocketRoute):
     async def ping(self):
         log.debug("someone called AfterEffects route ping")
 
+    async def client_connected(self):
+        """Extension announced support of batch calls."""
+        AfterEffectsServerStub.cache.register_client(self.socket)
+
     # This method calls function on the client side
     # client functions
     async def set_context(self, project, asset, task):
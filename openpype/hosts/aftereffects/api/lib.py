@@ -151,10 +151,18 @@ def set_settings(frames, resolution, comp_ids=None, print_msg=True):
         stub.print_msg("Select at least one composition to apply settings.")
         return
 
+    calls = []
     for comp_id in comp_ids:
         msg = f"Setting for comp {comp_id} " + msg
         log.debug(msg)
-        stub.set_comp_properties(comp_id, frame_start, frames_duration,
-                                 fps, width, height)
+        calls.append(("AfterEffects.set_comp_properties", {
+            "item_id": comp_id,
+            "start": frame_start,
+            "duration": frames_duration,
+            "frame_rate": fps,
+            "width": width,
+            "height": height
+        }))
         if print_msg:
-            stub.print_msg(msg)
+            calls.append(("AfterEffects.print_msg", {"msg": msg}))
+    stub.call_batch(calls)
@@ -9,6 +9,7 @@ import attr
 
 from wsrpc_aiohttp import WebSocketAsync
 from openpype.tools.adobe_webserver.app import WebServerTool
+from openpype.tools.adobe_webserver.document_cache import DocumentCache
 
 
 class ConnectionNotEstablishedYet(Exception):
@@ -48,10 +49,15 @@ class AfterEffectsServerStub():
         Expects that client is already connected (started when avalon menu
         is opened).
         'self.websocketserver.call' is used as async wrapper
+
+        Items and metadata of document are cached in 'cache.snapshot()'
+        context, cache is shared by all stubs, see 'DocumentCache'.
     """
     PUBLISH_ICON = '\u2117 '
     LOADED_ICON = '\u25bc'
 
+    cache = DocumentCache()
+
     def __init__(self):
         self.websocketserver = WebServerTool.get_instance()
         self.client = self.get_client()
@@ -72,6 +78,45 @@ class AfterEffectsServerStub():
 
         return client
 
+    def _call(self, method, **kwargs):
+        return self.websocketserver.call(self.client.call(method, **kwargs))
+
+    def _cached_call(self, method, **kwargs):
+        key = (method, tuple(sorted(kwargs.items())))
+        return self.cache.get(key, lambda: self._call(method, **kwargs))
+
+    def call_batch(self, calls):
+        """
+            Call multiple client methods in one websocket message.
+
+            Methods are called in order. Older extension which doesn't
+            support batch calls gets the calls one by one.
+        Args:
+            calls (list of tuple): method name and dictionary of arguments,
+                e.g. [('AfterEffects.set_label_color', {'item_id': 1,
+                'color_idx': 9})]
+        Returns:
+            (list) results of calls in order
+        """
+        calls = list(calls)
+        if not calls:
+            return []
+        try:
+            if self.cache.is_registered(self.client):
+                payload = json.dumps([
+                    {"method": method, "params": kwargs}
+                    for method, kwargs in calls
+                ])
+                results = json.loads(
+                    self._call('AfterEffects.batch', calls=payload)
+                )
+            else:
+                results = [self._call(method, **kwargs)
+                           for method, kwargs in calls]
+        finally:
+            self.cache.invalidate()
+        return [self._handle_return(res) for res in results]
+
     def open(self, path):
         """
             Open file located at 'path' (local).
@@ -81,6 +126,7 @@ class AfterEffectsServerStub():
         """
         res = self.websocketserver.call(self.client.call
                                         ('AfterEffects.open', path=path))
+        self.cache.invalidate()
 
         return self._handle_return(res)
 
@@ -95,8 +141,7 @@ class AfterEffectsServerStub():
         Returns:
             (list)
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_metadata'))
+        res = self._cached_call('AfterEffects.get_metadata')
         metadata = self._handle_return(res)
 
         return metadata or []
@@ -178,6 +223,7 @@ class AfterEffectsServerStub():
         res = self.websocketserver.call(self.client.call
                                         ('AfterEffects.imprint',
                                          payload=payload))
+        self.cache.invalidate(['AfterEffects.get_metadata'])
         return self._handle_return(res)
 
     def get_active_document_full_name(self):
@@ -217,12 +263,10 @@ class AfterEffectsServerStub():
         Returns:
             (list) of namedtuples
         """
-        res = self.websocketserver.call(
-            self.client.call('AfterEffects.get_items',
-                             comps=comps,
-                             folders=folders,
-                             footages=footages)
-              )
+        res = self._cached_call('AfterEffects.get_items',
+                                comps=comps,
+                                folders=folders,
+                                footages=footages)
         return self._to_records(self._handle_return(res))
 
     def select_items(self, items):
@@ -267,6 +311,7 @@ class AfterEffectsServerStub():
                                         ('AfterEffects.add_item',
                                          name=name,
                                          item_type=item_type))
+        self.cache.invalidate()
 
         return self._handle_return(res)
 
@@ -299,6 +344,7 @@ class AfterEffectsServerStub():
                              item_name=item_name,
                              import_options=import_options)
             )
+        self.cache.invalidate()
         records = self._to_records(self._handle_return(res))
         if records:
             return records.pop()
@@ -316,6 +362,7 @@ class AfterEffectsServerStub():
                                         ('AfterEffects.replace_item',
                                          item_id=item_id,
                                          path=path, item_name=item_name))
+        self.cache.invalidate()
 
         return self._handle_return(res)
 
@@ -331,6 +378,7 @@ class AfterEffectsServerStub():
                                         ('AfterEffects.rename_item',
                                          item_id=item_id,
                                          item_name=item_name))
+        self.cache.invalidate()
 
         return self._handle_return(res)
 
@@ -343,6 +391,7 @@ class AfterEffectsServerStub():
         res = self.websocketserver.call(self.client.call
                                         ('AfterEffects.delete_item',
                                          item_id=item_id))
+        self.cache.invalidate()
 
         return self._handle_return(res)
 
@@ -370,6 +419,7 @@ class AfterEffectsServerStub():
         res = self.websocketserver.call(self.client.call
                                         ('AfterEffects.imprint',
                                          payload=payload))
+        self.cache.invalidate(['AfterEffects.get_metadata'])
 
         return self._handle_return(res)
 
@@ -389,6 +439,7 @@ class AfterEffectsServerStub():
                                         ('AfterEffects.set_label_color',
                                          item_id=item_id,
                                          color_idx=color_idx))
+        self.cache.invalidate()
 
         return self._handle_return(res)
 
@@ -436,6 +487,7 @@ class AfterEffectsServerStub():
                                          frame_rate=frame_rate,
                                          width=width,
                                          height=height))
+        self.cache.invalidate()
         return self._handle_return(res)
 
     def save(self):
@@ -517,6 +569,7 @@ class AfterEffectsServerStub():
                                          comp_id=comp_id,
                                          comp_name=comp_name,
                                          files=files))
+        self.cache.invalidate()
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -543,6 +596,7 @@ class AfterEffectsServerStub():
                                          comp_id=comp_id,
                                          comp_name=comp_name,
                                          files=files))
+        self.cache.invalidate()
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -562,6 +616,7 @@ class AfterEffectsServerStub():
                                         ('AfterEffects.add_item_as_layer',
                                          comp_id=comp_id,
                                          item_id=item_id))
+        self.cache.invalidate()
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -581,6 +636,7 @@ class AfterEffectsServerStub():
                                         ('AfterEffects.add_item_instead_placeholder',  # noqa
                                          placeholder_item_id=placeholder_item_id,  # noqa
                                          item_id=item_id))
+        self.cache.invalidate()
 
         return self._handle_return(res)
 
@@ -605,6 +661,7 @@ class AfterEffectsServerStub():
                                          height=height,
                                          fps=fps,
                                          duration=duration))
+        self.cache.invalidate()
 
         return self._handle_return(res)
 
@@ -637,6 +694,7 @@ class AfterEffectsServerStub():
 
     def close(self):
         res = self.websocketserver.call(self.client.call('AfterEffects.close'))
+        self.cache.invalidate()
 
         return self._handle_return(res)
 
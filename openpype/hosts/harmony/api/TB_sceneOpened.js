@@ -257,7 +257,9 @@ function Client() {
             self._send(JSON.stringify(request));
         }
 
-        if ((length < data.size()) || (length < self.buffer.size())) {
+        // Requests can be pipelined, buffer may contain next whole message
+        //  which is shorter than the processed one.
+        if (self.buffer.size() >= 6) {
             // we've received more data.
             self.logDebug('--- Got more data to process ...');
             self.processBuffer();
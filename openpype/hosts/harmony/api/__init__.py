@@ -26,6 +26,7 @@ from .lib import (
     imprint,
     read,
     send,
+    send_batch,
     maintained_nodes_state,
     save_scene,
     save_scene_as,
@@ -69,6 +70,7 @@ __all__ = [
     "imprint",
     "read",
     "send",
+    "send_batch",
     "maintained_nodes_state",
     "save_scene",
     "save_scene_as",
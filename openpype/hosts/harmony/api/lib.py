@@ -516,6 +516,15 @@ def send(request):
     return ProcessContext.server.send(request)
 
 
+def send_batch(requests):
+    """Send multiple requests to Harmony without waiting on each of them.
+
+    Returns:
+        list[dict]: Replies in order of requests.
+    """
+    return ProcessContext.server.send_batch(requests)
+
+
 def select_nodes(nodes):
     """ Selects nodes in Node View """
     _ = send(
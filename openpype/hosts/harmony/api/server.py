@@ -6,22 +6,28 @@ import json
 import traceback
 import importlib
 import functools
-import time
 import struct
 from datetime import datetime
 import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from . import lib
 
+# Seconds to wait for a reply before logging and retrying
+REPLY_TIMEOUT = 30
+REPLY_RETRIES = 30
+
 
 class Server(threading.Thread):
     """Class for communication with Toon Boon Harmony.
 
+    Requests can be pipelined, each request waiting for reply gets future
+    which is resolved by `receive` loop when reply with the same message id
+    arrives.
+
     Attributes:
         connection (Socket): connection holding object.
-        received (str): received data buffer.any(iterable)
         port (int): port number.
-        message_id (int): index of last message going out.
-        queue (dict): dictionary holding queue of incoming messages.
+        message_id (int): index of next message going out.
 
     """
 
@@ -30,9 +36,13 @@ class Server(threading.Thread):
         super(Server, self).__init__()
         self.daemon = True
         self.connection = None
-        self.received = ""
         self.port = port
         self.message_id = 1
+        self._connected = threading.Event()
+        # Guards message id, futures and writes to socket
+        self._lock = threading.Lock()
+        # Futures waiting for reply by message id
+        self._pending = {}
 
         # Setup logging.
         self.log = logging.getLogger(__name__)
@@ -51,7 +61,6 @@ class Server(threading.Thread):
 
         # Listen for incoming connections
         self.socket.listen(1)
-        self.queue = {}
 
     def process_request(self, request):
         """Process incoming request.
@@ -81,25 +90,34 @@ class Server(threading.Thread):
         except Exception:
             self.log.error(traceback.format_exc())
 
+    def _recv_exactly(self, length):
+        """Receive exactly `length` bytes from `self.connection`.
+
+        Returns:
+            bytes: Received data, shorter if connection was closed.
+        """
+        data = b""
+        while len(data) < length:
+            try:
+                chunk = self.connection.recv(length - len(data))
+            except (OSError, AttributeError):
+                # could happen on MacOS or when connection was closed
+                break
+            if not chunk:
+                break
+            data += chunk
+        return data
+
     def receive(self):
         """Receives data from `self.connection`.
 
         When the data is a json serializable string, a reply is sent then
-        processing of the request.
+        processing of the request. Replies to requests sent by server are
+        passed to futures waiting for them.
         """
-        current_time = time.time()
         while True:
-            self.log.info("wait ttt")
-            # Receive the data in small chunks and retransmit it
-            request = None
-            try:
-                header = self.connection.recv(10)
-            except OSError:
-                # could happen on MacOS
-                self.log.info("")
-                break
-
-            if len(header) == 0:
+            header = self._recv_exactly(10)
+            if len(header) < 10:
                 # null data received, socket is closing.
                 self.log.info(f"[{self.timestamp()}] Connection closing.")
                 break
@@ -109,59 +127,51 @@ class Server(threading.Thread):
             content_length_str = header[2:].decode()
 
             length = int(content_length_str, 16)
-            data = self.connection.recv(length)
-            while (len(data) < length):
-                # we didn't received everything in first try, lets wait for
-                # all data.
-                self.log.info("loop")
-                time.sleep(0.1)
-                if self.connection is None:
-                    self.log.error(f"[{self.timestamp()}] "
-                                   "Connection is broken")
-                    break
-                if time.time() > current_time + 30:
-                    self.log.error(f"[{self.timestamp()}] Connection timeout.")
-                    break
-
-                data += self.connection.recv(length - len(data))
-            self.log.debug("data:: {} {}".format(data, type(data)))
-            self.received += data.decode("utf-8")
-            pretty = self._pretty(self.received)
+            data = self._recv_exactly(length)
+            if len(data) < length:
+                self.log.error(f"[{self.timestamp()}] Connection is broken")
+                break
+
+            received = data.decode("utf-8")
+            pretty = self._pretty(received)
             self.log.debug(
                 f"[{self.timestamp()}] Received:\n{pretty}")
 
             try:
-                request = json.loads(self.received)
+                request = json.loads(received)
             except json.decoder.JSONDecodeError as e:
                 self.log.error(f"[{self.timestamp()}] "
                                f"Invalid message received.\n{e}",
                                exc_info=True)
+                continue
 
-            self.received = ""
-            if request is None:
+            if "reply" in request.keys():
+                self._resolve_reply(request)
                 continue
 
-            if "message_id" in request.keys():
-                message_id = request["message_id"]
-                self.message_id = message_id + 1
-                self.log.debug(f"--- storing request as {message_id}")
-                self.queue[message_id] = request
-            if "reply" not in request.keys():
-                request["reply"] = True
-                self.send(request)
-                self.process_request(request)
-
-                if "message_id" in request.keys():
-                    try:
-                        self.log.debug(f"[{self.timestamp()}] "
-                                       f"Removing from the queue {message_id}")
-                        del self.queue[message_id]
-                    except IndexError:
-                        self.log.debug(f"[{self.timestamp()}] "
-                                       f"{message_id} is no longer in queue")
-            else:
-                self.log.debug(f"[{self.timestamp()}] "
-                               "received data was just a reply.")
+            request["reply"] = True
+            self.send(request)
+            self.process_request(request)
+
+        self._fail_pending(ConnectionError("Connection to Harmony closed."))
+
+    def _resolve_reply(self, reply):
+        message_id = reply.get("message_id")
+        with self._lock:
+            future = self._pending.pop(message_id, None)
+        if future is None:
+            self.log.debug(f"[{self.timestamp()}] "
+                           f"received data was just a reply ({message_id}).")
+            return
+        self.log.debug(f"[{self.timestamp()}] Got reply id {message_id}")
+        future.set_result(reply)
+
+    def _fail_pending(self, exc):
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            future.set_exception(exc)
 
     def run(self):
         """Entry method for server.
@@ -172,6 +182,7 @@ class Server(threading.Thread):
         timestamp = datetime.now().strftime("%H:%M:%S.%f")
         self.log.debug(f"[{timestamp}] Waiting for a connection.")
         self.connection, client_address = self.socket.accept()
+        self._connected.set()
 
         timestamp = datetime.now().strftime("%H:%M:%S.%f")
         self.log.debug(f"[{timestamp}] Connection from: {client_address}")
@@ -193,75 +204,108 @@ class Server(threading.Thread):
 
         self.socket.close()
 
-    def _send(self, message):
-        """Send a message to Harmony.
+    def _send(self, request, future=None):
+        """Send a request to Harmony.
+
+        Message id is assigned to request and future waiting for reply is
+        registered before the request is sent.
 
         Args:
-            message (str): Data to send to Harmony.
+            request (dict): Data to send to Harmony.
+            future (Optional[Future]): Future resolved with reply.
         """
         # Wait for a connection.
-        while not self.connection:
-            pass
-
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")
-        encoded = message.encode("utf-8")
-        coded_message = b"AH" + struct.pack('>I', len(encoded)) + encoded
-        pretty = self._pretty(coded_message)
-        self.log.debug(
-            f"[{timestamp}] Sending [{self.message_id}]:\n{pretty}")
-        self.log.debug(f"--- Message length: {len(encoded)}")
-        self.connection.sendall(coded_message)
-        self.message_id += 1
-
-    def send(self, request):
-        """Send a request in dictionary to Harmony.
+        self._connected.wait()
+
+        with self._lock:
+            message_id = self.message_id
+            self.message_id += 1
+            request["message_id"] = message_id
+            if future is not None:
+                self._pending[message_id] = future
+
+            encoded = json.dumps(request).encode("utf-8")
+            coded_message = b"AH" + struct.pack('>I', len(encoded)) + encoded
+            pretty = self._pretty(coded_message)
+            self.log.debug(
+                f"[{self.timestamp()}] Sending [{message_id}]:\n{pretty}")
+            self.log.debug(f"--- Message length: {len(encoded)}")
+            try:
+                self.connection.sendall(coded_message)
+            except Exception:
+                self._pending.pop(message_id, None)
+                raise
 
-        Waits for a reply from Harmony.
+    def send_async(self, request):
+        """Send a request to Harmony without waiting for reply.
 
         Args:
             request (dict): Data to send to Harmony.
+
+        Returns:
+            Future: Resolved with reply from Harmony. Already resolved with
+                None if request is a reply.
         """
-        request["message_id"] = self.message_id
-        self._send(json.dumps(request))
+        future = Future()
         if request.get("reply"):
+            self._send(request)
             timestamp = datetime.now().strftime("%H:%M:%S.%f")
             self.log.debug(
                 f"[{timestamp}] sent reply, not waiting for anything.")
-            return None
-        result = None
-        current_time = time.time()
-        try_index = 1
-        while True:
-            time.sleep(0.1)
-            if time.time() > current_time + 30:
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")
-                self.log.error((f"[{timestamp}][{self.message_id}] "
-                                "No reply from Harmony in 30s. "
-                                f"Retrying {try_index}"))
-                try_index += 1
-                current_time = time.time()
-            if try_index > 30:
-                break
-            try:
-                result = self.queue[request["message_id"]]
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")
-                self.log.debug((f"[{timestamp}] Got request "
-                                f"id {self.message_id}, "
-                                "removing from queue"))
-                del self.queue[request["message_id"]]
-                break
-            except KeyError:
-                # response not in received queue yey
-                pass
+            future.set_result(None)
+            return future
+
+        self._send(request, future)
+        return future
+
+    def wait_for_reply(self, future):
+        """Wait for reply of request sent with `send_async`.
+
+        Args:
+            future (Future): Future returned by `send_async`.
+
+        Returns:
+            Union[dict, None]: Reply from Harmony or None if Harmony did not
+                reply in time.
+        """
+        for try_index in range(1, REPLY_RETRIES + 1):
             try:
-                result = json.loads(self.received)
-                break
-            except json.decoder.JSONDecodeError:
-                pass
+                return future.result(timeout=REPLY_TIMEOUT)
+            except FutureTimeoutError:
+                self.log.error((f"[{self.timestamp()}] "
+                                f"No reply from Harmony in {REPLY_TIMEOUT}s. "
+                                f"Retrying {try_index}"))
+
+        with self._lock:
+            for message_id, pending in tuple(self._pending.items()):
+                if pending is future:
+                    del self._pending[message_id]
+        return None
 
-        self.received = ""
+    def send(self, request):
+        """Send a request in dictionary to Harmony.
+
+        Waits for a reply from Harmony.
+
+        Args:
+            request (dict): Data to send to Harmony.
+        """
+        return self.wait_for_reply(self.send_async(request))
+
+    def send_batch(self, requests):
+        """Send multiple requests to Harmony and wait for all replies.
 
-        return result
+        All requests are sent before waiting, Harmony processes them in
+        order they were sent.
+
+        Args:
+            requests (Iterable[dict]): Data to send to Harmony.
+
+        Returns:
+            list[Union[dict, None]]: Replies in order of requests.
+        """
+        futures = [self.send_async(request) for request in requests]
+        return [self.wait_for_reply(future) for future in futures]
 
     def _pretty(self, message) -> str:
         # result = pformat(message, indent=2)
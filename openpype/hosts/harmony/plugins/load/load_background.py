@@ -256,20 +256,21 @@ class BackgroundLoader(load.LoaderPlugin):
 
         subset_name = context["subset"]["name"]
         # read_node_name += "_{}".format(uuid.uuid4())
-        container_nodes = []
-
+        requests = []
         for layer in sorted(layers):
             file_to_import = [
                 os.path.join(bg_folder, layer).replace("\\", "/")
             ]
-
-            read_node = harmony.send(
+            requests.append(
                 {
                     "function": copy_files + import_files,
                     "args": ["Top", file_to_import, layer, 1]
                 }
-            )["result"]
-            container_nodes.append(read_node)
+            )
+
+        container_nodes = [
+            reply["result"] for reply in harmony.send_batch(requests)
+        ]
 
         return harmony.containerise(
             subset_name,
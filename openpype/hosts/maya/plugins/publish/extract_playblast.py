@@ -2,6 +2,7 @@ import os
 
 import clique
 
+from openpype.lib import get_collections
 from openpype.pipeline import publish
 from openpype.hosts.maya.api import lib
 
@@ -60,9 +61,8 @@ class ExtractPlayblast(publish.Extractor):
         lib.render_capture_preset(preset)
 
         # Find playblast sequence
-        collected_files = os.listdir(stagingdir)
         patterns = [clique.PATTERNS["frames"]]
-        collections, remainder = clique.assemble(collected_files,
+        collections, remainder = get_collections(stagingdir,
                                                  minimum_items=1,
                                                  patterns=patterns)
 
@@ -1,6 +1,7 @@
 import os
 import pyblish.api
 import clique
+from openpype.lib import find_missing_frames
 from openpype.pipeline import PublishXmlValidationError
 from openpype.pipeline.publish import get_errored_instances_from_context
 
@@ -94,7 +95,13 @@ class ValidateRenderedFrames(pyblish.api.InstancePlugin):
                         self, msg, formatting_data=f_data)
 
                 if not collection.is_contiguous():
-                    msg = "Some frames appear to be missing"
+                    missing_frames = find_missing_frames(
+                        collection.indexes,
+                        min(collection.indexes),
+                        max(collection.indexes)
+                    )
+                    msg = "Some frames appear to be missing: {}".format(
+                        ", ".join(str(frame) for frame in missing_frames))
                     self.log.error(msg)
                     raise PublishXmlValidationError(
                         self, msg, formatting_data=f_data)
@@ -316,6 +316,10 @@ class PhotoshopRoute(WebSocketRoute):
     async def ping(self):
         log.debug("someone called Photoshop route ping")
 
+    async def client_connected(self):
+        """Extension announced support of batch calls."""
+        PhotoshopServerStub.cache.register_client(self.socket)
+
     # This method calls function on the client side
     # client functions
     async def set_context(self, project, asset, task):
@@ -80,6 +80,4 @@ def maintained_visibility(layers=None):
     try:
         yield
     finally:
-        for layer in layers:
-            stub().set_visible(layer.id, visibility[layer.id])
-            pass
+        stub().set_visible_many(visibility)
@@ -7,6 +7,7 @@ import attr
 from wsrpc_aiohttp import WebSocketAsync
 
 from openpype.tools.adobe_webserver.app import WebServerTool
+from openpype.tools.adobe_webserver.document_cache import DocumentCache
 
 
 @attr.s
@@ -46,10 +47,15 @@ class PhotoshopServerStub:
         Expects that client is already connected (started when avalon menu
         is opened).
         'self.websocketserver.call' is used as async wrapper
+
+        Layers and metadata of document are cached in 'cache.snapshot()'
+        context, cache is shared by all stubs, see 'DocumentCache'.
     """
     PUBLISH_ICON = '\u2117 '
     LOADED_ICON = '\u25bc'
 
+    cache = DocumentCache()
+
     def __init__(self):
         self.websocketserver = WebServerTool.get_instance()
         self.client = self.get_client()
@@ -69,6 +75,43 @@ class PhotoshopServerStub:
 
         return client
 
+    def _call(self, method, **kwargs):
+        return self.websocketserver.call(self.client.call(method, **kwargs))
+
+    def _cached_call(self, method, **kwargs):
+        key = (method, tuple(sorted(kwargs.items())))
+        return self.cache.get(key, lambda: self._call(method, **kwargs))
+
+    def call_batch(self, calls):
+        """Call multiple client methods in one websocket message.
+
+        Methods are called in order. Older extension which doesn't support
+        batch calls gets the calls one by one.
+
+        Args:
+            calls (list of tuple): method name and dictionary of arguments,
+                e.g. [('Photoshop.set_visible', {'layer_id': 1,
+                'visibility': False})]
+        Returns:
+            (list) results of calls in order
+        """
+        calls = list(calls)
+        if not calls:
+            return []
+        try:
+            if not self.cache.is_registered(self.client):
+                return [self._call(method, **kwargs)
+                        for method, kwargs in calls]
+
+            payload = json.dumps([
+                {"method": method, "params": kwargs}
+                for method, kwargs in calls
+            ])
+            res = self._call('Photoshop.batch', calls=payload)
+            return json.loads(res)
+        finally:
+            self.cache.invalidate()
+
     def open(self, path):
         """Open file located at 'path' (local).
 
@@ -79,6 +122,7 @@ class PhotoshopServerStub:
         self.websocketserver.call(
             self.client.call('Photoshop.open', path=path)
         )
+        self.cache.invalidate()
 
     def read(self, layer, layers_meta=None):
         """Parses layer metadata from Headline field of active document.
@@ -186,6 +230,7 @@ class PhotoshopServerStub:
         self.websocketserver.call(
             self.client.call('Photoshop.imprint', payload=payload)
         )
+        self.cache.invalidate(['Photoshop.read'])
 
     def get_layers(self):
         """Returns JSON document with all(?) layers in active document.
@@ -196,9 +241,7 @@ class PhotoshopServerStub:
                                      'type': 'GUIDE'|'FG'|'BG'|'OBJ'
                                      'visible': 'true'|'false'
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_layers')
-        )
+        res = self._cached_call('Photoshop.get_layers')
 
         return self._to_records(res)
 
@@ -269,6 +312,7 @@ class PhotoshopServerStub:
         ret = self.websocketserver.call(
             self.client.call('Photoshop.create_group', name=enhanced_name)
         )
+        self.cache.invalidate()
         # create group on PS is asynchronous, returns only id
         return PSItem(id=ret, name=name, group=True)
 
@@ -284,6 +328,7 @@ class PhotoshopServerStub:
                 'Photoshop.group_selected_layers', name=enhanced_name
             )
         )
+        self.cache.invalidate()
         res = self._to_records(res)
         if res:
             rec = res.pop()
@@ -386,6 +431,20 @@ class PhotoshopServerStub:
                 visibility=visibility
             )
         )
+        self.cache.invalidate()
+
+    def set_visible_many(self, visibility_by_id):
+        """Set visibility of multiple layers with one call.
+
+        Args:
+            visibility_by_id (dict): <int> layer id: <bool> visibility
+        Returns: None
+        """
+        self.call_batch([
+            ('Photoshop.set_visible',
+             {'layer_id': layer_id, 'visibility': visibility})
+            for layer_id, visibility in visibility_by_id.items()
+        ])
 
     def hide_all_others_layers(self, layers):
         """hides all layers that are not part of the list or that are not
@@ -408,9 +467,11 @@ class PhotoshopServerStub:
         """
         if not layers:
             layers = self.get_layers()
-        for layer in layers:
-            if layer.visible and layer.id not in extract_ids:
-                self.set_visible(layer.id, False)
+        self.set_visible_many({
+            layer.id: False
+            for layer in layers
+            if layer.visible and layer.id not in extract_ids
+        })
 
     def get_layers_metadata(self):
         """Reads layers metadata from Headline from active document in PS.
@@ -424,7 +485,7 @@ class PhotoshopServerStub:
                       "asset":"Town"}}
                 8 is layer(group) id - used for deletion, update etc.
         """
-        res = self.websocketserver.call(self.client.call('Photoshop.read'))
+        res = self._cached_call('Photoshop.read')
         layers_data = []
         try:
             if res:
@@ -458,6 +519,7 @@ class PhotoshopServerStub:
                 as_reference=as_reference
             )
         )
+        self.cache.invalidate()
         rec = self._to_records(res).pop()
         if rec:
             rec.name = rec.name.replace(self.LOADED_ICON, '')
@@ -481,6 +543,7 @@ class PhotoshopServerStub:
                 name=enhanced_name
             )
         )
+        self.cache.invalidate()
 
     def delete_layer(self, layer_id):
         """Deletes specific layer by it's id.
@@ -491,6 +554,7 @@ class PhotoshopServerStub:
         self.websocketserver.call(
             self.client.call('Photoshop.delete_layer', layer_id=layer_id)
         )
+        self.cache.invalidate()
 
     def rename_layer(self, layer_id, name):
         """Renames specific layer by it's id.
@@ -506,6 +570,7 @@ class PhotoshopServerStub:
                 name=name
             )
         )
+        self.cache.invalidate()
 
     def remove_instance(self, instance_id):
         cleaned_data = []
@@ -520,6 +585,7 @@ class PhotoshopServerStub:
         self.websocketserver.call(
             self.client.call('Photoshop.imprint', payload=payload)
         )
+        self.cache.invalidate(['Photoshop.read'])
 
     def get_extension_version(self):
         """Returns version number of installed extension."""
@@ -534,6 +600,7 @@ class PhotoshopServerStub:
         """
         # TODO change client.call to method with checks for client
         self.websocketserver.call(self.client.call('Photoshop.close'))
+        self.cache.invalidate()
 
     def _to_records(self, res):
         """Converts string json representation into list of PSItem for
@@ -57,8 +57,9 @@ class ExtractImage(pyblish.api.ContextPlugin):
                                       get_layers_in_layers_ids(ids, all_layers)
                                        if ll.id not in hidden_layer_ids])
 
-                    for extracted_id in extract_ids:
-                        stub.set_visible(extracted_id, True)
+                    stub.set_visible_many(
+                        {extracted_id: True for extracted_id in extract_ids}
+                    )
 
                     file_basename = os.path.splitext(
                         stub.get_active_document_name()
@@ -86,8 +87,9 @@ class ExtractImage(pyblish.api.ContextPlugin):
 
                     self.log.info(f"Extracted {instance} to {staging_dir}")
 
-                    for extracted_id in extract_ids:
-                        stub.set_visible(extracted_id, False)
+                    stub.set_visible_many(
+                        {extracted_id: False for extracted_id in extract_ids}
+                    )
 
     def staging_dir(self, instance):
         """Provide a temporary directory in which to store extracted files
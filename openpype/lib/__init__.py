@@ -102,6 +102,7 @@ from .profiles_filtering import (
 
 from .transcoding import (
     get_transcode_temp_directory,
+    clear_probe_cache,
     should_convert_for_ffmpeg,
     convert_for_ffmpeg,
     convert_input_paths_for_ffmpeg,
@@ -146,6 +147,15 @@ from .plugin_tools import (
     source_hash,
 )
 
+from .file_sequences import (
+    FileSequence,
+    scan_directory,
+    get_sequences,
+    get_collections,
+    find_missing_frames,
+    clear_sequence_cache,
+)
+
 from .path_tools import (
     format_file_size,
     collect_frames,
@@ -224,6 +234,7 @@ __all__ = [
     "is_func_signature_supported",
 
     "get_transcode_temp_directory",
+    "clear_probe_cache",
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
     "convert_input_paths_for_ffmpeg",
@@ -263,6 +274,13 @@ __all__ = [
     "prepare_template_data",
     "source_hash",
 
+    "FileSequence",
+    "scan_directory",
+    "get_sequences",
+    "get_collections",
+    "find_missing_frames",
+    "clear_sequence_cache",
+
     "format_file_size",
     "collect_frames",
     "create_hard_link",
@@ -0,0 +1,325 @@
+"""Index of file sequences in directories.
+
+Directories with renders are listed and assembled to sequences many times
+during a single publish, which is slow on network storage. Directory is
+scanned once with 'os.scandir' and the result is cached until
+modification time of the directory changes. Assembled sequences are cached
+on the scan result.
+
+Modification time of directory changes when files are added, removed or
+renamed, but not when existing file is rewritten in place. Use
+'clear_sequence_cache' when sizes of files must be re-read.
+"""
+import os
+import time
+import threading
+import collections
+
+import clique
+
+# Directory which was modified right before scan may be modified again
+#   within mtime resolution of filesystem, such scan is not cached
+_RACY_MTIME_SECONDS = 2
+_MAX_CACHED_DIRECTORIES = 128
+
+_CACHE = collections.OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def get_frame_ranges(frames):
+    """Split frames to ranges of consecutive frames.
+
+    Args:
+        frames (Iterable[int]): Frame numbers.
+
+    Returns:
+        list[tuple[int, int]]: Start and end frame of each range.
+    """
+    frames = sorted(set(frames))
+    if not frames:
+        return []
+
+    ranges = []
+    range_start = previous = frames[0]
+    for frame in frames[1:]:
+        if frame != previous + 1:
+            ranges.append((range_start, previous))
+            range_start = frame
+        previous = frame
+    ranges.append((range_start, previous))
+    return ranges
+
+
+def find_missing_frames(frames, frame_start, frame_end):
+    """Frames in range which are not in passed frames.
+
+    Args:
+        frames (Iterable[int]): Existing frame numbers.
+        frame_start (int): First expected frame.
+        frame_end (int): Last expected frame.
+
+    Returns:
+        list[int]: Sorted missing frames.
+    """
+    missing = set(range(int(frame_start), int(frame_end) + 1))
+    missing.difference_update(frames)
+    return sorted(missing)
+
+
+class FileSequence(object):
+    """Sequence of files in a directory.
+
+    Args:
+        dirpath (str): Directory of the sequence.
+        head (str): Part of filename before frame number.
+        tail (str): Part of filename after frame number.
+        padding (int): Padding of frame number, 0 if not padded.
+        frames (list[int]): Sorted frame numbers.
+        sizes (list[int]): Sizes of files in order of frames.
+    """
+    def __init__(self, dirpath, head, tail, padding, frames, sizes):
+        self.dirpath = dirpath
+        self.head = head
+        self.tail = tail
+        self.padding = padding
+        self.frames = tuple(frames)
+        self.sizes = tuple(sizes)
+
+    def __repr__(self):
+        return "<{} {} [{}]>".format(
+            self.__class__.__name__, self.pattern, self.frames_label
+        )
+
+    @property
+    def frame_start(self):
+        return self.frames[0]
+
+    @property
+    def frame_end(self):
+        return self.frames[-1]
+
+    @property
+    def frames_label(self):
+        """Frame ranges in human readable form, e.g. '1001-1010, 1012'."""
+        return ", ".join(
+            str(start) if start == end else "{}-{}".format(start, end)
+            for start, end in get_frame_ranges(self.frames)
+        )
+
+    @property
+    def pattern(self):
+        """Filename with frame number as printf pattern, e.g. 'a.%04d.exr'.
+        """
+        frame_format = "%0{}d".format(self.padding) if self.padding else "%d"
+        return self.head + frame_format + self.tail
+
+    @property
+    def total_size(self):
+        return sum(self.sizes)
+
+    def format_filename(self, frame):
+        return "{}{}{}".format(
+            self.head, str(frame).zfill(self.padding), self.tail
+        )
+
+    @property
+    def filenames(self):
+        return [self.format_filename(frame) for frame in self.frames]
+
+    @property
+    def filepaths(self):
+        return [
+            os.path.join(self.dirpath, filename)
+            for filename in self.filenames
+        ]
+
+    def get_frame_ranges(self):
+        return get_frame_ranges(self.frames)
+
+    def get_missing_frames(self, frame_start=None, frame_end=None):
+        """Missing frames in range, sequence range is used by default."""
+        if frame_start is None:
+            frame_start = self.frame_start
+        if frame_end is None:
+            frame_end = self.frame_end
+        return find_missing_frames(self.frames, frame_start, frame_end)
+
+    def is_contiguous(self):
+        return len(self.frames) == self.frame_end - self.frame_start + 1
+
+    def to_collection(self):
+        """Convert to 'clique.Collection' with filenames."""
+        return clique.Collection(
+            self.head, self.tail, self.padding, indexes=set(self.frames)
+        )
+
+
+class DirectoryIndex(object):
+    """Result of directory scan.
+
+    Args:
+        dirpath (str): Scanned directory.
+        mtime (float): Modification time of directory before scan.
+        sizes (dict[str, int]): Sizes of files by filename.
+    """
+    def __init__(self, dirpath, mtime, sizes):
+        self.dirpath = dirpath
+        self.mtime = mtime
+        self.sizes = sizes
+        self._sequences = {}
+        self._lock = threading.Lock()
+
+    @property
+    def filenames(self):
+        return list(self.sizes.keys())
+
+    def get_sequences(self, patterns=None, minimum_items=2):
+        """Assemble files to sequences.
+
+        Arguments are passed to 'clique.assemble'.
+
+        Returns:
+            tuple[list[FileSequence], list[str]]: Sequences and filenames
+                which are not part of any sequence.
+        """
+        key = (tuple(patterns or []), minimum_items)
+        with self._lock:
+            result = self._sequences.get(key)
+            if result is None:
+                result = self._assemble(patterns, minimum_items)
+                self._sequences[key] = result
+        sequences, remainder = result
+        return list(sequences), list(remainder)
+
+    def _assemble(self, patterns, minimum_items):
+        collections_, remainder = clique.assemble(
+            self.sizes.keys(),
+            patterns=patterns,
+            minimum_items=minimum_items
+        )
+        sequences = []
+        for collection in collections_:
+            frames = sorted(collection.indexes)
+            sequence = FileSequence(
+                self.dirpath,
+                collection.head,
+                collection.tail,
+                collection.padding,
+                frames,
+                []
+            )
+            sequence.sizes = tuple(
+                self.sizes[filename] for filename in sequence.filenames
+            )
+            sequences.append(sequence)
+        sequences.sort(key=lambda item: (item.head, item.tail))
+        return tuple(sequences), tuple(sorted(remainder))
+
+
+def _scan(dirpath):
+    sizes = {}
+    scandir = getattr(os, "scandir", None)
+    if scandir is None:
+        # Python 2
+        for filename in os.listdir(dirpath):
+            filepath = os.path.join(dirpath, filename)
+            if os.path.isfile(filepath):
+                sizes[filename] = os.path.getsize(filepath)
+        return sizes
+
+    for entry in scandir(dirpath):
+        try:
+            if entry.is_file():
+                sizes[entry.name] = entry.stat().st_size
+        except OSError:
+            # File was removed during scan
+            continue
+    return sizes
+
+
+def scan_directory(dirpath):
+    """Scan files in directory.
+
+    Result is cached until modification time of directory changes.
+
+    Args:
+        dirpath (str): Path to directory.
+
+    Returns:
+        DirectoryIndex: Files in directory.
+
+    Raises:
+        OSError: Directory does not exist or can't be listed.
+    """
+    dirpath = os.path.normpath(dirpath)
+    mtime = os.stat(dirpath).st_mtime
+    key = os.path.normcase(os.path.abspath(dirpath))
+    with _CACHE_LOCK:
+        index = _CACHE.get(key)
+        if index is not None and index.mtime == mtime:
+            _CACHE[key] = _CACHE.pop(key)
+            return index
+
+    index = DirectoryIndex(dirpath, mtime, _scan(dirpath))
+    if time.time() - mtime < _RACY_MTIME_SECONDS:
+        return index
+
+    with _CACHE_LOCK:
+        _CACHE[key] = index
+        while len(_CACHE) > _MAX_CACHED_DIRECTORIES:
+            _CACHE.popitem(last=False)
+    return index
+
+
+def get_sequences(dirpath, ext=None, patterns=None, minimum_items=2):
+    """Sequences of files in directory.
+
+    Args:
+        dirpath (str): Path to directory.
+        ext (Optional[str]): Return only sequences with this extension.
+        patterns (Optional[list[str]]): Patterns for 'clique.assemble'.
+        minimum_items (int): Minimum number of files in sequence.
+
+    Returns:
+        tuple[list[FileSequence], list[str]]: Sequences and filenames
+            which are not part of any sequence.
+    """
+    sequences, remainder = scan_directory(dirpath).get_sequences(
+        patterns, minimum_items
+    )
+    if ext:
+        ext = "." + ext.lstrip(".")
+        sequences = [
+            sequence
+            for sequence in sequences
+            if sequence.tail.endswith(ext)
+        ]
+    return sequences, remainder
+
+
+def get_collections(dirpath, patterns=None, minimum_items=2):
+    """Cached replacement of 'clique.assemble(os.listdir(dirpath))'.
+
+    Args:
+        dirpath (str): Path to directory.
+        patterns (Optional[list[str]]): Patterns for 'clique.assemble'.
+        minimum_items (int): Minimum number of files in collection.
+
+    Returns:
+        tuple[list[clique.Collection], list[str]]: Collections of
+            filenames and filenames which are not part of any collection.
+    """
+    sequences, remainder = scan_directory(dirpath).get_sequences(
+        patterns, minimum_items
+    )
+    return [sequence.to_collection() for sequence in sequences], remainder
+
+
+def clear_sequence_cache(dirpath=None):
+    """Clear cached scans of all directories or of one directory."""
+    with _CACHE_LOCK:
+        if dirpath is None:
+            _CACHE.clear()
+            return
+        key = os.path.normcase(os.path.abspath(os.path.normpath(dirpath)))
+        _CACHE.pop(key, None)
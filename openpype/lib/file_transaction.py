@@ -2,6 +2,10 @@ import os
 import logging
 import sys
 import errno
+import json
+import uuid
+import hashlib
+import threading
 import six
 
 from openpype.lib import create_hard_link
@@ -12,6 +16,22 @@ if sys.platform == "win32":
 else:
     from shutil import copyfile
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Size of chunks used for checksums and zero copy
+_CHUNK_SIZE = 8 * 1024 * 1024
+# Errors of 'copy_file_range' when it is not supported for the files
+_ZERO_COPY_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+}
+
 
 class DuplicateDestinationError(ValueError):
     """Error raised when transfer destination already exists in queue.
@@ -23,6 +43,166 @@ class DuplicateDestinationError(ValueError):
     """
 
 
+class TransferVerificationError(IOError):
+    """Error raised when checksum of transferred file does not match source.
+
+    The error is only raised if `checksum_algorithm` is set on
+    the FileTransaction instance.
+
+    """
+
+
+def get_checksum_hasher(algorithm):
+    """Create hash object for checksum algorithm.
+
+    Args:
+        algorithm (str): Name of algorithm. Supports 'xxhash' (requires
+            'xxhash' module) and any algorithm available in 'hashlib'.
+
+    Returns:
+        Any: Object with 'update' and 'hexdigest' methods.
+    """
+
+    if algorithm == "xxhash":
+        if xxhash is None:
+            raise ValueError("Python module 'xxhash' is not available.")
+        return xxhash.xxh64()
+    return hashlib.new(algorithm)
+
+
+def get_file_checksum(path, algorithm="sha256"):
+    """Calculate checksum of file content reading it in chunks.
+
+    Args:
+        path (str): Path to file.
+        algorithm (Optional[str]): Checksum algorithm.
+
+    Returns:
+        str: Hex digest of file content.
+    """
+
+    hasher = get_checksum_hasher(algorithm)
+    with open(path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def zero_copy_file(src, dst):
+    """Copy file using 'copy_file_range' if available.
+
+    Data are copied in kernel without passing through user space and
+    network filesystems (NFS 4.2, SMB) can do server side copy. Falls
+    back to regular copy if 'copy_file_range' is not available or is not
+    supported for the paths.
+
+    Args:
+        src (str): Source path.
+        dst (str): Destination path.
+    """
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        copyfile(src, dst)
+        return
+
+    with open(src, "rb") as src_stream, open(dst, "wb") as dst_stream:
+        src_fd = src_stream.fileno()
+        dst_fd = dst_stream.fileno()
+        try:
+            while copy_file_range(src_fd, dst_fd, _CHUNK_SIZE):
+                pass
+            return
+        except OSError as exc:
+            if exc.errno not in _ZERO_COPY_UNSUPPORTED_ERRNOS:
+                raise
+    copyfile(src, dst)
+
+
+class FileTransactionJournal(object):
+    """Append-only journal of file transaction stored as JSON lines.
+
+    Each line is a record with 'action' key and data of the action. The
+    journal is written while transaction is processed so interrupted
+    transaction can be resumed or rolled back in another process.
+
+    Actions:
+        queued: Transfer planned to be processed ('src', 'dst', 'mode').
+        backup: Existing destination file is moved to backup
+            ('dst', 'backup'). Written before the file is moved.
+        started: Transfer of file started ('dst').
+        done: Transfer of file finished ('dst').
+
+    Args:
+        path (str): Path to journal file.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._stream = None
+
+    @property
+    def path(self):
+        return self._path
+
+    def exists(self):
+        return os.path.exists(self._path)
+
+    def write(self, action, **data):
+        """Append record to journal.
+
+        Args:
+            action (str): Action name.
+            **data (Any): Data of action.
+        """
+
+        data["action"] = action
+        line = json.dumps(data) + "\n"
+        with self._lock:
+            if self._stream is None:
+                self._stream = open(self._path, "a")
+            self._stream.write(line)
+            # Record must be on disk before the action happens
+            self._stream.flush()
+
+    def close(self):
+        with self._lock:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+
+    def read(self):
+        """Read records from journal.
+
+        Last line can be incomplete if process crashed during write, such
+        line is skipped.
+
+        Returns:
+            list[dict[str, Any]]: Records in order of writing.
+        """
+
+        records = []
+        if not self.exists():
+            return records
+
+        with open(self._path, "r") as stream:
+            for line in stream:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+        return records
+
+    def remove(self):
+        self.close()
+        if self.exists():
+            os.remove(self._path)
+
+
 class FileTransaction(object):
     """File transaction with rollback options.
 
@@ -33,7 +213,13 @@ class FileTransaction(object):
     3) Remove any backed up files (*no rollback possible!) during `finalize()`
 
     Step 3 is done during `finalize()`. If not called the .bak files will
-    remain on disk.
+    remain on disk. Backup files have unique names to not collide with
+    backups of other transactions.
+
+    When journal path is passed, every step is written into the journal
+    file. Transaction interrupted by crash can be recreated with
+    `from_journal` and then resumed with `process()`, which transfers only
+    files that were not finished, or reverted with `rollback()`.
 
     These steps try to ensure that we don't overwrite half of any existing
     files e.g. if they are currently in use.
@@ -47,19 +233,59 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Transfers can be processed in parallel by a pool of threads which
+    helps with latency of network storages. Backups are always created
+    before any transfer starts so rollback works the same way.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow to replace queued
+            transfer to the same destination with different source.
+        max_workers (Optional[int]): Number of threads used to transfer
+            files. Files are transferred one by one if is lower than 2.
+        zero_copy (Optional[bool]): Use 'copy_file_range' to copy files
+            when available (Linux).
+        checksum_algorithm (Optional[str]): Verify copied files by
+            comparing checksums of source and destination. Value can be
+            'xxhash' or name of 'hashlib' algorithm e.g. 'sha256'.
+        progress_callback (Optional[Callable[[str, str, int, int], None]]):
+            Called after each transferred file with source, destination,
+            number of processed and number of all transfers.
+        journal_path (Optional[str]): Path to journal file where progress
+            of transaction is stored. Journal is removed on finalize
+            or successful rollback.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=None,
+        zero_copy=False,
+        checksum_algorithm=None,
+        progress_callback=None,
+        journal_path=None,
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if checksum_algorithm:
+            # Validate that algorithm is available before any transfer
+            get_checksum_hasher(checksum_algorithm)
+
+        self._max_workers = max_workers or 1
+        self._zero_copy = zero_copy
+        self._checksum_algorithm = checksum_algorithm
+        self._progress_callback = progress_callback
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -72,6 +298,78 @@ class FileTransaction(object):
 
         self._allow_queue_replacements = allow_queue_replacements
 
+        self._journal = None
+        if journal_path:
+            self._journal = FileTransactionJournal(journal_path)
+        # Destinations which were processed by previous run of transaction
+        #   restored from journal
+        self._journal_restored = False
+        self._journal_started = set()
+        self._journal_done = set()
+
+    @classmethod
+    def from_journal(cls, journal_path, log=None, **kwargs):
+        """Recreate interrupted transaction from journal file.
+
+        Args:
+            journal_path (str): Path to journal file.
+            log (Optional[logging.Logger]): Logger used for output.
+            **kwargs (Any): Other arguments passed to '__init__'.
+
+        Returns:
+            FileTransaction: Transaction with queued transfers and backups
+                of the interrupted transaction.
+        """
+
+        journal = FileTransactionJournal(journal_path)
+        if not journal.exists():
+            raise ValueError(
+                "Journal file does not exist: {}".format(journal_path)
+            )
+
+        kwargs["allow_queue_replacements"] = True
+        transaction = cls(log=log, journal_path=journal_path, **kwargs)
+        transaction._journal_restored = True
+        for record in journal.read():
+            action = record["action"]
+            if action == "queued":
+                transaction._transfers[record["dst"]] = (
+                    record["src"], {"mode": record["mode"]}
+                )
+
+            elif action == "backup":
+                backup = record["backup"]
+                # Rename may not happen before crash
+                if os.path.exists(backup):
+                    transaction._backup_to_original[backup] = record["dst"]
+
+            elif action == "started":
+                transaction._journal_started.add(record["dst"])
+
+            elif action == "done":
+                transaction._journal_done.add(record["dst"])
+
+        for dst in transaction._journal_started:
+            if os.path.exists(dst):
+                transaction._transferred.append(dst)
+        return transaction
+
+    @property
+    def journal_path(self):
+        """Path to journal file if journal is used.
+
+        Returns:
+            Union[str, None]: Path to journal file.
+        """
+
+        if self._journal is not None:
+            return self._journal.path
+        return None
+
+    def _write_journal(self, action, **data):
+        if self._journal is not None:
+            self._journal.write(action, **data)
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
@@ -110,41 +408,141 @@ class FileTransaction(object):
         self._transfers[dst] = (src, opts)
 
     def process(self):
+        if not self._journal_restored:
+            for dst, (src, opts) in self._transfers.items():
+                self._write_journal(
+                    "queued", src=src, dst=dst, mode=opts["mode"]
+                )
+
         # Backup any existing files
+        backed_up = set(self._backup_to_original.values())
         for dst, (src, _) in self._transfers.items():
+            # Destinations of resumed transaction contain files created
+            #   by the transaction
+            if dst in backed_up or dst in self._journal_started:
+                continue
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
             path_same = self._same_paths(src, dst)
             if path_same or not os.path.exists(dst):
                 continue
 
             # Backup original file
-            # todo: add timestamp or uuid to ensure unique
-            backup = dst + ".bak"
+            backup = self._get_backup_path(dst)
+            self._write_journal("backup", dst=dst, backup=backup)
             self._backup_to_original[backup] = dst
             self.log.debug(
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
 
         # Copy the files to transfer
+        transfers = []
         for dst, (src, opts) in self._transfers.items():
+            if dst in self._journal_done and os.path.exists(dst):
+                self.log.debug(
+                    "File was already transferred {} -> {}".format(src, dst))
+                continue
+
             path_same = self._same_paths(src, dst)
             if path_same:
                 self.log.debug(
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
                 continue
+            transfers.append((src, dst, opts))
 
-            self._create_folder_for_file(dst)
+        if self._journal_restored:
+            # Unfinished files of resumed transaction are transferred again
+            pending = {dst for _, dst, _ in transfers}
+            self._transferred = [
+                path for path in self._transferred if path not in pending
+            ]
+
+        if self._max_workers > 1 and len(transfers) > 1:
+            self._process_transfers_parallel(transfers)
+            return
 
+        total = len(transfers)
+        for idx, (src, dst, opts) in enumerate(transfers):
+            self._create_folder_for_file(dst)
+            self._transfer_file(src, dst, opts)
+            if self._progress_callback is not None:
+                self._progress_callback(src, dst, idx + 1, total)
+
+    def _process_transfers_parallel(self, transfers):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        # Create folders upfront so workers don't race on them
+        dirnames = {os.path.dirname(dst) for _, dst, _ in transfers}
+        for dirname in sorted(dirnames):
+            self._create_folder(dirname)
+
+        total = len(transfers)
+        processed = 0
+        error = None
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(self._transfer_file, src, dst, opts): (
+                    src, dst
+                )
+                for src, dst, opts in transfers
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+
+                exc = future.exception()
+                if exc is not None:
+                    if error is None:
+                        error = exc
+                        # Don't start any other transfers
+                        for other_future in futures:
+                            other_future.cancel()
+                    continue
+
+                processed += 1
+                if self._progress_callback is not None:
+                    src, dst = futures[future]
+                    self._progress_callback(src, dst, processed, total)
+
+        if error is not None:
+            raise error
+
+    def _transfer_file(self, src, dst, opts):
+        self._write_journal("started", dst=dst)
+        try:
             if opts["mode"] == self.MODE_COPY:
                 self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
+                if self._zero_copy:
+                    zero_copy_file(src, dst)
+                else:
+                    copyfile(src, dst)
             elif opts["mode"] == self.MODE_HARDLINK:
                 self.log.debug("Hardlinking file ... {} -> {}".format(
                     src, dst))
                 create_hard_link(src, dst)
 
-            self._transferred.append(dst)
+        except Exception:
+            # Existing destination was moved to backup so anything on
+            #   the path is a partially written file which should be
+            #   removed on rollback
+            if os.path.exists(dst):
+                self._transferred.append(dst)
+            raise
+
+        self._transferred.append(dst)
+
+        if self._checksum_algorithm and opts["mode"] == self.MODE_COPY:
+            self._verify_transfer(src, dst)
+        self._write_journal("done", dst=dst)
+
+    def _verify_transfer(self, src, dst):
+        src_checksum = get_file_checksum(src, self._checksum_algorithm)
+        dst_checksum = get_file_checksum(dst, self._checksum_algorithm)
+        if src_checksum != dst_checksum:
+            raise TransferVerificationError(
+                "Checksum of transferred file does not match source:"
+                " {} -> {}".format(src, dst)
+            )
 
     def finalize(self):
         # Delete any backed up files
@@ -156,6 +554,9 @@ class FileTransaction(object):
                     "Failed to remove backup file: {}".format(backup),
                     exc_info=True)
 
+        if self._journal is not None:
+            self._journal.remove()
+
     def rollback(self):
         errors = 0
         # Rollback any transferred files
@@ -185,6 +586,9 @@ class FileTransaction(object):
                 exc_info=True)
             six.reraise(*sys.exc_info())
 
+        if self._journal is not None:
+            self._journal.remove()
+
     @property
     def transferred(self):
         """Return the processed transfers destination paths"""
@@ -195,8 +599,14 @@ class FileTransaction(object):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    @staticmethod
+    def _get_backup_path(path):
+        return "{}.{}.bak".format(path, uuid.uuid4().hex[:12])
+
     def _create_folder_for_file(self, path):
-        dirname = os.path.dirname(path)
+        self._create_folder(os.path.dirname(path))
+
+    def _create_folder(self, dirname):
         try:
             os.makedirs(dirname)
         except OSError as e:
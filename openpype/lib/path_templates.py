@@ -81,7 +81,18 @@ class TemplateUnsolved(Exception):
 
 
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Parsed parts of template are cached by template string so creation of
+    the same template multiple times does not parse it again. Parts are not
+    modified during formatting so they can be shared between objects.
+    """
+
+    # Cache of parsed template parts by template string
+    _parsed_parts_cache = {}
+    # Cache is cleared when reaches the limit to avoid unbound growth
+    _parsed_parts_cache_limit = 2048
+
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -89,6 +100,30 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        self._parts = self._get_parsed_parts(template)
+
+    @classmethod
+    def _get_parsed_parts(cls, template):
+        """Get parsed parts of template from cache or parse it.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list[Union[str, FormattingPart, OptionalPart]]: Parsed parts.
+        """
+
+        parts = cls._parsed_parts_cache.get(template)
+        if parts is None:
+            parts = cls._parse_template(template)
+            cache = cls._parsed_parts_cache
+            if len(cache) >= cls._parsed_parts_cache_limit:
+                cache.clear()
+            cache[template] = parts
+        return parts
+
+    @classmethod
+    def _parse_template(cls, template):
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -119,7 +154,7 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -152,12 +187,87 @@ class StringTemplate(object):
                 data needed or missing for filling template.
         """
         result = TemplatePartResult()
-        for part in self._parts:
+        self._format_parts(self._parts, data, result)
+        return self._create_template_result(result)
+
+    def format_many(self, data, items):
+        """Format template multiple times with changing values.
+
+        Useful for sequences where only few keys change (e.g. 'frame' or
+        'udim') and the rest of data stays the same. Parts of template
+        before first part which uses any of changing keys are formatted
+        only once and the rest is formatted for each item.
+
+        Only top level keys of data can be changed by items.
+
+        Example:
+            >>> template = StringTemplate("{name}.{frame:0>4}.exr")
+            >>> results = template.format_many(
+            ...     {"name": "beauty"},
+            ...     ({"frame": frame} for frame in (1001, 1002))
+            ... )
+            >>> [str(result) for result in results]
+            ['beauty.1001.exr', 'beauty.1002.exr']
+
+        Args:
+            data (dict): Data which are same for all results.
+            items (Iterable[dict]): Data which are different for each
+                result e.g. '{"frame": 1001}'.
+
+        Returns:
+            list[TemplateResult]: Result for each item in passed order.
+        """
+
+        items = list(items)
+        if not items:
+            return []
+
+        changing_keys = set()
+        for item in items:
+            changing_keys |= set(item.keys())
+
+        prefix_len = len(self._parts)
+        for idx, part in enumerate(self._parts):
+            if isinstance(part, six.string_types):
+                continue
+            if part.root_keys & changing_keys:
+                prefix_len = idx
+                break
+
+        prefix_result = TemplatePartResult()
+        self._format_parts(self._parts[:prefix_len], data, prefix_result)
+        suffix_parts = self._parts[prefix_len:]
+
+        fill_data = dict(data)
+        output = []
+        for item in items:
+            fill_data.update(item)
+            result = prefix_result.copy()
+            self._format_parts(suffix_parts, fill_data, result)
+            output.append(self._create_template_result(result))
+        return output
+
+    def format_many_strict(self, data, items):
+        """Format template multiple times and validate results.
+
+        Same as 'format_many' but raises 'TemplateUnsolved' when any of
+        results is not solved.
+        """
+
+        results = self.format_many(data, items)
+        for result in results:
+            result.validate()
+        return results
+
+    @staticmethod
+    def _format_parts(parts, data, result):
+        for part in parts:
             if isinstance(part, six.string_types):
                 result.add_output(part)
             else:
                 part.format(data, result)
 
+    def _create_template_result(self, result):
         invalid_types = result.invalid_types
         invalid_types.update(result.invalid_optional_types)
         invalid_types = result.split_keys_to_subdicts(invalid_types)
@@ -562,6 +672,22 @@ class TemplatePartResult:
         # Is this result from optional part
         self._optional = True
 
+    def copy(self):
+        """Copy of result which can be modified without affecting source."""
+        new_result = self.__class__(self._optional)
+        new_result._missing_keys = set(self._missing_keys)
+        new_result._invalid_types = dict(self._invalid_types)
+        new_result._missing_optional_keys = set(
+            self._missing_optional_keys
+        )
+        new_result._invalid_optional_types = dict(
+            self._invalid_optional_types
+        )
+        new_result._used_values = dict(self._used_values)
+        new_result._realy_used_values = dict(self._realy_used_values)
+        new_result._output = self._output
+        return new_result
+
     def add_output(self, other):
         if isinstance(other, six.string_types):
             self._output += other
@@ -704,10 +830,32 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Parse the key only once, formatting may happen many times
+        # - check if key expects subdictionary keys (e.g. project[name])
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+        self._root_keys = frozenset(self._key_subdict[:1])
+
     @property
     def template(self):
         return self._template
 
+    @property
+    def root_keys(self):
+        """Top level keys of data used by the part.
+
+        Returns:
+            frozenset[str]: Keys used from formatting data.
+        """
+
+        return self._root_keys
+
     def __repr__(self):
         return "<Format:{}>".format(self._template)
 
@@ -732,17 +880,13 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
-        # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -818,11 +962,26 @@ class OptionalPart:
 
     def __init__(self, parts):
         self._parts = parts
+        root_keys = set()
+        for part in parts:
+            if not isinstance(part, six.string_types):
+                root_keys |= part.root_keys
+        self._root_keys = frozenset(root_keys)
 
     @property
     def parts(self):
         return self._parts
 
+    @property
+    def root_keys(self):
+        """Top level keys of data used by the part and its children.
+
+        Returns:
+            frozenset[str]: Keys used from formatting data.
+        """
+
+        return self._root_keys
+
     def __str__(self):
         return "<{}>".format("".join([str(p) for p in self._parts]))
 
@@ -12,16 +12,26 @@ This gives ability to create project where a changes and tests can be done.
 
 Keep in mind that to be able to create a package of project has few
 requirements. Possible requirement should be listed in 'pack_project' function.
+
+Function 'pack_project_stream' creates package directory which can be used
+for big projects. Documents are streamed from mongo to gzipped json lines,
+project files are split to multiple zip archives which are written in
+parallel and manifest with checksums allows incremental re-packing.
 """
 
 import os
 import json
+import gzip
+import fnmatch
+import hashlib
 import platform
 import tempfile
 import shutil
 import datetime
 
 import zipfile
+from bson.json_util import dumps, loads, CANONICAL_JSON_OPTIONS
+
 from openpype.client.mongo import (
     load_json_file,
     get_project_connection,
@@ -33,6 +43,19 @@ DOCUMENTS_FILE_NAME = "database"
 METADATA_FILE_NAME = "metadata"
 PROJECT_FILES_DIR = "project_files"
 
+MANIFEST_FILE_NAME = "manifest"
+DOCUMENTS_STREAM_NAME = DOCUMENTS_FILE_NAME + ".jsonl.gz"
+FILES_ARCHIVE_TEMPLATE = "files_{:03}.zip"
+PACKAGE_DIR_SUFFIX = "_package"
+DOCUMENTS_BATCH_SIZE = 1000
+FILE_CHUNK_SIZE = 1024 * 1024
+# Files which are already compressed are stored to zip without compression
+STORED_EXTENSIONS = {
+    ".7z", ".aac", ".avi", ".bz2", ".gz", ".jpeg", ".jpg", ".m4a", ".mkv",
+    ".mov", ".mp3", ".mp4", ".mxf", ".png", ".rar", ".webm", ".webp",
+    ".xz", ".zip",
+}
+
 
 def add_timestamp(filepath):
     """Add timestamp string to a file."""
@@ -61,51 +84,16 @@ def get_project_document(project_name, database_name=None):
     return col.find_one({"type": "project"})
 
 
-def _pack_files_to_zip(zip_stream, source_path, root_path):
-    """Pack files to a zip stream.
-
-    Args:
-        zip_stream (zipfile.ZipFile): Stream to a zipfile.
-        source_path (str): Path to a directory where files are.
-        root_path (str): Path to a directory which is used for calculation
-            of relative path.
-    """
-
-    for root, _, filenames in os.walk(source_path):
-        for filename in filenames:
-            filepath = os.path.join(root, filename)
-            # TODO add one more folder
-            archive_name = os.path.join(
-                PROJECT_FILES_DIR,
-                os.path.relpath(filepath, root_path)
-            )
-            zip_stream.write(filepath, archive_name)
-
-
-def pack_project(
-    project_name,
-    destination_dir=None,
-    only_documents=False,
-    database_name=None
+def _prepare_pack(
+    project_name, destination_dir, only_documents, database_name
 ):
-    """Make a package of a project with mongo documents and files.
-
-    This function has few restrictions:
-    - project must have only one root
-    - project must have all templates starting with
-        "{root[...]}/{project[name]}"
+    """Validate project and find its root.
 
-    Args:
-        project_name (str): Project that should be packaged.
-        destination_dir (Optional[str]): Optional path where zip will be
-            stored. Project's root is used if not passed.
-        only_documents (Optional[bool]): Pack only Mongo documents and skip
-            files.
-        database_name (Optional[str]): Custom database name from which is
-            project queried.
+    Returns:
+        tuple[dict[str, str], Union[str, None], str]: Root of project, path
+            to root on current platform and destination directory.
     """
 
-    print("Creating package of project \"{}\"".format(project_name))
     # Validate existence of project
     project_doc = get_project_document(project_name, database_name)
     if not project_doc:
@@ -121,7 +109,6 @@ def pack_project(
 
     root_path = None
     source_root = {}
-    project_source_path = None
     if not only_documents:
         roots = project_doc["config"]["roots"]
         # Determine root directory of project
@@ -144,7 +131,7 @@ def pack_project(
         if not os.path.exists(project_source_path):
             raise ValueError("Didn't find source of project files")
 
-    # Determine zip filepath where data will be stored
+    # Determine destination where data will be stored
     if not destination_dir:
         destination_dir = root_path
 
@@ -156,6 +143,60 @@ def pack_project(
     destination_dir = os.path.normpath(destination_dir)
     if not os.path.exists(destination_dir):
         os.makedirs(destination_dir)
+    return source_root, root_path, destination_dir
+
+
+def _pack_files_to_zip(zip_stream, source_path, root_path):
+    """Pack files to a zip stream.
+
+    Args:
+        zip_stream (zipfile.ZipFile): Stream to a zipfile.
+        source_path (str): Path to a directory where files are.
+        root_path (str): Path to a directory which is used for calculation
+            of relative path.
+    """
+
+    for root, _, filenames in os.walk(source_path):
+        for filename in filenames:
+            filepath = os.path.join(root, filename)
+            # TODO add one more folder
+            archive_name = os.path.join(
+                PROJECT_FILES_DIR,
+                os.path.relpath(filepath, root_path)
+            )
+            zip_stream.write(filepath, archive_name)
+
+
+def pack_project(
+    project_name,
+    destination_dir=None,
+    only_documents=False,
+    database_name=None
+):
+    """Make a package of a project with mongo documents and files.
+
+    This function has few restrictions:
+    - project must have only one root
+    - project must have all templates starting with
+        "{root[...]}/{project[name]}"
+
+    Args:
+        project_name (str): Project that should be packaged.
+        destination_dir (Optional[str]): Optional path where zip will be
+            stored. Project's root is used if not passed.
+        only_documents (Optional[bool]): Pack only Mongo documents and skip
+            files.
+        database_name (Optional[str]): Custom database name from which is
+            project queried.
+    """
+
+    print("Creating package of project \"{}\"".format(project_name))
+    source_root, root_path, destination_dir = _prepare_pack(
+        project_name, destination_dir, only_documents, database_name
+    )
+    project_source_path = None
+    if root_path:
+        project_source_path = os.path.join(root_path, project_name)
 
     zip_path = os.path.join(destination_dir, project_name + ".zip")
 
@@ -205,25 +246,293 @@ def pack_project(
     print("*** Packing finished ***")
 
 
-def _unpack_project_files(unzip_dir, root_path, project_name):
-    """Move project files from unarchived temp folder to new root.
+def get_compress_type(filepath):
+    """Zip compression used for a file in package.
 
-    Unpack is skipped if source files are not available in the zip. That can
-    happen if nothing was published yet or only documents were stored to
-    package.
+    Args:
+        filepath (str): Path to file.
+
+    Returns:
+        int: 'zipfile.ZIP_STORED' for already compressed files, otherwise
+            'zipfile.ZIP_DEFLATED'.
+    """
+
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _store_documents_stream(project_name, filepath, database_name=None):
+    """Store project documents to gzipped json lines one by one.
+
+    Returns:
+        int: Number of stored documents.
+    """
+
+    collection = get_project_connection(project_name, database_name)
+    count = 0
+    with gzip.open(filepath, "wt") as stream:
+        for doc in collection.find({}):
+            stream.write(dumps(doc, json_options=CANONICAL_JSON_OPTIONS))
+            stream.write("\n")
+            count += 1
+    return count
+
+
+def _restore_documents_stream(project_name, filepath, database_name=None):
+    """Replace project documents with documents from gzipped json lines.
+
+    Warnings:
+        Existing project collection is removed if exists in mongo.
+
+    Returns:
+        int: Number of restored documents.
+    """
+
+    collection = get_project_connection(project_name, database_name)
+    collection.drop()
+    count = 0
+    batch = []
+    with gzip.open(filepath, "rt") as stream:
+        for line in stream:
+            if not line.strip():
+                continue
+            batch.append(loads(line))
+            if len(batch) >= DOCUMENTS_BATCH_SIZE:
+                collection.insert_many(batch)
+                count += len(batch)
+                batch = []
+    if batch:
+        collection.insert_many(batch)
+        count += len(batch)
+    return count
+
+
+def _collect_project_files(source_path, root_path):
+    """Files of project with their size and modification time.
+
+    Returns:
+        dict[str, dict[str, Any]]: Information about files by path relative
+            to root with forward slashes.
+    """
+
+    output = {}
+    for root, _, filenames in os.walk(source_path):
+        for filename in filenames:
+            filepath = os.path.join(root, filename)
+            stat = os.stat(filepath)
+            relpath = os.path.relpath(filepath, root_path).replace("\\", "/")
+            output[relpath] = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+            }
+    return output
+
+
+def _split_to_archives(file_items, count):
+    """Split files to archives with similar size of content.
 
     Args:
-        unzip_dir (str): Location where zip was unzipped.
-        root_path (str): Path to new root.
-        project_name (str): Name of project.
+        file_items (dict[str, dict[str, Any]]): Files by relative path.
+        count (int): Maximum number of archives.
+
+    Returns:
+        list[list[str]]: Relative paths of files for each archive.
     """
 
-    src_project_files_dir = os.path.join(
-        unzip_dir, PROJECT_FILES_DIR, project_name
+    archives = [[] for _ in range(max(1, min(count, len(file_items))))]
+    sizes = [0] * len(archives)
+    for relpath in sorted(
+        file_items, key=lambda path: file_items[path]["size"], reverse=True
+    ):
+        idx = sizes.index(min(sizes))
+        archives[idx].append(relpath)
+        sizes[idx] += file_items[relpath]["size"]
+    return archives
+
+
+def _pack_files_archive(archive_path, root_path, relpaths):
+    """Write files to zip archive and calculate their checksums.
+
+    Returns:
+        dict[str, str]: Sha256 checksum by relative path of file.
+    """
+
+    checksums = {}
+    with zipfile.ZipFile(archive_path, "w", allowZip64=True) as zip_stream:
+        for relpath in sorted(relpaths):
+            filepath = os.path.join(root_path, relpath)
+            zip_info = zipfile.ZipInfo.from_file(
+                filepath, relpath, strict_timestamps=False
+            )
+            zip_info.compress_type = get_compress_type(filepath)
+            checksum = hashlib.sha256()
+            with open(filepath, "rb") as src_stream, zip_stream.open(
+                zip_info, "w", force_zip64=True
+            ) as dst_stream:
+                for chunk in iter(
+                    lambda: src_stream.read(FILE_CHUNK_SIZE), b""
+                ):
+                    checksum.update(chunk)
+                    dst_stream.write(chunk)
+            checksums[relpath] = checksum.hexdigest()
+    return checksums
+
+
+def _load_package_json(package_dir, name):
+    with open(os.path.join(package_dir, name + ".json"), "r") as stream:
+        return json.load(stream)
+
+
+def pack_project_stream(
+    project_name,
+    destination_dir=None,
+    only_documents=False,
+    database_name=None,
+    previous_package=None,
+    workers=None
+):
+    """Make a package directory of a project for big projects.
+
+    Same restrictions as for 'pack_project' apply. Package is a directory
+    '{project_name}_package_{timestamp}' with metadata, manifest, documents
+    as gzipped json lines and zip archives with project files. Archives are
+    written in parallel, already compressed files are stored without
+    compression.
+
+    Files which have same size and modification time as in manifest of
+    previous package are not packed again, manifest points to the previous
+    package which must be next to the new package, under the same name, when
+    unpacked.
+
+    Args:
+        project_name (str): Project that should be packaged.
+        destination_dir (Optional[str]): Optional path where package will be
+            stored. Project's root is used if not passed.
+        only_documents (Optional[bool]): Pack only Mongo documents and skip
+            files.
+        database_name (Optional[str]): Custom database name from which is
+            project queried.
+        previous_package (Optional[str]): Path to previous package created
+            by this function.
+        workers (Optional[int]): Number of archives written in parallel.
+
+    Returns:
+        str: Path to package directory.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    print("Creating package of project \"{}\"".format(project_name))
+    source_root, root_path, destination_dir = _prepare_pack(
+        project_name, destination_dir, only_documents, database_name
     )
-    # Skip if files are not in the zip
-    if not os.path.exists(src_project_files_dir):
-        return
+
+    # Name of package is unique so previous packages are kept untouched
+    package_dir = add_timestamp(
+        os.path.join(destination_dir, project_name + PACKAGE_DIR_SUFFIX)
+    )
+    if os.path.exists(package_dir):
+        package_dir = tempfile.mkdtemp(
+            prefix=os.path.basename(package_dir) + "_", dir=destination_dir
+        )
+    else:
+        os.makedirs(package_dir)
+    print("Project will be packaged into \"{}\"".format(package_dir))
+
+    previous_files = {}
+    if previous_package:
+        previous_files = _load_package_json(
+            previous_package, MANIFEST_FILE_NAME
+        )["files"]
+        previous_name = os.path.basename(os.path.normpath(previous_package))
+        for item in previous_files.values():
+            item.setdefault("package", previous_name)
+
+    print("Storing database documents")
+    docs_count = _store_documents_stream(
+        project_name,
+        os.path.join(package_dir, DOCUMENTS_STREAM_NAME),
+        database_name
+    )
+
+    manifest_files = {}
+    to_pack = {}
+    if not only_documents:
+        project_source_path = os.path.join(root_path, project_name)
+        file_items = _collect_project_files(project_source_path, root_path)
+        for relpath, item in file_items.items():
+            previous_item = previous_files.get(relpath)
+            if (
+                previous_item
+                and previous_item["size"] == item["size"]
+                and previous_item["mtime"] == item["mtime"]
+            ):
+                manifest_files[relpath] = previous_item
+            else:
+                to_pack[relpath] = item
+
+    print("Packing files ({} unchanged, {} to pack)".format(
+        len(manifest_files), len(to_pack)
+    ))
+    if workers is None:
+        workers = min(8, os.cpu_count() or 1)
+    archives = _split_to_archives(to_pack, workers) if to_pack else []
+    with ThreadPoolExecutor(max_workers=max(1, len(archives))) as executor:
+        futures = {}
+        for idx, relpaths in enumerate(archives):
+            archive_name = FILES_ARCHIVE_TEMPLATE.format(idx)
+            future = executor.submit(
+                _pack_files_archive,
+                os.path.join(package_dir, archive_name),
+                root_path,
+                relpaths
+            )
+            futures[archive_name] = future
+
+        for archive_name, future in futures.items():
+            for relpath, checksum in future.result().items():
+                item = dict(to_pack[relpath])
+                item["sha256"] = checksum
+                item["archive"] = archive_name
+                manifest_files[relpath] = item
+
+    metadata = {
+        "project_name": project_name,
+        "root": source_root,
+        "version": 2,
+        "documents": docs_count,
+    }
+    with open(
+        os.path.join(package_dir, METADATA_FILE_NAME + ".json"), "w"
+    ) as stream:
+        json.dump(metadata, stream)
+
+    with open(
+        os.path.join(package_dir, MANIFEST_FILE_NAME + ".json"), "w"
+    ) as stream:
+        json.dump({"files": manifest_files}, stream, indent=1, sort_keys=True)
+
+    print("*** Packing finished ***")
+    return package_dir
+
+
+def _match_file_patterns(relpath, file_patterns):
+    if not file_patterns:
+        return True
+    return any(
+        fnmatch.fnmatchcase(relpath, pattern)
+        for pattern in file_patterns
+    )
+
+
+def _rename_existing_project_dir(root_path, project_name):
+    """Rename existing project folder in root so it's not overridden.
+
+    Returns:
+        str: Path to project folder in root.
+    """
 
     # Make sure root path exists
     if not os.path.exists(root_path):
@@ -238,44 +547,241 @@ def _unpack_project_files(unzip_dir, root_path, project_name):
             dst_project_files_dir, new_path
         ))
         os.rename(dst_project_files_dir, new_path)
+    return dst_project_files_dir
+
+
+def _unpack_project_files(unzip_dir, root_path, project_name, merge=False):
+    """Move project files from unarchived temp folder to new root.
+
+    Unpack is skipped if source files are not available in the zip. That can
+    happen if nothing was published yet or only documents were stored to
+    package.
 
+    Args:
+        unzip_dir (str): Location where zip was unzipped.
+        root_path (str): Path to new root.
+        project_name (str): Name of project.
+        merge (Optional[bool]): Move files into existing project folder
+            instead of renaming it.
+    """
+
+    src_project_files_dir = os.path.join(
+        unzip_dir, PROJECT_FILES_DIR, project_name
+    )
+    # Skip if files are not in the zip
+    if not os.path.exists(src_project_files_dir):
+        return
+
+    if not merge:
+        dst_project_files_dir = _rename_existing_project_dir(
+            root_path, project_name
+        )
+        print("Moving project files from temp \"{}\" -> \"{}\"".format(
+            src_project_files_dir, dst_project_files_dir
+        ))
+        shutil.move(src_project_files_dir, dst_project_files_dir)
+        return
+
+    src_root = os.path.join(unzip_dir, PROJECT_FILES_DIR)
     print("Moving project files from temp \"{}\" -> \"{}\"".format(
-        src_project_files_dir, dst_project_files_dir
+        src_root, root_path
     ))
-    shutil.move(src_project_files_dir, dst_project_files_dir)
+    for root, _, filenames in os.walk(src_project_files_dir):
+        dst_dir = os.path.join(root_path, os.path.relpath(root, src_root))
+        if not os.path.exists(dst_dir):
+            os.makedirs(dst_dir)
+        for filename in filenames:
+            dst_path = os.path.join(dst_dir, filename)
+            if os.path.exists(dst_path):
+                os.remove(dst_path)
+            shutil.move(os.path.join(root, filename), dst_path)
+
+
+def _set_project_root(project_name, new_root, low_platform, database_name):
+    project_doc = get_project_document(project_name, database_name)
+    roots = project_doc["config"]["roots"]
+    key = tuple(roots.keys())[0]
+    update_key = "config.roots.{}.{}".format(key, low_platform)
+    collection = get_project_connection(project_name, database_name)
+    collection.update_one(
+        {"_id": project_doc["_id"]},
+        {"$set": {
+            update_key: new_root
+        }}
+    )
+
+
+def _extract_files_archive(archive_path, root_path, relpaths, manifest_files):
+    """Extract files from package archive and validate their checksums."""
+
+    with zipfile.ZipFile(archive_path, "r") as zip_stream:
+        for relpath in relpaths:
+            item = manifest_files[relpath]
+            dst_path = os.path.join(root_path, relpath)
+            dst_dir = os.path.dirname(dst_path)
+            if not os.path.exists(dst_dir):
+                os.makedirs(dst_dir)
+
+            checksum = hashlib.sha256()
+            with zip_stream.open(relpath, "r") as src_stream, open(
+                dst_path, "wb"
+            ) as dst_stream:
+                for chunk in iter(
+                    lambda: src_stream.read(FILE_CHUNK_SIZE), b""
+                ):
+                    checksum.update(chunk)
+                    dst_stream.write(chunk)
+
+            if checksum.hexdigest() != item["sha256"]:
+                raise ValueError(
+                    "Checksum of unpacked file \"{}\" does not match".format(
+                        dst_path
+                    )
+                )
+            # Keep modification time so unpacked project can be re-packed
+            #   incrementally
+            os.utime(dst_path, (item["mtime"], item["mtime"]))
+
+
+def _unpack_package_files(
+    package_dir, root_path, project_name, file_patterns, workers
+):
+    """Extract project files from package directory to root.
+
+    Archives of files which were not changed since previous package are
+    expected next to the package directory.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    manifest_files = _load_package_json(
+        package_dir, MANIFEST_FILE_NAME
+    )["files"]
+    relpaths = [
+        relpath
+        for relpath in manifest_files
+        if _match_file_patterns(relpath, file_patterns)
+    ]
+    # Skip if files are not in the package
+    if not relpaths:
+        return
+
+    root_path = os.path.normpath(root_path)
+    if file_patterns:
+        if not os.path.exists(root_path):
+            os.makedirs(root_path)
+    else:
+        _rename_existing_project_dir(root_path, project_name)
+
+    packages_root = os.path.dirname(os.path.normpath(package_dir))
+    relpaths_by_archive = {}
+    for relpath in relpaths:
+        dst_path = os.path.normpath(os.path.join(root_path, relpath))
+        if not dst_path.startswith(os.path.join(root_path, "")):
+            raise ValueError(
+                "File \"{}\" is outside of project root".format(relpath)
+            )
+        item = manifest_files[relpath]
+        archive_dir = package_dir
+        if item.get("package"):
+            archive_dir = os.path.join(packages_root, item["package"])
+        archive_path = os.path.join(archive_dir, item["archive"])
+        relpaths_by_archive.setdefault(archive_path, []).append(relpath)
+
+    for archive_path in relpaths_by_archive:
+        if not os.path.exists(archive_path):
+            raise ValueError(
+                "Archive \"{}\" required by package was not found".format(
+                    archive_path
+                )
+            )
+
+    print("Unpacking {} project files to \"{}\"".format(
+        len(relpaths), root_path
+    ))
+    if workers is None:
+        workers = min(8, os.cpu_count() or 1)
+    workers = max(1, min(workers, len(relpaths_by_archive)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _extract_files_archive,
+                archive_path,
+                root_path,
+                archive_relpaths,
+                manifest_files
+            )
+            for archive_path, archive_relpaths in relpaths_by_archive.items()
+        ]
+        for future in futures:
+            future.result()
 
 
 def unpack_project(
-    path_to_zip, new_root=None, database_only=None, database_name=None
+    path_to_zip,
+    new_root=None,
+    database_only=None,
+    database_name=None,
+    file_patterns=None,
+    workers=None
 ):
     """Unpack project zip file to recreate project.
 
     Args:
         path_to_zip (str): Path to zip which was created using 'pack_project'
-            function.
+            function or to package directory created using
+            'pack_project_stream'.
         new_root (str): Optional way how to set different root path for
             unpacked project.
         database_only (Optional[bool]): Unpack only database from zip.
         database_name (str): Name of database where project will be recreated.
+        file_patterns (Optional[list[str]]): Unpack only project files with
+            path relative to root matching any of the patterns, e.g.
+            'MyProject/shots/sh010/*'. Files are unpacked into existing
+            project folder and project documents in database are kept.
+        workers (Optional[int]): Number of archives of package directory
+            extracted in parallel.
     """
 
     if database_only is None:
         database_only = False
 
-    print("Unpacking project from zip {}".format(path_to_zip))
+    print("Unpacking project from {}".format(path_to_zip))
     if not os.path.exists(path_to_zip):
         print("Zip file does not exists: {}".format(path_to_zip))
         return
 
+    if os.path.isdir(path_to_zip):
+        _unpack_project_stream(
+            path_to_zip,
+            new_root,
+            database_only,
+            database_name,
+            file_patterns,
+            workers
+        )
+        return
+
     tmp_dir = tempfile.mkdtemp(prefix="unpack_")
     print("Zip is extracted to temp: {}".format(tmp_dir))
     with zipfile.ZipFile(path_to_zip, "r") as zip_stream:
-        if database_only:
+        if database_only or file_patterns:
             for filename in (
                 "{}.json".format(METADATA_FILE_NAME),
                 "{}.json".format(DOCUMENTS_FILE_NAME),
             ):
                 zip_stream.extract(filename, tmp_dir)
+
+            files_prefix = PROJECT_FILES_DIR + "/"
+            if not database_only:
+                for name in zip_stream.namelist():
+                    if (
+                        name.startswith(files_prefix)
+                        and _match_file_patterns(
+                            name[len(files_prefix):], file_patterns
+                        )
+                    ):
+                        zip_stream.extract(name, tmp_dir)
         else:
             zip_stream.extractall(tmp_dir)
 
@@ -283,17 +789,10 @@ def unpack_project(
     with open(metadata_json_path, "r") as stream:
         metadata = json.load(stream)
 
-    docs_json_path = os.path.join(tmp_dir, DOCUMENTS_FILE_NAME + ".json")
-    docs = load_json_file(docs_json_path)
-
     low_platform = platform.system().lower()
     project_name = metadata["project_name"]
     root_path = metadata["root"].get(low_platform)
 
-    # Drop existing collection
-    replace_project_documents(project_name, docs, database_name)
-    print("Creating project documents ({})".format(len(docs)))
-
     # Skip change of root if is the same as the one stored in metadata
     if (
         new_root
@@ -305,21 +804,77 @@ def unpack_project(
         print("Using different root path {}".format(new_root))
         root_path = new_root
 
-        project_doc = get_project_document(project_name)
-        roots = project_doc["config"]["roots"]
-        key = tuple(roots.keys())[0]
-        update_key = "config.roots.{}.{}".format(key, low_platform)
-        collection = get_project_connection(project_name, database_name)
-        collection.update_one(
-            {"_id": project_doc["_id"]},
-            {"$set": {
-                update_key: new_root
-            }}
+    # Partial unpack of files must not replace documents of existing project
+    if not file_patterns:
+        docs_json_path = os.path.join(
+            tmp_dir, DOCUMENTS_FILE_NAME + ".json"
         )
+        docs = load_json_file(docs_json_path)
 
-    _unpack_project_files(tmp_dir, root_path, project_name)
+        # Drop existing collection
+        replace_project_documents(project_name, docs, database_name)
+        print("Creating project documents ({})".format(len(docs)))
+
+        if new_root:
+            _set_project_root(
+                project_name, new_root, low_platform, database_name
+            )
+
+    _unpack_project_files(
+        tmp_dir, root_path, project_name, merge=bool(file_patterns)
+    )
 
     # CLeanup
     print("Cleaning up")
     shutil.rmtree(tmp_dir)
     print("*** Unpack finished ***")
+
+
+def _unpack_project_stream(
+    package_dir,
+    new_root,
+    database_only,
+    database_name,
+    file_patterns,
+    workers
+):
+    """Recreate project from package directory."""
+
+    metadata = _load_package_json(package_dir, METADATA_FILE_NAME)
+
+    low_platform = platform.system().lower()
+    project_name = metadata["project_name"]
+    root_path = metadata["root"].get(low_platform)
+
+    # Skip change of root if is the same as the one stored in metadata
+    if (
+        new_root
+        and root_path
+        and (os.path.normpath(new_root) == os.path.normpath(root_path))
+    ):
+        new_root = None
+
+    if new_root:
+        print("Using different root path {}".format(new_root))
+        root_path = new_root
+
+    # Partial unpack of files must not replace documents of existing project
+    if not file_patterns:
+        # Drop existing collection
+        docs_count = _restore_documents_stream(
+            project_name,
+            os.path.join(package_dir, DOCUMENTS_STREAM_NAME),
+            database_name
+        )
+        print("Creating project documents ({})".format(docs_count))
+
+        if new_root:
+            _set_project_root(
+                project_name, new_root, low_platform, database_name
+            )
+
+    if not database_only and root_path:
+        _unpack_package_files(
+            package_dir, root_path, project_name, file_patterns, workers
+        )
+    print("*** Unpack finished ***")
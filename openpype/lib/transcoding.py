@@ -3,7 +3,10 @@ import re
 import logging
 import json
 import collections
+import sqlite3
 import tempfile
+import threading
+import multiprocessing
 import subprocess
 import platform
 
@@ -16,6 +19,8 @@ from .vendor_bin_utils import (
     is_oiio_supported,
 )
 
+# Environment variable with directory of probe cache database
+PROBE_CACHE_DIR_ENV = "OPENPYPE_PROBE_CACHE_DIR"
 # Max length of string that is supported by ffmpeg
 MAX_FFMPEG_STRING_LEN = 8196
 # Not allowed symbols in attributes for ffmpeg
@@ -78,6 +83,172 @@ def get_transcode_temp_directory():
     )
 
 
+class ProbeCache(object):
+    """Cache of metadata probe outputs (oiiotool, ffprobe).
+
+    Output of probe is cached by probe arguments, path, size and
+    modification time of probed file, so changed file is probed again.
+    Raw output is stored, parsing is cheap in comparison to subprocess.
+
+    Outputs are also stored to sqlite database in directory defined by
+    environment variable 'OPENPYPE_PROBE_CACHE_DIR' if is set. That way
+    are shared between processes, e.g. farm tasks on the same machine.
+
+    Args:
+        max_items (int): Maximum number of outputs kept in memory.
+    """
+    db_filename = "probe_cache.db"
+
+    def __init__(self, max_items=256):
+        self._max_items = max_items
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._db_path = None
+        self._conn = None
+
+    @staticmethod
+    def create_key(filepath, args):
+        """Key of probe output.
+
+        Returns:
+            Union[str, None]: Key or None if file does not exist.
+        """
+        try:
+            stat = os.stat(filepath)
+        except (OSError, TypeError, ValueError):
+            return None
+
+        mtime_ns = getattr(stat, "st_mtime_ns", None)
+        if mtime_ns is None:
+            mtime_ns = int(stat.st_mtime * 1000000000)
+        return json.dumps([
+            os.path.normcase(os.path.abspath(filepath)),
+            stat.st_size,
+            mtime_ns,
+            list(args)
+        ])
+
+    def get(self, key):
+        with self._lock:
+            output = self._items.pop(key, None)
+            if output is None:
+                output = self._load(key)
+
+            if output is not None:
+                self._set_item(key, output)
+        return output
+
+    def set(self, key, output):
+        with self._lock:
+            self._set_item(key, output)
+            self._store(key, output)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def _set_item(self, key, output):
+        self._items[key] = output
+        while len(self._items) > self._max_items:
+            self._items.popitem(last=False)
+
+    def _get_connection(self):
+        cache_dir = os.environ.get(PROBE_CACHE_DIR_ENV)
+        if not cache_dir:
+            return None
+
+        db_path = os.path.join(cache_dir, self.db_filename)
+        if db_path == self._db_path:
+            return self._conn
+
+        if self._conn is not None:
+            self._conn.close()
+        self._db_path = db_path
+        self._conn = None
+        try:
+            if not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            conn = sqlite3.connect(
+                db_path,
+                timeout=10,
+                check_same_thread=False,
+                isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS probes"
+                " (key TEXT PRIMARY KEY, output TEXT NOT NULL)"
+            )
+            self._conn = conn
+
+        except (OSError, sqlite3.Error):
+            logging.getLogger(__name__).debug(
+                "Failed to open probe cache \"{}\"".format(db_path),
+                exc_info=True
+            )
+        return self._conn
+
+    def _load(self, key):
+        conn = self._get_connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT output FROM probes WHERE key = ?", (key, )
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return row[0]
+
+    def _store(self, key, output):
+        conn = self._get_connection()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO probes (key, output) VALUES (?, ?)",
+                (key, output)
+            )
+        except sqlite3.Error:
+            logging.getLogger(__name__).debug(
+                "Failed to store probe output", exc_info=True
+            )
+
+
+_PROBE_CACHE = ProbeCache()
+
+
+def clear_probe_cache():
+    """Clear in-memory cache of oiiotool and ffprobe outputs."""
+    _PROBE_CACHE.clear()
+
+
+def _get_probe_output(filepath, args, probe_func):
+    """Output of probe from cache or from probe function.
+
+    Args:
+        filepath (str): Probed file.
+        args (list[str]): Probe arguments.
+        probe_func (Callable[[], tuple[str, bool]]): Run probe and return
+            output with information if output can be cached.
+
+    Returns:
+        str: Probe output.
+    """
+    key = _PROBE_CACHE.create_key(filepath, args)
+    if key is not None:
+        output = _PROBE_CACHE.get(key)
+        if output is not None:
+            return output
+
+    output, cacheable = probe_func()
+    if key is not None and cacheable:
+        _PROBE_CACHE.set(key, output)
+    return output
+
+
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
@@ -93,7 +264,9 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
+    output = _get_probe_output(
+        filepath, args, lambda: (run_subprocess(args, logger=logger), True)
+    )
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -659,7 +832,9 @@ def convert_for_ffmpeg(
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None,
+    frames_chunk_size=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -672,16 +847,28 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Conversion commands are processed in parallel. All commands are
+    processed even if some of them fail, failed commands are reported
+    together at the end.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of conversion processes
+            running at the same time. Number of cpu cores is used if not
+            passed.
+        frames_chunk_size (Optional[int]): Convert continuous frames of
+            sequence with one 'oiiotool --frames' command, for maximum of
+            passed frames. Each frame is converted with separated command
+            if not passed.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
             Currently is supported only ".exr" extension.
+        RuntimeError: Conversion of any input failed.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
@@ -706,66 +893,180 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    for input_path in input_paths:
-        # Prepare subprocess arguments
-        oiio_cmd = get_oiio_tool_args(
-            "oiiotool",
-            # Don't add any additional attributes
-            "--nosoftwareattrib",
-        )
-        # Add input compression if available
-        if compression:
-            oiio_cmd.extend(["--compression", compression])
+    # Prepare subprocess arguments
+    oiio_args = get_oiio_tool_args(
+        "oiiotool",
+        # Don't add any additional attributes
+        "--nosoftwareattrib",
+    )
+    # Add input compression if available
+    if compression:
+        oiio_args.extend(["--compression", compression])
 
-        oiio_cmd.extend([
-            input_arg, input_path,
-            # Tell oiiotool which channels should be put to top stack
-            #   (and output)
-            "--ch", channels_arg,
-            # Use first subimage
-            "--subimage", "0"
-        ])
+    post_input_args = [
+        # Tell oiiotool which channels should be put to top stack
+        #   (and output)
+        "--ch", channels_arg,
+        # Use first subimage
+        "--subimage", "0"
+    ]
 
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
 
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
 
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            post_input_args.extend(["--eraseattrib", attr_name])
+
+    commands = []
+    for input_path, frame_range in _get_conversion_inputs(
+        input_paths, frames_chunk_size
+    ):
+        oiio_cmd = list(oiio_args)
+        if frame_range is not None:
+            oiio_cmd.extend(["--frames", "{}-{}".format(*frame_range)])
+        oiio_cmd.extend([input_arg, input_path])
+        oiio_cmd.extend(post_input_args)
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
         output_path = os.path.join(output_dir, base_filename)
         oiio_cmd.extend([
             "-o", output_path
         ])
+        commands.append((input_path, oiio_cmd))
+
+    _run_conversion_commands(commands, max_workers, logger)
+
+
+def _get_conversion_inputs(input_paths, frames_chunk_size):
+    """Split input paths to inputs of conversion commands.
+
+    Continuous frames of sequences are merged to one input with frame
+    pattern if 'frames_chunk_size' is set.
+
+    Returns:
+        list[tuple[str, Union[tuple[int, int], None]]]: Input path with
+            frame range for sequence input.
+    """
+    if not frames_chunk_size or frames_chunk_size < 2:
+        return [(input_path, None) for input_path in input_paths]
 
+    import clique
+
+    collections, remainders = clique.assemble(
+        input_paths,
+        patterns=[clique.PATTERNS["frames"]],
+    )
+    output = [(input_path, None) for input_path in remainders]
+    for collection in collections:
+        head = collection.head
+        tail = collection.tail
+        padding = collection.padding
+        # Percent symbol would break frame pattern
+        if "%" in head or "%" in tail:
+            output.extend((input_path, None) for input_path in collection)
+            continue
+
+        pattern = "{}%0{}d{}".format(head, padding, tail)
+        if not padding:
+            pattern = "{}%d{}".format(head, tail)
+
+        frames = sorted(collection.indexes)
+        start = end = frames[0]
+        for frame in frames[1:] + [None]:
+            if (
+                frame is not None
+                and frame == end + 1
+                and frame - start < frames_chunk_size
+            ):
+                end = frame
+                continue
+
+            if start == end:
+                output.append((pattern % start, None))
+            else:
+                output.append((pattern, (start, end)))
+            start = end = frame
+    return output
+
+
+def _run_conversion_commands(commands, max_workers, logger):
+    """Run conversion commands in parallel and report all failures.
+
+    Args:
+        commands (list[tuple[str, list[str]]]): Input path and command.
+        max_workers (Optional[int]): Maximum of parallel processes.
+        logger (logging.Logger): Logger used for logging.
+
+    Raises:
+        RuntimeError: Any of commands failed.
+    """
+    if not max_workers:
+        max_workers = multiprocessing.cpu_count()
+    max_workers = min(max_workers, len(commands))
+
+    def _convert(oiio_cmd):
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
         run_subprocess(oiio_cmd, logger=logger)
 
+    failed = []
+    if max_workers <= 1:
+        for input_path, oiio_cmd in commands:
+            try:
+                _convert(oiio_cmd)
+            except RuntimeError as exc:
+                failed.append((input_path, exc))
+
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Threads are only waiting for subprocesses
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (input_path, executor.submit(_convert, oiio_cmd))
+                for input_path, oiio_cmd in commands
+            ]
+            for input_path, future in futures:
+                exc = future.exception()
+                if exc is not None:
+                    failed.append((input_path, exc))
+
+    if failed:
+        for input_path, exc in failed:
+            logger.error("Conversion of \"{}\" failed: {}".format(
+                input_path, exc
+            ))
+        raise RuntimeError(
+            "Conversion failed for {} of {} inputs: {}".format(
+                len(failed),
+                len(commands),
+                ", ".join(input_path for input_path, _ in failed)
+            )
+        )
+
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
@@ -794,6 +1095,13 @@ def get_ffprobe_data(path_to_file, logger=None):
         path_to_file
     ]
 
+    output = _get_probe_output(
+        path_to_file, args, lambda: _run_ffprobe(args, logger)
+    )
+    return json.loads(output)
+
+
+def _run_ffprobe(args, logger):
     logger.debug("FFprobe command: {}".format(
         subprocess.list2cmdline(args)
     ))
@@ -811,17 +1119,16 @@ def get_ffprobe_data(path_to_file, logger=None):
     popen = subprocess.Popen(args, **kwargs)
 
     popen_stdout, popen_stderr = popen.communicate()
+    popen_stdout = popen_stdout.decode("utf-8")
     if popen_stdout:
-        logger.debug("FFprobe stdout:\n{}".format(
-            popen_stdout.decode("utf-8")
-        ))
+        logger.debug("FFprobe stdout:\n{}".format(popen_stdout))
 
     if popen_stderr:
         logger.warning("FFprobe stderr:\n{}".format(
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    return popen_stdout, popen.returncode == 0
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -27,6 +27,9 @@ from openpype.pipeline.publish.lib import (
 )
 from openpype import AYON_SERVER_ENABLED
 
+from .deadline_module import DeadlineWebserviceError
+from .deadline_client import get_deadline_client
+
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
 
@@ -593,24 +596,37 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             KnownPublishError: if submission fails.
 
         """
-        url = "{}/api/jobs".format(self._deadline_url)
-        response = requests_post(url, json=payload)
-        if not response.ok:
-            self.log.error("Submission failed!")
-            self.log.error(response.status_code)
-            self.log.error(response.content)
-            self.log.debug(payload)
-            raise KnownPublishError(response.text)
+        return self.submit_many([payload])[0]
+
+    def submit_many(self, payloads):
+        """Submit multiple independent payloads to Deadline.
+
+        Jobs are submitted concurrently on shared connection pool of
+        Deadline webservice.
 
+        Args:
+            payloads (list[dict]): Payloads of jobs which don't depend
+                on each other.
+
+        Returns:
+            list[str]: Deadline job ids in order of payloads.
+
+        Throws:
+            KnownPublishError: if submission of any job fails.
+
+        """
+        if not payloads:
+            return []
+
+        client = get_deadline_client(self._deadline_url)
         try:
-            result = response.json()
-        except JSONDecodeError:
-            msg = "Broken response {}. ".format(response)
-            msg += "Try restarting the Deadline Webservice."
-            self.log.warning(msg, exc_info=True)
-            raise KnownPublishError("Broken response from DL")
+            results = client.submit_jobs(payloads)
+        except DeadlineWebserviceError as exc:
+            self.log.error("Submission failed!")
+            self.log.debug(payloads)
+            raise KnownPublishError(str(exc))
 
         # for submit publish job
-        self._instance.data["deadlineSubmissionJob"] = result
+        self._instance.data["deadlineSubmissionJob"] = results[-1]
 
-        return result["_id"]
+        return [result["_id"] for result in results]
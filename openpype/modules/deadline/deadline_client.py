@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Client for Deadline Webservice.
+
+Client keeps one 'requests' session with pool of connections per
+webservice url, so publish plugins talking to the same webservice don't
+open new connection for each request. Use 'get_deadline_client' to get
+the shared client.
+"""
+import os
+import time
+import json.decoder
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .deadline_module import DeadlineWebserviceError
+
+JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
+
+# Job states ('Stat' key) in which job won't change without user action
+JOB_STATE_COMPLETED = 3
+JOB_STATE_FAILED = 4
+JOB_FINISHED_STATES = (JOB_STATE_COMPLETED, JOB_STATE_FAILED)
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_deadline_client(url):
+    """Shared Deadline client for webservice url.
+
+    Args:
+        url (str): Deadline webservice url.
+
+    Returns:
+        DeadlineClient: Client for the url.
+    """
+    url = url.rstrip("/")
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(url)
+        if client is None:
+            client = DeadlineClient(url)
+            _CLIENTS[url] = client
+    return client
+
+
+class DeadlineClient(object):
+    """Deadline Webservice client with pooled connections.
+
+    SSL certificate validation is disabled unless
+    'OPENPYPE_DONT_VERIFY_SSL' is set to empty string, same as in
+    'requests_post' and 'requests_get'.
+
+    Args:
+        url (str): Deadline webservice url.
+        timeout (float): Timeout of requests in seconds.
+        pool_size (int): Maximum number of kept connections.
+    """
+    def __init__(self, url, timeout=10, pool_size=10):
+        self._url = url.rstrip("/")
+        self._timeout = timeout
+        self._pool_size = pool_size
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def url(self):
+        return self._url
+
+    def _get_session(self):
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self._pool_size
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+        return self._session
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _request(self, method, endpoint, **kwargs):
+        if "verify" not in kwargs:
+            kwargs["verify"] = not os.getenv("OPENPYPE_DONT_VERIFY_SSL", True)
+        kwargs.setdefault("timeout", self._timeout)
+        url = self._url + endpoint
+        return self._get_session().request(method, url, **kwargs)
+
+    def get(self, endpoint, **kwargs):
+        """GET request on webservice endpoint, e.g. '/api/pools'.
+
+        Returns:
+            requests.Response: Response of webservice.
+        """
+        return self._request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        """POST request on webservice endpoint, e.g. '/api/jobs'.
+
+        Returns:
+            requests.Response: Response of webservice.
+        """
+        return self._request("POST", endpoint, **kwargs)
+
+    def _get_json(self, response):
+        if not response.ok:
+            raise DeadlineWebserviceError(
+                "Request to {} failed ({}): {}".format(
+                    response.url, response.status_code, response.text
+                )
+            )
+        try:
+            return response.json()
+        except JSONDecodeError:
+            raise DeadlineWebserviceError(
+                "Broken response from {}. Try restarting the Deadline"
+                " Webservice.".format(response.url)
+            )
+
+    def submit_job(self, payload):
+        """Submit job to Deadline.
+
+        Args:
+            payload (dict): Payload with 'JobInfo', 'PluginInfo'
+                and 'AuxFiles'.
+
+        Returns:
+            dict: Submitted job data, job id is under '_id' key.
+
+        Raises:
+            DeadlineWebserviceError: Submission failed.
+        """
+        return self._get_json(self.post("/api/jobs", json=payload))
+
+    def submit_jobs(self, payloads, max_workers=None):
+        """Submit multiple independent jobs.
+
+        Webservice accepts one job per request, jobs are submitted
+        concurrently on pooled connections. Jobs depending on each other
+        must be submitted in separated calls.
+
+        Args:
+            payloads (list[dict]): Payloads of jobs.
+            max_workers (Optional[int]): Maximum number of concurrent
+                requests, size of connection pool by default.
+
+        Returns:
+            list[dict]: Submitted jobs data in order of payloads.
+
+        Raises:
+            DeadlineWebserviceError: Submission of any job failed. Jobs
+                which were submitted before the failure are not removed.
+        """
+        payloads = list(payloads)
+        if max_workers is None:
+            max_workers = self._pool_size
+        max_workers = min(max_workers, len(payloads))
+        if max_workers < 2:
+            return [self.submit_job(payload) for payload in payloads]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.submit_job, payloads))
+
+    def get_jobs(self, job_ids):
+        """Get information about jobs with one request.
+
+        Args:
+            job_ids (Iterable[str]): Deadline job ids.
+
+        Returns:
+            dict[str, dict]: Job information by job id. Jobs which were
+                not found are missing.
+
+        Raises:
+            DeadlineWebserviceError: Request failed.
+        """
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids:
+            return {}
+        response = self.get(
+            "/api/jobs", params={"JobID": ",".join(job_ids)}
+        )
+        return {
+            job_info["_id"]: job_info
+            for job_info in self._get_json(response) or []
+        }
+
+    def get_pools(self):
+        """Names of pools on Deadline.
+
+        Returns:
+            list[str]: Pool names.
+        """
+        response = self.get("/api/pools", params={"NamesOnly": "true"})
+        return self._get_json(response)
+
+    async def wait_for_jobs(
+        self, job_ids, poll_interval=10, timeout=None,
+        finished_states=JOB_FINISHED_STATES
+    ):
+        """Wait until all jobs are finished.
+
+        Jobs are polled with one request per interval. Requests run in
+        default executor of running loop so the loop is not blocked.
+
+        Args:
+            job_ids (Iterable[str]): Deadline job ids.
+            poll_interval (float): Seconds between polls.
+            timeout (Optional[float]): Maximum seconds to wait.
+            finished_states (Iterable[int]): Job states considered as
+                finished.
+
+        Returns:
+            dict[str, dict]: Last information about jobs by job id.
+
+        Raises:
+            TimeoutError: Jobs did not finish in time.
+        """
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        pending_ids = set(job_ids)
+        jobs_info = {}
+        start = time.time()
+        while True:
+            new_info = await loop.run_in_executor(
+                None, self.get_jobs, list(pending_ids)
+            )
+            jobs_info.update(new_info)
+            # Jobs which were not found are deleted and won't finish
+            pending_ids = {
+                job_id
+                for job_id, job_info in new_info.items()
+                if job_id in pending_ids
+                and job_info.get("Stat") not in finished_states
+            }
+            if not pending_ids:
+                return jobs_info
+
+            if timeout is not None and time.time() - start > timeout:
+                raise TimeoutError(
+                    "Deadline jobs did not finish in {} seconds: {}".format(
+                        timeout, ", ".join(sorted(pending_ids))
+                    )
+                )
+            await asyncio.sleep(poll_interval)
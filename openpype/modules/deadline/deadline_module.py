@@ -3,7 +3,7 @@ import requests
 import six
 import sys
 
-from openpype.lib import requests_get, Logger
+from openpype.lib import Logger
 from openpype.modules import OpenPypeModule, IPluginPaths
 
 
@@ -59,9 +59,11 @@ class DeadlineModule(OpenPypeModule, IPluginPaths):
         if not log:
             log = Logger.get_logger(__name__)
 
-        argument = "{}/api/pools?NamesOnly=true".format(webservice)
+        from .deadline_client import get_deadline_client
+
         try:
-            response = requests_get(argument)
+            response = get_deadline_client(webservice).get(
+                "/api/pools", params={"NamesOnly": "true"})
         except requests.exceptions.ConnectionError as exc:
             msg = 'Cannot connect to DL web service {}'.format(webservice)
             log.error(msg)
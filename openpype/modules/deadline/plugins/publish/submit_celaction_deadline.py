@@ -2,9 +2,10 @@ import os
 import re
 import json
 import getpass
-import requests
 import pyblish.api
 
+from openpype_modules.deadline.deadline_client import get_deadline_client
+
 
 class CelactionSubmitDeadline(pyblish.api.InstancePlugin):
     """Submit CelAction2D scene to Deadline
@@ -38,6 +39,7 @@ class CelactionSubmitDeadline(pyblish.api.InstancePlugin):
         assert deadline_url, "Requires Deadline Webservice URL"
 
         self.deadline_url = "{}/api/jobs".format(deadline_url)
+        self._deadline_client = get_deadline_client(deadline_url)
         self._comment = instance.data["comment"]
         self._deadline_user = context.data.get(
             "deadlineUser", getpass.getuser())
@@ -193,7 +195,7 @@ class CelactionSubmitDeadline(pyblish.api.InstancePlugin):
         self.log.debug("__ expectedFiles: `{}`".format(
             instance.data["expectedFiles"]))
 
-        response = requests.post(self.deadline_url, json=payload)
+        response = self._deadline_client.post("/api/jobs", json=payload)
 
         if not response.ok:
             self.log.error(
@@ -2,8 +2,6 @@ import os
 import json
 import getpass
 
-import requests
-
 import pyblish.api
 
 from openpype import AYON_SERVER_ENABLED
@@ -16,6 +14,7 @@ from openpype.lib import (
     NumberDef,
     is_running_from_build
 )
+from openpype_modules.deadline.deadline_client import get_deadline_client
 
 
 class FusionSubmitDeadline(
@@ -259,8 +258,9 @@ class FusionSubmitDeadline(
         self.log.debug(json.dumps(payload, indent=4, sort_keys=True))
 
         # E.g. http://192.168.0.1:8082/api/jobs
-        url = "{}/api/jobs".format(deadline_url)
-        response = requests.post(url, json=payload)
+        response = get_deadline_client(deadline_url).post(
+            "/api/jobs", json=payload
+        )
         if not response.ok:
             raise Exception(response.text)
 
@@ -2,13 +2,12 @@ import os
 import json
 from datetime import datetime
 
-import requests
-
 import pyblish.api
 
 from openpype.pipeline import legacy_io
 from openpype.tests.lib import is_in_tests
 from openpype.lib import is_running_from_build
+from openpype_modules.deadline.deadline_client import get_deadline_client
 
 
 class HoudiniSubmitPublishDeadline(pyblish.api.ContextPlugin):
@@ -167,7 +166,8 @@ class HoudiniSubmitPublishDeadline(pyblish.api.ContextPlugin):
         self.log.debug(json.dumps(payload, indent=4, sort_keys=True))
 
         # E.g. http://192.168.0.1:8082/api/jobs
-        url = "{}/api/jobs".format(deadline)
-        response = requests.post(url, json=payload)
+        response = get_deadline_client(deadline).post(
+            "/api/jobs", json=payload
+        )
         if not response.ok:
             raise Exception(response.text)
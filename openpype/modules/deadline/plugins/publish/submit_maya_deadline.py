@@ -22,6 +22,7 @@ import getpass
 import copy
 import re
 import hashlib
+import uuid
 from datetime import datetime
 import itertools
 from collections import OrderedDict
@@ -446,10 +447,10 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
             "Submitting tile job(s) [{}] ...".format(len(frame_payloads)))
 
         # Submit frame tile jobs
-        frame_tile_job_id = {}
-        for frame, tile_job_payload in frame_payloads.items():
-            job_id = self.submit(tile_job_payload)
-            frame_tile_job_id[frame] = job_id
+        frame_tile_job_id = dict(zip(
+            frame_payloads.keys(),
+            self.submit_many(list(frame_payloads.values()))
+        ))
 
         # Define assembly payloads
         assembly_job_info = copy.deepcopy(job_info)
@@ -471,7 +472,9 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
         assembly_plugin_info = {
             "CleanupTiles": 1,
             "ErrorOnMissing": True,
-            "Renderer": self._instance.data["renderer"]
+            "Renderer": self._instance.data["renderer"],
+            # Assembly jobs of all frames share cached geometry of tiles
+            "TilesGeometryKey": uuid.uuid4().hex
         }
 
         assembly_payloads = []
@@ -549,15 +552,11 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
             )
 
         # Submit assembly jobs
-        assembly_job_ids = []
-        num_assemblies = len(assembly_payloads)
-        for i, payload in enumerate(assembly_payloads):
-            self.log.debug(
-                "submitting assembly job {} of {}".format(i + 1,
-                                                          num_assemblies)
-            )
-            assembly_job_id = self.submit(payload)
-            assembly_job_ids.append(assembly_job_id)
+        self.log.debug(
+            "Submitting assembly job(s) [{}] ...".format(
+                len(assembly_payloads))
+        )
+        assembly_job_ids = self.submit_many(assembly_payloads)
 
         instance.data["assemblySubmissionJobs"] = assembly_job_ids
 
@@ -4,7 +4,6 @@ import json
 import getpass
 from datetime import datetime
 
-import requests
 import pyblish.api
 
 from openpype import AYON_SERVER_ENABLED
@@ -18,6 +17,7 @@ from openpype.lib import (
     BoolDef,
     NumberDef
 )
+from openpype_modules.deadline.deadline_client import get_deadline_client
 
 
 class NukeSubmitDeadline(pyblish.api.InstancePlugin,
@@ -120,6 +120,7 @@ class NukeSubmitDeadline(pyblish.api.InstancePlugin,
         assert deadline_url, "Requires Deadline Webservice URL"
 
         self.deadline_url = "{}/api/jobs".format(deadline_url)
+        self._deadline_client = get_deadline_client(deadline_url)
         self._comment = context.data.get("comment", "")
         self._ver = re.search(r"\d+\.\d+", context.data.get("hostVersion"))
         self._deadline_user = context.data.get(
@@ -443,7 +444,7 @@ class NukeSubmitDeadline(pyblish.api.InstancePlugin,
 
         self.log.debug("__ expectedFiles: `{}`".format(
             instance.data["expectedFiles"]))
-        response = requests.post(self.deadline_url, json=payload, timeout=10)
+        response = self._deadline_client.post("/api/jobs", json=payload)
 
         if not response.ok:
             raise Exception(response.text)
@@ -4,7 +4,6 @@ import os
 import json
 import re
 from copy import deepcopy
-import requests
 import clique
 
 import pyblish.api
@@ -25,6 +24,7 @@ from openpype.pipeline.farm.pyblish_functions import (
     prepare_representations,
     create_metadata_path
 )
+from openpype_modules.deadline.deadline_client import get_deadline_client
 
 
 def get_resource_files(resources, frame_range=None):
@@ -312,8 +312,9 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
 
         self.log.debug("Submitting Deadline publish job ...")
 
-        url = "{}/api/jobs".format(self.deadline_url)
-        response = requests.post(url, json=payload, timeout=10)
+        response = get_deadline_client(self.deadline_url).post(
+            "/api/jobs", json=payload
+        )
         if not response.ok:
             raise Exception(response.text)
 
@@ -1,6 +1,6 @@
 import pyblish.api
 
-from openpype_modules.deadline.abstract_submit_deadline import requests_get
+from openpype_modules.deadline.deadline_client import get_deadline_client
 
 
 class ValidateDeadlineConnection(pyblish.api.InstancePlugin):
@@ -26,7 +26,8 @@ class ValidateDeadlineConnection(pyblish.api.InstancePlugin):
         assert deadline_url, "Requires Deadline Webservice URL"
 
         if deadline_url not in self.responses:
-            self.responses[deadline_url] = requests_get(deadline_url)
+            self.responses[deadline_url] = get_deadline_client(
+                deadline_url).get("")
 
         response = self.responses[deadline_url]
         assert response.ok, "Response must be ok"
@@ -4,7 +4,10 @@ import requests
 import pyblish.api
 
 from openpype.lib import collect_frames
-from openpype_modules.deadline.abstract_submit_deadline import requests_get
+from openpype_modules.deadline.deadline_module import (
+    DeadlineWebserviceError
+)
+from openpype_modules.deadline.deadline_client import get_deadline_client
 
 
 class ValidateExpectedFiles(pyblish.api.InstancePlugin):
@@ -129,8 +132,9 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         """
         all_frame_lists = []
 
+        jobs_info = self._get_jobs_info(instance, dependent_job_ids)
         for job_id in dependent_job_ids:
-            job_info = self._get_job_info(instance, job_id)
+            job_info = jobs_info.get(job_id, {})
             frame_list = job_info["Props"].get("Frames")
             if frame_list:
                 all_frame_lists.extend(frame_list.split(','))
@@ -198,6 +202,20 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         Returns:
             (dict): Job info from Deadline
 
+        """
+        return self._get_jobs_info(instance, [job_id]).get(job_id, {})
+
+    def _get_jobs_info(self, instance, job_ids):
+        """Calls DL for actual job info of all 'job_ids' in one request.
+
+        Args:
+            instance (pyblish.api.Instance): pyblish instance
+            job_ids (list[str]): Deadline job ids
+
+        Returns:
+            (dict): Job info from Deadline by job id, empty if Deadline
+                is not accessible.
+
         """
         # get default deadline webservice url from deadline module
         deadline_url = instance.context.data["defaultDeadline"]
@@ -206,24 +224,15 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
             deadline_url = instance.data.get("deadlineUrl")
         assert deadline_url, "Requires Deadline Webservice URL"
 
-        url = "{}/api/jobs?JobID={}".format(deadline_url, job_id)
         try:
-            response = requests_get(url)
+            return get_deadline_client(deadline_url).get_jobs(job_ids)
         except requests.exceptions.ConnectionError:
             self.log.error("Deadline is not accessible at "
                            "{}".format(deadline_url))
             return {}
-
-        if not response.ok:
+        except DeadlineWebserviceError as exc:
             self.log.error("Submission failed!")
-            self.log.error(response.status_code)
-            self.log.error(response.content)
-            raise RuntimeError(response.text)
-
-        json_content = response.json()
-        if json_content:
-            return json_content.pop()
-        return {}
+            raise RuntimeError(str(exc))
 
     def _get_existing_files(self, staging_dir):
         """Returns set of existing file names from 'staging_dir'"""
@@ -2,9 +2,11 @@
 # -*- coding: utf-8 -*-
 import os
 import tempfile
+import time
 from datetime import datetime
 import subprocess
 import json
+import hashlib
 import platform
 import uuid
 import re
@@ -23,6 +25,12 @@ VERSION_REGEX = re.compile(
     r"(?:\+(?P<buildmetadata>[a-zA-Z\d\-.]*))?"
 )
 
+# Environments extracted for job are cached on worker in temp directory of
+#   user running the worker
+ENV_CACHE_DIR_NAME = "openpype_job_environments"
+# Cached environments older than this (in seconds) are not used
+ENV_CACHE_MAX_AGE = 24 * 60 * 60
+
 
 class OpenPypeVersion:
     """Fake semver version class for OpenPype version purposes.
@@ -286,6 +294,166 @@ def get_requested_openpype_executable(
     return FileUtils.SearchFileList(";".join(exe_list))
 
 
+def _get_env_cache_dir():
+    """Directory with cached environments of current user.
+
+    Temp directory is shared by all users on Linux and macOS, so name of
+    directory contains user id. On Windows is used local app data of user,
+    temp directory of worker running as service is shared.
+    """
+    if hasattr(os, "getuid"):
+        return os.path.join(
+            tempfile.gettempdir(),
+            "{}_{}".format(ENV_CACHE_DIR_NAME, os.getuid())
+        )
+
+    local_app_data = os.environ.get("LOCALAPPDATA")
+    if local_app_data:
+        return os.path.join(local_app_data, "Temp", ENV_CACHE_DIR_NAME)
+    return os.path.join(tempfile.gettempdir(), ENV_CACHE_DIR_NAME)
+
+
+def _get_env_cache_path(job, exe, args, context_values):
+    """Path to file with environments cached for job on this worker.
+
+    Path contains job id and hash of all values that affect extracted
+    environments, so changed job environment does not use old cache.
+    """
+    context_data = json.dumps(
+        [exe, args, context_values, platform.system()]
+    )
+    context_hash = hashlib.sha1(context_data.encode("utf-8")).hexdigest()
+    return os.path.join(
+        _get_env_cache_dir(),
+        "{}_{}.json".format(job.JobId, context_hash)
+    )
+
+
+def _is_private_path(path):
+    """Path is not a link, is owned by current user and is private.
+
+    Environments may contain secrets and other user must not be able to
+    read or prepare them. Access on Windows is limited by directory of user.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    path_stat = os.lstat(path)
+    return (
+        not os.path.islink(path)
+        and path_stat.st_uid == os.getuid()
+        and not path_stat.st_mode & 0o077
+    )
+
+
+def _load_cached_environments(cache_path):
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        if not (
+            _is_private_path(os.path.dirname(cache_path))
+            and _is_private_path(cache_path)
+        ):
+            print(">>> Cached environments are not private, ignoring them")
+            return None
+        if time.time() - os.path.getmtime(cache_path) > ENV_CACHE_MAX_AGE:
+            return None
+        with open(cache_path) as fp:
+            return json.load(fp)
+    except (IOError, OSError, ValueError):
+        print(">>> Failed to load cached environments")
+    return None
+
+
+def _store_cached_environments(cache_path, contents):
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        if not _is_private_path(cache_dir):
+            print(">>> Cache directory is not private: {}".format(cache_dir))
+            return
+
+        # Remove caches of old jobs
+        now = time.time()
+        for filename in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, filename)
+            if now - os.path.getmtime(path) > ENV_CACHE_MAX_AGE:
+                os.remove(path)
+
+        # Write to temp file and rename so tasks running concurrently
+        #   on worker don't read incomplete file
+        #   - environments may contain secrets, only owner can read it
+        tmp_path = "{}.{}.tmp".format(cache_path, uuid.uuid4().hex)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as fp:
+            json.dump(contents, fp)
+        os.replace(tmp_path, cache_path)
+
+    except (IOError, OSError):
+        print(">>> Failed to cache environments")
+
+
+def extract_environments(deadlinePlugin, label, exe, args, context_values):
+    """Extract environments for job or use environments cached for job.
+
+    Running 'extractenvironments' is expensive, so result is cached for the
+    job on the worker and only the first task of the job on the worker
+    runs it.
+
+    Args:
+        deadlinePlugin (DeadlinePlugin): Plugin processing the task.
+        label (str): Label of executable used in messages.
+        exe (str): Path to OpenPype or Ayon executable.
+        args (list[str]): Context arguments for 'extractenvironments'.
+        context_values (list[str]): Other values affecting environments.
+
+    Returns:
+        dict[str, str]: Extracted environments.
+    """
+    job = deadlinePlugin.GetJob()
+    cache_path = _get_env_cache_path(job, exe, args, context_values)
+    contents = _load_cached_environments(cache_path)
+    if contents is not None:
+        print(">>> Using cached environments: {}".format(cache_path))
+        return contents
+
+    # tempfile.TemporaryFile cannot be used because of locking
+    temp_file_name = "{}_{}.json".format(
+        datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
+        str(uuid.uuid1())
+    )
+    export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
+    print(">>> Temporary path: {}".format(export_url))
+
+    process_args = [
+        "--headless",
+        "extractenvironments",
+        export_url
+    ]
+    process_args.extend(args)
+
+    args_str = subprocess.list2cmdline(process_args)
+    print(">>> Executing: {} {}".format(exe, args_str))
+    process_exitcode = deadlinePlugin.RunProcess(
+        exe, args_str, os.path.dirname(exe), -1
+    )
+
+    if process_exitcode != 0:
+        raise RuntimeError(
+            "Failed to run {} process to extract environments.".format(label)
+        )
+
+    print(">>> Loading file ...")
+    with open(export_url) as fp:
+        contents = json.load(fp)
+
+    print(">>> Removing temporary file")
+    os.remove(export_url)
+
+    _store_cached_environments(cache_path, contents)
+    return contents
+
+
 def inject_openpype_environment(deadlinePlugin):
     """ Pull env vars from OpenPype and push them to rendering process.
 
@@ -321,19 +489,7 @@ def inject_openpype_environment(deadlinePlugin):
 
         print("--- OpenPype executable: {}".format(exe))
 
-        # tempfile.TemporaryFile cannot be used because of locking
-        temp_file_name = "{}_{}.json".format(
-            datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
-            str(uuid.uuid1())
-        )
-        export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
-        print(">>> Temporary path: {}".format(export_url))
-
-        args = [
-            "--headless",
-            "extractenvironments",
-            export_url
-        ]
+        args = []
 
         add_kwargs = {
             "project": job.GetJobEnvironmentKeyValue("AVALON_PROJECT"),
@@ -367,21 +523,14 @@ def inject_openpype_environment(deadlinePlugin):
 
         os.environ["AVALON_TIMEOUT"] = "5000"
 
-        args_str = subprocess.list2cmdline(args)
-        print(">>> Executing: {} {}".format(exe, args_str))
-        process_exitcode = deadlinePlugin.RunProcess(
-            exe, args_str, os.path.dirname(exe), -1
+        contents = extract_environments(
+            deadlinePlugin,
+            "OpenPype",
+            exe,
+            args,
+            [openpype_mongo or os.environ.get("OPENPYPE_MONGO")]
         )
 
-        if process_exitcode != 0:
-            raise RuntimeError(
-                "Failed to run OpenPype process to extract environments."
-            )
-
-        print(">>> Loading file ...")
-        with open(export_url) as fp:
-            contents = json.load(fp)
-
         for key, value in contents.items():
             deadlinePlugin.SetProcessEnvironmentVariable(key, value)
 
@@ -397,9 +546,6 @@ def inject_openpype_environment(deadlinePlugin):
             print(">>> Setting script path {}".format(script_url))
             job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
 
-        print(">>> Removing temporary file")
-        os.remove(export_url)
-
         print(">> Injection end.")
     except Exception as e:
         if hasattr(e, "output"):
@@ -455,19 +601,7 @@ def inject_ayon_environment(deadlinePlugin):
                 "AYON_SERVER_URL and AYON_API_KEY"
             ))
 
-        # tempfile.TemporaryFile cannot be used because of locking
-        temp_file_name = "{}_{}.json".format(
-            datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
-            str(uuid.uuid1())
-        )
-        export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
-        print(">>> Temporary path: {}".format(export_url))
-
-        args = [
-            "--headless",
-            "extractenvironments",
-            export_url
-        ]
+        args = []
 
         add_kwargs = {
             "project": job.GetJobEnvironmentKeyValue("AVALON_PROJECT"),
@@ -500,21 +634,14 @@ def inject_ayon_environment(deadlinePlugin):
             # Add the env var for current calls to `DeadlinePlugin.RunProcess`
             deadlinePlugin.SetProcessEnvironmentVariable(env, val)
 
-        args_str = subprocess.list2cmdline(args)
-        print(">>> Executing: {} {}".format(exe, args_str))
-        process_exitcode = deadlinePlugin.RunProcess(
-            exe, args_str, os.path.dirname(exe), -1
+        contents = extract_environments(
+            deadlinePlugin,
+            "Ayon",
+            exe,
+            args,
+            [ayon_server_url, ayon_bundle_name]
         )
 
-        if process_exitcode != 0:
-            raise RuntimeError(
-                "Failed to run Ayon process to extract environments."
-            )
-
-        print(">>> Loading file ...")
-        with open(export_url) as fp:
-            contents = json.load(fp)
-
         for key, value in contents.items():
             deadlinePlugin.SetProcessEnvironmentVariable(key, value)
 
@@ -530,9 +657,6 @@ def inject_ayon_environment(deadlinePlugin):
             print(">>> Setting script path {}".format(script_url))
             job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
 
-        print(">>> Removing temporary file")
-        os.remove(export_url)
-
         print(">> Injection end.")
     except Exception as e:
         if hasattr(e, "output"):
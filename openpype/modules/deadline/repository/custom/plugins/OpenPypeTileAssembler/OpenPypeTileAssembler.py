@@ -6,6 +6,10 @@ Todo:
 """
 import os
 import re
+import json
+import time
+import hashlib
+import tempfile
 import subprocess
 import xml.etree.ElementTree
 
@@ -42,6 +46,16 @@ XML_CHAR_REF_REGEX_HEX = re.compile(r"&#x?[0-9a-fA-F]+;")
 # Regex to parse array attributes
 ARRAY_TYPE_REGEX = re.compile(r"^(int|float|string)\[\d+\]$")
 
+# Regex to replace frame number in tile file path
+FRAME_NUMBER_REGEX = re.compile(r"(.+\.)([0-9]+)(\.[^.]+)$")
+
+# Geometry of tiles is the same for all frames of a submission, it's stored
+#   in temp directory of worker so only first frame has to probe tiles
+TILES_GEOMETRY_CACHE_DIR_NAME = "openpype_tile_assembler"
+# Cached geometry of submissions older than this is removed
+TILES_GEOMETRY_CACHE_MAX_AGE = 3 * 24 * 60 * 60
+_TILES_GEOMETRY_CACHE = {}
+
 
 def convert_value_by_type_name(value_type, value):
     """Convert value to proper type based on type name.
@@ -234,6 +248,106 @@ def info_about_input(oiiotool_path, filepath):
     return parse_oiio_xml_output(xml_text)
 
 
+def _get_tiles_geometry_cache_path(key):
+    return os.path.join(
+        tempfile.gettempdir(),
+        TILES_GEOMETRY_CACHE_DIR_NAME,
+        "{}.json".format(key)
+    )
+
+
+def _prune_tiles_geometry_cache(cache_dir):
+    """Remove cached geometry of old submissions."""
+    oldest_time = time.time() - TILES_GEOMETRY_CACHE_MAX_AGE
+    for filename in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, filename)
+        try:
+            if os.path.getmtime(path) < oldest_time:
+                os.remove(path)
+        except (IOError, OSError):
+            # Removed by other process
+            continue
+
+
+def probe_tiles_geometry(oiiotool_path, tile_info):
+    """Probe format, channels count and heights of tiles with oiiotool.
+
+    Args:
+        oiiotool_path (str): Path to oiiotool.
+        tile_info (list): Tile items with `filepath` key.
+
+    Returns:
+        dict: With keys `format`, `nchannels` and `heights` (list of
+            heights of tiles in order of `tile_info`).
+
+    """
+    first_tile_info = info_about_input(
+        oiiotool_path, tile_info[0]["filepath"])
+    heights = [first_tile_info["height"]]
+    for tile in tile_info[1:]:
+        heights.append(
+            info_about_input(oiiotool_path, tile["filepath"])["height"]
+        )
+    return {
+        "format": first_tile_info.get("format"),
+        "nchannels": first_tile_info["nchannels"],
+        "heights": heights,
+    }
+
+
+def get_tiles_geometry(oiiotool_path, tile_info, key_data):
+    """Cached format, channels count and heights of tiles.
+
+    Tiles are probed with oiiotool only if geometry for the key is not
+    cached in memory or in temp directory.
+
+    Args:
+        oiiotool_path (str): Path to oiiotool.
+        tile_info (list): Tile items with `filepath` key.
+        key_data (Any): Json serializable data identifying tiles layout
+            which is the same for all frames of a submission, must contain
+            id of the submission.
+
+    Returns:
+        dict: Geometry from `probe_tiles_geometry`.
+
+    """
+    key = hashlib.sha1(
+        json.dumps(key_data, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    geometry = _TILES_GEOMETRY_CACHE.get(key)
+    if geometry is not None:
+        return geometry
+
+    cache_path = _get_tiles_geometry_cache_path(key)
+    try:
+        with open(cache_path, "r") as stream:
+            geometry = json.load(stream)
+    except (IOError, OSError, ValueError):
+        geometry = None
+
+    if geometry is None or len(geometry["heights"]) != len(tile_info):
+        geometry = probe_tiles_geometry(oiiotool_path, tile_info)
+        # Write to temp file and rename so other processes don't read
+        #   incomplete file
+        tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            if not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            else:
+                _prune_tiles_geometry_cache(cache_dir)
+            with open(tmp_path, "w") as stream:
+                json.dump(geometry, stream)
+            os.replace(tmp_path, cache_path)
+        except (IOError, OSError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    _TILES_GEOMETRY_CACHE[key] = geometry
+    return geometry
+
+
 def GetDeadlinePlugin():  # noqa: N802
     """Helper."""
     return OpenPypeTileAssembler()
@@ -270,7 +384,9 @@ class OpenPypeTileAssembler(DeadlinePlugin):
     def initialize_process(self):
         """Initialization."""
         self.LogInfo("Plugin version: {}".format(version_string))
-        self.SingleFramesOnly = True
+        # Multiple frames can be assembled in one task if job has
+        #   'ConfigFile<frame>' for each frame in plugin info
+        self.SingleFramesOnly = False
         self.StdoutHandling = True
         self.renderer = self.GetPluginInfoEntryWithDefault(
             "Renderer", "undefined")
@@ -305,10 +421,31 @@ class OpenPypeTileAssembler(DeadlinePlugin):
             (str): arguments to add to render executable.
 
         """
-        # Read tile config file. This file is in compatible format with
-        # Draft Tile Assembler
+        oiiotool_path = self.render_executable()
+        arguments = []
+        self.tiles = []
+        for config_file in self.config_files:
+            if arguments:
+                # Remove output of previous frame from stack
+                arguments.append("--pop")
+            arguments.extend(
+                self.frame_oiio_args(oiiotool_path, config_file))
+
+        self.LogInfo(
+            "Using arguments: {}".format(" ".join(arguments)))
+        return " ".join(arguments)
+
+    def read_config_file(self, config_file):
+        """Read tile config file.
+
+        This file is in compatible format with Draft Tile Assembler.
+
+        Returns:
+            (dict): Key-value pairs from config file.
+
+        """
         data = {}
-        with open(self.config_file, "rU") as f:
+        with open(config_file, "rU") as f:
             for text in f:
                 # Parsing key-value pair and removing white-space
                 # around the entries
@@ -321,6 +458,16 @@ class OpenPypeTileAssembler(DeadlinePlugin):
                         # should never be called
                         self.FailRender(
                             "Cannot parse config file: {}".format(e))
+        return data
+
+    def frame_oiio_args(self, oiiotool_path, config_file):
+        """Generate oiio tool arguments for frame from config file.
+
+        Returns:
+            (list): oiio tools arguments.
+
+        """
+        data = self.read_config_file(config_file)
 
         # Get output file. We support only EXRs now.
         output_file = data["ImageFileName"]
@@ -336,14 +483,38 @@ class OpenPypeTileAssembler(DeadlinePlugin):
                 "height": int(data["Tile{}Height".format(tile)]),
                 "width": int(data["Tile{}Width".format(tile)])
             })
-
-        arguments = self.tile_oiio_args(
-            int(data["ImageWidth"]), int(data["ImageHeight"]),
-            tile_info, output_file)
-        self.LogInfo(
-            "Using arguments: {}".format(" ".join(arguments)))
-        self.tiles = tile_info
-        return " ".join(arguments)
+        self.tiles.extend(tile_info)
+
+        output_width = int(data["ImageWidth"])
+        output_height = int(data["ImageHeight"])
+        # Submission id is part of key, later submissions may render
+        #   different channels or bit depth to the same paths. Assembly jobs
+        #   of one submission share it, each job assembles single frame.
+        submission_id = self.GetPluginInfoEntryWithDefault(
+            "TilesGeometryKey", "") or self.GetJob().JobId
+        key_data = [
+            submission_id,
+            self.renderer,
+            output_width,
+            output_height,
+            [
+                [
+                    FRAME_NUMBER_REGEX.sub(r"\1#\3", tile["filepath"]),
+                    tile["pos_x"],
+                    tile["pos_y"],
+                    tile["width"],
+                    tile["height"],
+                ]
+                for tile in tile_info
+            ]
+        ]
+        tiles_geometry = get_tiles_geometry(
+            oiiotool_path, tile_info, key_data)
+
+        return self.tile_oiio_args(
+            output_width, output_height, tile_info, output_file,
+            tiles_geometry
+        )
 
     def process_path(self, filepath):
         """Handle slashes in file paths."""
@@ -358,21 +529,35 @@ class OpenPypeTileAssembler(DeadlinePlugin):
     def pre_render_tasks(self):
         """Load config file and do remapping."""
         self.LogInfo("OpenPype Tile Assembler starting...")
-        config_file = self.GetPluginInfoEntry("ConfigFile")
+        default_config_file = self.GetPluginInfoEntryWithDefault(
+            "ConfigFile", "")
+
+        config_files = []
+        for frame in range(self.GetStartFrame(), self.GetEndFrame() + 1):
+            config_file = self.GetPluginInfoEntryWithDefault(
+                "ConfigFile{}".format(frame), default_config_file)
+            if not config_file:
+                self.FailRender(
+                    "Config file for frame {} is not set.".format(frame))
+            if config_file not in config_files:
+                config_files.append(config_file)
 
         temp_scene_directory = self.CreateTempDirectory(
             "thread" + str(self.GetThreadNumber()))
-        temp_scene_filename = Path.GetFileName(config_file)
-        self.config_file = Path.Combine(
-            temp_scene_directory, temp_scene_filename)
-
-        if SystemUtils.IsRunningOnWindows():
-            RepositoryUtils.CheckPathMappingInFileAndReplaceSeparator(
-                config_file, self.config_file, "/", "\\")
-        else:
-            RepositoryUtils.CheckPathMappingInFileAndReplaceSeparator(
-                config_file, self.config_file, "\\", "/")
-            os.chmod(self.config_file, os.stat(self.config_file).st_mode)
+        self.config_files = []
+        for config_file in config_files:
+            temp_scene_filename = Path.GetFileName(config_file)
+            temp_config_file = Path.Combine(
+                temp_scene_directory, temp_scene_filename)
+
+            if SystemUtils.IsRunningOnWindows():
+                RepositoryUtils.CheckPathMappingInFileAndReplaceSeparator(
+                    config_file, temp_config_file, "/", "\\")
+            else:
+                RepositoryUtils.CheckPathMappingInFileAndReplaceSeparator(
+                    config_file, temp_config_file, "\\", "/")
+                os.chmod(temp_config_file, os.stat(temp_config_file).st_mode)
+            self.config_files.append(temp_config_file)
 
     def post_render_tasks(self):
         """Cleanup tiles if required."""
@@ -398,7 +583,8 @@ class OpenPypeTileAssembler(DeadlinePlugin):
         self.FailRender(self.GetRegexMatch(0))
 
     def tile_oiio_args(
-            self, output_width, output_height, tile_info, output_path):
+            self, output_width, output_height, tile_info, output_path,
+            tiles_geometry=None):
         """Generate oiio tool arguments for tile assembly.
 
         Args:
@@ -409,6 +595,9 @@ class OpenPypeTileAssembler(DeadlinePlugin):
                 representing path to file and x, y coordinates on output
                 image where top-left point of tile item should start.
             output_path (str): Path to file where should be output stored.
+            tiles_geometry (dict, optional): Format, channels count and
+                heights of tiles from `get_tiles_geometry`. Tiles are
+                probed if not passed.
 
         Returns:
             (list): oiio tools arguments.
@@ -418,26 +607,25 @@ class OpenPypeTileAssembler(DeadlinePlugin):
 
         # Create new image with output resolution, and with same type and
         # channels as input
-        oiiotool_path = self.render_executable()
-        first_tile_path = tile_info[0]["filepath"]
-        first_tile_info = info_about_input(oiiotool_path, first_tile_path)
+        if tiles_geometry is None:
+            tiles_geometry = probe_tiles_geometry(
+                self.render_executable(), tile_info)
         create_arg_template = "--create{} {}x{} {}"
 
         image_type = ""
-        image_format = first_tile_info.get("format")
+        image_format = tiles_geometry["format"]
         if image_format:
             image_type = ":type={}".format(image_format)
 
         create_arg = create_arg_template.format(
             image_type, output_width,
-            output_height, first_tile_info["nchannels"]
+            output_height, tiles_geometry["nchannels"]
         )
         args.append(create_arg)
 
-        for tile in tile_info:
+        for tile, tile_height in zip(tile_info, tiles_geometry["heights"]):
             path = tile["filepath"]
             pos_x = tile["pos_x"]
-            tile_height = info_about_input(oiiotool_path, path)["height"]
             if self.renderer == "vray":
                 pos_y = tile["pos_y"]
             else:
@@ -2,7 +2,6 @@ import os
 import collections
 import uuid
 
-import clique
 from pymongo import UpdateOne
 
 from openpype.client import (
@@ -15,6 +14,7 @@ from openpype.lib import (
     StringTemplate,
     TemplateUnsolved,
     format_file_size,
+    get_collections,
 )
 from openpype.pipeline import AvalonMongoDB, Anatomy
 from openpype_modules.ftrack.lib import BaseAction, statics_icon
@@ -470,8 +470,7 @@ class DeleteOldVersions(BaseAction):
         size = 0
 
         for dir_id, dir_path in dir_paths.items():
-            dir_files = os.listdir(dir_path)
-            collections, remainders = clique.assemble(dir_files)
+            collections, remainders = get_collections(dir_path)
             for file_path, seq_path in file_paths[dir_id]:
                 file_path_base = os.path.split(file_path)[1]
                 # Just remove file if `frame` key was not in context or
@@ -1,9 +1,14 @@
 import json
+import asyncio
 
-from aiohttp.web_response import Response
+from aiohttp.web_response import Response, StreamResponse
 
 
 class JobQueueResource:
+    # Send comment to event stream to keep connection alive
+    keep_alive_seconds = 15
+    finished_states = ("done", "error", "deleted")
+
     def __init__(self, job_queue, server_manager):
         self.server_manager = server_manager
 
@@ -11,9 +16,13 @@ class JobQueueResource:
 
         self._job_queue = job_queue
 
+        # NOTE '/jobs/events' and '/jobs/batch' must be registered before
+        #   '/jobs/{job_id}'
         self.endpoint_defs = (
             ("POST", "/jobs", self.post_job),
+            ("POST", "/jobs/batch", self.post_jobs),
             ("GET", "/jobs", self.get_jobs),
+            ("GET", "/jobs/events", self.get_job_events),
             ("GET", "/jobs/{job_id}", self.get_job)
         )
 
@@ -32,17 +41,73 @@ class JobQueueResource:
             jobs_data.append(job.status())
         return Response(status=200, body=self.encode(jobs_data))
 
-    async def post_job(self, request):
-        data = await request.json()
-        host_name = data.get("host_name")
+    @staticmethod
+    def _parse_job_info(data, default_host_name=None):
+        """Host name, priority and max retries from job data.
+
+        Raises:
+            ValueError: Data are not valid.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Job data must be an object.")
+
+        host_name = data.get("host_name") or default_host_name
         if not host_name:
-            return Response(
-                status=400, message="Key \"host_name\" not filled."
+            raise ValueError("Key \"host_name\" not filled.")
+
+        try:
+            priority = int(data.get("priority") or 0)
+            max_retries = data.get("max_retries")
+            if max_retries is not None:
+                max_retries = int(max_retries)
+        except (TypeError, ValueError):
+            raise ValueError(
+                "Keys \"priority\" and \"max_retries\" must be int."
             )
+        return host_name, data, priority, max_retries
 
-        job = self._job_queue.create_job(host_name, data)
+    async def post_job(self, request):
+        data = await request.json()
+        try:
+            job_info = self._parse_job_info(data)
+        except ValueError as exc:
+            return Response(status=400, text=str(exc))
+
+        job = self._job_queue.create_job(*job_info)
         return Response(status=201, text=job.id)
 
+    async def post_jobs(self, request):
+        """Create multiple jobs with one request.
+
+        Body contains "jobs" with list of job data. Key "host_name" can be
+        defined for all jobs next to "jobs". Response contains ids of created
+        jobs in passed order. No job is created if any of them is invalid.
+        """
+        data = await request.json()
+        if not isinstance(data, dict):
+            return Response(status=400, text="Body must be an object.")
+
+        jobs_data = data.get("jobs")
+        if not isinstance(jobs_data, list):
+            return Response(status=400, text="Key \"jobs\" not filled.")
+
+        default_host_name = data.get("host_name")
+        jobs_info = []
+        for job_data in jobs_data:
+            try:
+                job_info = self._parse_job_info(job_data, default_host_name)
+            except ValueError as exc:
+                return Response(status=400, text=str(exc))
+            job_data["host_name"] = job_info[0]
+            jobs_info.append(job_info)
+
+        jobs = self._job_queue.create_jobs(jobs_info)
+        return Response(
+            status=201,
+            body=self.encode([job.id for job in jobs]),
+            content_type="application/json"
+        )
+
     async def get_job(self, request):
         job_id = request.match_info["job_id"]
         content = self._job_queue.get_job_status(job_id)
@@ -54,9 +119,75 @@ class JobQueueResource:
             content_type="application/json"
         )
 
+    async def get_job_events(self, request):
+        """Stream of job status changes as server-sent events.
+
+        Query "job_ids" (comma separated) limits events to specific jobs,
+        current status of those jobs is sent first and stream ends when all
+        of them are finished. Without the query are sent changes of all jobs
+        until client disconnects.
+        """
+        job_ids = None
+        job_ids_value = request.query.get("job_ids")
+        if job_ids_value:
+            job_ids = set(job_ids_value.split(","))
+
+        queue = asyncio.Queue()
+        listener = queue.put_nowait
+        # Register listener before current state is collected
+        self._job_queue.add_listener(listener)
+        response = StreamResponse(
+            status=200,
+            headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-cache",
+            }
+        )
+        try:
+            await response.prepare(request)
+            pending_ids = None
+            if job_ids is not None:
+                pending_ids = set()
+                for job_id in job_ids:
+                    status = self._job_queue.get_job_status(job_id)
+                    if not status:
+                        status = {"id": job_id, "state": "deleted"}
+                    await response.write(self.encode_event(status))
+                    if status["state"] not in self.finished_states:
+                        pending_ids.add(job_id)
+
+            while pending_ids is None or pending_ids:
+                try:
+                    status = await asyncio.wait_for(
+                        queue.get(), self.keep_alive_seconds
+                    )
+                except asyncio.TimeoutError:
+                    await response.write(b": keep-alive\n\n")
+                    continue
+
+                if job_ids is not None:
+                    if status["id"] not in job_ids:
+                        continue
+                    if status["state"] in self.finished_states:
+                        pending_ids.discard(status["id"])
+                await response.write(self.encode_event(status))
+
+        except ConnectionResetError:
+            pass
+
+        finally:
+            self._job_queue.remove_listener(listener)
+        return response
+
     @classmethod
     def encode(cls, data):
         return json.dumps(
             data,
             indent=4
         ).encode("utf-8")
+
+    @classmethod
+    def encode_event(cls, status):
+        return "event: job\ndata: {}\n\n".format(
+            json.dumps(status)
+        ).encode("utf-8")
@@ -1,27 +1,60 @@
+import heapq
 import datetime
+import itertools
 import collections
 from uuid import uuid4
 
 
+def _to_timestamp(value):
+    if value is None:
+        return None
+    return value.timestamp()
+
+
+def _from_timestamp(value):
+    if value is None:
+        return None
+    return datetime.datetime.fromtimestamp(value)
+
+
 class Job:
     """Job related to specific host name.
 
     Data must contain everything needed to finish the job.
+
+    Jobs with higher priority are assigned first. Job is requeued when it's
+    worker is lost until 'max_retries' is reached. Failure reported by
+    worker is final.
     """
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
-
-    def __init__(self, host_name, data, job_id=None, created_time=None):
+    default_max_retries = 3
+
+    def __init__(
+        self,
+        host_name,
+        data,
+        job_id=None,
+        created_time=None,
+        priority=0,
+        max_retries=None
+    ):
         if job_id is None:
             job_id = str(uuid4())
         self._id = job_id
         if created_time is None:
             created_time = datetime.datetime.now()
+        if max_retries is None:
+            max_retries = self.default_max_retries
         self._created_time = created_time
         self._started_time = None
         self._done_time = None
         self.host_name = host_name
         self.data = data
+        self.priority = priority
+        self.max_retries = max_retries
+        self.attempts = 0
+        self.retry_time = None
         self._result_data = None
 
         self._started = False
@@ -44,10 +77,18 @@ class Job:
     def id(self):
         return self._id
 
+    @property
+    def created_time(self):
+        return self._created_time
+
     @property
     def done(self):
         return self._done
 
+    @property
+    def worker(self):
+        return self._worker
+
     def reset(self):
         self._started = False
         self._started_time = None
@@ -56,7 +97,7 @@ class Job:
         self._errored = False
         self._message = None
 
-        self._worker = None
+        self.set_worker(None)
 
     @property
     def started(self):
@@ -74,7 +115,11 @@ class Job:
         if worker is self._worker:
             return
 
-        if self._worker is not None:
+        # Worker may already process another job
+        if (
+            self._worker is not None
+            and self._worker.current_job is self
+        ):
             self._worker.set_current_job(None)
 
         self._worker = worker
@@ -94,6 +139,18 @@ class Job:
         if self._worker is not None:
             self._worker.set_current_job(None)
 
+    @property
+    def state(self):
+        if self._deleted:
+            return "deleted"
+        if self._errored:
+            return "error"
+        if self._done:
+            return "done"
+        if self._started:
+            return "started"
+        return "waiting"
+
     def status(self):
         worker_id = None
         if self._worker is not None:
@@ -104,39 +161,123 @@ class Job:
             "done": self._done
         }
         output["message"] = self._message or None
-
-        state = "waiting"
-        if self._deleted:
-            state = "deleted"
-        elif self._errored:
-            state = "error"
-        elif self._done:
-            state = "done"
-        elif self._started:
-            state = "started"
-
         output["result"] = self._result_data
-
-        output["state"] = state
+        output["state"] = self.state
+        output["priority"] = self.priority
+        output["attempts"] = self.attempts
 
         return output
 
+    def to_data(self):
+        """Serialize job for persistent storage."""
+        return {
+            "id": self.id,
+            "host_name": self.host_name,
+            "data": self.data,
+            "priority": self.priority,
+            "max_retries": self.max_retries,
+            "attempts": self.attempts,
+            "state": self.state,
+            "message": self._message,
+            "result": self._result_data,
+            "created_time": _to_timestamp(self._created_time),
+            "started_time": _to_timestamp(self._started_time),
+            "done_time": _to_timestamp(self._done_time),
+            "retry_time": _to_timestamp(self.retry_time),
+        }
+
+    @classmethod
+    def from_data(cls, job_data):
+        """Create job from data stored by 'to_data'."""
+        job = cls(
+            job_data["host_name"],
+            job_data["data"],
+            job_id=job_data["id"],
+            created_time=_from_timestamp(job_data["created_time"]),
+            priority=job_data["priority"],
+            max_retries=job_data["max_retries"]
+        )
+        job.attempts = job_data["attempts"]
+        job.retry_time = _from_timestamp(job_data["retry_time"])
+        job._started_time = _from_timestamp(job_data["started_time"])
+        job._started = job._started_time is not None
+        job._done_time = _from_timestamp(job_data["done_time"])
+        job._done = job._done_time is not None
+        job._errored = job_data["state"] == "error"
+        job._message = job_data["message"]
+        job._result_data = job_data["result"]
+        return job
+
 
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
     Also asign jobs to a worker.
+
+    Jobs are stored to passed storage on each change so they're restored
+    when server is restarted. Jobs that were assigned to a worker before
+    restart are requeued.
+
+    Args:
+        storage (Optional[JobStorage]): Persistent storage of jobs.
     """
     old_jobs_check_minutes_interval = 30
-
-    def __init__(self):
-        self._last_old_jobs_check = datetime.datetime.now()
+    # Job of worker which did not send heartbeat is requeued
+    worker_lease_seconds = 120
+    # Time for workers to reconnect after restart before jobs are errored
+    worker_reconnect_seconds = 60
+    retry_backoff_seconds = 5
+    max_retry_backoff_seconds = 300
+
+    def __init__(self, storage=None):
+        now = datetime.datetime.now()
+        self._last_old_jobs_check = now
+        self._wait_for_workers_until = None
+        self._storage = storage
+        self._listeners = []
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
-        )
+        # Heap of (-priority, order, job) for each host name
+        self._job_queue_by_host_name = collections.defaultdict(list)
+        # Heap of (retry time, order, job) waiting for retry
+        self._delayed_jobs = []
+        self._order_counter = itertools.count()
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        self._idle_workers_by_host_name = collections.defaultdict(
+            collections.OrderedDict
+        )
+        if storage is not None:
+            self._restore_jobs(now)
+
+    def _restore_jobs(self, now):
+        jobs = [
+            Job.from_data(job_data)
+            for job_data in self._storage.load_jobs()
+        ]
+        jobs.sort(key=lambda job: job.created_time)
+        requeued = False
+        for job in jobs:
+            self._jobs_by_id[job.id] = job
+            if job.done:
+                continue
+
+            requeued = True
+            # Job was processed by a worker when server stopped
+            if job._started or job.attempts:
+                self._retry_job(
+                    job, "Server was stopped while job was processed."
+                )
+            else:
+                self._enqueue_job(job)
+
+        if requeued:
+            self._wait_for_workers_until = now + datetime.timedelta(
+                seconds=self.worker_reconnect_seconds
+            )
+
+    def close(self):
+        if self._storage is not None:
+            self._storage.close()
 
     def workers(self):
         """All currently registered workers."""
@@ -147,6 +288,7 @@ class JobQueue:
         print("Added new worker for \"{}\"".format(host_name))
         self._workers_by_id[worker.id] = worker
         self._workers_by_host_name[host_name].append(worker)
+        self._set_worker_idle(worker)
 
     def get_worker(self, worker_id):
         return self._workers_by_id.get(worker_id)
@@ -155,48 +297,84 @@ class JobQueue:
         # Look if worker had assigned job to do
         job = worker.current_job
         if job is not None and not job.done:
-            # Reset job
-            job.set_worker(None)
-            job.reset()
-            # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
+            self._retry_job(job, "Worker processing the job was lost.")
 
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
         host_name = worker.host_name
+        self._idle_workers_by_host_name[host_name].pop(worker.id, None)
         if worker in self._workers_by_host_name[host_name]:
             self._workers_by_host_name[host_name].remove(worker)
 
         print("Removed worker for \"{}\"".format(host_name))
 
+    def heartbeat(self, worker_id):
+        """Worker is alive, extend lease of its job.
+
+        Returns:
+            bool: Worker is registered.
+        """
+        worker = self._workers_by_id.get(worker_id)
+        if worker is None:
+            return False
+        worker.renew_lease(self.worker_lease_seconds)
+        return True
+
+    def get_expired_workers(self):
+        """Workers with assigned job which did not send heartbeat in time."""
+        return [
+            worker
+            for worker in self._workers_by_id.values()
+            if worker.job_assigned() and worker.lease_expired()
+        ]
+
     def assign_jobs(self):
         """Try to assign job for each idle worker.
 
         Error all jobs without needed worker.
         """
-        available_host_names = set()
-        for worker in self._workers_by_id.values():
-            host_name = worker.host_name
-            available_host_names.add(host_name)
-            if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
-                        break
-
-        for host_name in tuple(self._job_queue_by_host_name.keys()):
-            if host_name in available_host_names:
+        now = datetime.datetime.now()
+        self._enqueue_delayed_jobs(now)
+        for host_name, jobs in self._job_queue_by_host_name.items():
+            idle_workers = self._idle_workers_by_host_name.get(host_name)
+            while jobs and idle_workers:
+                _, _, job = heapq.heappop(jobs)
+                if job.deleted:
+                    continue
+                _, worker = idle_workers.popitem(last=False)
+                self._assign_job(worker, job)
+
+        if (
+            self._wait_for_workers_until is not None
+            and now < self._wait_for_workers_until
+        ):
+            return
+
+        for host_name, jobs in self._job_queue_by_host_name.items():
+            if self._workers_by_host_name.get(host_name):
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
             message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
+            while jobs:
+                _, _, job = heapq.heappop(jobs)
                 if not job.deleted:
                     job.set_done(False, message)
-        self._remove_old_jobs()
+                    self._job_changed(job)
+        self._remove_old_jobs(now)
+
+    def finish_job(self, worker_id, job_id, success, message, data):
+        """Worker finished a job."""
+        worker = self._workers_by_id.get(worker_id)
+        if worker is not None:
+            worker.set_current_job(None)
+
+        job = self._jobs_by_id.get(job_id)
+        if job is not None:
+            job.set_done(success, message, data)
+            self._job_changed(job)
+
+        if worker is not None:
+            self._set_worker_idle(worker)
 
     def get_jobs(self):
         return self._jobs_by_id.values()
@@ -205,32 +383,135 @@ class JobQueue:
         """Job by it's id."""
         return self._jobs_by_id.get(job_id)
 
-    def create_job(self, host_name, job_data):
+    def create_job(self, host_name, job_data, priority=0, max_retries=None):
         """Create new job from passed data and add it to queue."""
-        job = Job(host_name, job_data)
+        job = Job(
+            host_name, job_data, priority=priority, max_retries=max_retries
+        )
         self._jobs_by_id[job.id] = job
-        self._job_queue_by_host_name[host_name].append(job)
+        self._enqueue_job(job)
+        self._job_changed(job)
         return job
 
-    def _remove_old_jobs(self):
+    def create_jobs(self, jobs_info):
+        """Create multiple jobs at once.
+
+        Args:
+            jobs_info (Iterable[tuple[str, dict, int, Optional[int]]]): Host
+                name, job data, priority and max retries of each job.
+
+        Returns:
+            list[Job]: Created jobs in passed order.
+        """
+        return [
+            self.create_job(host_name, job_data, priority, max_retries)
+            for host_name, job_data, priority, max_retries in jobs_info
+        ]
+
+    def _assign_job(self, worker, job):
+        job.attempts += 1
+        job.retry_time = None
+        job.set_worker(worker)
+        worker.renew_lease(self.worker_lease_seconds)
+        self._job_changed(job)
+
+    def _retry_job(self, job, message):
+        """Requeue job with backoff or error it when out of retries."""
+        worker = job.worker
+        job.reset()
+        if worker is not None:
+            self._set_worker_idle(worker)
+
+        if job.attempts > job.max_retries:
+            job.set_done(False, message)
+        else:
+            backoff = min(
+                self.retry_backoff_seconds * (2 ** max(job.attempts - 1, 0)),
+                self.max_retry_backoff_seconds
+            )
+            job.retry_time = (
+                datetime.datetime.now()
+                + datetime.timedelta(seconds=backoff)
+            )
+            self._enqueue_job(job)
+        self._job_changed(job)
+
+    def _enqueue_job(self, job):
+        order = next(self._order_counter)
+        if job.retry_time is not None:
+            heapq.heappush(
+                self._delayed_jobs, (job.retry_time, order, job)
+            )
+        else:
+            heapq.heappush(
+                self._job_queue_by_host_name[job.host_name],
+                (-job.priority, order, job)
+            )
+
+    def _enqueue_delayed_jobs(self, now):
+        while self._delayed_jobs and self._delayed_jobs[0][0] <= now:
+            _, order, job = heapq.heappop(self._delayed_jobs)
+            if job.deleted:
+                continue
+            heapq.heappush(
+                self._job_queue_by_host_name[job.host_name],
+                (-job.priority, order, job)
+            )
+
+    def _set_worker_idle(self, worker):
+        if worker.id in self._workers_by_id and worker.is_idle():
+            idle_workers = self._idle_workers_by_host_name[worker.host_name]
+            idle_workers[worker.id] = worker
+
+    def add_listener(self, callback):
+        """Register callback called with job status on each job change."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _job_changed(self, job):
+        if self._storage is not None and not job.deleted:
+            self._storage.save_job(job.to_data())
+
+        if self._listeners:
+            status = job.status()
+            for callback in tuple(self._listeners):
+                callback(status)
+
+    def _remove_old_jobs(self, now):
         """Once in specific time look if should remove old finished jobs."""
-        delta = datetime.datetime.now() - self._last_old_jobs_check
-        if delta.seconds < self.old_jobs_check_minutes_interval:
+        delta = now - self._last_old_jobs_check
+        if delta.total_seconds() < self.old_jobs_check_minutes_interval * 60:
             return
 
+        self._last_old_jobs_check = now
         for job_id in tuple(self._jobs_by_id.keys()):
             job = self._jobs_by_id[job_id]
             if not job.keep_in_memory():
                 self._jobs_by_id.pop(job_id)
 
+        if self._storage is not None:
+            done_before = now - datetime.timedelta(
+                days=Job.keep_in_memory_days
+            )
+            self._storage.remove_done_jobs(done_before.timestamp())
+
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
         job = self._jobs_by_id.get(job_id)
         if job is None:
             return
 
+        worker = job.worker
         job.set_deleted()
+        if worker is not None:
+            self._set_worker_idle(worker)
         self._jobs_by_id.pop(job.id)
+        if self._storage is not None:
+            self._storage.remove_job(job.id)
+        self._job_changed(job)
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
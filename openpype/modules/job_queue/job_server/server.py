@@ -5,6 +5,7 @@ import logging
 from aiohttp import web
 
 from .jobs import JobQueue
+from .storage import JobStorage
 from .job_queue_route import JobQueueResource
 from .workers_rpc_route import WorkerRpc
 
@@ -13,9 +14,10 @@ log = logging.getLogger(__name__)
 
 class WebServerManager:
     """Manger that care about web server thread."""
-    def __init__(self, port, host, loop=None):
+    def __init__(self, port, host, loop=None, db_path=None):
         self.port = port
         self.host = host
+        self.db_path = db_path
         self.app = web.Application()
         if loop is None:
             loop = asyncio.new_event_loop()
@@ -71,7 +73,11 @@ class WebServerThread(threading.Thread):
         self.runner = None
         self.site = None
 
-        job_queue = JobQueue()
+        storage = None
+        if manager.db_path:
+            storage = JobStorage(manager.db_path)
+        job_queue = JobQueue(storage)
+        self.job_queue = job_queue
         self.job_queue_route = JobQueueResource(job_queue, manager)
         self.workers_route = WorkerRpc(job_queue, manager, loop=loop)
 
@@ -138,6 +144,7 @@ class WebServerThread(threading.Thread):
         await self.site.stop()
         print("Site stopped")
         await self.runner.cleanup()
+        self.job_queue.close()
 
         print("Runner stopped")
         tasks = [
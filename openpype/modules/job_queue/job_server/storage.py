@@ -0,0 +1,89 @@
+import json
+import sqlite3
+import threading
+
+
+class JobStorage:
+    """Persistent storage of jobs in sqlite database.
+
+    Database is using WAL journal mode so job status changes are cheap and
+    are not lost when server process is killed. Storage does not know
+    anything about job logic, it stores and loads serialized job data.
+
+    Args:
+        db_path (str): Path to sqlite database file. Use ":memory:" to keep
+            jobs only in memory.
+    """
+    def __init__(self, db_path):
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " host_name TEXT NOT NULL,"
+            " state TEXT NOT NULL,"
+            " done_time REAL,"
+            " data TEXT NOT NULL"
+            ")"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_done_time ON jobs (done_time)"
+        )
+
+    @property
+    def db_path(self):
+        return self._db_path
+
+    def save_job(self, job_data):
+        """Insert or update job.
+
+        Args:
+            job_data (dict[str, Any]): Serialized job from 'Job.to_data'.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs"
+                " (id, host_name, state, done_time, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    job_data["id"],
+                    job_data["host_name"],
+                    job_data["state"],
+                    job_data["done_time"],
+                    json.dumps(job_data)
+                )
+            )
+
+    def load_jobs(self):
+        """Serialized jobs stored in database.
+
+        Returns:
+            list[dict[str, Any]]: Jobs data.
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM jobs").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def remove_job(self, job_id):
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id, ))
+
+    def remove_done_jobs(self, done_before):
+        """Remove jobs that were finished before passed timestamp.
+
+        Args:
+            done_before (float): Timestamp.
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE done_time < ?", (done_before, )
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
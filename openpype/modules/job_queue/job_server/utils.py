@@ -1,8 +1,11 @@
+import os
 import sys
 import signal
 import time
 import socket
 
+import appdirs
+
 from .server import WebServerManager
 
 
@@ -14,7 +17,14 @@ class SharedObjects:
         cls.stopped = True
 
 
-def main(port=None, host=None):
+def get_default_db_path():
+    """Default path to database where jobs are stored."""
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"), "job_queue.db"
+    )
+
+
+def main(port=None, host=None, db_path=None):
     def signal_handler(sig, frame):
         print("Signal to kill process received. Termination starts.")
         SharedObjects.stop()
@@ -34,8 +44,17 @@ def main(port=None, host=None):
         ).format(host, port))
         return 1
 
-    print("Running server {}:{}".format(host, port))
-    manager = WebServerManager(port, host)
+    if not db_path:
+        db_path = get_default_db_path()
+
+    if db_path != ":memory:":
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+    print("Running server {}:{} (jobs stored to {})".format(
+        host, port, db_path))
+    manager = WebServerManager(port, host, db_path=db_path)
     manager.start_server()
 
     stopped = False
@@ -1,3 +1,4 @@
+import time
 import asyncio
 from uuid import uuid4
 from aiohttp import WSCloseCode
@@ -18,6 +19,7 @@ class Worker:
         self._http_request = http_request
         self._state = WorkerState.IDLE
         self._job = None
+        self._lease_expires = None
 
         # Give ability to send requests to worker
         http_request.request_id = str(uuid4())
@@ -91,6 +93,14 @@ class Worker:
             return False
         return True
 
+    def renew_lease(self, seconds):
+        self._lease_expires = time.time() + seconds
+
+    def lease_expired(self):
+        if self._lease_expires is None:
+            return False
+        return time.time() > self._lease_expires
+
     def is_idle(self):
         return self._state is WorkerState.IDLE
 
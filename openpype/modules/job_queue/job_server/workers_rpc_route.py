@@ -21,7 +21,8 @@ class WorkerRpc(JsonRpc):
         # Register methods
         self.add_methods(
             ("", self.register_worker),
-            ("", self.job_done)
+            ("", self.job_done),
+            ("", self.heartbeat)
         )
         asyncio.ensure_future(self._rpc_loop(), loop=self.loop)
 
@@ -43,21 +44,25 @@ class WorkerRpc(JsonRpc):
             for worker in tuple(self._job_queue.workers()):
                 if not worker.connection_is_alive():
                     self._job_queue.remove_worker(worker)
+
+            for worker in self._job_queue.get_expired_workers():
+                print("Worker \"{}\" did not send heartbeat".format(
+                    worker.id))
+                self._job_queue.remove_worker(worker)
+                asyncio.ensure_future(worker.close(), loop=self.loop)
+
             self._job_queue.assign_jobs()
 
             await self.send_jobs()
             await asyncio.sleep(5)
 
     async def job_done(self, worker_id, job_id, success, message, data):
-        worker = self._job_queue.get_worker(worker_id)
-        if worker is not None:
-            worker.set_current_job(None)
-
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
+        self._job_queue.finish_job(worker_id, job_id, success, message, data)
         return True
 
+    async def heartbeat(self, worker_id):
+        return self._job_queue.heartbeat(worker_id)
+
     async def send_jobs(self):
         invalid_workers = []
         for worker in self._job_queue.workers():
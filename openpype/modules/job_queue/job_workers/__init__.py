@@ -1,5 +1,9 @@
-from .base_worker import WorkerJobsConnection
+from .base_worker import (
+    WorkerJobsConnection,
+    JobQueueClient,
+)
 
 __all__ = (
     "WorkerJobsConnection",
+    "JobQueueClient",
 )
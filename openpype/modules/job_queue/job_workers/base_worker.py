@@ -1,8 +1,11 @@
 import sys
+import json
+import time
 import datetime
 import asyncio
 import traceback
 
+import aiohttp
 from aiohttp_json_rpc import JsonRpcClient
 
 
@@ -19,6 +22,10 @@ class WorkerClient(JsonRpcClient):
     def set_id(self, worker_id):
         self._id = worker_id
 
+    @property
+    def worker_id(self):
+        return self._id
+
     async def start_job(self, job_data):
         if self.current_job is not None:
             return False
@@ -52,6 +59,8 @@ class WorkerJobsConnection:
     as worker for specific host.
     """
     retry_time_seconds = 5
+    # Must be lower than worker lease time on server
+    heartbeat_interval_seconds = 15
 
     def __init__(self, server_url, host_name, loop=None):
         self.client = None
@@ -156,10 +165,19 @@ class WorkerJobsConnection:
         if register_worker:
             self.register_as_worker()
 
+        last_heartbeat = None
         while self._connected and self._loop.is_running():
             if self._stopped or ws.closed:
                 break
 
+            if self.client.worker_id is not None and (
+                last_heartbeat is None
+                or time.time() - last_heartbeat
+                >= self.heartbeat_interval_seconds
+            ):
+                last_heartbeat = time.time()
+                self.send_heartbeat()
+
             await asyncio.sleep(0.3)
 
         await self._stop_cleanup()
@@ -177,6 +195,13 @@ class WorkerJobsConnection:
             "Registered as worker with id {}".format(worker_id)
         )
 
+    def send_heartbeat(self):
+        """Tell server that worker is alive so its job is not requeued."""
+        asyncio.ensure_future(
+            self.client.call("heartbeat", [self.client.worker_id]),
+            loop=self._loop
+        )
+
     async def disconnect(self):
         await self._stop_cleanup()
 
@@ -188,3 +213,112 @@ class WorkerJobsConnection:
         self.client = None
         self._connecting = False
         self._connected = False
+
+
+class JobQueueClient:
+    """Async client of job server used to send jobs and receive results.
+
+    Example:
+        ```python
+        async with JobQueueClient(server_url) as client:
+            job_ids = await client.send_jobs("tvpaint", jobs_data)
+            async for status in client.iter_job_events(job_ids):
+                print(status["id"], status["state"])
+        ```
+
+    Args:
+        server_url (str): Http url of job server.
+    """
+    def __init__(self, server_url):
+        self._server_url = server_url.rstrip("/")
+        self._session = None
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_url(self, endpoint):
+        return "{}/api/{}".format(self._server_url, endpoint)
+
+    async def send_job(self, host_name, job_data):
+        """Send job to server.
+
+        Returns:
+            str: Job id.
+        """
+        job_data = dict(job_data or {})
+        job_data["host_name"] = host_name
+        async with self._session.post(
+            self._get_url("jobs"), data=json.dumps(job_data)
+        ) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    async def send_jobs(self, host_name, jobs_data):
+        """Send multiple jobs to server with one request.
+
+        Returns:
+            list[str]: Job ids in order of passed jobs.
+        """
+        data = {"host_name": host_name, "jobs": list(jobs_data)}
+        async with self._session.post(
+            self._get_url("jobs/batch"), data=json.dumps(data)
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def get_job_status(self, job_id):
+        async with self._session.get(
+            self._get_url("jobs/{}".format(job_id))
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def iter_job_events(self, job_ids=None):
+        """Yield job statuses on each change of job.
+
+        Current status of each passed job is yielded first and iteration
+        ends when all of them are finished. Without job ids are statuses of
+        all jobs yielded until iteration is stopped.
+
+        Args:
+            job_ids (Optional[Iterable[str]]): Ids of jobs to watch.
+        """
+        params = {}
+        if job_ids is not None:
+            params["job_ids"] = ",".join(job_ids)
+
+        async with self._session.get(
+            self._get_url("jobs/events"),
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=None)
+        ) as response:
+            response.raise_for_status()
+            data_lines = []
+            async for line in response.content:
+                line = line.decode("utf-8").rstrip("\r\n")
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].strip())
+
+                elif not line and data_lines:
+                    yield json.loads("\n".join(data_lines))
+                    data_lines = []
+
+    async def wait_for_jobs(self, job_ids):
+        """Wait until passed jobs are finished.
+
+        Returns:
+            dict[str, dict]: Last status of each job by id.
+        """
+        statuses = {}
+        async for status in self.iter_job_events(job_ids):
+            statuses[status["id"]] = status
+        return statuses
@@ -27,6 +27,13 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- jobs are stored to sqlite database so they survive restart of server, path
+    to database can be changed with '--db_path'
+- jobs can have 'priority' (higher first) and 'max_retries' (how many times
+    is job requeued when worker processing it is lost)
+- multiple jobs can be sent at once to '/api/jobs/batch' and changes of jobs
+    are streamed as server-sent events from '/api/jobs/events'
+    (see 'JobQueueClient' in 'job_workers/base_worker.py')
 
 ### start_worker
 - start worker which will process jobs
@@ -145,6 +152,22 @@ class JobQueueModule(OpenPypeModule):
         post_request = requests.post(api_path, data=json.dumps(job_data))
         return str(post_request.content.decode())
 
+    def send_jobs(self, host_name, jobs_data):
+        """Send multiple jobs with one request.
+
+        Returns:
+            list[str]: Ids of created jobs in order of passed jobs.
+        """
+        import requests
+
+        api_path = "{}/api/jobs/batch".format(self._server_url)
+        post_request = requests.post(
+            api_path,
+            data=json.dumps({"host_name": host_name, "jobs": jobs_data})
+        )
+        post_request.raise_for_status()
+        return post_request.json()
+
     def get_job_status(self, job_id):
         import requests
 
@@ -164,10 +187,10 @@ class JobQueueModule(OpenPypeModule):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(cls, port=None, host=None, db_path=None):
         from .job_server import main
 
-        return main(port, host)
+        return main(port, host, db_path)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -226,8 +249,12 @@ def cli_main():
 )
 @click_wrap.option("--port", help="Server port")
 @click_wrap.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueModule.start_server(port, host)
+@click_wrap.option(
+    "--db_path",
+    help="Path to database where jobs are stored (\":memory:\" to not store)"
+)
+def cli_start_server(port, host, db_path):
+    JobQueueModule.start_server(port, host, db_path)
 
 
 @cli_main.command(
@@ -1,9 +1,15 @@
 import abc
+import time
+import hashlib
+
 import six
 from openpype.lib import Logger
 
 log = Logger.get_logger("SyncServer")
 
+# Default size of chunk for chunked transfers
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
 
 @six.add_metaclass(abc.ABCMeta)
 class AbstractProvider:
@@ -12,6 +18,10 @@ class AbstractProvider:
 
     _log = None
 
+    # Transfer direction values used by chunked transfers
+    UPLOAD = "upload"
+    DOWNLOAD = "download"
+
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
         self.active = False
@@ -215,3 +225,192 @@ class AbstractProvider:
             raise ValueError(msg)
 
         return path
+
+    def get_chunk_size(self):
+        """
+            Returns size of chunk in bytes for chunked transfers.
+
+            Can be changed by 'chunk_size' (in MB) in site presets.
+        Returns:
+            (int)
+        """
+        chunk_size = (self.presets or {}).get("chunk_size")
+        if chunk_size:
+            return int(float(chunk_size) * 1024 * 1024)
+        return DEFAULT_CHUNK_SIZE
+
+    def transfer_in_chunks(self, source_path, target_path,
+                           server, project_name, file, representation, site,
+                           direction):
+        """
+            Copy file from 'source_path' to 'target_path' in chunks.
+
+            Offset of transferred data with checksum of last chunk is stored
+            to site record of file in DB (as 'resume'), so interrupted
+            transfer continues from the offset in next attempt instead of
+            starting from zero. Last chunk on target is verified against
+            stored checksum before the transfer is resumed.
+
+            Provider must implement '_open_chunk_source',
+            '_open_chunk_target' and '_get_chunk_target_size', it may
+            implement '_start_chunks_read'.
+
+        Args:
+            source_path (string):
+            target_path (string):
+            server (SyncServer): server instance to call update_db on
+            project_name (str):
+            file (dict): info about transferred file (matches structure
+                from db)
+            representation (dict): complete repre containing 'file'
+            site (str): site name which resume information is used
+            direction (str): 'upload' or 'download'
+        """
+        chunk_size = self.get_chunk_size()
+        with self._open_chunk_source(source_path, direction) as src_stream:
+            src_stream.seek(0, 2)
+            source_size = src_stream.tell()
+            offset = self._get_resume_offset(
+                src_stream, target_path, file, site, source_size, direction
+            )
+            src_stream.seek(offset)
+            resumed = bool(offset)
+            if resumed:
+                self.log.debug("Resuming {} of {} from {} bytes".format(
+                    direction, target_path, offset))
+            self._start_chunks_read(src_stream, direction)
+
+            last_tick = None
+            with self._open_chunk_target(
+                target_path, direction, offset
+            ) as dst_stream:
+                while True:
+                    chunk = src_stream.read(chunk_size)
+                    if not chunk:
+                        break
+                    dst_stream.write(chunk)
+                    offset += len(chunk)
+                    if (
+                        last_tick is not None
+                        and time.time() - last_tick < server.LOG_PROGRESS_SEC
+                    ):
+                        continue
+
+                    # Data must be written before offset is stored
+                    dst_stream.flush()
+                    last_tick = time.time()
+                    server.update_resume_info(
+                        project_name, file, representation, site,
+                        {
+                            "offset": offset,
+                            "chunk_size": len(chunk),
+                            "checksum": hashlib.md5(chunk).hexdigest(),
+                            "source_size": source_size,
+                        }
+                    )
+                    if source_size:
+                        server.update_db(project_name=project_name,
+                                         new_file_id=None,
+                                         file=file,
+                                         representation=representation,
+                                         site=site,
+                                         progress=offset / source_size)
+
+                if resumed:
+                    # Target of older attempt may be longer than source
+                    dst_stream.flush()
+                    dst_stream.truncate(offset)
+
+    def _get_resume_offset(self, src_stream, target_path, file, site,
+                           source_size, direction):
+        """
+            Returns offset from which transfer can continue.
+
+            Resume information must be for same source size and last
+            transferred chunk on target must match checksum of source chunk.
+        Returns:
+            (int) 0 if transfer must start from beginning
+        """
+        resume_info = None
+        for site_info in file.get("sites") or []:
+            if site_info.get("name") == site:
+                resume_info = site_info.get("resume")
+                break
+
+        if not resume_info:
+            return 0
+
+        offset = resume_info.get("offset") or 0
+        chunk_size = resume_info.get("chunk_size") or 0
+        if (
+            resume_info.get("source_size") != source_size
+            or not chunk_size
+            or offset > source_size
+            or offset < chunk_size
+        ):
+            return 0
+
+        try:
+            target_size = self._get_chunk_target_size(target_path, direction)
+        except (IOError, OSError):
+            return 0
+
+        if target_size < offset:
+            return 0
+
+        src_stream.seek(offset - chunk_size)
+        src_checksum = hashlib.md5(src_stream.read(chunk_size)).hexdigest()
+        if src_checksum != resume_info.get("checksum"):
+            return 0
+
+        with self._open_chunk_source(target_path, self._opposite(direction)
+                                     ) as target_stream:
+            target_stream.seek(offset - chunk_size)
+            target_chunk = target_stream.read(chunk_size)
+        if hashlib.md5(target_chunk).hexdigest() != src_checksum:
+            return 0
+        return offset
+
+    def _opposite(self, direction):
+        if direction == self.UPLOAD:
+            return self.DOWNLOAD
+        return self.UPLOAD
+
+    def _open_chunk_source(self, path, direction):
+        """
+            Open file for reading in binary mode.
+
+            Upload reads local file, download reads file on provider.
+        Returns:
+            file like object
+        """
+        raise NotImplementedError(
+            "{} does not support chunked transfers".format(self.CODE))
+
+    def _start_chunks_read(self, src_stream, direction):
+        """
+            Source stream is at offset from which chunks are read.
+
+            Provider may start reading rest of the file in advance.
+        """
+        pass
+
+    def _open_chunk_target(self, path, direction, offset):
+        """
+            Open file for writing in binary mode at 'offset'.
+
+            Upload writes file on provider, download writes local file.
+            Data after 'offset' are overwritten, file is created if offset
+            is 0.
+        Returns:
+            file like object
+        """
+        raise NotImplementedError(
+            "{} does not support chunked transfers".format(self.CODE))
+
+    def _get_chunk_target_size(self, path, direction):
+        """
+            Returns size of target file in bytes.
+        """
+        raise NotImplementedError(
+            "{} does not support chunked transfers".format(self.CODE))
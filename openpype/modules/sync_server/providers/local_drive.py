@@ -1,8 +1,6 @@
 from __future__ import print_function
 import os.path
 import shutil
-import threading
-import time
 
 from openpype.lib import Logger
 from openpype.lib.local_settings import get_local_site_id
@@ -93,11 +91,17 @@ class LocalDriveHandler(AbstractProvider):
                                     .format(source_path))
 
         if overwrite:
-            thread = threading.Thread(target=self._copy,
-                                      args=(source_path, target_path))
-            thread.start()
-            self._mark_progress(project_name, file, representation, server,
-                                site, source_path, target_path, direction)
+            if (
+                os.path.exists(target_path)
+                and os.path.samefile(source_path, target_path)
+            ):
+                print("same files, skipping")
+            else:
+                self.transfer_in_chunks(source_path, target_path,
+                                        server, project_name, file,
+                                        representation, site,
+                                        direction.lower())
+                shutil.copymode(source_path, target_path)
         else:
             if os.path.exists(target_path):
                 raise ValueError("File {} exists, set overwrite".
@@ -183,41 +187,18 @@ class LocalDriveHandler(AbstractProvider):
         """
         pass
 
-    def _copy(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        try:
-            shutil.copy(source_path, target_path)
-        except shutil.SameFileError:
-            print("same files, skipping")
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        source_file_size = os.path.getsize(source_path)
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+    def _open_chunk_source(self, path, direction):
+        return open(path, "rb")
+
+    def _open_chunk_target(self, path, direction, offset):
+        if not offset:
+            return open(path, "wb")
+        stream = open(path, "r+b")
+        stream.seek(offset)
+        return stream
+
+    def _get_chunk_target_size(self, path, direction):
+        return os.path.getsize(path)
 
     def _normalize_site_name(self, site_name):
         """Transform user id to 'local' for Local settings"""
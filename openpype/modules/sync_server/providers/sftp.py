@@ -1,7 +1,5 @@
 import os
 import os.path
-import time
-import threading
 import platform
 
 from openpype.lib import Logger
@@ -254,19 +252,13 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._upload,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "upload")
+        print("copying {}->{}".format(source_path, target_path))
+        self.transfer_in_chunks(source_path, target_path,
+                                server, project_name, file,
+                                representation, site, self.UPLOAD)
 
         return os.path.basename(target_path)
 
-    def _upload(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.put(source_path, target_path)
-
     def download_file(self, source_path, target_path,
                       server, project_name, file, representation, site,
                       overwrite=False):
@@ -300,18 +292,39 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._download,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "download")
+        print("downloading {}->{}".format(source_path, target_path))
+        self.transfer_in_chunks(source_path, target_path,
+                                server, project_name, file,
+                                representation, site, self.DOWNLOAD)
 
         return os.path.basename(target_path)
 
-    def _download(self, source_path, target_path):
-        print("downloading {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.get(source_path, target_path)
+    def _open_chunk_source(self, path, direction):
+        if direction == self.UPLOAD:
+            return open(path, "rb")
+        return self.conn.open(path, "rb")
+
+    def _start_chunks_read(self, src_stream, direction):
+        if direction == self.DOWNLOAD:
+            # Requests rest of the file from current position at once
+            src_stream.prefetch()
+
+    def _open_chunk_target(self, path, direction, offset):
+        if direction == self.UPLOAD:
+            mode = "r+b" if offset else "wb"
+            stream = self.conn.open(path, mode)
+            # Don't wait for acknowledge of each write, resumed transfer
+            #   verifies last chunk on target anyway
+            stream.set_pipelined(True)
+        else:
+            stream = open(path, "r+b" if offset else "wb")
+        stream.seek(offset)
+        return stream
+
+    def _get_chunk_target_size(self, path, direction):
+        if direction == self.UPLOAD:
+            return self.conn.stat(path).st_size
+        return os.path.getsize(path)
 
     def delete_file(self, path):
         """
@@ -425,40 +438,3 @@ class SFTPHandler(AbstractProvider):
         except (paramiko.ssh_exception.SSHException,
                 pysftp.exceptions.ConnectionException):
             self.log.warning("Couldn't connect", exc_info=True)
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        pass
-        if direction == "upload":
-            source_file_size = os.path.getsize(source_path)
-        else:
-            source_file_size = self.conn.stat(source_path).st_size
-
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                self.log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                if direction == "upload":
-                    target_file_size = self.conn.stat(target_path).st_size
-                else:
-                    target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
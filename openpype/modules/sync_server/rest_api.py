@@ -1,4 +1,4 @@
-from aiohttp.web_response import Response
+from aiohttp.web_response import Response, json_response
 from openpype.lib import Logger
 
 
@@ -29,9 +29,18 @@ class SyncServerModuleRestApi:
             self.prefix + "/reset_timer",
             self.reset_timer,
         )
+        self.server_manager.add_route(
+            "GET",
+            self.prefix + "/stats",
+            self.get_stats,
+        )
 
     async def reset_timer(self, _request):
         """Force timer to run immediately."""
         self.module.reset_timer()
 
         return Response(status=200)
+
+    async def get_stats(self, _request):
+        """Statistics of sync loop (queue depth, throughput...)."""
+        return json_response(self.module.get_sync_stats())
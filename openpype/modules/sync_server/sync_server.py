@@ -1,10 +1,14 @@
 """Python 3 only implementation."""
 import os
+import time
 import asyncio
+import datetime
 import threading
 import concurrent.futures
 from time import sleep
 
+from bson.objectid import ObjectId
+
 from .providers import lib
 from openpype.client.entity_links import get_linked_representation_id
 from openpype.lib import Logger
@@ -43,30 +47,19 @@ async def upload(module, project_name, file, representation, provider_name,
         preset (dictionary): site config ('credentials_url', 'root'...)
 
     """
-    # create ids sequentially, upload file in parallel later
-    with module.lock:
-        # this part modifies structure on 'remote_site', only single
-        # thread can do that at a time, upload/download to prepared
-        # structure should be run in parallel
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  project_name,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, project_name,
-            remote_site_name, remote_handler
-        )
-
-        target_folder = os.path.dirname(remote_file_path)
-        folder_id = remote_handler.create_folder(target_folder)
-
-        if not folder_id:
-            err = "Folder {} wasn't created. Check permissions.". \
-                format(target_folder)
-            raise NotADirectoryError(err)
+    # target folders are created in batch before uploads by
+    # 'create_remote_folders', upload to prepared structure runs in parallel
+    remote_handler = lib.factory.get_provider(provider_name,
+                                              project_name,
+                                              remote_site_name,
+                                              tree=tree,
+                                              presets=preset)
+
+    file_path = file.get("path", "")
+    local_file_path, remote_file_path = resolve_paths(
+        module, file_path, project_name,
+        remote_site_name, remote_handler
+    )
 
     loop = asyncio.get_running_loop()
     file_id = await loop.run_in_executor(None,
@@ -107,20 +100,19 @@ async def download(module, project_name, file, representation, provider_name,
         Returns:
         (string) - 'name' of local file
     """
-    with module.lock:
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  project_name,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, project_name, remote_site_name, remote_handler
-        )
+    remote_handler = lib.factory.get_provider(provider_name,
+                                              project_name,
+                                              remote_site_name,
+                                              tree=tree,
+                                              presets=preset)
+
+    file_path = file.get("path", "")
+    local_file_path, remote_file_path = resolve_paths(
+        module, file_path, project_name, remote_site_name, remote_handler
+    )
 
-        local_folder = os.path.dirname(local_file_path)
-        os.makedirs(local_folder, exist_ok=True)
+    local_folder = os.path.dirname(local_file_path)
+    os.makedirs(local_folder, exist_ok=True)
 
     local_site = module.get_active_site(project_name)
 
@@ -143,6 +135,58 @@ async def download(module, project_name, file, representation, provider_name,
     return file_id
 
 
+def create_remote_folders(module, project_name, files, provider_name,
+                          remote_site_name, tree=None, preset=None):
+    """
+        Creates target folders for all 'files' which will be uploaded.
+
+        Folder structure on 'remote_site' can be modified only by single
+        thread at a time, so all folders needed in one loop are created
+        at once before uploads run in parallel. Each unique folder is
+        created only once.
+
+    Args:
+        module(SyncServerModule): object to run SyncServerModule API
+        project_name (str): source db
+        files (list): of file dictionaries from representations
+        provider_name (string): gdrive, gdc etc.
+        remote_site_name (string): site on provider
+        tree (dictionary): injected memory structure for performance
+        preset (dictionary): site config ('credentials_url', 'root'...)
+
+    Returns:
+        (dict) - file '_id' to error for files which folder wasn't created
+    """
+    remote_handler = lib.factory.get_provider(provider_name,
+                                              project_name,
+                                              remote_site_name,
+                                              tree=tree,
+                                              presets=preset)
+    errors = {}
+    folder_errors = {}
+    for file in files:
+        _, remote_file_path = resolve_paths(
+            module, file.get("path", ""), project_name,
+            remote_site_name, remote_handler
+        )
+        target_folder = os.path.dirname(remote_file_path)
+        if target_folder not in folder_errors:
+            error = None
+            try:
+                if not remote_handler.create_folder(target_folder):
+                    error = NotADirectoryError(
+                        "Folder {} wasn't created. Check permissions.".format(
+                            target_folder))
+            except Exception as exc:
+                error = exc
+            folder_errors[target_folder] = error
+
+        error = folder_errors[target_folder]
+        if error is not None:
+            errors[file["_id"]] = error
+    return errors
+
+
 def resolve_paths(module, file_path, project_name,
                   remote_site_name=None, remote_handler=None):
     """
@@ -285,6 +329,211 @@ def download_last_published_workfile(
     return last_published_workfile_path
 
 
+async def _raise_error(error):
+    """Coroutine which only raises 'error', keeps failed files in results."""
+    raise error
+
+
+class TransferJob(object):
+    """Single file which should be uploaded or downloaded in a loop."""
+
+    def __init__(self, status, file, representation, priority=None):
+        self.status = status
+        self.file = file
+        self.representation = representation
+        self.priority = priority or 0
+        self.size = file.get("size") or 0
+
+    def sort_key(self):
+        """Higher priority first, smaller files first for same priority."""
+        return -self.priority, self.size
+
+
+class TokenBucket(object):
+    """Limits amount of transferred bytes per second.
+
+    Whole size of file is consumed before transfer starts, bucket can go to
+    debt for files larger than its capacity, following transfers wait
+    until the debt is paid off.
+
+    Args:
+        rate (float): Bytes per second.
+    """
+
+    def __init__(self, rate):
+        self.rate = float(rate)
+        self.capacity = self.rate
+        self._tokens = self.capacity
+        self._last_time = time.monotonic()
+
+    async def consume(self, amount):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._last_time) * self.rate
+            )
+            self._last_time = now
+            if self._tokens > 0:
+                self._tokens -= amount
+                return
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class TransferScheduler(object):
+    """Runs transfers with bounded concurrency and bandwidth per site.
+
+    Collects statistics of transfers which are available through REST api.
+    All methods except 'get_stats' must be called from the sync loop.
+    """
+
+    def __init__(self):
+        self._semaphores = {}
+        self._buckets = {}
+        self._site_limits = {}
+        self._waiting = 0
+        self._active = 0
+        self._loop_files = 0
+        self._loop_bytes = 0
+        self._total_files = 0
+        self._total_bytes = 0
+        self._last_loop = {}
+
+    def configure_site(self, site_name, max_concurrent, bandwidth_limit):
+        """Set limits for a site, recreated only when limits change.
+
+        Args:
+            site_name (str): Name of site.
+            max_concurrent (int): Maximum of concurrent transfers.
+            bandwidth_limit (float): Bytes per second, 0 means unlimited.
+        """
+        limits = (max_concurrent, bandwidth_limit)
+        if self._site_limits.get(site_name) == limits:
+            return
+        self._site_limits[site_name] = limits
+        self._semaphores[site_name] = asyncio.Semaphore(max(max_concurrent, 1))
+        self._buckets[site_name] = None
+        if bandwidth_limit:
+            self._buckets[site_name] = TokenBucket(bandwidth_limit)
+
+    async def run(self, site_name, size, coro):
+        """Await transfer 'coro' when site limits allow it.
+
+        Args:
+            site_name (str): Site which limits are used.
+            size (int): Size of transferred file in bytes.
+            coro (Coroutine): Transfer coroutine.
+        """
+        started = False
+        self._waiting += 1
+        try:
+            async with self._semaphores[site_name]:
+                bucket = self._buckets[site_name]
+                if bucket is not None:
+                    await bucket.consume(size)
+                self._waiting -= 1
+                started = True
+                self._active += 1
+                try:
+                    result = await coro
+                finally:
+                    self._active -= 1
+        finally:
+            if not started:
+                # cancelled while waiting
+                self._waiting -= 1
+                coro.close()
+
+        self._loop_files += 1
+        self._loop_bytes += size
+        return result
+
+    def finish_loop(self, duration):
+        """Store statistics of finished loop.
+
+        Args:
+            duration (float): Duration of loop in seconds.
+        """
+        bytes_per_second = 0
+        if duration > 0:
+            bytes_per_second = self._loop_bytes / duration
+        self._total_files += self._loop_files
+        self._total_bytes += self._loop_bytes
+        self._last_loop = {
+            "duration": duration,
+            "files": self._loop_files,
+            "bytes": self._loop_bytes,
+            "bytes_per_second": bytes_per_second,
+            "finished": time.time()
+        }
+        self._loop_files = 0
+        self._loop_bytes = 0
+
+    def get_stats(self):
+        return {
+            "queue_depth": self._waiting,
+            "active_transfers": self._active,
+            "transferred_files": self._total_files + self._loop_files,
+            "transferred_bytes": self._total_bytes + self._loop_bytes,
+            "last_loop": dict(self._last_loop),
+            "site_limits": {
+                site_name: {
+                    "max_concurrent": limits[0],
+                    "bandwidth_limit": limits[1]
+                }
+                for site_name, limits in tuple(self._site_limits.items())
+            }
+        }
+
+
+class ProjectSyncState(object):
+    """Incremental synchronization state of single project.
+
+    Full scan of all representations is done only once per 'full scan
+    delay'. Loops in between query only representations which were waiting
+    for synchronization in previous loop, representations created after
+    high-water mark and representations with sites changed since the full
+    scan (e.g. site added from Loader). The mark is set before each full
+    scan with a margin because '_id' of representation is created before it
+    is stored to DB (e.g. during long publishing). Time of sites change is
+    written by other machines, margin covers difference of their clocks.
+    """
+
+    # Representations created this long before full scan are queried again
+    high_water_mark_margin = datetime.timedelta(hours=1)
+    # Representations with sites changed this long before full scan are
+    #   queried again
+    sites_changed_margin = datetime.timedelta(minutes=10)
+
+    def __init__(self):
+        self.high_water_mark = None
+        self.sites_changed_after = None
+        self.last_full_scan = None
+        self.sites = None
+        self.pending_ids = set()
+        self.full_scan_requested = True
+
+    def is_full_scan_needed(self, sites, full_scan_delay):
+        if (
+            self.full_scan_requested
+            or self.last_full_scan is None
+            or self.sites != sites
+            or not full_scan_delay
+        ):
+            return True
+        return (time.time() - self.last_full_scan) >= full_scan_delay
+
+    def start_full_scan(self, sites):
+        self.full_scan_requested = False
+        self.sites = sites
+        self.last_full_scan = time.time()
+        now = datetime.datetime.utcnow()
+        self.high_water_mark = ObjectId.from_datetime(
+            now - self.high_water_mark_margin
+        )
+        self.sites_changed_after = now - self.sites_changed_margin
+
+
 class SyncServerThread(threading.Thread):
     """
         Separate thread running synchronization server with asyncio loop.
@@ -297,8 +546,10 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
         self.timer = None
+        self.scheduler = TransferScheduler()
+        self._project_states = {}
 
     def run(self):
         self.is_running = True
@@ -336,7 +587,6 @@ class SyncServerThread(threading.Thread):
         """
         while self.is_running and not self.module.is_paused():
             try:
-                import time
                 start_time = time.time()
                 self.module.set_sync_project_settings()  # clean cache
                 project_name = None
@@ -349,14 +599,13 @@ class SyncServerThread(threading.Thread):
                     if not all([local_site, remote_site]):
                         continue
 
-                    sync_repres = self.module.get_sync_representations(
+                    sync_repres = self._get_sync_representations(
                         project_name,
                         local_site,
                         remote_site
                     )
 
-                    task_files_to_process = []
-                    files_processed_info = []
+                    jobs = []
                     # process only unique file paths in one batch
                     # multiple representation could have same file path
                     # (textures),
@@ -373,64 +622,100 @@ class SyncServerThread(threading.Thread):
                                                        presets=site_preset)
                     limit = lib.factory.get_provider_batch_limit(
                         remote_provider)
-                    # first call to get_provider could be expensive, its
-                    # building folder tree structure in memory
-                    # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+                    self.scheduler.configure_site(
+                        remote_site,
+                        self.module.get_max_concurrent_transfers(
+                            project_name, remote_site),
+                        self.module.get_bandwidth_limit(
+                            project_name, remote_site)
+                    )
                     for sync in sync_repres:
                         if limit <= 0:
                             continue
                         files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
-                                    file,
-                                    local_site,
-                                    remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
+                        for file in files:
+                            # skip already processed files
+                            file_path = file.get('path', '')
+                            if file_path in processed_file_path:
+                                continue
+                            status = self.module.check_status(
+                                file,
+                                local_site,
+                                remote_site,
+                                preset.get('config'))
+                            if status not in (SyncStatus.DO_UPLOAD,
+                                              SyncStatus.DO_DOWNLOAD):
+                                continue
+                            limit -= 1
+                            jobs.append(TransferJob(
+                                status, file, sync, sync.get("priority")
+                            ))
+                            processed_file_path.add(file_path)
+
+                    # first call to get_tree could be expensive, its
+                    # building folder tree structure in memory
+                    # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+                    tree = None
+                    if jobs:
+                        tree = handler.get_tree()
+
+                    # create remote folders for all uploads at once
+                    upload_files = [
+                        job.file for job in jobs
+                        if job.status == SyncStatus.DO_UPLOAD
+                    ]
+                    folder_errors = {}
+                    if upload_files:
+                        folder_errors = await self.loop.run_in_executor(
+                            None,
+                            create_remote_folders,
+                            self.module,
+                            project_name,
+                            upload_files,
+                            remote_provider,
+                            remote_site,
+                            tree,
+                            site_preset
+                        )
+
+                    task_files_to_process = []
+                    files_processed_info = []
+                    # higher priority first, smaller files first
+                    for job in sorted(jobs, key=TransferJob.sort_key):
+                        file = job.file
+                        if job.status == SyncStatus.DO_UPLOAD:
+                            site = remote_site
+                            error = folder_errors.get(file["_id"])
+                            if error is not None:
+                                coro = _raise_error(error)
+                            else:
+                                coro = upload(self.module,
+                                              project_name,
+                                              file,
+                                              job.representation,
+                                              remote_provider,
+                                              remote_site,
+                                              tree,
+                                              site_preset)
+                        else:
+                            site = local_site
+                            coro = download(self.module,
+                                            project_name,
+                                            file,
+                                            job.representation,
+                                            remote_provider,
+                                            remote_site,
+                                            tree,
+                                            site_preset)
+                        task = asyncio.create_task(
+                            self.scheduler.run(remote_site, job.size, coro)
+                        )
+                        task_files_to_process.append(task)
+                        # store info for exception handling
+                        files_processed_info.append((file,
+                                                     job.representation,
+                                                     site,
+                                                     project_name))
 
                     self.log.debug("Sync tasks count {}".format(
                         len(task_files_to_process)
@@ -453,6 +738,7 @@ class SyncServerThread(threading.Thread):
                                               error)
 
                 duration = time.time() - start_time
+                self.scheduler.finish_loop(duration)
                 self.log.debug("One loop took {:.2f}s".format(duration))
                 delay = self.module.get_loop_delay(project_name)
                 self.log.debug(
@@ -513,10 +799,54 @@ class SyncServerThread(threading.Thread):
     def reset_timer(self):
         """Called when waiting for next loop should be skipped"""
         self.log.debug("Resetting timer")
+        # Something was changed from outside, changes might not be
+        #   caught by incremental query
+        for state in self._project_states.values():
+            state.full_scan_requested = True
         if self.timer:
             self.timer.cancel()
             self.timer = None
 
+    def _get_sync_representations(self, project_name, local_site,
+                                  remote_site):
+        """Get representations to sync, incrementally when possible.
+
+        Returns:
+            list[dict]: Representations sorted by priority.
+        """
+        state = self._project_states.get(project_name)
+        if state is None:
+            state = ProjectSyncState()
+            self._project_states[project_name] = state
+
+        sites = (local_site, remote_site)
+        full_scan_delay = self.module.get_full_scan_delay(project_name)
+        if state.is_full_scan_needed(sites, full_scan_delay):
+            self.log.debug("Full scan of '{}'".format(project_name))
+            state.start_full_scan(sites)
+            sync_repres = self.module.get_sync_representations(
+                project_name, local_site, remote_site
+            )
+        else:
+            self.log.debug(
+                "Incremental scan of '{}', pending {}".format(
+                    project_name, len(state.pending_ids))
+            )
+            sync_repres = self.module.get_sync_representations(
+                project_name,
+                local_site,
+                remote_site,
+                representation_ids=state.pending_ids,
+                created_after_id=state.high_water_mark,
+                sites_changed_after=state.sites_changed_after
+            )
+
+        # Representations which matched are queried again in next loop,
+        #   synchronized representations won't match anymore
+        sync_repres = list(sync_repres)
+        state.pending_ids = {repre["_id"] for repre in sync_repres}
+        return sync_repres
+
     def _working_sites(self, project_name, sync_config):
         if self.module.is_project_paused(project_name):
             self.log.debug("Both sites same, skipping")
@@ -112,6 +112,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    # representation key with time of last change of sites from outside of
+    #   sync loop (add, reset, remove, pause site), used by incremental scan
+    SITES_CHANGED_KEY = "sites_changed_dt"
 
     name = "sync_server"
     label = "Sync Queue"
@@ -137,6 +140,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         self._paused = False
         self._paused_projects = set()
         self._anatomies = {}
+        # projects with index for incremental scan
+        self._sites_changed_indexed = set()
 
         self._connection = None
 
@@ -1686,7 +1691,10 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         return sites.get(site, 'N/A')
 
     @time_function
-    def get_sync_representations(self, project_name, active_site, remote_site):
+    def get_sync_representations(self, project_name, active_site, remote_site,
+                                 representation_ids=None,
+                                 created_after_id=None,
+                                 sites_changed_after=None):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1696,12 +1704,23 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             Querying of 'to-be-synched' files is offloaded to Mongod for
             better performance. Goal is to get as few representations as
             possible.
+
+            Query can be limited to specific representations and/or
+            representations created after an id and/or representations with
+            sites changed after a time (incremental sync), in that case
+            representation matching any of them is returned.
         Args:
             project_name (string):
             active_site (string): identifier of current active site (could be
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            representation_ids (Iterable[ObjectId]): limit query to these
+                representations
+            created_after_id (ObjectId): limit query to representations with
+                greater '_id'
+            sites_changed_after (datetime): limit query to representations
+                with sites changed after this time (UTC)
 
         Returns:
             (list) of dictionaries
@@ -1750,6 +1769,24 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                 ]}
             ]
         }
+        if (
+            representation_ids is not None
+            or created_after_id is not None
+            or sites_changed_after is not None
+        ):
+            id_filters = []
+            if representation_ids:
+                id_filters.append({"_id": {"$in": list(representation_ids)}})
+            if created_after_id is not None:
+                id_filters.append({"_id": {"$gt": created_after_id}})
+            if sites_changed_after is not None:
+                self._ensure_sites_changed_index(project_name)
+                id_filters.append({
+                    self.SITES_CHANGED_KEY: {"$gte": sites_changed_after}
+                })
+            if not id_filters:
+                return []
+            match = {"$and": [match, {"$or": id_filters}]}
 
         aggr = [
             {"$match": match},
@@ -1795,6 +1832,16 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         return representations
 
+    def _ensure_sites_changed_index(self, project_name):
+        """Create sparse index for incremental scan, only once per project.
+        """
+        if project_name in self._sites_changed_indexed:
+            return
+        self.connection.database[project_name].create_index(
+            self.SITES_CHANGED_KEY, sparse=True
+        )
+        self._sites_changed_indexed.add(project_name)
+
     def check_status(self, file, local_site, remote_site, config_preset):
         """
             Check synchronization status for single 'file' of single
@@ -1883,8 +1930,13 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         update = {}
         if new_file_id:
             update["$set"] = self._get_success_dict(new_file_id)
+            # other sites may sync the file now, picked up by incremental
+            #   scan of sync loop
+            update["$set"][self.SITES_CHANGED_KEY] = datetime.utcnow()
             # reset previous errors if any
             update["$unset"] = self._get_error_dict("", "", "")
+            # remove resume information of chunked transfer
+            update["$unset"]["files.$[f].sites.$[s].resume"] = ""
         elif progress is not None:
             update["$set"] = self._get_progress_dict(progress)
         elif priority is not None:
@@ -1929,6 +1981,31 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             )
         )
 
+    def update_resume_info(self, project_name, file, representation, site,
+                           resume_info):
+        """
+            Store information about progress of chunked transfer.
+
+            Providers use it to resume interrupted transfer of file from
+            stored offset.
+
+        Args:
+            project_name (string): name of project
+            file (dictionary): info about processed file (pulled from DB)
+            representation (dictionary): parent repr of file (from DB)
+            site (string): site name
+            resume_info (dict): offset, size and checksum of last chunk
+        """
+        arr_filter = [
+            {'s.name': site},
+            {'f._id': ObjectId(file["_id"])}
+        ]
+        self.connection.database[project_name].update_one(
+            {"_id": representation["_id"]},
+            {"$set": {"files.$[f].sites.$[s].resume": resume_info}},
+            array_filters=arr_filter
+        )
+
     def _get_file_info(self, files, _id):
         """
             Return record from list of records which name matches to 'provider'
@@ -2048,10 +2125,17 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             Auxiliary method to call update_one function on DB
 
             Used for refactoring ugly reset_provider_for_file
+
+            Time of change is stored on representation so the change is
+            picked up by incremental scan of sync loop in any process.
         """
         query = {
             "_id": ObjectId(representation_id)
         }
+        update = copy.deepcopy(update)
+        update.setdefault("$set", {})[self.SITES_CHANGED_KEY] = (
+            datetime.utcnow()
+        )
 
         self.connection.database[project_name].update_one(
             query,
@@ -2278,6 +2362,64 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         ld = self.sync_project_settings[project_name]["config"]["loop_delay"]
         return int(ld)
 
+    def get_max_concurrent_transfers(self, project_name, site_name):
+        """
+            Return maximum of files transferred at the same time for site.
+
+            Site configuration can override project configuration.
+        Returns:
+            (int)
+        """
+        value = self._get_site_transfer_config(
+            project_name, site_name, "max_concurrent_transfers")
+        return int(value or 3)
+
+    def get_bandwidth_limit(self, project_name, site_name):
+        """
+            Return bandwidth limit of transfers for site in bytes per second.
+
+            Value in settings is in megabytes per second. Site configuration
+            can override project configuration.
+        Returns:
+            (float): 0 means unlimited
+        """
+        value = self._get_site_transfer_config(
+            project_name, site_name, "bandwidth_limit")
+        return float(value or 0) * 1024 * 1024
+
+    def _get_site_transfer_config(self, project_name, site_name, key):
+        sync_settings = self.sync_project_settings[project_name]
+        site_config = sync_settings.get("sites", {}).get(site_name) or {}
+        value = site_config.get(key)
+        if value in (None, ""):
+            value = sync_settings["config"].get(key)
+        return value
+
+    def get_sync_stats(self):
+        """
+            Return statistics of sync loop transfers.
+
+            Used by REST api.
+        Returns:
+            (dict): empty if sync server is not running in this process
+        """
+        if self.sync_server_thread is None:
+            return {}
+        return self.sync_server_thread.scheduler.get_stats()
+
+    def get_full_scan_delay(self, project_name):
+        """
+            Return count of seconds between full scans of representations.
+
+            Loops between full scans process only new representations and
+            representations which were waiting for synchronization in
+            previous loop.
+        Returns:
+            (int): in seconds, 0 means that each loop is full scan
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        return int(config.get("full_scan_delay") or 0)
+
     def show_widget(self):
         """Show dialog for Sync Queue"""
         no_errors = False
@@ -640,6 +640,31 @@ class AnatomyStringTemplate(StringTemplate):
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_many(self, data, items):
+        """Format template multiple times and add 'root' key to data.
+
+        Args:
+            data (dict[str, Any]): Formatting data same for all results.
+            items (Iterable[dict[str, Any]]): Formatting data different for
+                each result e.g. '{"frame": 1001}'.
+
+        Returns:
+            list[AnatomyTemplateResult]: Formatting results.
+        """
+
+        anatomy_templates = self.anatomy_templates
+        if not data.get("root"):
+            data = copy.deepcopy(data)
+            data["root"] = anatomy_templates.anatomy.roots
+
+        output = []
+        for result in StringTemplate.format_many(self, data, items):
+            rootless_path = anatomy_templates.rootless_path_from_result(
+                result
+            )
+            output.append(AnatomyTemplateResult(result, rootless_path))
+        return output
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -986,7 +1011,8 @@ class AnatomyTemplates(TemplatesDict):
         return output
 
     def format(self, data, strict=True):
-        copy_data = copy.deepcopy(data)
+        # Data are deep copied in 'TemplatesDict.format'
+        copy_data = dict(data)
         roots = self.roots
         if roots:
             copy_data["root"] = roots
@@ -1,11 +1,14 @@
 import re
 import os
 import json
+import atexit
 import contextlib
 import functools
 import platform
 import tempfile
 import warnings
+import threading
+import subprocess
 from copy import deepcopy
 
 from openpype import PACKAGE_DIR
@@ -13,6 +16,10 @@ from openpype.settings import get_project_settings
 from openpype.lib import (
     StringTemplate,
     run_openpype_process,
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
+    is_running_from_build,
+    CREATE_NO_WINDOW,
     Logger
 )
 from openpype.pipeline import Anatomy
@@ -25,8 +32,8 @@ log = Logger.get_logger(__name__)
 class CachedData:
     remapping = None
     has_compatible_ocio_package = None
-    config_version_data = {}
-    ocio_config_colorspaces = {}
+    # Results of OCIO queries by config path, modification time and query
+    ocio_query_results = {}
     allowed_exts = {
         ext.lstrip(".") for ext in IMAGE_EXTENSIONS.union(VIDEO_EXTENSIONS)
     }
@@ -283,25 +290,11 @@ def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
     Returns:
         Any[str, None]: matching colorspace name
     """
-    if not compatibility_check():
-        # python environment is not compatible with PyOpenColorIO
-        # needs to be run in subprocess
-        result_data = _get_wrapped_with_subprocess(
-            "colorspace", "get_config_file_rules_colorspace_from_filepath",
-            config_path=config_path,
-            filepath=filepath
-        )
-        if result_data:
-            return result_data[0]
-
-    # TODO: refactor this so it is not imported but part of this file
-    from openpype.scripts.ocio_wrapper import _get_config_file_rules_colorspace_from_filepath  # noqa: E501
-
-    result_data = _get_config_file_rules_colorspace_from_filepath(
-        config_path, filepath)
-
-    if result_data:
-        return result_data[0]
+    return _get_ocio_data(
+        "get_config_file_rules_colorspace_from_filepath",
+        config_path,
+        filepath=filepath
+    ) or None
 
 
 def parse_colorspace_from_filepath(
@@ -455,6 +448,203 @@ def _get_wrapped_with_subprocess(command_group, command, **kwargs):
             return json.load(f_)
 
 
+class _OCIOHelperConnectionError(Exception):
+    """Communication with OCIO helper process failed."""
+
+
+class _OCIOHelperProcess(object):
+    """Long running OpenPype process answering OCIO queries.
+
+    Used in Python 2 hosts or where PyOpenColorIO is not available, so
+    OpenPype process is started only once instead of for each query.
+    Process runs 'serve' command of 'ocio_wrapper.py' and communicates
+    through stdin and stdout with json lines.
+    """
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+        self._request_id = 0
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def _start(self):
+        args = get_openpype_execute_args(
+            "run", get_ocio_config_script_path(), "serve"
+        )
+        env = clean_envs_for_openpype_process(os.environ)
+        # Only keep OpenPype version if we are running from build.
+        if not is_running_from_build():
+            env.pop("OPENPYPE_VERSION", None)
+
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = CREATE_NO_WINDOW
+
+        log.debug("Starting OCIO helper: {}".format(" ".join(args)))
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env={str(key): str(value) for key, value in env.items()},
+            **kwargs
+        )
+
+    def stop(self):
+        with self._lock:
+            if self.is_running():
+                try:
+                    self._process.stdin.close()
+                except (IOError, OSError):
+                    pass
+                self._process.terminate()
+                self._process.wait()
+            self._process = None
+
+    def request(self, command, **kwargs):
+        """Send request to helper process and wait for result.
+
+        Args:
+            command (str): Key of 'SERVE_COMMANDS' in 'ocio_wrapper.py'.
+            **kwargs: Arguments of the command.
+
+        Raises:
+            _OCIOHelperConnectionError: Process is not available.
+            RuntimeError: Command failed in the helper process.
+        """
+        with self._lock:
+            response = self._request(command, kwargs)
+
+        if "error" in response:
+            raise RuntimeError(
+                "OCIO helper failed to process '{}': {}".format(
+                    command, response["error"]
+                )
+            )
+        return response.get("result")
+
+    def _request(self, command, kwargs):
+        # Prefix of 'SERVE_RESPONSE_PREFIX' in 'ocio_wrapper.py'
+        response_prefix = "__ocio_wrapper_response__"
+        try:
+            if not self.is_running():
+                self._start()
+
+            self._request_id += 1
+            request_id = self._request_id
+            request = json.dumps({
+                "id": request_id,
+                "command": command,
+                "kwargs": kwargs
+            }) + "\n"
+            self._process.stdin.write(request.encode("utf-8"))
+            self._process.stdin.flush()
+
+            while True:
+                line = self._process.stdout.readline()
+                if not line:
+                    raise _OCIOHelperConnectionError(
+                        "OCIO helper process has ended."
+                    )
+                line = line.decode("utf-8", "replace").strip()
+                if not line.startswith(response_prefix):
+                    # Output of OpenPype process start
+                    log.debug(line)
+                    continue
+
+                response = json.loads(line[len(response_prefix):])
+                if response.get("id") == request_id:
+                    return response
+
+        except (IOError, OSError, ValueError) as exc:
+            raise _OCIOHelperConnectionError(str(exc))
+
+
+_OCIO_HELPER = _OCIOHelperProcess()
+atexit.register(_OCIO_HELPER.stop)
+
+# Command name, group and argument name of config path in 'ocio_wrapper.py'
+#   for one-shot subprocess fallback
+_OCIO_SUBPROCESS_COMMANDS = {
+    "get_colorspace": ("config", "get_colorspace", "in_path"),
+    "get_views": ("config", "get_views", "in_path"),
+    "get_version": ("config", "get_version", "config_path"),
+    "get_display_view_colorspace_name": (
+        "config", "get_display_view_colorspace_name", "in_path"
+    ),
+    "get_config_file_rules_colorspace_from_filepath": (
+        "colorspace",
+        "get_config_file_rules_colorspace_from_filepath",
+        "config_path"
+    ),
+}
+
+
+def _get_ocio_data_from_subprocess(command, config_path, **kwargs):
+    try:
+        return _OCIO_HELPER.request(
+            command, config_path=config_path, **kwargs
+        )
+
+    except _OCIOHelperConnectionError:
+        log.warning(
+            "OCIO helper process failed, using one-shot subprocess.",
+            exc_info=True
+        )
+        _OCIO_HELPER.stop()
+
+    command_group, command_name, path_arg = _OCIO_SUBPROCESS_COMMANDS[command]
+    kwargs[path_arg] = config_path
+    return _get_wrapped_with_subprocess(command_group, command_name, **kwargs)
+
+
+def _get_ocio_data(command, config_path, **kwargs):
+    """Query OCIO config with cache of results.
+
+    Results are cached by config path, its modification time and the query.
+    Query is processed in this process if PyOpenColorIO is available,
+    otherwise in OCIO helper process.
+
+    Args:
+        command (str): Key of 'SERVE_COMMANDS' in 'ocio_wrapper.py'.
+        config_path (str): path leading to config.ocio file
+        **kwargs: Arguments of the command.
+
+    Returns:
+        Any: Result of the command.
+    """
+    cache_key = None
+    try:
+        cache_key = (
+            os.path.normpath(os.path.abspath(config_path)),
+            os.path.getmtime(config_path),
+            command,
+            tuple(sorted(kwargs.items()))
+        )
+    except (IOError, OSError):
+        # Query will fail on missing file with proper error
+        pass
+
+    if cache_key is not None and cache_key in CachedData.ocio_query_results:
+        return deepcopy(CachedData.ocio_query_results[cache_key])
+
+    if compatibility_check():
+        # TODO: refactor this so it is not imported but part of this file
+        from openpype.scripts.ocio_wrapper import SERVE_COMMANDS
+
+        result = SERVE_COMMANDS[command](config_path=config_path, **kwargs)
+    else:
+        # python environment is not compatible with PyOpenColorIO
+        # needs to be run in subprocess
+        result = _get_ocio_data_from_subprocess(
+            command, config_path, **kwargs
+        )
+
+    if cache_key is not None:
+        CachedData.ocio_query_results[cache_key] = result
+    return deepcopy(result)
+
+
 # TODO: this should be part of ocio_wrapper.py
 def compatibility_check():
     """Making sure PyOpenColorIO is importable"""
@@ -475,28 +665,14 @@ def compatibility_check():
 def compatibility_check_config_version(config_path, major=1, minor=None):
     """Making sure PyOpenColorIO config version is compatible"""
 
-    if not CachedData.config_version_data.get(config_path):
-        if compatibility_check():
-            # TODO: refactor this so it is not imported but part of this file
-            from openpype.scripts.ocio_wrapper import _get_version_data
-
-            CachedData.config_version_data[config_path] = \
-                _get_version_data(config_path)
-
-        else:
-            # python environment is not compatible with PyOpenColorIO
-            # needs to be run in subprocess
-            CachedData.config_version_data[config_path] = \
-                _get_wrapped_with_subprocess(
-                    "config", "get_version", config_path=config_path
-            )
+    version_data = _get_ocio_data("get_version", config_path)
 
     # check major version
-    if CachedData.config_version_data[config_path]["major"] != major:
+    if version_data["major"] != major:
         return False
 
     # check minor version
-    if minor and CachedData.config_version_data[config_path]["minor"] != minor:
+    if minor and version_data["minor"] != minor:
         return False
 
     # compatible
@@ -515,22 +691,7 @@ def get_ocio_config_colorspaces(config_path):
     Returns:
         dict: colorspace and family in couple
     """
-    if not CachedData.ocio_config_colorspaces.get(config_path):
-        if not compatibility_check():
-            # python environment is not compatible with PyOpenColorIO
-            # needs to be run in subprocess
-            CachedData.ocio_config_colorspaces[config_path] = \
-                _get_wrapped_with_subprocess(
-                    "config", "get_colorspace", in_path=config_path
-            )
-        else:
-            # TODO: refactor this so it is not imported but part of this file
-            from openpype.scripts.ocio_wrapper import _get_colorspace_data
-
-            CachedData.ocio_config_colorspaces[config_path] = \
-                _get_colorspace_data(config_path)
-
-    return CachedData.ocio_config_colorspaces[config_path]
+    return _get_ocio_data("get_colorspace", config_path)
 
 
 def convert_colorspace_enumerator_item(
@@ -714,17 +875,7 @@ def get_ocio_config_views(config_path):
     Returns:
         dict: `display/viewer` and viewer data
     """
-    if not compatibility_check():
-        # python environment is not compatible with PyOpenColorIO
-        # needs to be run in subprocess
-        return _get_wrapped_with_subprocess(
-            "config", "get_views", in_path=config_path
-        )
-
-    # TODO: refactor this so it is not imported but part of this file
-    from openpype.scripts.ocio_wrapper import _get_views_data
-
-    return _get_views_data(config_path)
+    return _get_ocio_data("get_views", config_path)
 
 
 # TODO: remove this in future - backward compatibility
@@ -1150,16 +1301,12 @@ def get_display_view_colorspace_name(config_path, display, view):
     Returns:
         view color space name (str) e.g. "Output - sRGB"
     """
-
-    if not compatibility_check():
-        # python environment is not compatible with PyOpenColorIO
-        # needs to be run in subprocess
-        return get_display_view_colorspace_subprocess(config_path,
-                                                      display, view)
-
-    from openpype.scripts.ocio_wrapper import _get_display_view_colorspace_name  # noqa
-
-    return _get_display_view_colorspace_name(config_path, display, view)
+    return _get_ocio_data(
+        "get_display_view_colorspace_name",
+        config_path,
+        display=display,
+        view=view
+    )
 
 
 def get_display_view_colorspace_subprocess(config_path, display, view):
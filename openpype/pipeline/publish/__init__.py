@@ -26,6 +26,7 @@ from .lib import (
     get_publish_template_name,
 
     publish_plugins_discover,
+    publish_iter_with_entity_cache,
     load_help_content_from_plugin,
     load_help_content_from_filepath,
 
@@ -74,6 +75,7 @@ __all__ = (
     "get_publish_template_name",
 
     "publish_plugins_discover",
+    "publish_iter_with_entity_cache",
     "load_help_content_from_plugin",
     "load_help_content_from_filepath",
 
@@ -8,7 +8,9 @@ import xml.etree.ElementTree
 import pyblish.util
 import pyblish.plugin
 import pyblish.api
+import pyblish.lib
 
+from openpype.client import entity_cache
 from openpype.lib import (
     Logger,
     import_filepath,
@@ -485,6 +487,40 @@ def filter_pyblish_plugins(plugins):
             plugins.remove(plugin)
 
 
+def publish_iter_with_entity_cache(context=None, plugins=None, targets=None):
+    """Publish same way as 'pyblish.util.publish_iter'.
+
+    Collectors often query the same entity documents, entities are cached
+    during collection. Later plugins create documents and entities are
+    not cached for them.
+
+    Args:
+        context (Optional[pyblish.api.Context]): Context to publish.
+        plugins (Optional[list[pyblish.api.Plugin]]): Plugins to process,
+            discovered if not passed.
+        targets (Optional[list[str]]): Targets of plugins.
+
+    Yields:
+        dict: Result of processed plugin.
+    """
+    if context is None:
+        context = pyblish.api.Context()
+    if plugins is None:
+        plugins = pyblish.api.discover()
+
+    with entity_cache():
+        for result in pyblish.util.collect_iter(context, plugins, targets):
+            yield result
+
+    plugins = [
+        plugin
+        for plugin in plugins
+        if not pyblish.lib.inrange(plugin.order, pyblish.api.CollectorOrder)
+    ]
+    for result in pyblish.util.publish_iter(context, plugins, targets):
+        yield result
+
+
 def remote_publish(log):
     """Loops through all plugins, logs to console. Used for tests.
 
@@ -495,7 +531,7 @@ def remote_publish(log):
     # Error exit as soon as any error occurs.
     error_format = "Failed {plugin.__name__}: {error}\n{error.traceback}"
 
-    for result in pyblish.util.publish_iter():
+    for result in publish_iter_with_entity_cache():
         if not result["error"]:
             continue
 
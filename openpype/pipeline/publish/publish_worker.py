@@ -0,0 +1,584 @@
+"""Persistent worker for headless publishing.
+
+Start of headless publish process is expensive. Plugins have to be
+installed and discovered, settings and anatomy resolved and application
+environments prepared, before any work is done. Worker does that once and
+keeps the results in memory while it processes publish jobs sent over local
+socket one by one.
+
+Each job is published with new pyblish context. Environment of the worker
+is replaced by environment of the job before publishing and restored
+when job is done. Environment variables which the job changed are
+reported in result of the job.
+
+Only processes of user running the worker can send jobs. Worker stores
+random key to file in private directory of user and both sides of
+connection must prove they know the key before job is sent.
+
+Communication uses json messages. Client sends one message with job data
+and receives messages with output of the job. The last message contains
+result.
+"""
+import os
+import sys
+import json
+import hashlib
+import logging
+import collections
+import contextlib
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+
+import appdirs
+
+from openpype import AYON_SERVER_ENABLED
+
+PUBLISH_WORKER_PORT_ENV = "OPENPYPE_PUBLISH_WORKER_PORT"
+DEFAULT_PUBLISH_WORKER_PORT = 8151
+
+
+class PublishJobError(Exception):
+    """Publish job failed."""
+
+
+def _get_worker_dir():
+    """Directory of current user where keys of publish workers are stored.
+
+    Directory is created with access only for the user.
+
+    Raises:
+        PermissionError: Directory is accessible by other users.
+    """
+    if AYON_SERVER_ENABLED:
+        app_dir = appdirs.user_data_dir("AYON", "Ynput")
+    else:
+        app_dir = appdirs.user_data_dir("openpype", "pypeclub")
+    worker_dir = os.path.join(app_dir, "publish_worker")
+    os.makedirs(worker_dir, mode=0o700, exist_ok=True)
+    # Access on Windows is limited by directory of user
+    if hasattr(os, "getuid"):
+        dir_stat = os.lstat(worker_dir)
+        if (
+            os.path.islink(worker_dir)
+            or dir_stat.st_uid != os.getuid()
+            or dir_stat.st_mode & 0o077
+        ):
+            raise PermissionError(
+                "Directory is accessible by other users: {}".format(
+                    worker_dir
+                )
+            )
+    return worker_dir
+
+
+def _get_worker_key_path(port):
+    return os.path.join(
+        _get_worker_dir(), "publish_worker_{}.key".format(port)
+    )
+
+
+def _write_worker_key(path, key):
+    """Store key to file readable only by current user."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as stream:
+        stream.write(key)
+
+
+def _read_worker_key(port):
+    """Key of worker listening on port or None if worker is not running."""
+    try:
+        with open(_get_worker_key_path(port), "r") as stream:
+            return stream.read().strip().encode("ascii")
+    except (IOError, OSError):
+        return None
+
+
+class _OutputStream(object):
+    """Stream sending written text as output messages."""
+    def __init__(self, send_func):
+        self._send_func = send_func
+        self._buffer = ""
+
+    def write(self, text):
+        self._buffer += text
+        lines = self._buffer.split("\n")
+        self._buffer = lines.pop(-1)
+        for line in lines:
+            self._send_func(line)
+
+    def flush(self):
+        if self._buffer:
+            self._send_func(self._buffer)
+            self._buffer = ""
+
+
+class _OutputHandler(logging.Handler):
+    def __init__(self, send_func):
+        super(_OutputHandler, self).__init__()
+        self._send_func = send_func
+        self.setFormatter(logging.Formatter(
+            "%(levelname)s:%(name)s: %(message)s"
+        ))
+
+    def emit(self, record):
+        try:
+            self._send_func(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+class PublishWorker(object):
+    """Process publish jobs in warm process.
+
+    Plugin paths and root environments are registered for project and host
+    of each job, same as in new publish process. Discovered plugins are
+    cached by project name, host name and targets, application environments
+    by context.
+
+    Args:
+        max_cached_environments (int): Maximum number of cached application
+            environments.
+    """
+    def __init__(self, max_cached_environments=32):
+        self._log = None
+        self._installed = False
+        self._modules_manager = None
+        self._base_environ = None
+        self._installed_context = None
+        self._root_environments_by_project = {}
+        self._plugins_by_key = {}
+        self._env_changes_by_context = collections.OrderedDict()
+        self._max_cached_environments = max_cached_environments
+
+    @property
+    def log(self):
+        if self._log is None:
+            from openpype.lib import Logger
+
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    def install(self):
+        """Prepare worker, plugins are installed for context of each job."""
+        if self._installed:
+            return
+
+        import pyblish.api
+        from openpype.modules import ModulesManager
+
+        pyblish.api.register_host("shell")
+        self._modules_manager = ModulesManager()
+        self._base_environ = dict(os.environ)
+        self._installed = True
+
+    def _get_root_environments(self, project_name):
+        """Root environments of project, e.g. 'OPENPYPE_ROOT_WORK'."""
+        if not project_name:
+            return {}
+
+        root_environments = self._root_environments_by_project.get(
+            project_name
+        )
+        if root_environments is None:
+            from openpype.pipeline import Anatomy
+
+            root_environments = Anatomy(project_name).root_environments()
+            self._root_environments_by_project[project_name] = (
+                root_environments
+            )
+        return root_environments
+
+    def _install_context(self, project_name, host_name):
+        """Register plugin paths for project and host of job.
+
+        Paths registered for previous context are deregistered. Must be
+        called with environment of job.
+        """
+        key = (project_name, host_name)
+        if self._installed_context == key:
+            return
+
+        import pyblish.api
+        from openpype.pipeline import install_openpype_plugins
+        from openpype.pipeline.publish.lib import filter_pyblish_plugins
+
+        self.log.debug(
+            "Installing plugins for project \"{}\" and host \"{}\"".format(
+                project_name, host_name
+            )
+        )
+        pyblish.api.deregister_all_paths()
+        try:
+            pyblish.api.deregister_discovery_filter(filter_pyblish_plugins)
+        except ValueError:
+            pass
+        # Invalidate in case install fails
+        self._installed_context = None
+
+        install_openpype_plugins(project_name, host_name)
+        for path in self._modules_manager.collect_plugin_paths()["publish"]:
+            pyblish.api.register_plugin_path(path)
+        self._installed_context = key
+
+    def _get_app_env_changes(self, environ):
+        """Changes of environment for application of job context.
+
+        Returns:
+            dict[str, str]: Environment variables which are added or changed.
+        """
+        from openpype.lib.applications import (
+            get_app_environments_for_context,
+            LaunchTypes,
+        )
+
+        app_full_name = environ.get("AVALON_APP_NAME")
+        if not app_full_name:
+            return {}
+
+        key = (
+            environ.get("AVALON_PROJECT"),
+            environ.get("AVALON_ASSET"),
+            environ.get("AVALON_TASK"),
+            app_full_name,
+        )
+        changes = self._env_changes_by_context.pop(key, None)
+        if changes is None:
+            env = get_app_environments_for_context(
+                *key,
+                launch_type=LaunchTypes.farm_publish,
+                env=dict(environ),
+                modules_manager=self._modules_manager
+            )
+            changes = {
+                env_key: value
+                for env_key, value in env.items()
+                if environ.get(env_key) != value
+            }
+
+        self._env_changes_by_context[key] = changes
+        while (
+            len(self._env_changes_by_context) > self._max_cached_environments
+        ):
+            self._env_changes_by_context.popitem(last=False)
+        return changes
+
+    def _get_settings_fingerprint(self, project_name):
+        """Hash of settings which are applied to plugins."""
+        from openpype.settings import (
+            get_system_settings,
+            get_project_settings,
+        )
+
+        settings = [get_system_settings(read_only=True)]
+        if project_name:
+            settings.append(
+                get_project_settings(project_name, read_only=True)
+            )
+        return hashlib.sha1(
+            json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def _get_plugins(self, project_name, host_name, targets):
+        """Discovered plugins for installed context and targets.
+
+        Plugins are discovered again when settings changed.
+        """
+        import pyblish.api
+
+        key = (project_name, host_name, tuple(targets))
+        fingerprint = self._get_settings_fingerprint(project_name)
+        cached = self._plugins_by_key.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        # Settings are applied to plugins during discovery
+        plugins = pyblish.api.discover()
+        self._plugins_by_key[key] = (fingerprint, plugins)
+        return plugins
+
+    def _set_environ(self, environ):
+        os.environ.clear()
+        os.environ.update(environ)
+
+    def process_job(self, paths, targets=None, environ=None):
+        """Publish job.
+
+        Args:
+            paths (list[str]): Paths to publish metadata json files.
+            targets (Optional[list[str]]): Pyblish targets, "farm" is used
+                when not passed.
+            environ (Optional[dict[str, str]]): Environment of job.
+
+        Returns:
+            list[str]: Environment variables changed by the job. Changes
+                are reverted after the job.
+
+        Raises:
+            PublishJobError: Publishing failed.
+        """
+        import pyblish.api
+        from openpype.pipeline.publish import publish_iter_with_entity_cache
+
+        if not any(paths):
+            raise PublishJobError("No publish paths specified")
+
+        self.install()
+
+        targets = list(targets or ["farm"])
+        job_environ = dict(self._base_environ)
+        if environ:
+            job_environ.update(environ)
+        project_name = job_environ.get("AVALON_PROJECT")
+        host_name = job_environ.get("AVALON_APP")
+        job_environ.update(self._get_root_environments(project_name))
+        job_environ.update(self._get_app_env_changes(job_environ))
+        job_environ["OPENPYPE_PUBLISH_DATA"] = os.pathsep.join(paths)
+        job_environ["HEADLESS_PUBLISH"] = "true"
+
+        registered_targets = pyblish.api.registered_targets()
+        for target in targets:
+            print("setting target: {}".format(target))
+            pyblish.api.register_target(target)
+
+        self._set_environ(job_environ)
+        try:
+            self._install_context(project_name, host_name)
+            self.log.info("Running publish ...")
+            plugins = self._get_plugins(project_name, host_name, targets)
+            print("Using plugins:")
+            for plugin in plugins:
+                print(plugin)
+
+            error_format = (
+                "Failed {plugin.__name__}: {error} -- {error.traceback}"
+            )
+            # Entity cache of collection is released when job fails
+            with contextlib.closing(
+                publish_iter_with_entity_cache(plugins=plugins)
+            ) as results:
+                for result in results:
+                    if result["error"]:
+                        raise PublishJobError(error_format.format(**result))
+
+            self.log.info("Publish finished.")
+
+        finally:
+            changed_keys = self._validate_isolation(
+                job_environ, registered_targets
+            )
+            self._set_environ(self._base_environ)
+            pyblish.api.deregister_all_targets()
+            for target in registered_targets:
+                pyblish.api.register_target(target)
+        return changed_keys
+
+    def _validate_isolation(self, job_environ, registered_targets):
+        """Find changes done by job which are reverted.
+
+        Returns:
+            list[str]: Environment variables changed by the job.
+        """
+        import pyblish.api
+
+        changed_keys = {
+            key
+            for key in set(job_environ) | set(os.environ)
+            if job_environ.get(key) != os.environ.get(key)
+        }
+        if changed_keys:
+            self.log.warning(
+                "Publish job changed environment variables: {}".format(
+                    ", ".join(sorted(changed_keys))
+                )
+            )
+
+        new_targets = (
+            set(pyblish.api.registered_targets()) - set(registered_targets)
+        )
+        if new_targets:
+            self.log.debug("Unregistering job targets: {}".format(
+                ", ".join(sorted(new_targets))
+            ))
+        return sorted(changed_keys)
+
+    def _handle_request(self, conn):
+        """Process job received on authenticated connection."""
+        def send(data):
+            conn.send_bytes(json.dumps(data).encode("utf-8"))
+
+        def send_output(line):
+            send({"type": "output", "line": line})
+
+        try:
+            job_data = json.loads(conn.recv_bytes().decode("utf-8"))
+        except ValueError:
+            send({"type": "result", "success": False,
+                  "message": "Invalid job data", "changed_environ": []})
+            return
+
+        stream = _OutputStream(send_output)
+        handler = _OutputHandler(send_output)
+        root_logger = logging.getLogger()
+        root_logger.addHandler(handler)
+        success = True
+        message = None
+        changed_keys = []
+        try:
+            with contextlib.redirect_stdout(stream):
+                changed_keys = self.process_job(
+                    job_data.get("paths") or [],
+                    job_data.get("targets"),
+                    job_data.get("environ"),
+                )
+        except Exception as exc:
+            self.log.warning("Publish job failed", exc_info=True)
+            success = False
+            message = str(exc)
+
+        finally:
+            stream.flush()
+            root_logger.removeHandler(handler)
+
+        send({
+            "type": "result",
+            "success": success,
+            "message": message,
+            "changed_environ": changed_keys,
+        })
+
+    def serve_forever(self, port=None):
+        """Process publish jobs received on local socket.
+
+        Only clients which know key of the worker are accepted, key is
+        replaced on each start of worker.
+        """
+        if port is None:
+            port = get_publish_worker_port()
+
+        self.install()
+
+        key = os.urandom(32).hex().encode("ascii")
+        key_path = _get_worker_key_path(port)
+        tmp_path = "{}.{}.tmp".format(key_path, os.getpid())
+        _write_worker_key(tmp_path, key)
+        # Key is stored after port is bound, key of other worker running
+        #   on the port must stay valid
+        try:
+            listener = Listener(("localhost", port), authkey=key)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, key_path)
+        try:
+            self.log.info(
+                "Publish worker listening on port {}".format(port)
+            )
+            # Jobs are processed one by one
+            while True:
+                try:
+                    conn = listener.accept()
+                except (AuthenticationError, EOFError, OSError) as exc:
+                    self.log.warning(
+                        "Rejected connection: {}".format(exc)
+                    )
+                    continue
+
+                with conn:
+                    try:
+                        self._handle_request(conn)
+                    except (EOFError, OSError):
+                        self.log.warning(
+                            "Connection to client was lost", exc_info=True
+                        )
+        finally:
+            listener.close()
+            if os.path.exists(key_path):
+                os.remove(key_path)
+
+
+def get_publish_worker_port():
+    return int(
+        os.environ.get(PUBLISH_WORKER_PORT_ENV)
+        or DEFAULT_PUBLISH_WORKER_PORT
+    )
+
+
+def send_publish_job(paths, targets=None, port=None, environ=None):
+    """Publish job in running publish worker.
+
+    Output of job is printed to stdout.
+
+    Args:
+        paths (list[str]): Paths to publish metadata json files.
+        targets (Optional[list[str]]): Pyblish targets.
+        port (Optional[int]): Port of publish worker.
+        environ (Optional[dict[str, str]]): Environment of job, current
+            environment is used when not passed.
+
+    Returns:
+        list[str]: Environment variables changed by the job in worker.
+
+    Raises:
+        ConnectionRefusedError: Publish worker of current user is not
+            running, job was not sent.
+        PublishJobError: Publishing failed or connection to worker was lost
+            after job was sent. Job may be partially published.
+    """
+    if port is None:
+        port = get_publish_worker_port()
+
+    if environ is None:
+        environ = dict(os.environ)
+
+    key = _read_worker_key(port)
+    if key is None:
+        raise ConnectionRefusedError(
+            "Publish worker of current user is not running on port {}".format(
+                port
+            )
+        )
+
+    try:
+        conn = Client(("localhost", port), authkey=key)
+    except (AuthenticationError, EOFError) as exc:
+        raise ConnectionRefusedError(
+            "Publish worker on port {} is not authenticated: {}".format(
+                port, exc
+            )
+        )
+
+    job_data = {
+        "paths": list(paths),
+        "targets": list(targets) if targets else None,
+        "environ": environ,
+    }
+    with conn:
+        try:
+            conn.send_bytes(json.dumps(job_data).encode("utf-8"))
+            while True:
+                data = json.loads(conn.recv_bytes().decode("utf-8"))
+                if data["type"] == "output":
+                    print(data["line"])
+                    continue
+
+                changed_keys = data.get("changed_environ") or []
+                if changed_keys:
+                    print((
+                        "Publish job changed environment variables"
+                        " in worker: {}"
+                    ).format(", ".join(changed_keys)))
+
+                if not data["success"]:
+                    raise PublishJobError(data["message"])
+                return changed_keys
+
+        except (EOFError, OSError, ValueError) as exc:
+            raise PublishJobError(
+                "Connection to publish worker failed: {}".format(exc)
+            )
+
+
+def main(port=None):
+    """Run publish worker until process is killed."""
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+    PublishWorker().serve_forever(port)
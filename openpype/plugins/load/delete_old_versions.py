@@ -2,7 +2,6 @@ import collections
 import os
 import uuid
 
-import clique
 from pymongo import UpdateOne
 import qargparse
 from qtpy import QtWidgets, QtCore
@@ -10,7 +9,7 @@ from qtpy import QtWidgets, QtCore
 from openpype import style
 from openpype.client import get_versions, get_representations
 from openpype.modules import ModulesManager
-from openpype.lib import format_file_size
+from openpype.lib import format_file_size, get_collections
 from openpype.pipeline import load, AvalonMongoDB, Anatomy
 from openpype.pipeline.load import (
     get_representation_path_with_anatomy,
@@ -104,8 +103,7 @@ class DeleteOldVersions(load.SubsetLoaderPlugin):
         size = 0
 
         for dir_id, dir_path in dir_paths.items():
-            dir_files = os.listdir(dir_path)
-            collections, remainders = clique.assemble(dir_files)
+            collections, remainders = get_collections(dir_path)
             for file_path, seq_path in file_paths[dir_id]:
                 file_path_base = os.path.split(file_path)[1]
                 # Just remove file if `frame` key was not in context or
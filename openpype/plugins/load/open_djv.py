@@ -1,5 +1,5 @@
 import os
-from openpype.lib import ApplicationManager
+from openpype.lib import ApplicationManager, get_collections
 from openpype.pipeline import load
 
 
@@ -39,9 +39,8 @@ class OpenInDJV(load.LoaderPlugin):
         directory = os.path.dirname(path)
 
         pattern = clique.PATTERNS["frames"]
-        files = os.listdir(directory)
-        collections, remainder = clique.assemble(
-            files,
+        collections, remainder = get_collections(
+            directory,
             patterns=[pattern],
             minimum_items=1
         )
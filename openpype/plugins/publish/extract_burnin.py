@@ -13,6 +13,7 @@ from openpype import resources, PACKAGE_DIR
 from openpype.pipeline import publish
 from openpype.lib import (
     run_openpype_process,
+    run_subprocess,
 
     get_transcode_temp_directory,
     convert_input_paths_for_ffmpeg,
@@ -96,6 +97,12 @@ class ExtractBurnin(publish.Extractor):
                 self.log.debug("Removing representation: {}".format(repre))
                 instance.data["representations"].remove(repre)
 
+    def _render_fused_review(self, repre):
+        fused_review = repre.pop("fusedReview")
+        ffmpeg_cmd = " ".join(fused_review["ffmpeg_args"])
+        self.log.debug("Executing: {}".format(ffmpeg_cmd))
+        run_subprocess(ffmpeg_cmd, shell=True, logger=self.log)
+
     def _get_burnins_per_representations(self, instance, src_burnin_defs):
         self.log.debug("Filtering of representations and their burnins starts")
 
@@ -216,8 +223,12 @@ class ExtractBurnin(publish.Extractor):
                 src_filepaths = [os.path.join(src_repre_staging_dir, filename)]
 
             first_input_path = os.path.join(src_repre_staging_dir, filename)
+            # Output of ExtractReview is rendered together with burnins
+            fused_review = repre.get("fusedReview")
             # Determine if representation requires pre conversion for ffmpeg
-            do_convert = should_convert_for_ffmpeg(first_input_path)
+            do_convert = False
+            if fused_review is None:
+                do_convert = should_convert_for_ffmpeg(first_input_path)
             # If result is None the requirement of conversion can't be
             #   determined
             if do_convert is None:
@@ -279,6 +290,7 @@ class ExtractBurnin(publish.Extractor):
             for filename_suffix, burnin_def in repre_burnin_defs.items():
                 new_repre = copy.deepcopy(repre)
                 new_repre["stagingDir"] = src_repre_staging_dir
+                new_repre.pop("fusedReview", None)
 
                 # Keep "ftrackreview" tag only on first output
                 if first_output:
@@ -325,36 +337,27 @@ class ExtractBurnin(publish.Extractor):
                     "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", "")
                 }
 
-                self.log.debug(
-                    "script_data: {}".format(json.dumps(script_data, indent=4))
-                )
-
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
+                if fused_review is not None:
+                    # Input is not rendered, burnins are added to review
+                    #   command
+                    fused_script_data = copy.deepcopy(script_data)
+                    fused_script_data["fused_review"] = fused_review
+                    fused_script_data["first_frame"] = None
+                    try:
+                        self._run_burnin_script(
+                            executable_args, fused_script_data
+                        )
 
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                self.log.debug("Executing: {}".format(" ".join(args)))
+                    except RuntimeError:
+                        self.log.warning((
+                            "Failed to render review with burnins in single"
+                            " pass. Rendering review separately."
+                        ), exc_info=True)
+                        self._render_fused_review(repre)
+                        fused_review = None
 
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
-
-                run_openpype_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                if fused_review is None:
+                    self._run_burnin_script(executable_args, script_data)
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
@@ -386,6 +389,40 @@ class ExtractBurnin(publish.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
+    def _run_burnin_script(self, executable_args, script_data):
+        self.log.debug(
+            "script_data: {}".format(json.dumps(script_data, indent=4))
+        )
+
+        # Dump data to string
+        dumped_script_data = json.dumps(script_data)
+
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(dumped_script_data)
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = list(executable_args)
+        args.append(temporary_json_filepath)
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        # Run burnin script
+        process_kwargs = {
+            "logger": self.log
+        }
+
+        try:
+            run_openpype_process(*args, **process_kwargs)
+        finally:
+            # Remove the temporary json
+            os.remove(temporary_json_filepath)
+
     def _get_burnin_options(self):
         # Prepare burnin options
         burnin_options = copy.deepcopy(self.default_options)
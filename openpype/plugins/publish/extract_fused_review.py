@@ -0,0 +1,35 @@
+import pyblish.api
+
+from openpype.lib import run_subprocess
+from openpype.pipeline import publish
+
+
+class ExtractFusedReview(publish.Extractor):
+    """Render review outputs which were left for burnins.
+
+    ExtractReview defers rendering of outputs with "burnin" tag to
+    ExtractBurnin when 'fuse_with_review' is enabled. ExtractBurnin may not
+    process the instance, e.g. it is turned off by artist, host is not in
+    its hosts or no burnin profile matched. Outputs which still have
+    "fusedReview" are rendered here, without burnins, so integrated
+    representations always have their files.
+    """
+
+    label = "Extract Fused Review"
+    # After 'ExtractBurnin' and before 'ExtractReviewSlate'
+    order = pyblish.api.ExtractorOrder + 0.0305
+    families = ["review"]
+
+    def process(self, instance):
+        for repre in instance.data.get("representations") or []:
+            fused_review = repre.pop("fusedReview", None)
+            if fused_review is None:
+                continue
+
+            self.log.info((
+                "Review output \"{}\" was not rendered with burnins,"
+                " rendering it without them."
+            ).format(repre["name"]))
+            ffmpeg_cmd = " ".join(fused_review["ffmpeg_args"])
+            self.log.debug("Executing: {}".format(ffmpeg_cmd))
+            run_subprocess(ffmpeg_cmd, shell=True, logger=self.log)
@@ -2,8 +2,11 @@ import os
 import re
 import copy
 import json
+import time
+import collections
 import shutil
 import subprocess
+import multiprocessing
 from abc import ABCMeta, abstractmethod
 
 import six
@@ -76,6 +79,15 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Maximum number of outputs rendered at once, based on cpu count if
+    #   not set or 0
+    max_concurrent_outputs = None
+    # Minimum number of ffmpeg threads of each output when concurrency is
+    #   based on cpu count
+    min_threads_per_output = 4
+    # Render outputs with same input by one ffmpeg process which decodes
+    #   input only once
+    decode_once_outputs = False
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -292,8 +304,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     self.log
                 )
 
+            fused_review_count = 0
             try:
-                self._render_output_definitions(
+                fused_review_count = self._render_output_definitions(
                     instance,
                     repre,
                     src_repre_staging_dir,
@@ -308,7 +321,13 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     # Set staging dir of source representation back to previous
                     #   value
                     repre["stagingDir"] = src_repre_staging_dir
-                    if os.path.exists(new_staging_dir):
+                    if fused_review_count:
+                        # Converted files are input of outputs rendered
+                        #   with burnins
+                        instance.context.data["cleanupFullPaths"].append(
+                            new_staging_dir
+                        )
+                    elif os.path.exists(new_staging_dir):
                         shutil.rmtree(new_staging_dir)
 
     def _render_output_definitions(
@@ -319,6 +338,16 @@ class ExtractReview(pyblish.api.InstancePlugin):
         output_definitions,
         layer_name
     ):
+        """Render output definitions of representation.
+
+        Returns:
+            int: Number of outputs which are rendered later by
+                'ExtractBurnin' together with burnins.
+        """
+        fused_review_count = 0
+        # Outputs with their commands, rendered after all are prepared
+        outputs = []
+        files_to_clean = []
         fill_data = copy.deepcopy(instance.data["anatomyData"])
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
@@ -369,15 +398,16 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
             if temp_data["input_is_sequence"]:
                 self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
+                for filepath in self.fill_sequence_gaps(
                     files=temp_data["origin_repre"]["files"],
                     staging_dir=new_repre["stagingDir"],
                     start_frame=temp_data["frame_start"],
                     end_frame=temp_data["frame_end"]
-                )
+                ):
+                    if filepath not in files_to_clean:
+                        files_to_clean.append(filepath)
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -414,20 +444,25 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    break
                 raise NotImplementedError
 
             subprcs_cmd = " ".join(ffmpeg_args)
 
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
-
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            render_args = None
+            if self._fuse_with_burnins(instance, output_def, new_repre):
+                # Output is rendered by 'ExtractBurnin' together with burnins
+                self.log.debug("Deferred to burnins: {}".format(subprcs_cmd))
+                new_repre["fusedReview"] = {
+                    "ffmpeg_args": ffmpeg_args,
+                    "width": new_repre["resolutionWidth"],
+                    "height": new_repre["resolutionHeight"],
+                    "fps": temp_data["fps"],
+                }
+                fused_review_count += 1
 
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
+            else:
+                render_args = ffmpeg_args
 
             new_repre.update({
                 "fps": temp_data["fps"],
@@ -444,13 +479,267 @@ class ExtractReview(pyblish.api.InstancePlugin):
             if "clean_name" in new_repre.get("tags", []):
                 new_repre.pop("outputName")
 
-            # adding representation
+            outputs.append((
+                output_name,
+                new_repre,
+                render_args,
+                temp_data["ffmpeg_args_parts"]
+            ))
+
+        renders = [
+            (output_name, render_args, args_parts)
+            for output_name, _, render_args, args_parts in outputs
+            if render_args is not None
+        ]
+        if self.decode_once_outputs:
+            renders = self._merge_renders_by_input(renders)
+        else:
+            # Output path is last argument
+            renders = [
+                (output_name, render_args, [len(render_args) - 1])
+                for output_name, render_args, _ in renders
+            ]
+
+        try:
+            self._render_outputs(renders)
+
+        finally:
+            if fused_review_count:
+                # Files used as input must exist until burnins are rendered
+                instance.context.data["cleanupFullPaths"].extend(
+                    files_to_clean
+                )
+            else:
+                # delete files added to fill gaps
+                for f in files_to_clean:
+                    os.unlink(f)
+
+        # Representations are added in order of output definitions
+        for _, new_repre, _, _ in outputs:
             self.log.debug(
                 "Adding new representation: {}".format(new_repre)
             )
             instance.data["representations"].append(new_repre)
 
             add_repre_files_for_cleanup(instance, new_repre)
+        return fused_review_count
+
+    def _merge_renders_by_input(self, renders):
+        """Merge renders with same input to single ffmpeg process.
+
+        Input is decoded once and 'split' filter passes it to filters and
+        output arguments of each output. Audio streams of input are mapped
+        to each output. Outputs with additional audio or with filters using
+        labels are rendered separately.
+
+        Args:
+            renders (list[tuple[str, list[str], tuple]]): Output names with
+                ffmpeg arguments and parts of the arguments.
+
+        Returns:
+            list[tuple[str, list[str], list[int]]]: Output names with ffmpeg
+                arguments and indexes of output paths in the arguments.
+        """
+        renders_by_input = collections.OrderedDict()
+        for render in renders:
+            input_args, video_filters, audio_filters, output_args = render[2]
+            input_count = sum(
+                1 for arg in input_args
+                if arg == "-i" or arg.startswith("-i ")
+            )
+            can_merge = (
+                input_count == 1
+                and not audio_filters
+                and not any("[" in value for value in video_filters)
+                and not any(
+                    arg.startswith(("-map", "-filter_complex"))
+                    for arg in output_args
+                )
+            )
+            key = tuple(input_args) if can_merge else id(render)
+            renders_by_input.setdefault(key, []).append(render)
+
+        output = []
+        for merged_renders in renders_by_input.values():
+            if len(merged_renders) == 1:
+                output_name, ffmpeg_args, _ = merged_renders[0]
+                output.append(
+                    (output_name, ffmpeg_args, [len(ffmpeg_args) - 1])
+                )
+                continue
+
+            input_args = merged_renders[0][2][0]
+            split_labels = ""
+            graph = []
+            output_names = []
+            output_args = []
+            output_indexes = []
+            for idx, render in enumerate(merged_renders):
+                output_name, _, args_parts = render
+                video_filters = args_parts[1]
+                split_labels += "[v{}]".format(idx)
+                graph.append("[v{}]{}[out{}]".format(
+                    idx, ",".join(video_filters) or "null", idx
+                ))
+                output_names.append(output_name)
+                # Stream selection is disabled by '-map', audio of input
+                #   would be lost without mapping it explicitly
+                output_args.extend([
+                    "-map", "\"[out{}]\"".format(idx), "-map", "0:a?"
+                ])
+                output_args.extend(args_parts[3])
+                output_indexes.append(len(output_args) - 1)
+
+            graph.insert(0, "[0:v]split={}{}".format(
+                len(merged_renders), split_labels
+            ))
+
+            ffmpeg_args = [
+                subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+            ]
+            ffmpeg_args.extend(input_args)
+            ffmpeg_args.extend([
+                "-filter_complex", "\"{}\"".format(";".join(graph))
+            ])
+            offset = len(ffmpeg_args)
+            ffmpeg_args.extend(output_args)
+            self.log.debug("Outputs {} are rendered with one decode".format(
+                ", ".join(output_names)
+            ))
+            output.append((
+                ", ".join(output_names),
+                ffmpeg_args,
+                [offset + idx for idx in output_indexes]
+            ))
+        return output
+
+    def _get_outputs_concurrency(self, outputs_count):
+        """Number of outputs rendered at once and ffmpeg threads of each.
+
+        Returns:
+            tuple[int, Union[int, None]]: Number of concurrent renders and
+                threads for each ffmpeg process. Threads are None when
+                outputs are rendered one by one.
+        """
+        cpu_count = multiprocessing.cpu_count()
+        concurrency = self.max_concurrent_outputs
+        if concurrency is None or concurrency < 1:
+            concurrency = cpu_count // self.min_threads_per_output
+        concurrency = max(1, min(concurrency, outputs_count))
+        if concurrency == 1:
+            return concurrency, None
+        return concurrency, max(1, cpu_count // concurrency)
+
+    def _render_outputs(self, outputs):
+        """Render outputs with ffmpeg, concurrently if possible.
+
+        Total number of ffmpeg threads is limited by number of cpu cores,
+        threads of render with multiple outputs are divided between them.
+        Render time of each output is logged.
+
+        Args:
+            outputs (list[tuple[str, list[str], list[int]]]): Output names
+                with ffmpeg arguments and indexes of output paths in the
+                arguments.
+
+        Raises:
+            RuntimeError: Render of any output failed. Raised after all
+                renders are finished.
+        """
+        if not outputs:
+            return
+
+        concurrency, threads = self._get_outputs_concurrency(len(outputs))
+        executor_cls = None
+        if concurrency > 1:
+            try:
+                from concurrent.futures import ThreadPoolExecutor
+                executor_cls = ThreadPoolExecutor
+            except ImportError:
+                # Python 2 does not have 'concurrent.futures'
+                concurrency, threads = 1, None
+
+        def _render(output_name, ffmpeg_args, output_indexes):
+            ffmpeg_args = list(ffmpeg_args)
+            if threads:
+                output_threads = str(
+                    max(1, threads // len(output_indexes))
+                )
+                # Threads are option of each output, arguments of output
+                #   are between previous output path and its path
+                starts = [0] + [idx + 1 for idx in output_indexes[:-1]]
+                for start, idx in reversed(
+                    list(zip(starts, output_indexes))
+                ):
+                    if "-threads" not in " ".join(ffmpeg_args[start:idx]):
+                        ffmpeg_args[idx:idx] = ["-threads", output_threads]
+            subprcs_cmd = " ".join(ffmpeg_args)
+
+            # run subprocess
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+            start_time = time.time()
+            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            self.log.info("Output \"{}\" rendered in {:.2f}s".format(
+                output_name, time.time() - start_time
+            ))
+
+        if concurrency == 1:
+            for output_name, ffmpeg_args, output_indexes in outputs:
+                _render(output_name, ffmpeg_args, output_indexes)
+            return
+
+        self.log.debug(
+            "Rendering {} outputs, {} at once with {} threads each".format(
+                len(outputs), concurrency, threads
+            )
+        )
+        with executor_cls(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(
+                    _render, output_name, ffmpeg_args, output_indexes
+                )
+                for output_name, ffmpeg_args, output_indexes in outputs
+            ]
+
+        # Raise first error in order of outputs
+        for future in futures:
+            future.result()
+
+    def _fuse_with_burnins(self, instance, output_def, new_repre):
+        """Output should be rendered in single pass with burnins.
+
+        Enabled by 'fuse_with_review' in 'ExtractBurnin' settings. Rendering
+        of output is deferred to 'ExtractBurnin' which adds burnin filters
+        to review command, so output is decoded and encoded only once.
+        Outputs which are not processed by 'ExtractBurnin' are rendered by
+        'ExtractFusedReview'.
+        """
+        if "burnin" not in new_repre["tags"]:
+            return False
+
+        project_settings = instance.context.data.get("project_settings")
+        burnin_settings = (
+            (project_settings or {})
+            .get("global", {})
+            .get("publish", {})
+            .get("ExtractBurnin")
+        ) or {}
+        if (
+            not burnin_settings.get("enabled")
+            or not burnin_settings.get("fuse_with_review")
+        ):
+            return False
+
+        # Custom video filters may change resolution used for burnins layout
+        out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
+        for value in out_def_ffmpeg_args.get("video_filters") or []:
+            if value.strip():
+                return False
+
+        for value in out_def_ffmpeg_args.get("output") or []:
+            if "-vf" in value or "-filter" in value:
+                return False
+        return True
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -761,6 +1050,17 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
+        ffmpeg_output_args = self.move_filters_from_output_args(
+            ffmpeg_video_filters, ffmpeg_audio_filters, ffmpeg_output_args
+        )
+        # Store arguments to be able render multiple outputs at once
+        temp_data["ffmpeg_args_parts"] = (
+            list(ffmpeg_input_args),
+            list(ffmpeg_video_filters),
+            list(ffmpeg_audio_filters),
+            list(ffmpeg_output_args),
+        )
+
         return self.ffmpeg_full_args(
             ffmpeg_input_args,
             ffmpeg_video_filters,
@@ -809,22 +1109,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
-        output_args = self.split_ffmpeg_args(output_args)
-
-        video_args_dentifiers = ["-vf", "-filter:v"]
-        audio_args_dentifiers = ["-af", "-filter:a"]
-        for arg in tuple(output_args):
-            for identifier in video_args_dentifiers:
-                if arg.startswith("{} ".format(identifier)):
-                    output_args.remove(arg)
-                    arg = arg.replace(identifier, "").strip()
-                    video_filters.append(arg)
-
-            for identifier in audio_args_dentifiers:
-                if arg.startswith("{} ".format(identifier)):
-                    output_args.remove(arg)
-                    arg = arg.replace(identifier, "").strip()
-                    audio_filters.append(arg)
+        output_args = self.move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
 
         all_args = [
             subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
@@ -842,6 +1129,37 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         return all_args
 
+    def move_filters_from_output_args(
+        self, video_filters, audio_filters, output_args
+    ):
+        """Move filters defined in output arguments to filters.
+
+        Args:
+            video_filters (list): All collected video filters.
+            audio_filters (list): All collected audio filters.
+            output_args (list): All collected ffmpeg output arguments.
+
+        Returns:
+            list: Output arguments without filters.
+        """
+        output_args = self.split_ffmpeg_args(output_args)
+
+        video_args_dentifiers = ["-vf", "-filter:v"]
+        audio_args_dentifiers = ["-af", "-filter:a"]
+        for arg in tuple(output_args):
+            for identifier in video_args_dentifiers:
+                if arg.startswith("{} ".format(identifier)):
+                    output_args.remove(arg)
+                    arg = arg.replace(identifier, "").strip()
+                    video_filters.append(arg)
+
+            for identifier in audio_args_dentifiers:
+                if arg.startswith("{} ".format(identifier)):
+                    output_args.remove(arg)
+                    arg = arg.replace(identifier, "").strip()
+                    audio_filters.append(arg)
+        return output_args
+
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
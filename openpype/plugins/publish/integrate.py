@@ -2,6 +2,7 @@ import os
 import logging
 import sys
 import copy
+import uuid
 import datetime
 
 import clique
@@ -146,6 +147,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
     default_template_name = "publish"
 
+    # Number of threads used to transfer files, files are transferred
+    #   one by one if is lower than 2
+    file_transfer_workers = 1
+    # Use 'copy_file_range' for copies if available (Linux)
+    file_transfer_zero_copy = False
+    # Verify copied files with checksum e.g. 'xxhash' or 'sha256'
+    file_transfer_checksum = None
+
     # Representation context keys that should always be written to
     # the database even if not used by the destination template
     db_representation_context_keys = [
@@ -176,9 +185,25 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        # Journal of file transaction which allows to resume or rollback
+        #   the transfers if publishing crashes
+        journal_path = None
+        staging_dir = instance.data.get("stagingDir")
+        if staging_dir and os.path.isdir(staging_dir):
+            journal_path = os.path.join(
+                staging_dir,
+                "file_transaction_{}.jsonl".format(uuid.uuid4().hex)
+            )
+
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.file_transfer_workers,
+            zero_copy=self.file_transfer_zero_copy,
+            checksum_algorithm=self.file_transfer_checksum,
+            journal_path=journal_path,
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -735,22 +760,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            # - only the frame or udim key changes between the files, so
+            #   the rest of the template is formatted only once
+            index_key = "udim" if is_udim else "frame"
+            dst_filepaths = path_template_obj.format_many_strict(
+                template_data,
+                ({index_key: index} for index in destination_indexes)
+            )
+            template_data[index_key] = destination_indexes[-1]
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
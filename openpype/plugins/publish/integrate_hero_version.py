@@ -56,6 +56,10 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
     _default_template_name = "hero"
 
+    # Number of threads used to copy files, files are copied
+    #   one by one if is lower than 2
+    file_transfer_workers = 1
+
     def process(self, instance):
         self.log.debug(
             "--- Integration of Hero version for subset `{}` begins.".format(
@@ -458,11 +462,9 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             # Copy(hardlink) paths of source and destination files
             # TODO should we *only* create hardlinks?
             # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            self.copy_files(
+                src_to_dst_file_paths + other_file_paths_mapping
+            )
 
             # Archive not replaced old representations
             for repre_name_low, repre in old_repres_to_delete.items():
@@ -588,6 +590,32 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             family = instance.data["families"][0]
         return family
 
+    def copy_files(self, src_to_dst_file_paths):
+        """Copy(hardlink) files, in parallel if workers are enabled.
+
+        Args:
+            src_to_dst_file_paths (list[tuple[str, str]]): Source and
+                destination paths.
+        """
+
+        if self.file_transfer_workers < 2 or len(src_to_dst_file_paths) < 2:
+            for src_path, dst_path in src_to_dst_file_paths:
+                self.copy_file(src_path, dst_path)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+            max_workers=self.file_transfer_workers
+        ) as executor:
+            futures = [
+                executor.submit(self.copy_file, src_path, dst_path)
+                for src_path, dst_path in src_to_dst_file_paths
+            ]
+        # Raise first error if any copy failed
+        for future in futures:
+            future.result()
+
     def copy_file(self, src_path, dst_path):
         # TODO check drives if are the same to check if cas hardlink
         dirname = os.path.dirname(dst_path)
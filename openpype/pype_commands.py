@@ -72,22 +72,56 @@ class PypeCommands:
         traypublisher.main()
 
     @staticmethod
-    def publish(paths, targets=None, gui=False):
+    def publish(paths, targets=None, gui=False, worker_port=None):
         """Start headless publishing.
 
         Publish use json from passed paths argument.
 
+        Publishing is sent to running publish worker when port is passed
+        or set in 'OPENPYPE_PUBLISH_WORKER_PORT' environment variable.
+        Publishing is processed in this process when worker is not running.
+
         Args:
             paths (list): Paths to jsons.
             targets (string): What module should be targeted
                 (to choose validator for example)
             gui (bool): Show publish UI.
+            worker_port (Optional[int]): Port of publish worker.
 
         Raises:
             RuntimeError: When there is no path to process.
         """
 
         from openpype.lib import Logger
+        from openpype.pipeline.publish.publish_worker import (
+            PUBLISH_WORKER_PORT_ENV,
+            PublishJobError,
+            send_publish_job,
+        )
+
+        log = Logger.get_logger("CLI-publish")
+
+        if not any(paths):
+            raise RuntimeError("No publish paths specified")
+
+        if worker_port is None and os.getenv(PUBLISH_WORKER_PORT_ENV):
+            worker_port = int(os.environ[PUBLISH_WORKER_PORT_ENV])
+
+        if worker_port and not gui:
+            try:
+                send_publish_job(paths, targets, worker_port)
+                return
+            except PublishJobError as exc:
+                log.error(str(exc))
+                sys.exit(1)
+            except ConnectionRefusedError:
+                # Job was not sent, other connection errors after the job
+                #   was sent are raised as 'PublishJobError'
+                log.info((
+                    "Publish worker is not running on port {},"
+                    " publishing in current process."
+                ).format(worker_port))
+
         from openpype.lib.applications import (
             get_app_environments_for_context,
             LaunchTypes,
@@ -97,14 +131,12 @@ class PypeCommands:
             install_openpype_plugins,
             get_global_context,
         )
+        from openpype.pipeline.publish import publish_iter_with_entity_cache
         from openpype.tools.utils.host_tools import show_publish
         from openpype.tools.utils.lib import qt_app_context
 
         # Register target and host
         import pyblish.api
-        import pyblish.util
-
-        log = Logger.get_logger("CLI-publish")
 
         install_openpype_plugins()
 
@@ -115,9 +147,6 @@ class PypeCommands:
         for path in publish_paths:
             pyblish.api.register_plugin_path(path)
 
-        if not any(paths):
-            raise RuntimeError("No publish paths specified")
-
         app_full_name = os.getenv("AVALON_APP_NAME")
         if app_full_name:
             context = get_global_context()
@@ -157,7 +186,7 @@ class PypeCommands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
+            for result in publish_iter_with_entity_cache(plugins=plugins):
                 if result["error"]:
                     log.error(error_format.format(**result))
                     # uninstall()
@@ -165,6 +194,17 @@ class PypeCommands:
 
         log.info("Publish finished.")
 
+    @staticmethod
+    def publish_worker(port=None):
+        """Start publish worker processing headless publish jobs.
+
+        Args:
+            port (Optional[int]): Port on which worker listens.
+        """
+        from openpype.pipeline.publish.publish_worker import main
+
+        main(port)
+
     @staticmethod
     def extractenvironments(output_json_path, project, asset, task, app,
                             env_group):
@@ -293,8 +333,18 @@ class PypeCommands:
         version_packer = VersionRepacker(directory)
         version_packer.process()
 
-    def pack_project(self, project_name, dirpath, database_only):
-        from openpype.lib.project_backpack import pack_project
+    def pack_project(
+        self,
+        project_name,
+        dirpath,
+        database_only,
+        streaming=False,
+        previous_package=None
+    ):
+        from openpype.lib.project_backpack import (
+            pack_project,
+            pack_project_stream,
+        )
 
         if database_only and not dirpath:
             raise ValueError((
@@ -303,9 +353,35 @@ class PypeCommands:
                 " to specify directory."
             ))
 
-        pack_project(project_name, dirpath, database_only)
+        if streaming or previous_package:
+            pack_project_stream(
+                project_name,
+                dirpath,
+                database_only,
+                previous_package=previous_package
+            )
+        else:
+            pack_project(project_name, dirpath, database_only)
 
-    def unpack_project(self, zip_filepath, new_root, database_only):
+    def unpack_project(
+        self, zip_filepath, new_root, database_only, file_patterns=None
+    ):
         from openpype.lib.project_backpack import unpack_project
 
-        unpack_project(zip_filepath, new_root, database_only)
+        unpack_project(
+            zip_filepath,
+            new_root,
+            database_only,
+            file_patterns=file_patterns
+        )
+
+    def file_transaction(self, journal_path, rollback):
+        from openpype.lib.file_transaction import FileTransaction
+
+        transaction = FileTransaction.from_journal(journal_path)
+        if rollback:
+            transaction.rollback()
+            return
+
+        transaction.process()
+        transaction.finalize()
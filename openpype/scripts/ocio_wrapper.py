@@ -17,13 +17,41 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- serve - console command - python 2
+        - long running process answering requests from stdin
+          (see 'serve' command docstring).
 """
 
+import sys
 import click
 import json
 from pathlib import Path
 import PyOpenColorIO as ocio
 
+# Prefix of response lines written to stdout by 'serve' command
+SERVE_RESPONSE_PREFIX = "__ocio_wrapper_response__"
+
+# Parsed configs by path with modification time of the file
+_CONFIG_CACHE = {}
+
+
+def _get_config(config_path):
+    """Load OCIO config, configs are reused until file is modified.
+
+    Args:
+        config_path (Path): path leading to config.ocio
+
+    Returns:
+        ocio.Config: loaded config
+    """
+    path = str(config_path)
+    mtime = config_path.stat().st_mtime
+    cached = _CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, ocio.Config.CreateFromFile(path))
+        _CONFIG_CACHE[path] = cached
+    return cached[1]
+
 
 @click.group()
 def main():
@@ -104,7 +132,7 @@ def _get_colorspace_data(config_path):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     colorspace_data = {
         "roles": {},
@@ -201,7 +229,7 @@ def _get_views_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     data_ = {}
     for display in config.getDisplays():
@@ -274,7 +302,7 @@ def _get_version_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     return {
         "major": config.getMajorVersion(),
@@ -347,7 +375,7 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     # TODO: use `parseColorSpaceFromString` instead if ocio v1
     colorspace = config.getColorSpaceFromFilepath(str(filepath))
@@ -376,7 +404,7 @@ def _get_display_view_colorspace_name(config_path, display, view):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config.CreateFromFile(str(config_path))
+    config = _get_config(config_path)
     colorspace = config.getDisplayViewColorSpaceName(display, view)
 
     return colorspace
@@ -429,5 +457,55 @@ def get_display_view_colorspace_name(in_path, out_path,
 
     print(f"Display view colorspace saved to '{out_path}'")
 
+
+# Functions available in 'serve' command
+SERVE_COMMANDS = {
+    "get_colorspace": _get_colorspace_data,
+    "get_views": _get_views_data,
+    "get_version": _get_version_data,
+    "get_display_view_colorspace_name": _get_display_view_colorspace_name,
+    "get_config_file_rules_colorspace_from_filepath": (
+        _get_config_file_rules_colorspace_from_filepath
+    ),
+}
+
+
+@main.command(
+    name="serve",
+    help=(
+        "process json requests from stdin until stdin is closed"
+    )
+)
+def serve():
+    """Answer requests from stdin.
+
+    Wrapper command for processes without access to OpenColorIO which need
+    to ask multiple times. Each request is a json line with "id", "command"
+    (key of 'SERVE_COMMANDS') and "kwargs". Response is a json line with
+    "id" and "result" or "error", prefixed with 'SERVE_RESPONSE_PREFIX' as
+    stdout may contain other output.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py serve
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        response = {"id": None}
+        try:
+            request = json.loads(line)
+            response["id"] = request.get("id")
+            func = SERVE_COMMANDS[request["command"]]
+            response["result"] = func(**(request.get("kwargs") or {}))
+
+        except Exception as exc:
+            response["error"] = f"{exc.__class__.__name__}: {exc}"
+
+        sys.stdout.write(SERVE_RESPONSE_PREFIX + json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
@@ -4,6 +4,7 @@ import subprocess
 import platform
 import json
 import tempfile
+from fractions import Fraction
 from string import Formatter
 
 import opentimelineio_contrib.adapters.ffmpeg_burnins as ffmpeg_burnins
@@ -64,6 +65,30 @@ def _get_ffprobe_data(source):
     return json.loads(out)
 
 
+def _get_fused_ffprobe_data(fused_review):
+    """Fake ffprobe data of review output which was not rendered yet.
+
+    Args:
+        fused_review (dict[str, Any]): Information about review output
+            stored by 'ExtractReview'.
+
+    Returns:
+        dict[str, Any]: Data with video stream for burnins.
+    """
+    frame_rate = Fraction(str(fused_review["fps"])).limit_denominator(1001)
+    return {
+        "streams": [{
+            "codec_type": "video",
+            "width": fused_review["width"],
+            "height": fused_review["height"],
+            "r_frame_rate": "{}/{}".format(
+                frame_rate.numerator, frame_rate.denominator
+            ),
+        }],
+        "format": {},
+    }
+
+
 class ModifiedBurnins(ffmpeg_burnins.Burnins):
     '''
     This is modification of OTIO FFmpeg Burnin adapter.
@@ -461,13 +486,52 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             'filters': filters
         }).strip()
 
-    def render(self, output, args=None, overwrite=False, **kwargs):
+    def fused_command(self, output, review_args):
+        """Generate command rendering review and burnins in single pass.
+
+        Burnin filters are added after video filters of review command and
+        output of review command is replaced.
+
+        :param str output: output file
+        :param list review_args: arguments of review command, last argument
+            is output file
+        :returns: completed command
+        :rtype: str
+        """
+        args = list(review_args)
+        args.pop(-1)
+
+        video_filters = []
+        if "-filter:v" in args:
+            idx = args.index("-filter:v")
+            args.pop(idx)
+            video_filters.append(args.pop(idx).strip('"'))
+
+        filter_string = self.filter_string
+        if filter_string:
+            video_filters.append(filter_string)
+
+        if video_filters:
+            with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp:
+                temp.write(",".join(video_filters))
+                filters_path = temp.name
+            print("Filters:", ",".join(video_filters))
+            self.cleanup_paths.append(filters_path)
+            args.extend(["-filter_script:v", '"{}"'.format(filters_path)])
+
+        args.append('"{}"'.format(output))
+        return " ".join(args)
+
+    def render(
+        self, output, args=None, overwrite=False, review_args=None, **kwargs
+    ):
         """
         Render the media to a specified destination.
 
         :param str output: output file
         :param str args: additional FFMPEG arguments
         :param bool overwrite: overwrite the output if it exists
+        :param list review_args: render with review command in single pass
         """
         if not overwrite and os.path.exists(output):
             raise RuntimeError("Destination '%s' exists, please "
@@ -475,11 +539,14 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
 
         is_sequence = "%" in output
 
-        command = self.command(
-            output=output,
-            args=args,
-            overwrite=overwrite
-        )
+        if review_args:
+            command = self.fused_command(output, review_args)
+        else:
+            command = self.command(
+                output=output,
+                args=args,
+                overwrite=overwrite
+            )
         print("Launching command: {}".format(command))
 
         kwargs = {
@@ -581,7 +648,8 @@ def prepare_fill_values(burnin_template, data):
 def burnins_from_data(
     input_path, output_path, data,
     codec_data=None, options=None, burnin_values=None, overwrite=True,
-    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None,
+    fused_review=None
 ):
     """This method adds burnins to video/image file based on presets setting.
 
@@ -597,6 +665,9 @@ def burnins_from_data(
         burnin_values (dict): Contain positioned values.
         overwrite (bool): Output will be overwritten if already exists,
             True by default.
+        fused_review (dict): Review output which was not rendered by
+            ExtractReview. Burnins are rendered with review command in single
+            pass and input is not used.
 
     Presets must be set separately. Should be dict with 2 keys:
     - "options" - sets look of burnins - colors, opacity,...
@@ -641,7 +712,9 @@ def burnins_from_data(
     }
     """
     ffprobe_data = None
-    if full_input_path:
+    if fused_review:
+        ffprobe_data = _get_fused_ffprobe_data(fused_review)
+    elif full_input_path:
         ffprobe_data = _get_ffprobe_data(full_input_path)
 
     burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
@@ -779,6 +852,16 @@ def burnins_from_data(
 
         burnin.add_text(text, align, frame_start, frame_end)
 
+    if fused_review:
+        # Output arguments are part of review command
+        burnin.render(
+            output_path,
+            overwrite=overwrite,
+            review_args=fused_review["ffmpeg_args"],
+            **data
+        )
+        return
+
     ffmpeg_args = []
     if codec_data:
         # Use codec definition from method arguments
@@ -827,6 +910,7 @@ if __name__ == "__main__":
         burnin_values=in_data.get("values"),
         full_input_path=in_data.get("full_input_path"),
         first_frame=in_data.get("first_frame"),
-        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
+        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd"),
+        fused_review=in_data.get("fused_review")
     )
     print("* Burnin script has finished")
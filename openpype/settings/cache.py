@@ -0,0 +1,222 @@
+"""Cache of resolved settings.
+
+Resolving of settings (defaults, studio and project overrides, local
+settings) is expensive and the same settings are resolved many times
+in a single process. Resolved values are cached by a key which contains
+fingerprints of all inputs, so changed overrides or local settings create
+a new key and cache does not have to be invalidated with a timer.
+
+Cached values are stored as read-only views. Callers get a mutable copy
+unless they ask for the read-only view.
+
+Cache can be also stored to disk when environment variable
+'OPENPYPE_SETTINGS_CACHE_DIR' is set. Child processes that inherit the
+environment then don't have to resolve settings again. Disk cache key
+contains OpenPype version but not default settings, the directory should be
+cleared when defaults change without version change (development).
+The directory is not cleaned up automatically.
+"""
+import os
+import json
+import uuid
+import hashlib
+import logging
+import collections
+
+import six
+
+from openpype.version import __version__
+
+log = logging.getLogger(__name__)
+
+SETTINGS_CACHE_DIR_ENV = "OPENPYPE_SETTINGS_CACHE_DIR"
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError("Settings view is read-only.")
+
+
+class SettingsDictView(dict):
+    """Read-only dictionary of cached settings.
+
+    Object is still 'dict' so it can be used where dictionary is expected,
+    but any modification raises 'TypeError'. Deep copy returns mutable
+    'dict'.
+    """
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+    __ior__ = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return to_mutable(self)
+
+    def __reduce__(self):
+        return (dict, (to_mutable(self), ))
+
+
+class SettingsListView(tuple):
+    """Read-only list of cached settings.
+
+    Deep copy returns mutable 'list'.
+    """
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return to_mutable(self)
+
+    def __reduce__(self):
+        return (list, (to_mutable(self), ))
+
+
+def to_read_only(value):
+    """Convert settings value to read-only view."""
+    if isinstance(value, dict):
+        view = SettingsDictView()
+        for key, item in value.items():
+            dict.__setitem__(view, key, to_read_only(item))
+        return view
+
+    if isinstance(value, list):
+        return SettingsListView(to_read_only(item) for item in value)
+    return value
+
+
+def to_mutable(value):
+    """Convert read-only view of settings to mutable dictionaries and lists.
+
+    Faster alternative of 'copy.deepcopy' for json serializable values.
+    """
+    if isinstance(value, dict):
+        return {
+            key: to_mutable(item)
+            for key, item in value.items()
+        }
+
+    if isinstance(value, (list, SettingsListView)):
+        return [to_mutable(item) for item in value]
+    return value
+
+
+def get_fingerprint(value):
+    """Fingerprint of json serializable value.
+
+    Returns:
+        str: Hash of value.
+    """
+    content = json.dumps(value, sort_keys=True, default=str)
+    if isinstance(content, six.text_type):
+        content = content.encode("utf-8")
+    return hashlib.md5(content).hexdigest()
+
+
+class SettingsCache(object):
+    """Cache of resolved settings values by key.
+
+    Args:
+        max_items (int): Maximum number of values kept in memory.
+    """
+    def __init__(self, max_items=64):
+        self._max_items = max_items
+        self._items = collections.OrderedDict()
+
+    def create_key(self, *parts):
+        """Create cache key from parts.
+
+        Parts are converted to fingerprint if they're not string.
+
+        Returns:
+            str: Cache key.
+        """
+        key_parts = [__version__]
+        for part in parts:
+            if part is None or isinstance(part, six.string_types):
+                key_parts.append(str(part))
+            else:
+                key_parts.append(get_fingerprint(part))
+        return hashlib.md5(
+            "|".join(key_parts).encode("utf-8")
+        ).hexdigest()
+
+    def clear(self):
+        self._items.clear()
+
+    def get(self, key, create_func, read_only=False):
+        """Get cached value or create it.
+
+        Args:
+            key (str): Key created with 'create_key'.
+            create_func (Callable[[], dict]): Function creating the value
+                when it's not cached.
+            read_only (bool): Return read-only view instead of copy.
+
+        Returns:
+            Union[dict, SettingsDictView]: Settings value.
+        """
+        value = self._items.get(key)
+        if value is None:
+            value = self._load_from_disk(key)
+            if value is None:
+                value = create_func()
+                self._store_to_disk(key, value)
+            value = to_read_only(value)
+            self._items[key] = value
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+
+        if read_only:
+            return value
+        return to_mutable(value)
+
+    def _get_cache_path(self, key):
+        cache_dir = os.environ.get(SETTINGS_CACHE_DIR_ENV)
+        if not cache_dir:
+            return None
+        return os.path.join(cache_dir, "{}.json".format(key))
+
+    def _load_from_disk(self, key):
+        path = self._get_cache_path(key)
+        if not path or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r") as stream:
+                return json.load(stream)
+        except (IOError, OSError, ValueError):
+            log.debug("Failed to load settings cache", exc_info=True)
+        return None
+
+    def _store_to_disk(self, key, value):
+        path = self._get_cache_path(key)
+        if not path:
+            return
+
+        # Write to temp file and rename so other processes don't read
+        #   incomplete file
+        tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+        try:
+            cache_dir = os.path.dirname(path)
+            if not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            with open(tmp_path, "w") as stream:
+                json.dump(value, stream)
+
+            if six.PY2:
+                if os.path.exists(path):
+                    os.remove(path)
+                os.rename(tmp_path, path)
+            else:
+                os.replace(tmp_path, path)
+
+        except (IOError, OSError, TypeError, ValueError):
+            log.debug("Failed to store settings cache", exc_info=True)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
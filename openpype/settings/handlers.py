@@ -588,6 +588,7 @@ class CacheValues:
                     data = json.loads(value)
 
         self.data = data
+        self.creation_time = datetime.datetime.now()
         self.version = version
 
     def to_json_string(self):
@@ -597,11 +598,11 @@ class CacheValues:
     def is_outdated(self):
         if self.creation_time is None:
             return True
-        delta = (datetime.datetime.now() - self.creation_time).seconds
-        return delta > self.cache_lifetime
+        delta = datetime.datetime.now() - self.creation_time
+        return delta.total_seconds() > self.cache_lifetime
 
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
 
 
 class MongoSettingsHandler(SettingsHandler):
@@ -25,6 +25,7 @@ from .ayon_settings import (
     get_ayon_project_settings,
     get_ayon_system_settings
 )
+from .cache import SettingsCache
 
 log = logging.getLogger(__name__)
 
@@ -47,6 +48,9 @@ _SETTINGS_HANDLER = None
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Cache of resolved settings
+_SETTINGS_CACHE = SettingsCache()
+
 
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
@@ -186,6 +190,7 @@ def save_studio_settings(data):
 
     _SETTINGS_HANDLER.save_change_log(None, changes, "system")
     _SETTINGS_HANDLER.save_studio_settings(data)
+    clear_settings_cache()
     if warnings:
         raise SaveWarningExc(warnings)
 
@@ -246,6 +251,7 @@ def save_project_settings(project_name, overrides):
                 warnings.extend(exc.warnings)
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "project")
     _SETTINGS_HANDLER.save_project_settings(project_name, overrides)
+    clear_settings_cache()
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -308,6 +314,7 @@ def save_project_anatomy(project_name, anatomy_data):
 
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "anatomy")
     _SETTINGS_HANDLER.save_project_anatomy(project_name, anatomy_data)
+    clear_settings_cache()
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -515,7 +522,9 @@ def clear_project_settings_overrides_for_version(
 
 @require_local_handler
 def save_local_settings(data):
-    return _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    output = _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    clear_settings_cache()
+    return output
 
 
 @require_local_handler
@@ -539,6 +548,17 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    clear_settings_cache()
+
+
+def clear_settings_cache():
+    """Clear cache of resolved settings.
+
+    Cache is cleared automatically when settings are saved in this process.
+    Changes saved by other processes are loaded when studio overrides are
+    reloaded by settings handler.
+    """
+    _SETTINGS_CACHE.clear()
 
 
 def _get_default_settings():
@@ -595,6 +615,19 @@ def get_default_settings():
     return copy.deepcopy(_DEFAULT_SETTINGS)
 
 
+def _get_default_settings_value(settings_key):
+    """Copy of default settings of one type.
+
+    Args:
+        settings_key (str): One of 'system_settings', 'project_settings'
+            or 'project_anatomy'.
+    """
+    global _DEFAULT_SETTINGS
+    if _DEFAULT_SETTINGS is None:
+        _DEFAULT_SETTINGS = _get_default_settings()
+    return copy.deepcopy(_DEFAULT_SETTINGS[settings_key])
+
+
 def load_json_file(fpath):
     # Load json data
     try:
@@ -922,74 +955,145 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
-def _get_system_settings(clear_metadata=True, exclude_locals=None):
-    """System settings with applied studio overrides."""
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+def _create_system_settings(studio_overrides, clear_metadata, local_settings):
+    result = _get_default_settings_value(SYSTEM_SETTINGS_KEY)
+    if studio_overrides:
+        merge_overrides(result, studio_overrides)
 
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
 
     # Apply local settings
-    # Default behavior is based on `clear_metadata` value
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
-    if not exclude_locals:
+    if local_settings is not None:
         # TODO local settings may be required to apply for environments
-        local_settings = get_local_settings()
         apply_local_settings_on_system_settings(result, local_settings)
-
     return result
 
 
-def get_default_project_settings(clear_metadata=True, exclude_locals=None):
-    """Project settings with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
-    studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+def _create_project_settings(
+    project_name,
+    studio_overrides,
+    project_overrides,
+    clear_metadata,
+    local_settings
+):
+    result = _get_default_settings_value(PROJECT_SETTINGS_KEY)
+    if studio_overrides:
+        merge_overrides(result, studio_overrides)
+
+    if project_overrides:
+        merge_overrides(result, project_overrides)
+
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
 
     # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
-    if not exclude_locals:
-        local_settings = get_local_settings()
+    if local_settings is not None:
         apply_local_settings_on_project_settings(
-            result, local_settings, None
+            result, local_settings, project_name
         )
     return result
 
 
-def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
-    """Project anatomy data with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
-    studio_values = get_studio_project_anatomy_overrides()
+def _create_anatomy_settings(
+    project_name,
+    site_name,
+    studio_overrides,
+    project_overrides,
+    clear_metadata,
+    local_settings
+):
+    result = _get_default_settings_value(PROJECT_ANATOMY_KEY)
+    if studio_overrides:
+        merge_overrides(result, studio_overrides)
+
+    # Project anatomy overrides replace whole top level keys
+    if project_overrides:
+        for key, value in project_overrides.items():
+            result[key] = value
 
-    result = apply_overrides(default_values, studio_values)
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
 
     # Apply local settings
+    if local_settings is not None:
+        apply_local_settings_on_anatomy_settings(
+            result, local_settings, project_name, site_name
+        )
+    return result
+
+
+def _get_cached_settings(
+    settings_key, key_parts, create_func, create_args, read_only
+):
+    """Resolve settings using cache.
+
+    Args:
+        settings_key (str): Type of settings.
+        key_parts (Iterable[Any]): Values identifying the settings. Must
+            be collected before 'create_func' is called as overrides are
+            modified during resolving.
+        create_func (Callable): Function resolving settings.
+        create_args (tuple): Arguments for 'create_func'.
+        read_only (bool): Return read-only view instead of copy.
+    """
+    cache_key = _SETTINGS_CACHE.create_key(settings_key, *key_parts)
+    return _SETTINGS_CACHE.get(
+        cache_key, lambda: create_func(*create_args), read_only
+    )
+
+
+def _get_system_settings(
+    clear_metadata=True, exclude_locals=None, read_only=False
+):
+    """System settings with applied studio overrides."""
+    studio_overrides = get_studio_system_settings_overrides()
+
+    # Apply local settings
+    # Default behavior is based on `clear_metadata` value
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    local_settings = None
     if not exclude_locals:
         local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, None
-        )
-    return result
+
+    return _get_cached_settings(
+        SYSTEM_SETTINGS_KEY,
+        (str(clear_metadata), studio_overrides, local_settings),
+        _create_system_settings,
+        (studio_overrides, clear_metadata, local_settings),
+        read_only
+    )
+
+
+def get_default_project_settings(
+    clear_metadata=True, exclude_locals=None, read_only=False
+):
+    """Project settings with applied studio's default project overrides."""
+    return _get_project_settings_value(
+        None, clear_metadata, exclude_locals, read_only
+    )
+
+
+def get_default_anatomy_settings(
+    clear_metadata=True, exclude_locals=None, read_only=False
+):
+    """Project anatomy data with applied studio's default project overrides."""
+    return _get_anatomy_settings_value(
+        None, None, clear_metadata, exclude_locals, read_only
+    )
 
 
 def get_anatomy_settings(
-    project_name, site_name=None, clear_metadata=True, exclude_locals=None
+    project_name,
+    site_name=None,
+    clear_metadata=True,
+    exclude_locals=None,
+    read_only=False
 ):
     """Project anatomy data with applied studio and project overrides."""
     if not project_name:
@@ -998,34 +1102,52 @@ def get_anatomy_settings(
             "`get_default_anatomy_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_anatomy_settings(False)
-    project_overrides = get_project_anatomy_overrides(
-        project_name
+    return _get_anatomy_settings_value(
+        project_name, site_name, clear_metadata, exclude_locals, read_only
     )
-    result = copy.deepcopy(studio_overrides)
-    if project_overrides:
-        for key, value in project_overrides.items():
-            result[key] = value
 
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
+
+def _get_anatomy_settings_value(
+    project_name, site_name, clear_metadata, exclude_locals, read_only
+):
+    studio_overrides = get_studio_project_anatomy_overrides()
+    project_overrides = None
+    if project_name:
+        project_overrides = get_project_anatomy_overrides(project_name)
 
     # Apply local settings
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    local_settings = None
     if not exclude_locals:
         local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, project_name, site_name
-        )
 
-    return result
+    return _get_cached_settings(
+        PROJECT_ANATOMY_KEY,
+        (
+            project_name,
+            site_name,
+            str(clear_metadata),
+            studio_overrides,
+            project_overrides,
+            local_settings
+        ),
+        _create_anatomy_settings,
+        (
+            project_name,
+            site_name,
+            studio_overrides,
+            project_overrides,
+            clear_metadata,
+            local_settings
+        ),
+        read_only
+    )
 
 
 def _get_project_settings(
-    project_name, clear_metadata=True, exclude_locals=None
+    project_name, clear_metadata=True, exclude_locals=None, read_only=False
 ):
     """Project settings with applied studio and project overrides."""
     if not project_name:
@@ -1034,28 +1156,46 @@ def _get_project_settings(
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
-    project_overrides = get_project_settings_overrides(
-        project_name
+    return _get_project_settings_value(
+        project_name, clear_metadata, exclude_locals, read_only
     )
 
-    result = apply_overrides(studio_overrides, project_overrides)
 
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
+def _get_project_settings_value(
+    project_name, clear_metadata, exclude_locals, read_only
+):
+    studio_overrides = get_studio_project_settings_overrides()
+    project_overrides = None
+    if project_name:
+        project_overrides = get_project_settings_overrides(project_name)
 
     # Apply local settings
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    local_settings = None
     if not exclude_locals:
         local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, project_name
-        )
 
-    return result
+    return _get_cached_settings(
+        PROJECT_SETTINGS_KEY,
+        (
+            project_name,
+            str(clear_metadata),
+            studio_overrides,
+            project_overrides,
+            local_settings
+        ),
+        _create_project_settings,
+        (
+            project_name,
+            studio_overrides,
+            project_overrides,
+            clear_metadata,
+            local_settings
+        ),
+        read_only
+    )
 
 
 def get_current_project_settings():
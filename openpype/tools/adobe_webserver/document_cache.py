@@ -0,0 +1,121 @@
+"""Cache of document data for websocket stubs of Adobe hosts.
+
+Stubs query whole list of layers (items) and metadata of active document
+for most operations, each query is a websocket round trip. Cache keeps raw
+results of those queries in 'snapshot' context, which should wrap code
+doing many stub calls while user can't change the document, e.g. loop
+updating metadata of instances. Hosts don't notify about all changes of
+document, so results are never cached outside of snapshot. Changes done
+through stub invalidate cached results.
+
+Extension registers its client on connection, registered client supports
+batch calls, see 'call_batch' of stubs.
+"""
+import threading
+import contextlib
+
+
+class DocumentCache(object):
+    """Versioned cache of raw results of stub calls.
+
+    Keys of results are tuples where first item is name of called method.
+    Version is increased on each change of document, results fetched during
+    older version are not stored.
+
+    Attributes:
+        hits (int): Number of results returned from cache.
+        misses (int): Number of results which had to be queried.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._values = {}
+        self._client = None
+        self._snapshot_depth = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self):
+        return self._version
+
+    def register_client(self, client):
+        """Extension connected and announced support of batch calls.
+
+        Args:
+            client (WebSocketAsync): Connected client.
+        """
+        with self._lock:
+            self._client = client
+            self._version += 1
+            self._values.clear()
+
+    def is_registered(self, client):
+        """Client was registered and supports batch calls."""
+        return client is not None and client is self._client
+
+    def invalidate(self, methods=None):
+        """Forget cached results, document was changed through stub.
+
+        Args:
+            methods (Optional[Iterable[str]]): Forget only results of these
+                methods, all results are forgotten if not passed.
+        """
+        with self._lock:
+            self._version += 1
+            if methods is None:
+                self._values.clear()
+                return
+            methods = set(methods)
+            for key in tuple(self._values):
+                if key[0] in methods:
+                    self._values.pop(key)
+
+    def is_enabled(self):
+        """Results are cached, only inside of snapshot."""
+        return self._snapshot_depth > 0
+
+    def get(self, key, getter):
+        """Cached result for key or result of getter.
+
+        Args:
+            key (tuple): Key of query, method name with arguments.
+            getter (Callable[[], Any]): Function doing the query.
+
+        Returns:
+            Any: Result of query.
+        """
+        if not self.is_enabled():
+            return getter()
+
+        with self._lock:
+            version = self._version
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+
+        self.misses += 1
+        value = getter()
+        with self._lock:
+            # Document changed while query was running
+            if version == self._version and self._snapshot_depth > 0:
+                self._values[key] = value
+        return value
+
+    @contextlib.contextmanager
+    def snapshot(self):
+        """Cache results in context.
+
+        Use only when user can't change the document. Cached results are
+        forgotten when outermost snapshot ends.
+        """
+        with self._lock:
+            self._snapshot_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._snapshot_depth -= 1
+                if self._snapshot_depth == 0:
+                    self._version += 1
+                    self._values.clear()
@@ -8,6 +8,7 @@ import qtawesome
 
 from openpype.host import ILoadHost
 from openpype.client import (
+    entity_cache,
     get_asset_by_id,
     get_subset_by_id,
     get_version_by_id,
@@ -324,13 +325,52 @@ class InventoryModel(TreeModel):
         # NOTE: @iLLiCiTiT this need refactor
         project_name = get_current_project_name()
 
-        self.beginResetModel()
-
         # Group by representation
         grouped = defaultdict(lambda: {"items": list()})
         for item in items:
             grouped[item["representation"]]["items"].append(item)
 
+        # Entities of all containers are queried at once
+        with entity_cache() as cache:
+            self._prefetch_entities(cache, project_name, list(grouped))
+            return self._add_grouped_items(project_name, grouped, parent)
+
+    def _prefetch_entities(self, cache, project_name, repre_ids):
+        """Query entities of representations with one query per type."""
+        repre_docs = cache.get_many(
+            project_name, "representation", repre_ids, ["parent"]
+        )
+        version_docs = cache.get_many(
+            project_name,
+            "version",
+            {doc["parent"] for doc in repre_docs if doc},
+            ["type", "parent", "version_id"]
+        )
+        cache.get_many(
+            project_name,
+            "version",
+            {
+                doc["version_id"]
+                for doc in version_docs
+                if doc and doc["type"] == "hero_version"
+            },
+            ["parent"]
+        )
+        subset_ids = {doc["parent"] for doc in version_docs if doc}
+        subset_docs = cache.get_many(
+            project_name, "subset", subset_ids, ["parent"]
+        )
+        cache.get_many(project_name, "last_version", subset_ids, ["_id"])
+        cache.get_many(
+            project_name,
+            "asset",
+            {doc["parent"] for doc in subset_docs if doc},
+            ["_id"]
+        )
+
+    def _add_grouped_items(self, project_name, grouped, parent):
+        self.beginResetModel()
+
         # Add to model
         not_found = defaultdict(list)
         not_found_ids = []
@@ -456,6 +456,23 @@ class ExtractReviewProfileModel(BaseSettingsModel):
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    max_concurrent_outputs: int = SettingsField(
+        0,
+        ge=0,
+        title="Max concurrent outputs",
+        description=(
+            "Maximum number of outputs rendered at once. Value 0 decides"
+            " based on number of cpu cores."
+        )
+    )
+    decode_once_outputs: bool = SettingsField(
+        False,
+        title="Decode input once for all outputs",
+        description=(
+            "Outputs with same input are rendered by one ffmpeg process."
+            " Outputs with audio are rendered separately."
+        )
+    )
     profiles: list[ExtractReviewProfileModel] = SettingsField(
         default_factory=list,
         title="Profiles"
@@ -553,6 +570,7 @@ class ExtractBurninProfile(BaseSettingsModel):
 class ExtractBurninModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    fuse_with_review: bool = SettingsField(False, title="Fuse with review")
     options: ExtractBurninOptionsModel = SettingsField(
         default_factory=ExtractBurninOptionsModel,
         title="Burnin formatting options"
@@ -866,6 +884,8 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractReview": {
         "enabled": True,
+        "max_concurrent_outputs": 0,
+        "decode_once_outputs": False,
         "profiles": [
             {
                 "product_types": [],
@@ -960,6 +980,7 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractBurnin": {
         "enabled": True,
+        "fuse_with_review": False,
         "options": {
             "font_size": 42,
             "font_color": [255, 255, 255, 1.0],
@@ -3,6 +3,7 @@
 import os
 import sys
 from collections import namedtuple
+from hashlib import sha256
 from pathlib import Path
 from zipfile import ZipFile
 from uuid import uuid4
@@ -388,3 +389,27 @@ def test_find_openpype(fix_bootstrap, tmp_path_factory, monkeypatch, printer):
     )
     assert result[-1].path == expected_path, ("not a latest version of "
                                               "OpenPype 4")
+
+
+def test_validate_openpype_version(fix_bootstrap, tmp_path, printer):
+    version_dir = tmp_path / "openpype-v3.0.0"
+    version_dir.mkdir()
+    checksums = []
+    for idx in range(10):
+        file_path = version_dir / f"file{idx}.txt"
+        file_path.write_text(str(idx))
+        checksums.append(
+            f"{sha256(file_path.read_bytes()).hexdigest()}:{file_path.name}"
+        )
+    (version_dir / "checksums").write_text("\n".join(checksums))
+
+    printer("testing validation of version directory ...")
+    assert fix_bootstrap.validate_openpype_version(version_dir) == (
+        True, "All ok")
+    assert fix_bootstrap.validate_openpype_version(version_dir) == (
+        True, "All ok (cached)")
+
+    printer("testing changed file is validated again ...")
+    (version_dir / "file3.txt").write_text("changed")
+    assert fix_bootstrap.validate_openpype_version(version_dir) == (
+        False, "Invalid checksum on file3.txt")
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""Test suite for request scoped entity cache.
+
+Database is replaced with in-memory 'mongomock' client.
+"""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import OpenPypeMongoConnection
+from openpype.client.mongo.entities import (
+    get_asset_by_id,
+    get_subset_by_name,
+    get_version_by_id,
+    get_last_version_by_subset_id,
+)
+from openpype.client.mongo.entity_cache import entity_cache
+
+mongomock = pytest.importorskip("mongomock")
+
+PROJECT_NAME = "test_project"
+
+
+@pytest.fixture
+def project_docs(monkeypatch):
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(
+        OpenPypeMongoConnection,
+        "get_mongo_client",
+        classmethod(lambda cls, mongo_url=None: client)
+    )
+    conn = client["avalon"][PROJECT_NAME]
+    asset_doc = {"_id": ObjectId(), "type": "asset", "name": "sh010",
+                 "data": {"frameStart": 1001, "frameEnd": 1010}}
+    subset_doc = {"_id": ObjectId(), "type": "subset", "name": "modelMain",
+                  "parent": asset_doc["_id"]}
+    version_docs = [
+        {"_id": ObjectId(), "type": "version", "name": name,
+         "parent": subset_doc["_id"]}
+        for name in (1, 2, 3)
+    ]
+    conn.insert_many([asset_doc, subset_doc] + version_docs)
+    return asset_doc, subset_doc, version_docs
+
+
+def test_batched_loading(project_docs):
+    asset_doc, subset_doc, version_docs = project_docs
+    missing_id = ObjectId()
+    with entity_cache() as cache:
+        promises = [
+            cache.load(PROJECT_NAME, "version", version_doc["_id"])
+            for version_doc in version_docs
+        ]
+        cache.load(PROJECT_NAME, "version", missing_id)
+        assert cache.queries == 0
+
+        assert [promise.get() for promise in promises] == version_docs
+        assert cache.queries == 1
+        assert get_version_by_id(PROJECT_NAME, missing_id) is None
+        assert get_version_by_id(
+            PROJECT_NAME, str(version_docs[0]["_id"]), fields=["name"]
+        ) == {"_id": version_docs[0]["_id"], "name": 1}
+        assert cache.get_stats() == {"hits": 4, "misses": 4, "queries": 1}
+
+    # Cache is not active out of context
+    assert get_version_by_id(PROJECT_NAME, missing_id) is None
+    assert cache.hits == 4
+
+
+def test_cached_documents(project_docs):
+    asset_doc, subset_doc, version_docs = project_docs
+    with entity_cache() as cache:
+        last_version = get_last_version_by_subset_id(
+            PROJECT_NAME, subset_doc["_id"]
+        )
+        assert last_version == version_docs[-1]
+        # Returned documents are copies of cached documents
+        last_version["data"] = {"modified": True}
+        assert get_version_by_id(
+            PROJECT_NAME, last_version["_id"]
+        ) == version_docs[-1]
+
+        assert get_subset_by_name(
+            PROJECT_NAME, "modelMain", asset_doc["_id"]
+        ) == subset_doc
+        assert get_asset_by_id(
+            PROJECT_NAME, asset_doc["_id"], fields=["data.frameStart"]
+        ) == {"_id": asset_doc["_id"], "data": {"frameStart": 1001}}
+
+        with entity_cache() as nested_cache:
+            assert nested_cache is cache
+        assert cache.queries == 3
+
+
+class CountingConnection(object):
+    """Collection proxy counting queries."""
+    def __init__(self, conn, counter):
+        self._conn = conn
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._conn, name)
+        if name in ("find", "find_one", "aggregate"):
+            self._counter.append(name)
+        return attr
+
+
+@pytest.fixture
+def queries(monkeypatch, project_docs):
+    import importlib
+
+    counter = []
+    for module_name in ("entities", "entity_cache"):
+        module = importlib.import_module(
+            "openpype.client.mongo." + module_name
+        )
+        get_connection = module.get_project_connection
+        monkeypatch.setattr(
+            module, "get_project_connection",
+            lambda *args, _get=get_connection: CountingConnection(
+                _get(*args), counter
+            )
+        )
+    return counter
+
+
+def _insert_representations(project_docs):
+    asset_doc, subset_doc, version_docs = project_docs
+    conn = OpenPypeMongoConnection.get_mongo_client()["avalon"][PROJECT_NAME]
+    conn.update_one(
+        {"_id": subset_doc["_id"]},
+        {"$set": {"schema": "openpype:subset-3.0",
+                  "data": {"families": ["model"]}}}
+    )
+    conn.update_many({"type": "version"}, {"$set": {"data": {}}})
+    repre_docs = [
+        {"_id": ObjectId(), "type": "representation", "name": "abc",
+         "parent": version_doc["_id"]}
+        for version_doc in version_docs
+    ]
+    conn.insert_many(repre_docs)
+    return repre_docs
+
+
+def test_scene_inventory_queries(project_docs, queries, monkeypatch):
+    from openpype.tools.utils.models import TreeModel
+    from openpype.tools.sceneinventory import model
+
+    repre_docs = _insert_representations(project_docs)
+    monkeypatch.setattr(
+        model, "get_current_project_name", lambda: PROJECT_NAME
+    )
+    inventory_model = model.InventoryModel.__new__(model.InventoryModel)
+    TreeModel.__init__(inventory_model)
+    inventory_model.family_config_cache = type(
+        "FamilyConfigCache", (), {"family_config": lambda self, name: {}}
+    )()
+    inventory_model.sync_enabled = False
+
+    root_item = inventory_model.add_items([
+        {"representation": str(repre_doc["_id"]), "objectName": str(idx),
+         "namespace": "ns{}".format(idx)}
+        for idx, repre_doc in enumerate(repre_docs)
+    ])
+    assert [
+        group_node["version"] for group_node in root_item.children()
+    ] == [1, 2, 3]
+    # Representations, versions, subsets, last versions (two queries) and
+    #   assets, without cache each container queries each of them
+    assert len(queries) == 6
+
+
+def test_publish_queries(project_docs, queries):
+    import pyblish.api
+    import pyblish.util
+    from openpype.pipeline.publish import publish_iter_with_entity_cache
+
+    asset_doc, subset_doc, version_docs = project_docs
+
+    class CollectVersions(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for version_doc in version_docs:
+                instance = context.create_instance(str(version_doc["name"]))
+                instance.data["versionEntity"] = get_version_by_id(
+                    PROJECT_NAME, version_doc["_id"]
+                )
+
+    class CollectAssets(pyblish.api.InstancePlugin):
+        order = pyblish.api.CollectorOrder + 0.1
+
+        def process(self, instance):
+            get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+            get_last_version_by_subset_id(PROJECT_NAME, subset_doc["_id"])
+
+    class IntegrateVersion(pyblish.api.ContextPlugin):
+        order = pyblish.api.IntegratorOrder
+
+        def process(self, context):
+            conn = OpenPypeMongoConnection.get_mongo_client()["avalon"][
+                PROJECT_NAME
+            ]
+            conn.insert_one({"_id": ObjectId(), "type": "version",
+                             "name": 4, "parent": subset_doc["_id"]})
+            context.data["lastVersion"] = get_last_version_by_subset_id(
+                PROJECT_NAME, subset_doc["_id"]
+            )
+
+    plugins = [CollectVersions, CollectAssets, IntegrateVersion]
+    context = pyblish.api.Context()
+    for result in pyblish.util.publish_iter(context, plugins):
+        assert result["error"] is None
+    uncached_queries = len(queries)
+
+    del queries[:]
+    context = pyblish.api.Context()
+    for result in publish_iter_with_entity_cache(context, plugins):
+        assert result["error"] is None
+    assert uncached_queries == 14
+    # Each version once, asset and last version once during collection,
+    #   integrator does not use cache and finds new version
+    assert len(queries) == 8
+    assert context.data["lastVersion"]["name"] == 4
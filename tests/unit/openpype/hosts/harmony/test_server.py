@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Test suite for Harmony server reply dispatch.
+
+Harmony is replaced with a fake peer connected to the server socket.
+"""
+import json
+import socket
+import struct
+import threading
+
+import pytest
+
+# Harmony api requires modules loaded by OpenPype process ('runtests')
+server_module = pytest.importorskip("openpype.hosts.harmony.api.server")
+Server = server_module.Server
+
+
+class FakeHarmony(object):
+    """Socket peer speaking Harmony protocol."""
+    def __init__(self, port):
+        self.socket = socket.create_connection(("127.0.0.1", port))
+        self.stream = self.socket.makefile("rb")
+
+    def read(self):
+        header = self.stream.read(6)
+        length = struct.unpack(">I", header[2:])[0]
+        return json.loads(self.stream.read(length).decode("utf-8"))
+
+    def write(self, data):
+        encoded = json.dumps(data).encode("utf-8")
+        header = "AH{:08x}".format(len(encoded)).encode("utf-8")
+        self.socket.sendall(header + encoded)
+
+    def reply(self, request):
+        request["reply"] = True
+        request["result"] = request["args"][0] * 2
+        self.write(request)
+
+    def close(self):
+        self.stream.close()
+        self.socket.close()
+
+
+@pytest.fixture
+def server():
+    server = Server(0)
+    server.port = server.socket.getsockname()[1]
+    server.start()
+    harmony = FakeHarmony(server.port)
+    yield server, harmony
+    harmony.close()
+    server.socket.close()
+
+
+def test_send_batch_out_of_order(server):
+    server, harmony = server
+
+    def answer():
+        requests = [harmony.read() for _ in range(3)]
+        for request in reversed(requests):
+            harmony.reply(request)
+
+    thread = threading.Thread(target=answer)
+    thread.start()
+    replies = server.send_batch(
+        [{"function": "double", "args": [idx]} for idx in range(3)]
+    )
+    thread.join()
+    assert [reply["result"] for reply in replies] == [0, 2, 4]
+    assert not server._pending
+
+
+def test_request_from_harmony(server, monkeypatch):
+    server, harmony = server
+    processed = []
+    monkeypatch.setattr(server, "process_request", processed.append)
+
+    harmony.write({"module": "openpype.lib", "method": "emit_event",
+                   "message_id": 1})
+    echo = harmony.read()
+    assert echo["reply"] is True
+
+    # Reply to request sent by server is not mistaken for a new request
+    thread = threading.Thread(target=lambda: harmony.reply(harmony.read()))
+    thread.start()
+    assert server.send({"function": "double", "args": [5]})["result"] == 10
+    thread.join()
+    assert [request["method"] for request in processed] == ["emit_event"]
+
+
+def test_pending_fail_on_close(server):
+    server, harmony = server
+    future = server.send_async({"function": "double", "args": [1]})
+    harmony.read()
+    harmony.close()
+    with pytest.raises(ConnectionError):
+        future.result(timeout=5)
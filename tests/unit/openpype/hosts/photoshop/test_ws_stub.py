@@ -0,0 +1,110 @@
+"""Tests of layer cache and batch calls of Photoshop websocket stub.
+
+Websocket server and connected client are replaced by fake objects which
+record calls.
+"""
+import json
+
+import pytest
+
+from openpype.tools.adobe_webserver.document_cache import DocumentCache
+from openpype.hosts.photoshop.api.ws_stub import PhotoshopServerStub
+
+LAYERS = json.dumps([
+    {"id": 1, "name": "BG", "visible": True},
+    {"id": 2, "name": "FG", "visible": True},
+    {"id": 3, "name": "Guide", "visible": False},
+])
+
+
+class FakeServer(object):
+    def call(self, result):
+        return result
+
+
+class FakeClient(object):
+    def __init__(self):
+        self.calls = []
+
+    def call(self, method, **kwargs):
+        self.calls.append((method, kwargs))
+        if method == "Photoshop.get_layers":
+            return LAYERS
+        if method == "Photoshop.batch":
+            return json.dumps([None] * len(json.loads(kwargs["calls"])))
+        return None
+
+    def methods(self):
+        return [method for method, _ in self.calls]
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.setattr(PhotoshopServerStub, "cache", DocumentCache())
+    stub = PhotoshopServerStub.__new__(PhotoshopServerStub)
+    stub.websocketserver = FakeServer()
+    stub.client = FakeClient()
+    return stub
+
+
+def test_layers_not_cached_outside_snapshot(stub):
+    stub.cache.register_client(stub.client)
+
+    stub.get_layers()
+    stub.get_layers()
+    assert stub.client.methods() == [
+        "Photoshop.get_layers", "Photoshop.get_layers"
+    ]
+    assert stub.cache.hits == 0
+
+
+def test_layers_cached_in_snapshot(stub):
+    with stub.cache.snapshot():
+        assert [layer.id for layer in stub.get_layers()] == [1, 2, 3]
+        stub.get_layers()
+        assert stub.client.methods() == ["Photoshop.get_layers"]
+
+        # change of layers forgets everything
+        stub.set_visible(1, False)
+        stub.get_layers()
+        assert stub.client.methods().count("Photoshop.get_layers") == 2
+
+    # cache is cleared when snapshot ends
+    stub.get_layers()
+    assert stub.client.methods().count("Photoshop.get_layers") == 3
+    assert stub.cache.hits == 1
+
+
+def test_imprint_keeps_layers(stub):
+    with stub.cache.snapshot():
+        stub.get_layers()
+        stub.get_layers_metadata()
+        stub.get_layers_metadata()
+        stub.imprint(1, {"id": "pyblish.avalon.instance"})
+        stub.get_layers()
+        stub.get_layers_metadata()
+
+    assert stub.client.methods().count("Photoshop.get_layers") == 1
+    assert stub.client.methods().count("Photoshop.read") == 2
+
+
+def test_batch_visibility(stub):
+    stub.cache.register_client(stub.client)
+
+    stub.hide_all_others_layers_ids([1])
+    assert stub.client.methods() == [
+        "Photoshop.get_layers", "Photoshop.batch"
+    ]
+    calls = json.loads(stub.client.calls[-1][1]["calls"])
+    assert calls == [{
+        "method": "Photoshop.set_visible",
+        "params": {"layer_id": 2, "visibility": False}
+    }]
+
+
+def test_unregistered_client(stub):
+    stub.set_visible_many({1: False, 2: True})
+    assert stub.client.methods() == [
+        "Photoshop.set_visible",
+        "Photoshop.set_visible",
+    ]
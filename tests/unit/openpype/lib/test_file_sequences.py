@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file sequences index."""
+import os
+import time
+
+import pytest
+
+from openpype.lib import file_sequences
+
+
+@pytest.fixture
+def render_dir(tmp_path):
+    for frame in (1001, 1002, 1003, 1005):
+        (tmp_path / "beauty.{}.exr".format(frame)).write_bytes(b"x" * frame)
+    (tmp_path / "beauty.0001.png").write_bytes(b"png")
+    (tmp_path / "beauty.0002.png").write_bytes(b"png")
+    (tmp_path / "notes.txt").write_bytes(b"notes")
+    (tmp_path / "subdir.0001").mkdir()
+    # Make directory mtime old enough to be cached
+    old_time = time.time() - 60
+    os.utime(str(tmp_path), (old_time, old_time))
+    file_sequences.clear_sequence_cache()
+    return tmp_path
+
+
+def test_get_sequences(render_dir):
+    sequences, remainder = file_sequences.get_sequences(
+        str(render_dir), ext="exr")
+
+    assert len(sequences) == 1
+    sequence = sequences[0]
+    assert sequence.pattern == "beauty.%d.exr"
+    assert sequence.frames == (1001, 1002, 1003, 1005)
+    assert sequence.sizes == (1001, 1002, 1003, 1005)
+    assert sequence.frames_label == "1001-1003, 1005"
+    assert sequence.get_missing_frames() == [1004]
+    assert sequence.get_missing_frames(1000, 1006) == [1000, 1004, 1006]
+    assert not sequence.is_contiguous()
+    assert remainder == ["notes.txt"]
+
+    collections, _ = file_sequences.get_collections(str(render_dir))
+    padded = [
+        collection
+        for collection in collections
+        if collection.tail == ".png"
+    ][0]
+    assert list(padded) == ["beauty.0001.png", "beauty.0002.png"]
+
+
+def test_scan_cache(render_dir):
+    index = file_sequences.scan_directory(str(render_dir))
+    assert file_sequences.scan_directory(str(render_dir)) is index
+
+    # New file changes directory mtime
+    (render_dir / "beauty.1004.exr").write_bytes(b"x")
+    new_index = file_sequences.scan_directory(str(render_dir))
+    assert new_index is not index
+    sequence = file_sequences.get_sequences(str(render_dir), ext="exr")[0][0]
+    assert sequence.is_contiguous()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file transaction."""
+import os
+
+import pytest
+
+from openpype.lib.file_transaction import (
+    FileTransaction,
+    TransferVerificationError,
+)
+
+
+def _create_files(root, count):
+    src_dir = root / "src"
+    src_dir.mkdir()
+    paths = []
+    for idx in range(count):
+        path = src_dir / "file.{:04d}.exr".format(idx)
+        path.write_bytes(os.urandom(1024) * (idx + 1))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_process_with_backup_and_progress(tmp_path, max_workers):
+    src_paths = _create_files(tmp_path, 10)
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+    existing = dst_dir / os.path.basename(src_paths[0])
+    existing.write_bytes(b"old")
+
+    progress = []
+    transaction = FileTransaction(
+        max_workers=max_workers,
+        zero_copy=True,
+        checksum_algorithm="sha256",
+        progress_callback=lambda *args: progress.append(args)
+    )
+    for src_path in src_paths:
+        transaction.add(
+            src_path, str(dst_dir / os.path.basename(src_path))
+        )
+    transaction.process()
+
+    assert len(transaction.transferred) == len(src_paths)
+    backups = transaction.backups
+    assert len(backups) == 1
+    assert backups[0].startswith(str(existing) + ".")
+    assert backups[0].endswith(".bak")
+    assert sorted(item[2] for item in progress) == list(range(1, 11))
+    for src_path in src_paths:
+        dst_path = dst_dir / os.path.basename(src_path)
+        with open(src_path, "rb") as stream:
+            assert dst_path.read_bytes() == stream.read()
+
+    transaction.finalize()
+    assert not os.path.exists(backups[0])
+
+
+def test_verification_failure_rollback(tmp_path, monkeypatch):
+    src_paths = _create_files(tmp_path, 4)
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+    existing = dst_dir / os.path.basename(src_paths[0])
+    existing.write_bytes(b"old")
+
+    # Corrupt one of the copies
+    def broken_copy(src, dst):
+        with open(dst, "wb") as stream:
+            stream.write(b"corrupted")
+
+    monkeypatch.setattr(
+        "openpype.lib.file_transaction.copyfile", broken_copy
+    )
+
+    transaction = FileTransaction(max_workers=2, checksum_algorithm="md5")
+    for src_path in src_paths:
+        transaction.add(
+            src_path, str(dst_dir / os.path.basename(src_path))
+        )
+
+    with pytest.raises(TransferVerificationError):
+        transaction.process()
+
+    transaction.rollback()
+    assert os.listdir(str(dst_dir)) == [existing.name]
+    assert existing.read_bytes() == b"old"
+
+
+def _interrupted_transaction(tmp_path, journal_path):
+    src_paths = _create_files(tmp_path, 6)
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+    existing = dst_dir / os.path.basename(src_paths[0])
+    existing.write_bytes(b"old")
+
+    transaction = FileTransaction(journal_path=journal_path)
+    for src_path in src_paths:
+        transaction.add(
+            src_path, str(dst_dir / os.path.basename(src_path))
+        )
+
+    # Simulate crash in the middle of transfers
+    original_transfer = transaction._transfer_file
+    counter = {"count": 0}
+
+    def crashing_transfer(src, dst, opts):
+        if counter["count"] == 3:
+            transaction._write_journal("started", dst=dst)
+            with open(dst, "wb") as stream:
+                stream.write(b"partial")
+            raise KeyboardInterrupt()
+        counter["count"] += 1
+        original_transfer(src, dst, opts)
+
+    transaction._transfer_file = crashing_transfer
+    with pytest.raises(KeyboardInterrupt):
+        transaction.process()
+    transaction._journal.close()
+    return src_paths, dst_dir, existing
+
+
+def test_resume_from_journal(tmp_path):
+    journal_path = str(tmp_path / "journal.jsonl")
+    src_paths, dst_dir, existing = _interrupted_transaction(
+        tmp_path, journal_path
+    )
+
+    transferred = []
+    transaction = FileTransaction.from_journal(
+        journal_path,
+        progress_callback=lambda src, dst, *args: transferred.append(dst)
+    )
+    transaction.process()
+    transaction.finalize()
+
+    # Only unfinished files were transferred
+    assert len(transferred) == 3
+    assert not os.path.exists(journal_path)
+    assert sorted(os.listdir(str(dst_dir))) == sorted(
+        os.path.basename(path) for path in src_paths
+    )
+    for src_path in src_paths:
+        dst_path = dst_dir / os.path.basename(src_path)
+        with open(src_path, "rb") as stream:
+            assert dst_path.read_bytes() == stream.read()
+
+
+def test_rollback_from_journal(tmp_path):
+    journal_path = str(tmp_path / "journal.jsonl")
+    _, dst_dir, existing = _interrupted_transaction(tmp_path, journal_path)
+
+    transaction = FileTransaction.from_journal(journal_path)
+    transaction.rollback()
+
+    assert not os.path.exists(journal_path)
+    assert os.listdir(str(dst_dir)) == [existing.name]
+    assert existing.read_bytes() == b"old"
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path templates formatting."""
+import timeit
+
+import pytest
+
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplateUnsolved,
+)
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/<{hierarchy}/>{asset}/publish"
+    "/{family}/{subset}/v{version:0>3}"
+    "/{project[code]}_{asset}_{subset}_v{version:0>3}<_{output}>"
+    ".{frame:0>4}.{ext}"
+)
+TEMPLATE_DATA = {
+    "root": {"work": "/mnt/projects"},
+    "project": {"name": "test_project", "code": "tp"},
+    "hierarchy": "shots/sq01",
+    "asset": "sh010",
+    "family": "render",
+    "subset": "renderMain",
+    "version": 12,
+    "ext": "exr",
+}
+
+
+def test_parsed_parts_are_cached():
+    template_a = StringTemplate(TEMPLATE)
+    template_b = StringTemplate(TEMPLATE)
+
+    assert template_a._parts is template_b._parts
+
+
+def test_format_many_matches_format():
+    template = StringTemplate(TEMPLATE)
+    frames = list(range(1001, 1011))
+    results = template.format_many(
+        TEMPLATE_DATA, ({"frame": frame} for frame in frames)
+    )
+
+    assert len(results) == len(frames)
+    for frame, result in zip(frames, results):
+        data = dict(TEMPLATE_DATA, frame=frame)
+        expected = template.format(data)
+        assert str(result) == str(expected)
+        assert result.solved == expected.solved
+        assert result.used_values == expected.used_values
+        assert result.missing_keys == expected.missing_keys
+
+
+def test_format_many_strict_raises_on_unsolved():
+    template = StringTemplate(TEMPLATE)
+    data = dict(TEMPLATE_DATA)
+    data.pop("asset")
+
+    with pytest.raises(TemplateUnsolved):
+        template.format_many_strict(data, [{"frame": 1001}])
+
+
+def test_format_many_empty_items():
+    template = StringTemplate(TEMPLATE)
+
+    assert template.format_many(TEMPLATE_DATA, []) == []
+
+
+@pytest.mark.slow
+def test_format_many_benchmark():
+    """Compare formatting of 2000 frames one by one and with 'format_many'.
+
+    Only prints timings, run with '-s' to see them.
+    """
+
+    frames = list(range(1001, 3001))
+
+    def format_each():
+        template = StringTemplate(TEMPLATE)
+        data = dict(TEMPLATE_DATA)
+        for frame in frames:
+            data["frame"] = frame
+            template.format(data)
+
+    def format_many():
+        template = StringTemplate(TEMPLATE)
+        template.format_many(
+            TEMPLATE_DATA, ({"frame": frame} for frame in frames)
+        )
+
+    each_time = min(timeit.repeat(format_each, number=1, repeat=3))
+    many_time = min(timeit.repeat(format_many, number=1, repeat=3))
+    print("format: {:.4f}s format_many: {:.4f}s".format(
+        each_time, many_time
+    ))
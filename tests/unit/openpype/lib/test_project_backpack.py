@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Test suite for streaming project package.
+
+Database is replaced with in-memory 'mongomock' client.
+"""
+import os
+import platform
+
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import OpenPypeMongoConnection
+from openpype.lib import project_backpack
+
+mongomock = pytest.importorskip("mongomock")
+
+PROJECT_NAME = "test_project"
+
+
+@pytest.fixture
+def project_root(monkeypatch, tmp_path):
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(
+        OpenPypeMongoConnection,
+        "get_mongo_client",
+        classmethod(lambda cls, mongo_url=None: client)
+    )
+    root_path = str(tmp_path / "root")
+    conn = client["avalon"][PROJECT_NAME]
+    conn.insert_one({
+        "_id": ObjectId(),
+        "type": "project",
+        "name": PROJECT_NAME,
+        "config": {"roots": {"work": {platform.system().lower(): root_path}}}
+    })
+    conn.insert_many([
+        {"_id": ObjectId(), "type": "asset", "name": "sh{:03}".format(idx)}
+        for idx in range(5)
+    ])
+
+    for relpath, content in (
+        ("shots/sh010/work/scene.ma", b"scene"),
+        ("shots/sh010/publish/review.mp4", b"\x00" * 1024),
+        ("shots/sh020/work/scene.ma", b"other scene"),
+    ):
+        filepath = os.path.join(root_path, PROJECT_NAME, relpath)
+        os.makedirs(os.path.dirname(filepath))
+        with open(filepath, "wb") as stream:
+            stream.write(content)
+    return root_path
+
+
+def test_pack_unpack_stream(project_root, tmp_path):
+    packages_dir = str(tmp_path / "packages")
+    package_dir = project_backpack.pack_project_stream(
+        PROJECT_NAME, packages_dir, workers=2
+    )
+    manifest = project_backpack._load_package_json(
+        package_dir, project_backpack.MANIFEST_FILE_NAME
+    )["files"]
+    assert len(manifest) == 3
+    assert {item["archive"] for item in manifest.values()} == {
+        "files_000.zip", "files_001.zip"
+    }
+
+    # Only changed file is packed to new package
+    changed_path = os.path.join(
+        project_root, PROJECT_NAME, "shots/sh020/work/scene.ma"
+    )
+    with open(changed_path, "wb") as stream:
+        stream.write(b"changed scene")
+    os.utime(changed_path, (1000000000, 1000000000))
+    previous_package = package_dir
+    package_dir = project_backpack.pack_project_stream(
+        PROJECT_NAME, packages_dir, previous_package=previous_package
+    )
+    manifest = project_backpack._load_package_json(
+        package_dir, project_backpack.MANIFEST_FILE_NAME
+    )["files"]
+    assert [
+        relpath
+        for relpath, item in manifest.items()
+        if "package" not in item
+    ] == [PROJECT_NAME + "/shots/sh020/work/scene.ma"]
+    assert manifest[PROJECT_NAME + "/shots/sh010/work/scene.ma"][
+        "package"
+    ] == os.path.basename(previous_package)
+
+    OpenPypeMongoConnection.get_mongo_client().drop_database("avalon")
+    new_root = str(tmp_path / "new_root")
+    project_backpack.unpack_project(package_dir, new_root)
+
+    project_doc = project_backpack.get_project_document(PROJECT_NAME)
+    assert project_doc["config"]["roots"]["work"][
+        platform.system().lower()
+    ] == new_root
+    asset_conn = project_backpack.get_project_connection(PROJECT_NAME)
+    assert asset_conn.count_documents({"type": "asset"}) == 5
+
+    # Partial unpack of files keeps documents in database
+    asset_conn.delete_one({"type": "asset", "name": "sh000"})
+    for shot in ("sh010", "sh020"):
+        os.remove(os.path.join(
+            new_root, PROJECT_NAME, "shots", shot, "work", "scene.ma"
+        ))
+    project_backpack.unpack_project(
+        package_dir,
+        new_root,
+        file_patterns=[PROJECT_NAME + "/shots/sh0[12]0/work/*"]
+    )
+    assert asset_conn.count_documents({"type": "asset"}) == 4
+
+    unpacked = sorted(
+        os.path.relpath(os.path.join(root, filename), new_root)
+        for root, _, filenames in os.walk(new_root)
+        for filename in filenames
+    )
+    assert unpacked == sorted(
+        os.path.join(PROJECT_NAME, "shots", *parts)
+        for parts in (
+            ("sh010", "work", "scene.ma"),
+            ("sh010", "publish", "review.mp4"),
+            ("sh020", "work", "scene.ma"),
+        )
+    )
+    unpacked_path = os.path.join(
+        new_root, PROJECT_NAME, "shots", "sh020", "work", "scene.ma"
+    )
+    with open(unpacked_path, "rb") as stream:
+        assert stream.read() == b"changed scene"
+    assert os.path.getmtime(unpacked_path) == 1000000000
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Test suite for conversion of inputs for ffmpeg.
+
+Subprocess calls are replaced so oiiotool is not needed.
+"""
+import pytest
+
+from openpype.lib import transcoding
+
+
+INPUT_INFO = {
+    "attribs": {
+        "compression": "dwaa",
+        "Long": "a" * (transcoding.MAX_FFMPEG_STRING_LEN + 1),
+    },
+}
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    commands = []
+
+    def run_subprocess(cmd, logger=None):
+        commands.append(cmd)
+        if "/src/shot.0003.exr" in cmd:
+            raise RuntimeError("Failed")
+
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+    monkeypatch.setattr(
+        transcoding, "get_oiio_info_for_input",
+        lambda *args, **kwargs: INPUT_INFO
+    )
+    monkeypatch.setattr(
+        transcoding, "get_oiio_input_and_channel_args",
+        lambda *args, **kwargs: ("-i", "R,G,B")
+    )
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args", lambda *args: list(args)
+    )
+    return commands
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_convert_reports_all_failures(commands, max_workers):
+    input_paths = [
+        "/src/shot.{:04d}.exr".format(frame)
+        for frame in range(1, 6)
+    ]
+    with pytest.raises(RuntimeError) as exc_info:
+        transcoding.convert_input_paths_for_ffmpeg(
+            input_paths, "/dst", max_workers=max_workers
+        )
+
+    assert "1 of 5" in str(exc_info.value)
+    assert len(commands) == 5
+    for cmd in commands:
+        assert cmd[:4] == [
+            "oiiotool", "--nosoftwareattrib", "--compression", "none"
+        ]
+        assert cmd[cmd.index("--eraseattrib") + 1] == "Long"
+        assert cmd[-2:] == ["-o", "/dst/" + cmd[5].split("/")[-1]]
+
+
+def test_convert_frame_chunks(commands):
+    input_paths = [
+        "/src/shot.{:04d}.exr".format(frame)
+        for frame in (4, 5, 6, 7, 8, 10)
+    ]
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths, "/dst", frames_chunk_size=3
+    )
+
+    inputs = sorted(
+        (cmd[cmd.index("-i") + 1], cmd[cmd.index("-o") + 1])
+        for cmd in commands
+    )
+    assert inputs == [
+        ("/src/shot.%04d.exr", "/dst/shot.%04d.exr"),
+        ("/src/shot.%04d.exr", "/dst/shot.%04d.exr"),
+        ("/src/shot.0010.exr", "/dst/shot.0010.exr"),
+    ]
+    frames = sorted(
+        cmd[cmd.index("--frames") + 1]
+        for cmd in commands
+        if "--frames" in cmd
+    )
+    assert frames == ["4-6", "7-8"]
+
+
+def test_probe_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(transcoding.PROBE_CACHE_DIR_ENV, str(tmp_path / "db"))
+    monkeypatch.setattr(transcoding, "_PROBE_CACHE", transcoding.ProbeCache())
+    filepath = tmp_path / "input.mov"
+    filepath.write_bytes(b"data")
+    calls = []
+
+    def probe():
+        calls.append(True)
+        return "output {}".format(len(calls)), True
+
+    args = ["ffprobe", str(filepath)]
+    for _ in range(2):
+        output = transcoding._get_probe_output(str(filepath), args, probe)
+        assert output == "output 1"
+
+    # Other process reads output from database
+    transcoding.clear_probe_cache()
+    monkeypatch.setattr(transcoding, "_PROBE_CACHE", transcoding.ProbeCache())
+    output = transcoding._get_probe_output(str(filepath), args, probe)
+    assert output == "output 1"
+    assert len(calls) == 1
+
+    # Changed file is probed again
+    filepath.write_bytes(b"changed data")
+    output = transcoding._get_probe_output(str(filepath), args, probe)
+    assert output == "output 2"
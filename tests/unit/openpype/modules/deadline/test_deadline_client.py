@@ -0,0 +1,131 @@
+"""Test for DeadlineClient.
+
+Uses local HTTP server as stand-in for Deadline Webservice.
+"""
+import json
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from openpype.modules.deadline.deadline_client import DeadlineClient
+from openpype.modules.deadline.deadline_module import (
+    DeadlineWebserviceError,
+)
+
+
+class _Webservice(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super(_Webservice, self).__init__(("localhost", 0), _Handler)
+        self.jobs = {}
+        self.requests = []
+        self.connections = set()
+        self.lock = threading.Lock()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _register(self):
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path))
+            self.server.connections.add(self.client_address)
+
+    def do_GET(self):
+        self._register()
+        parsed = urlparse(self.path)
+        job_ids = parse_qs(parsed.query)["JobID"][0].split(",")
+        with self.server.lock:
+            jobs = [
+                self.server.jobs[job_id]
+                for job_id in job_ids
+                if job_id in self.server.jobs
+            ]
+            # Jobs finish after first query
+            for job in jobs:
+                self.server.jobs[job["_id"]] = dict(job, Stat=3)
+        self._send(200, jobs)
+
+    def do_POST(self):
+        self._register()
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        name = payload["JobInfo"]["Name"]
+        if name == "broken":
+            self._send(400, "Invalid job")
+            return
+        with self.server.lock:
+            job = {"_id": name, "Stat": 1}
+            self.server.jobs[name] = job
+        self._send(200, job)
+
+
+@pytest.fixture
+def webservice():
+    server = _Webservice()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def client(webservice):
+    client = DeadlineClient(
+        "http://localhost:{}/".format(webservice.server_address[1])
+    )
+    yield client
+    client.close()
+
+
+def _payload(name):
+    return {"JobInfo": {"Name": name}, "PluginInfo": {}, "AuxFiles": []}
+
+
+def test_submit_jobs(client, webservice):
+    names = ["job{}".format(idx) for idx in range(20)]
+    results = client.submit_jobs([_payload(name) for name in names])
+
+    assert [result["_id"] for result in results] == names
+    # Connections are reused
+    assert len(webservice.connections) <= 10
+
+    with pytest.raises(DeadlineWebserviceError):
+        client.submit_jobs([_payload("job"), _payload("broken")])
+
+
+def test_get_jobs(client, webservice):
+    client.submit_jobs([_payload("job1"), _payload("job2")])
+    webservice.requests.clear()
+
+    jobs_info = client.get_jobs(["job1", "job2", "missing"])
+
+    assert set(jobs_info) == {"job1", "job2"}
+    assert len(webservice.requests) == 1
+
+
+def test_wait_for_jobs(client):
+    client.submit_jobs([_payload("job1"), _payload("job2")])
+
+    jobs_info = asyncio.run(
+        client.wait_for_jobs(["job1", "job2"], poll_interval=0.01)
+    )
+
+    assert {job["Stat"] for job in jobs_info.values()} == {3}
@@ -0,0 +1,108 @@
+"""Test of cached tiles geometry of Tile Assembler Deadline plugin.
+
+Plugin runs inside Deadline, its modules are replaced by fake modules and
+oiiotool is not called.
+"""
+import os
+import sys
+import types
+import importlib.util
+
+import pytest
+
+PLUGIN_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "..", "..", "..", "..", "..",
+    "openpype", "modules", "deadline", "repository", "custom", "plugins",
+    "OpenPypeTileAssembler", "OpenPypeTileAssembler.py"
+)
+TILES_X = 2
+TILES_Y = 2
+
+
+class FakeDeadlinePlugin(object):
+    pass
+
+
+@pytest.fixture
+def assembler(monkeypatch, tmp_path):
+    system_io = types.ModuleType("System.IO")
+    system_io.Path = None
+    plugins = types.ModuleType("Deadline.Plugins")
+    plugins.DeadlinePlugin = FakeDeadlinePlugin
+    scripting = types.ModuleType("Deadline.Scripting")
+    scripting.FileUtils = None
+    scripting.RepositoryUtils = types.SimpleNamespace(
+        CheckPathMapping=lambda path: path)
+    scripting.SystemUtils = types.SimpleNamespace(
+        IsRunningOnWindows=lambda: False)
+    for name, module in (
+        ("System", types.ModuleType("System")),
+        ("System.IO", system_io),
+        ("Deadline", types.ModuleType("Deadline")),
+        ("Deadline.Plugins", plugins),
+        ("Deadline.Scripting", scripting),
+    ):
+        monkeypatch.setitem(sys.modules, name, module)
+
+    spec = importlib.util.spec_from_file_location(
+        "OpenPypeTileAssembler", PLUGIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(
+        module.tempfile, "gettempdir", lambda: str(tmp_path))
+    return module
+
+
+def _config_data(frame):
+    data = {
+        "TileCount": str(TILES_X * TILES_Y),
+        "ImageFileName": "/renders/beauty.{}.exr".format(frame),
+        "ImageWidth": "200",
+        "ImageHeight": "100",
+    }
+    for idx in range(TILES_X * TILES_Y):
+        data.update({
+            "Tile{}".format(idx): "/renders/_tile_{}/beauty.{}.exr".format(
+                idx, frame),
+            "Tile{}X".format(idx): str((idx % TILES_X) * 100),
+            "Tile{}Y".format(idx): str((idx // TILES_X) * 50),
+            "Tile{}Width".format(idx): "100",
+            "Tile{}Height".format(idx): "50",
+        })
+    return data
+
+
+def _create_plugin(assembler, job_id, frame):
+    plugin = assembler.OpenPypeTileAssembler.__new__(
+        assembler.OpenPypeTileAssembler)
+    plugin.renderer = "arnold"
+    plugin.tiles = []
+    plugin.GetJob = lambda: types.SimpleNamespace(JobId=job_id)
+    plugin.GetPluginInfoEntryWithDefault = (
+        lambda key, default: "submission_a"
+        if key == "TilesGeometryKey" else default
+    )
+    plugin.read_config_file = lambda config_file: _config_data(frame)
+    return plugin
+
+
+def test_frames_of_submission_probe_tiles_once(assembler, monkeypatch):
+    probed = []
+
+    def info_about_input(oiiotool_path, filepath):
+        probed.append(filepath)
+        return {"format": "half", "nchannels": 4, "height": 50}
+
+    monkeypatch.setattr(assembler, "info_about_input", info_about_input)
+
+    frames_count = 5
+    for frame in range(1001, 1001 + frames_count):
+        # Each frame is separate assembly job, possibly in new process
+        assembler._TILES_GEOMETRY_CACHE.clear()
+        plugin = _create_plugin(assembler, "job_{}".format(frame), frame)
+        args = plugin.frame_oiio_args("oiiotool", "config.txt")
+        assert args[0] == "--create:type=half 200x100 4"
+        assert args[-1] == "/renders/beauty.{}.exr".format(frame)
+
+    assert len(probed) == TILES_X * TILES_Y
@@ -0,0 +1,176 @@
+"""Test for JobQueue of job server.
+
+Doesn't need running server, workers are not connected.
+"""
+import types
+import asyncio
+import datetime
+
+import pytest
+
+pytest.importorskip("aiohttp_json_rpc")
+
+from openpype.modules.job_queue.job_server.jobs import JobQueue  # noqa: E402
+from openpype.modules.job_queue.job_server.storage import (  # noqa: E402
+    JobStorage,
+)
+from openpype.modules.job_queue.job_server.workers import (  # noqa: E402
+    Worker,
+)
+
+
+def _create_worker(host_name="tvpaint"):
+    return Worker(host_name, types.SimpleNamespace())
+
+
+def test_priority_order():
+    job_queue = JobQueue()
+    low = job_queue.create_job("tvpaint", {}, priority=0)
+    high = job_queue.create_job("tvpaint", {}, priority=10)
+    worker = _create_worker()
+    job_queue.add_worker(worker)
+
+    job_queue.assign_jobs()
+    assert worker.current_job is high
+
+    job_queue.finish_job(worker.id, high.id, True, None, None)
+    job_queue.assign_jobs()
+    assert worker.current_job is low
+    assert high.status()["state"] == "done"
+
+
+def test_lost_worker_retry():
+    job_queue = JobQueue()
+    job_queue.retry_backoff_seconds = 0
+    job = job_queue.create_job("tvpaint", {}, max_retries=1)
+    for _ in range(2):
+        worker = _create_worker()
+        job_queue.add_worker(worker)
+        job_queue.assign_jobs()
+        assert worker.current_job is job
+
+        # Heartbeat was not sent in time
+        worker.renew_lease(-1)
+        assert job_queue.get_expired_workers() == [worker]
+        job_queue.remove_worker(worker)
+
+    assert job.attempts == 2
+    assert job.status()["state"] == "error"
+
+
+def test_restore_jobs(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    job_queue = JobQueue(JobStorage(db_path))
+    finished = job_queue.create_job("tvpaint", {"a": 1}, priority=5)
+    started = job_queue.create_job("tvpaint", {"b": 2})
+    queued = job_queue.create_job("tvpaint", {"c": 3})
+    worker = _create_worker()
+    job_queue.add_worker(worker)
+    job_queue.assign_jobs()
+    job_queue.finish_job(worker.id, finished.id, True, None, {"out": 1})
+    job_queue.assign_jobs()
+    assert worker.current_job is started
+    job_queue.close()
+
+    job_queue = JobQueue(JobStorage(db_path))
+    assert job_queue.get_job(finished.id).status()["result"] == {"out": 1}
+    restored = job_queue.get_job(started.id)
+    assert restored.attempts == 1
+    assert restored.retry_time > datetime.datetime.now()
+    assert job_queue.get_job(queued.id).data == {"c": 3}
+
+    # Jobs are not errored until workers can reconnect
+    job_queue.assign_jobs()
+    assert job_queue.get_job(queued.id).status()["state"] == "waiting"
+    job_queue.close()
+
+
+def test_batch_and_events():
+    from aiohttp import web
+    from openpype.modules.job_queue.job_server.job_queue_route import (
+        JobQueueResource,
+    )
+    from openpype.modules.job_queue.job_workers.base_worker import (
+        JobQueueClient,
+    )
+
+    app = web.Application()
+    job_queue = JobQueue()
+    JobQueueResource(
+        job_queue, types.SimpleNamespace(add_route=app.router.add_route)
+    )
+
+    async def main():
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "localhost", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with JobQueueClient(
+                "http://localhost:{}".format(port)
+            ) as client:
+                job_ids = await client.send_jobs(
+                    "tvpaint", [{"a": 1}, {"b": 2, "priority": 3}]
+                )
+                assert job_queue.get_job(job_ids[1]).priority == 3
+
+                # Finish jobs when client is waiting for them
+                async def finish_jobs():
+                    await asyncio.sleep(0.1)
+                    for job_id in job_ids:
+                        job_queue.finish_job(None, job_id, True, None, job_id)
+
+                asyncio.ensure_future(finish_jobs())
+                statuses = await client.wait_for_jobs(job_ids)
+        finally:
+            await runner.cleanup()
+        return job_ids, statuses
+
+    job_ids, statuses = asyncio.run(main())
+    for job_id in job_ids:
+        assert statuses[job_id]["state"] == "done"
+        assert statuses[job_id]["result"] == job_id
+
+
+def test_batch_invalid_body():
+    from aiohttp import web, ClientSession
+    from openpype.modules.job_queue.job_server.job_queue_route import (
+        JobQueueResource,
+    )
+
+    app = web.Application()
+    job_queue = JobQueue()
+    JobQueueResource(
+        job_queue, types.SimpleNamespace(add_route=app.router.add_route)
+    )
+
+    async def main():
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "localhost", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        url = "http://localhost:{}/api/jobs/batch".format(port)
+        responses = []
+        try:
+            async with ClientSession() as session:
+                for body in (
+                    [{"host_name": "tvpaint"}],
+                    {"jobs": [{"host_name": "tvpaint"}, "job"]},
+                    {"jobs": None},
+                ):
+                    async with session.post(url, json=body) as response:
+                        responses.append(
+                            (response.status, await response.text())
+                        )
+        finally:
+            await runner.cleanup()
+        return responses
+
+    assert asyncio.run(main()) == [
+        (400, "Body must be an object."),
+        (400, "Job data must be an object."),
+        (400, "Key \"jobs\" not filled."),
+    ]
+    assert list(job_queue.get_jobs()) == []
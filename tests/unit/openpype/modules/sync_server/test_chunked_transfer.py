@@ -0,0 +1,148 @@
+"""Test for chunked resumable transfers of sync server providers.
+
+Uses local drive provider and SFTP provider with fake connection to local
+files, fake server, doesn't need DB.
+"""
+import io
+import os
+
+from openpype.modules.sync_server.providers.local_drive import (
+    LocalDriveHandler,
+)
+from openpype.modules.sync_server.providers.sftp import SFTPHandler
+
+
+class FakeServer:
+    LOG_PROGRESS_SEC = 0
+
+    def __init__(self):
+        self.resume_infos = []
+        self.progress = []
+
+    def update_resume_info(self, project_name, file, representation, site,
+                           resume_info):
+        self.resume_infos.append(resume_info)
+
+    def update_db(self, project_name, new_file_id, file, representation,
+                  site, progress=None, **kwargs):
+        self.progress.append(progress)
+
+
+def _create_handler(chunk_size_mb):
+    handler = LocalDriveHandler("test_project", "studio")
+    handler.presets = {"chunk_size": chunk_size_mb}
+    return handler
+
+
+def test_transfer_in_chunks(tmp_path):
+    source = tmp_path / "source.exr"
+    target = tmp_path / "target.exr"
+    content = os.urandom(1024 * 10)
+    source.write_bytes(content)
+
+    server = FakeServer()
+    handler = _create_handler(1 / 1024.0)
+    file = {"path": "source.exr", "sites": [{"name": "studio"}]}
+    handler.upload_file(str(source), str(target), server, "test_project",
+                        file, {}, "studio", overwrite=True)
+
+    assert target.read_bytes() == content
+    assert len(server.resume_infos) == 10
+    assert server.resume_infos[-1]["offset"] == len(content)
+    assert server.progress[-1] == 1
+
+
+def test_resume_transfer(tmp_path):
+    source = tmp_path / "source.exr"
+    target = tmp_path / "target.exr"
+    content = os.urandom(1024 * 10)
+    source.write_bytes(content)
+
+    # simulate transfer interrupted after 4 chunks
+    handler = _create_handler(1 / 1024.0)
+    file = {"path": "source.exr", "sites": [{"name": "studio"}]}
+    server = FakeServer()
+    handler.upload_file(str(source), str(target), server,
+                        "test_project", file, {}, "studio", overwrite=True)
+    resume_info = server.resume_infos[3]
+    target.write_bytes(content[:resume_info["offset"]])
+
+    file["sites"][0]["resume"] = resume_info
+    server = FakeServer()
+    handler.upload_file(str(source), str(target), server, "test_project",
+                        file, {}, "studio", overwrite=True)
+
+    assert target.read_bytes() == content
+    assert len(server.resume_infos) == 6
+
+    # corrupted target starts from beginning
+    server = FakeServer()
+    target.write_bytes(b"x" * resume_info["offset"])
+    handler.upload_file(str(source), str(target), server, "test_project",
+                        file, {}, "studio", overwrite=True)
+
+    assert target.read_bytes() == content
+    assert len(server.resume_infos) == 10
+
+
+class FakeSFTPFile(io.FileIO):
+    """Local file with methods of paramiko 'SFTPFile'."""
+    def __init__(self, path, mode, calls):
+        super(FakeSFTPFile, self).__init__(path, mode)
+        self._calls = calls
+
+    def prefetch(self):
+        self._calls.append(("prefetch", self.tell()))
+
+    def set_pipelined(self, pipelined=True):
+        self._calls.append(("set_pipelined", pipelined))
+
+
+class FakeSFTPConnection:
+    def __init__(self):
+        self.calls = []
+
+    def open(self, path, mode):
+        return FakeSFTPFile(path, mode, self.calls)
+
+    def isfile(self, path):
+        return os.path.isfile(path)
+
+    def stat(self, path):
+        return os.stat(path)
+
+
+def _create_sftp_handler(chunk_size_mb):
+    handler = SFTPHandler("test_project", "sftp")
+    handler.presets = {"chunk_size": chunk_size_mb}
+    handler._conn = FakeSFTPConnection()
+    return handler
+
+
+def test_sftp_transfer(tmp_path):
+    remote = tmp_path / "remote.exr"
+    local = tmp_path / "local.exr"
+    content = os.urandom(1024 * 10)
+    remote.write_bytes(content)
+
+    handler = _create_sftp_handler(1 / 1024.0)
+    file = {"path": "remote.exr", "sites": [{"name": "sftp"}]}
+    server = FakeServer()
+    handler.download_file(str(remote), str(local), server, "test_project",
+                          file, {}, "sftp", overwrite=True)
+    assert local.read_bytes() == content
+    assert handler.conn.calls == [("prefetch", 0)]
+
+    # resumed upload over longer remote file
+    resume_info = server.resume_infos[3]
+    remote.write_bytes(
+        content[:resume_info["offset"]] + os.urandom(1024 * 20)
+    )
+    file["sites"][0]["resume"] = resume_info
+    handler.conn.calls = []
+    server = FakeServer()
+    handler.upload_file(str(local), str(remote), server, "test_project",
+                        file, {}, "sftp", overwrite=True)
+    assert remote.read_bytes() == content
+    assert len(server.resume_infos) == 6
+    assert handler.conn.calls == [("set_pipelined", True)]
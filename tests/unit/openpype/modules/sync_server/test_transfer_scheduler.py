@@ -0,0 +1,73 @@
+"""Test for TransferScheduler of sync server loop.
+
+Doesn't need DB, only asyncio loop.
+"""
+import time
+import asyncio
+
+from openpype.modules.sync_server.sync_server import (
+    TransferScheduler,
+    TransferJob,
+)
+from openpype.modules.sync_server.utils import SyncStatus
+
+
+def test_concurrency_limit():
+    scheduler = TransferScheduler()
+    state = {"active": 0, "max_active": 0}
+
+    async def transfer():
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return "file_id"
+
+    async def main():
+        scheduler.configure_site("remote", 2, 0)
+        return await asyncio.gather(*[
+            scheduler.run("remote", 10, transfer())
+            for _ in range(6)
+        ])
+
+    results = asyncio.run(main())
+    scheduler.finish_loop(1.0)
+    stats = scheduler.get_stats()
+
+    assert results == ["file_id"] * 6
+    assert state["max_active"] == 2
+    assert stats["transferred_files"] == 6
+    assert stats["transferred_bytes"] == 60
+    assert stats["queue_depth"] == 0
+    assert stats["last_loop"]["bytes_per_second"] == 60
+
+
+def test_bandwidth_limit():
+    scheduler = TransferScheduler()
+
+    async def transfer():
+        return None
+
+    async def main():
+        # 1000 bytes per second, 1500 bytes must wait for debt of 500
+        scheduler.configure_site("remote", 4, 1000)
+        await asyncio.gather(*[
+            scheduler.run("remote", 750, transfer())
+            for _ in range(3)
+        ])
+
+    start = time.monotonic()
+    asyncio.run(main())
+    assert time.monotonic() - start >= 0.45
+
+
+def test_job_ordering():
+    jobs = [
+        TransferJob(SyncStatus.DO_UPLOAD, {"size": 100}, {}, 50),
+        TransferJob(SyncStatus.DO_UPLOAD, {"size": 10}, {}, 50),
+        TransferJob(SyncStatus.DO_UPLOAD, {"size": 1}, {}, None),
+        TransferJob(SyncStatus.DO_UPLOAD, {"size": 1000}, {}, 99),
+    ]
+    ordered = sorted(jobs, key=TransferJob.sort_key)
+
+    assert [job.size for job in ordered] == [1000, 10, 100, 1]
@@ -0,0 +1,54 @@
+"""Test of update queries of sync server module.
+
+Uses fake connection collecting queries, doesn't need DB.
+"""
+import logging
+
+from bson.objectid import ObjectId
+
+from openpype.modules.sync_server.sync_server_module import (
+    SyncServerModule,
+)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.updates = []
+
+    def update_one(self, query, update, **kwargs):
+        self.updates.append(update)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.database = {"test_project": FakeCollection()}
+
+
+def _create_module():
+    module = SyncServerModule.__new__(SyncServerModule)
+    module._connection = FakeConnection()
+    module.log = logging.getLogger("test_update_db")
+    return module
+
+
+def _update_db(module, **kwargs):
+    file = {"_id": str(ObjectId()), "path": "source.exr", "sites": []}
+    representation = {"_id": ObjectId()}
+    module.update_db("test_project", file=file,
+                     representation=representation, site="studio", **kwargs)
+    return module.connection.database["test_project"].updates[-1]
+
+
+def test_success_stamps_sites_changed():
+    module = _create_module()
+    update = _update_db(module, new_file_id="new_file_id")
+
+    assert SyncServerModule.SITES_CHANGED_KEY in update["$set"]
+    assert "files.$[f].sites.$[s].resume" in update["$unset"]
+
+
+def test_progress_does_not_stamp_sites_changed():
+    module = _create_module()
+    update = _update_db(module, new_file_id=None, progress=0.5)
+
+    assert SyncServerModule.SITES_CHANGED_KEY not in update["$set"]
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""Test suite for publish worker.
+
+Plugins installation is skipped and only in-memory plugins are published.
+"""
+import os
+import json
+
+import pytest
+import pyblish.api
+
+from openpype.pipeline.publish import publish_worker
+
+
+class CollectEnv(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+    targets = ["worker_test"]
+
+    def process(self, context):
+        if os.environ.get("WORKER_TEST_FAIL"):
+            raise ValueError("Job failed")
+        os.environ["WORKER_TEST_LEAKED"] = "1"
+        print("collected {}".format(os.environ["OPENPYPE_PUBLISH_DATA"]))
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    worker = publish_worker.PublishWorker()
+    monkeypatch.setattr(worker, "_installed", True)
+    monkeypatch.setattr(worker, "_base_environ", dict(os.environ))
+    monkeypatch.setattr(
+        worker, "_get_root_environments",
+        lambda project_name: {"OPENPYPE_ROOT_WORK": "/" + project_name}
+        if project_name else {}
+    )
+    worker.installed_contexts = []
+    monkeypatch.setattr(
+        worker, "_install_context",
+        lambda *args: worker.installed_contexts.append(args)
+    )
+    monkeypatch.setattr(
+        worker, "_get_plugins",
+        lambda project_name, host_name, targets: [CollectEnv]
+    )
+    return worker
+
+
+def test_process_job_isolation(worker):
+    targets = pyblish.api.registered_targets()
+    worker.process_job(["/job.json"], ["worker_test"], {"JOB_ENV": "1"})
+
+    assert "JOB_ENV" not in os.environ
+    assert "WORKER_TEST_LEAKED" not in os.environ
+    assert pyblish.api.registered_targets() == targets
+
+    with pytest.raises(publish_worker.PublishJobError):
+        worker.process_job(
+            ["/job.json"], ["worker_test"], {"WORKER_TEST_FAIL": "1"}
+        )
+    assert pyblish.api.registered_targets() == targets
+
+
+def test_process_job_context(worker, monkeypatch):
+    monkeypatch.delenv("AVALON_PROJECT", raising=False)
+    monkeypatch.delenv("AVALON_APP", raising=False)
+    monkeypatch.setattr(worker, "_base_environ", dict(os.environ))
+    environs = []
+    monkeypatch.setattr(
+        CollectEnv, "process",
+        lambda self, context: environs.append(dict(os.environ))
+    )
+    worker.process_job(
+        ["/job.json"], ["worker_test"],
+        {"AVALON_PROJECT": "projectA", "AVALON_APP": "maya"}
+    )
+    worker.process_job(
+        ["/job.json"], ["worker_test"],
+        {"AVALON_PROJECT": "projectB", "AVALON_APP": "nuke"}
+    )
+
+    assert worker.installed_contexts == [
+        ("projectA", "maya"), ("projectB", "nuke")
+    ]
+    assert [environ["OPENPYPE_ROOT_WORK"] for environ in environs] == [
+        "/projectA", "/projectB"
+    ]
+    assert "OPENPYPE_ROOT_WORK" not in os.environ
+
+
+class FakeConnection(object):
+    def __init__(self, job_data):
+        self.received = [json.dumps(job_data).encode("utf-8")]
+        self.sent = []
+
+    def recv_bytes(self):
+        return self.received.pop(0)
+
+    def send_bytes(self, data):
+        self.sent.append(json.loads(data.decode("utf-8")))
+
+
+def test_handle_request(worker):
+    def handle(environ):
+        conn = FakeConnection({
+            "paths": ["/job.json"],
+            "targets": ["worker_test"],
+            "environ": environ,
+        })
+        worker._handle_request(conn)
+        return conn.sent
+
+    messages = handle({})
+    assert messages[-1] == {
+        "type": "result",
+        "success": True,
+        "message": None,
+        "changed_environ": ["WORKER_TEST_LEAKED"],
+    }
+    assert {
+        "type": "output", "line": "collected /job.json"
+    } in messages
+    assert "WORKER_TEST_LEAKED" not in os.environ
+
+    result = handle({"WORKER_TEST_FAIL": "1"})[-1]
+    assert result["success"] is False
+    assert "Job failed" in result["message"]
+
+
+def test_plugins_rediscovered_on_settings_change(monkeypatch):
+    worker = publish_worker.PublishWorker()
+    fingerprints = iter(["a", "a", "b"])
+    monkeypatch.setattr(
+        worker, "_get_settings_fingerprint",
+        lambda project_name: next(fingerprints)
+    )
+    discovered = []
+    monkeypatch.setattr(
+        pyblish.api, "discover",
+        lambda: discovered.append(1) or [CollectEnv]
+    )
+    for _ in range(3):
+        assert worker._get_plugins(
+            "projectA", "maya", ["farm"]
+        ) == [CollectEnv]
+    assert len(discovered) == 2
+
+
+@pytest.fixture
+def worker_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        publish_worker, "_get_worker_dir", lambda: str(tmp_path)
+    )
+    return tmp_path
+
+
+def _serve_one(listener, handle):
+    """Accept one connection in thread and pass it to 'handle'."""
+    import threading
+
+    def accept():
+        try:
+            conn = listener.accept()
+        except publish_worker.AuthenticationError:
+            return
+        with conn:
+            handle(conn)
+
+    thread = threading.Thread(target=accept)
+    thread.start()
+    return thread
+
+
+def test_send_publish_job(worker, worker_dir):
+    from multiprocessing.connection import Listener
+
+    listener = Listener(("localhost", 0), authkey=b"worker_key")
+    port = listener.address[1]
+
+    # Key of worker is not stored, worker of user is not running
+    with pytest.raises(ConnectionRefusedError):
+        publish_worker.send_publish_job(["/job.json"], port=port, environ={})
+
+    # Listener on port does not know key of user
+    publish_worker._write_worker_key(
+        publish_worker._get_worker_key_path(port), b"other_key"
+    )
+    thread = _serve_one(listener, worker._handle_request)
+    with pytest.raises(ConnectionRefusedError):
+        publish_worker.send_publish_job(["/job.json"], port=port, environ={})
+    thread.join()
+
+    os.remove(publish_worker._get_worker_key_path(port))
+    publish_worker._write_worker_key(
+        publish_worker._get_worker_key_path(port), b"worker_key"
+    )
+    thread = _serve_one(listener, worker._handle_request)
+    changed_keys = publish_worker.send_publish_job(
+        ["/job.json"], ["worker_test"], port=port, environ={}
+    )
+    thread.join()
+    assert changed_keys == ["WORKER_TEST_LEAKED"]
+
+    # Worker accepted the job and dropped the connection
+    thread = _serve_one(listener, lambda conn: conn.recv_bytes())
+    with pytest.raises(publish_worker.PublishJobError):
+        publish_worker.send_publish_job(["/job.json"], port=port, environ={})
+    thread.join()
+    listener.close()
@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from openpype.pipeline import colorspace
+
+
+class TestOCIOQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.tmp_dir, "config.ocio")
+        with open(self.config_path, "w") as stream:
+            stream.write("ocio_profile_version: 2\n")
+
+        self.views = {
+            "ACES/sRGB": {
+                "display": "ACES", "view": "sRGB", "colorspace": "sRGB"
+            }
+        }
+        colorspace.CachedData.ocio_query_results = {}
+        self._compatible = colorspace.CachedData.has_compatible_ocio_package
+        # Use OCIO helper process
+        colorspace.CachedData.has_compatible_ocio_package = False
+
+    def tearDown(self):
+        colorspace.CachedData.has_compatible_ocio_package = self._compatible
+        colorspace.CachedData.ocio_query_results = {}
+        shutil.rmtree(self.tmp_dir)
+
+    def test_cached_until_config_changes(self):
+        with mock.patch.object(
+            colorspace._OCIO_HELPER, "request", return_value=self.views
+        ) as request:
+            result = colorspace.get_ocio_config_views(self.config_path)
+            result["ACES/sRGB"]["view"] = "changed"
+            result = colorspace.get_ocio_config_views(self.config_path)
+
+            self.assertEqual(result, self.views)
+            request.assert_called_once_with(
+                "get_views", config_path=self.config_path
+            )
+
+            stat = os.stat(self.config_path)
+            os.utime(self.config_path, (stat.st_atime, stat.st_mtime + 10))
+            colorspace.get_ocio_config_views(self.config_path)
+            self.assertEqual(request.call_count, 2)
+
+    def test_fallback_to_subprocess(self):
+        with mock.patch.object(
+            colorspace._OCIO_HELPER,
+            "request",
+            side_effect=colorspace._OCIOHelperConnectionError("ended")
+        ), mock.patch.object(
+            colorspace,
+            "_get_wrapped_with_subprocess",
+            return_value="Output - sRGB"
+        ) as subprocess_call:
+            result = colorspace.get_display_view_colorspace_name(
+                self.config_path, "ACES", "sRGB"
+            )
+
+        self.assertEqual(result, "Output - sRGB")
+        subprocess_call.assert_called_once_with(
+            "config",
+            "get_display_view_colorspace_name",
+            in_path=self.config_path,
+            display="ACES",
+            view="sRGB"
+        )
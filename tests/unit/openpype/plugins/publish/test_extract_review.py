@@ -27,3 +27,96 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def test_extract_fused_review_leftovers(monkeypatch):
+    """Deferred outputs are rendered when burnins did not process them."""
+    import pyblish.api
+    from openpype.plugins.publish import extract_fused_review
+
+    commands = []
+    monkeypatch.setattr(
+        extract_fused_review, "run_subprocess",
+        lambda cmd, **kwargs: commands.append(cmd)
+    )
+    context = pyblish.api.Context()
+    instance = context.create_instance("review")
+    instance.data["representations"] = [
+        {"name": "h264_mov", "fusedReview": {"ffmpeg_args": ["ffmpeg", "-y"]}},
+        {"name": "png"},
+    ]
+    extract_fused_review.ExtractFusedReview().process(instance)
+    assert commands == ["ffmpeg -y"]
+    assert not any(
+        "fusedReview" in repre for repre in instance.data["representations"]
+    )
+
+
+def test_merge_renders_by_input(monkeypatch):
+    """Outputs with same input are rendered by one ffmpeg process."""
+    from openpype.plugins.publish import extract_review
+
+    monkeypatch.setattr(
+        extract_review, "get_ffmpeg_tool_args", lambda tool: [tool]
+    )
+    input_args = ["-y", "-i \"input.mov\""]
+    renders = [
+        ("h264", ["ffmpeg"], (input_args, ["scale=1920:1080"], [],
+                              ["-codec:v libx264", "h264.mp4"])),
+        ("prores", ["ffmpeg"], (input_args, [], [],
+                                ["-codec:v prores_ks", "prores.mov"])),
+        ("audio", ["ffmpeg", "audio.mp4"], (input_args, [], ["adeclick"],
+                                            ["audio.mp4"])),
+    ]
+    merged = ExtractReview()._merge_renders_by_input(renders)
+    assert len(merged) == 2
+
+    output_name, ffmpeg_args, output_indexes = merged[0]
+    assert output_name == "h264, prores"
+    assert ffmpeg_args == [
+        "ffmpeg", "-y", "-i \"input.mov\"",
+        "-filter_complex",
+        "\"[0:v]split=2[v0][v1];[v0]scale=1920:1080[out0];"
+        "[v1]null[out1]\"",
+        "-map", "\"[out0]\"", "-map", "0:a?",
+        "-codec:v libx264", "h264.mp4",
+        "-map", "\"[out1]\"", "-map", "0:a?",
+        "-codec:v prores_ks", "prores.mov",
+    ]
+    assert [ffmpeg_args[idx] for idx in output_indexes] == [
+        "h264.mp4", "prores.mov"
+    ]
+    # Output with audio filters is not merged
+    assert merged[1] == ("audio", ["ffmpeg", "audio.mp4"], [1])
+
+
+def test_render_outputs_threads(monkeypatch):
+    """Threads are limited by cpu count and divided between outputs."""
+    from openpype.plugins.publish import extract_review
+
+    commands = []
+    monkeypatch.setattr(
+        extract_review, "run_subprocess",
+        lambda cmd, **kwargs: commands.append(cmd)
+    )
+    monkeypatch.setattr(
+        extract_review.multiprocessing, "cpu_count", lambda: 16
+    )
+    plugin = ExtractReview()
+    assert plugin._get_outputs_concurrency(1) == (1, None)
+    assert plugin._get_outputs_concurrency(2) == (2, 8)
+    assert plugin._get_outputs_concurrency(10) == (4, 4)
+    plugin.max_concurrent_outputs = 1
+    assert plugin._get_outputs_concurrency(10) == (1, None)
+
+    plugin.max_concurrent_outputs = None
+    plugin._render_outputs([
+        ("single", ["ffmpeg", "-i in.mov", "out.mov"], [2]),
+        ("merged", ["ffmpeg", "-i in.mov", "-map 0", "a.mov",
+                    "-threads 2", "b.mov", "-map 1", "c.mov"], [3, 5, 7]),
+    ])
+    assert sorted(commands) == sorted([
+        "ffmpeg -i in.mov -threads 8 out.mov",
+        "ffmpeg -i in.mov -map 0 -threads 2 a.mov -threads 2 b.mov"
+        " -map 1 -threads 2 c.mov",
+    ])
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cache of resolved settings.
+
+Default settings and overrides are replaced so DB is not needed.
+"""
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.cache import (
+    SettingsCache,
+    SETTINGS_CACHE_DIR_ENV,
+)
+from openpype.settings.handlers import CacheValues
+
+DEFAULT_SETTINGS = {
+    "system_settings": {},
+    "project_anatomy": {},
+    "project_settings": {
+        "global": {
+            "value": 1,
+            "nested": {"items": ["a", "b"]}
+        }
+    },
+}
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    overrides = {
+        "studio": {"global": {"value": 2}},
+        "project": {"global": {"nested": {"items": ["c"]}}},
+    }
+    calls = []
+    create_project_settings = lib._create_project_settings
+
+    def _create_project_settings(*args):
+        calls.append(args[0])
+        return create_project_settings(*args)
+
+    monkeypatch.setattr(lib, "_DEFAULT_SETTINGS", DEFAULT_SETTINGS)
+    monkeypatch.setattr(lib, "_create_project_settings",
+                        _create_project_settings)
+    monkeypatch.setattr(
+        lib, "get_studio_project_settings_overrides",
+        lambda: lib.copy.deepcopy(overrides["studio"])
+    )
+    monkeypatch.setattr(
+        lib, "get_project_settings_overrides",
+        lambda project_name: lib.copy.deepcopy(overrides["project"])
+    )
+    monkeypatch.setattr(lib, "get_local_settings", lambda: {})
+    lib.clear_settings_cache()
+    yield overrides, calls
+    lib.clear_settings_cache()
+
+
+def test_project_settings_cached(settings):
+    overrides, calls = settings
+    result = lib._get_project_settings("test_project")
+    assert result == {
+        "global": {"value": 2, "nested": {"items": ["c"]}}
+    }
+
+    # Returned value is a copy
+    result["global"]["value"] = 10
+    assert lib._get_project_settings("test_project")["global"]["value"] == 2
+    assert calls == ["test_project"]
+
+    # Changed overrides create new value
+    overrides["studio"]["global"]["value"] = 3
+    assert lib._get_project_settings("test_project")["global"]["value"] == 3
+    assert calls == ["test_project", "test_project"]
+
+    lib.clear_settings_cache()
+    lib._get_project_settings("test_project")
+    assert len(calls) == 3
+
+
+def test_read_only_view(settings):
+    result = lib._get_project_settings("test_project", read_only=True)
+    with pytest.raises(TypeError):
+        result["global"]["value"] = 10
+    with pytest.raises(TypeError):
+        result["global"].update({"value": 10})
+
+    mutable = lib.copy.deepcopy(result)
+    mutable["global"]["nested"]["items"].append("d")
+    assert mutable["global"]["nested"]["items"] == ["c", "d"]
+    assert result["global"]["nested"]["items"] == ("c", )
+
+
+def test_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(SETTINGS_CACHE_DIR_ENV, str(tmp_path))
+    cache = SettingsCache()
+    key = cache.create_key("project_settings", "test", {"value": 1})
+    assert cache.get(key, lambda: {"value": [1]}) == {"value": [1]}
+
+    def fail():
+        raise AssertionError("Value should be loaded from disk")
+
+    # New cache, e.g. in child process
+    assert SettingsCache().get(key, fail) == {"value": [1]}
+
+
+def test_cache_values_set_outdated():
+    cache = CacheValues()
+    cache.update_from_document({"data": {"value": 1}}, None)
+    assert not cache.is_outdated
+
+    cache.set_outdated()
+    assert cache.is_outdated